@@ -0,0 +1,5 @@
+"""
+性能基准
+测量框架自身和页面渲染的开销，用于调优配置和发现性能回退；
+以及以并发虚拟用户对被测系统施加负载（不属于测试用例，不会被 pytest 收集）
+"""
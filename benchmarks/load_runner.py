@@ -0,0 +1,446 @@
+"""
+负载运行器
+复用页面对象，以多个虚拟用户（每个用户一个浏览器上下文，以管理员身份登录）
+并发执行测试覆盖的 PIM 流程，统计每个步骤的耗时分布和吞吐量，用于观察被测系统在并发下的表现
+
+- 虚拟用户按序号轮流分配到多个进程，每个进程启动一个浏览器，
+  进程内的虚拟用户通过异步页面对象（与同步页面对象共用选择器）并发执行
+- 虚拟用户在 --ramp-up 秒内依次启动
+- 每个虚拟用户登录一次，然后循环执行：打开员工列表 -> 按员工 ID 搜索
+  （--flow write 时再创建一个员工并删除；删除失败遗留的员工 ID 符合 data_factory 的生成规则，
+  可用 pytest --sweep-test-data 清扫）
+- 运行 --duration 秒或每个用户执行 --iterations 次后结束
+
+被测系统默认为 BASE_URL，可用 --base-url 指定，或用 --local-site 在本地测试站点上运行（CI）。
+
+运行：
+    python -m benchmarks.load_runner --users 50 --processes 5 --ramp-up 30 --duration 120
+    python -m benchmarks.load_runner --local-site --users 8 --iterations 5 --flow write
+    python -m benchmarks.load_runner --users 20 --json reports/load.json
+"""
+
+import argparse
+import asyncio
+import contextlib
+import json
+import math
+import multiprocessing
+import sys
+import time
+from collections.abc import Iterator
+from pathlib import Path
+
+from playwright.async_api import Browser, Page, async_playwright
+
+from config.settings import settings
+from pages.async_employee_form_page import AsyncEmployeeFormPage
+from pages.async_login_page import AsyncLoginPage
+from pages.async_pim_page import AsyncPIMPage
+from utils.browser_context import close_context_async, new_context_async
+from utils.data_factory import WORKER_WIDTH, DataFactory, data_factory
+from utils.local_site import LocalSite
+from utils.logger import logger
+
+# 耗时直方图的桶上界（毫秒），最后一个桶收集更慢的样本
+HISTOGRAM_BOUNDS_MS = (100, 250, 500, 1000, 2500, 5000, 10000)
+
+# 流程 -> 每次迭代执行的步骤（登录只在用户开始时执行一次）
+FLOWS = {
+    "read": ("open_pim", "search"),
+    "write": ("open_pim", "search", "create_employee", "delete_employee"),
+}
+
+
+# ==================== 统计 ====================
+
+
+class StepRecorder:
+    """记录每个步骤的耗时样本和失败次数"""
+
+    def __init__(self):
+        # 步骤名称 -> 成功执行的耗时（毫秒）
+        self.samples: dict[str, list[float]] = {}
+        # 步骤名称 -> 失败次数
+        self.errors: dict[str, int] = {}
+        # 完整执行的迭代次数
+        self.iterations = 0
+
+    @contextlib.contextmanager
+    def step(self, name: str) -> Iterator[None]:
+        """
+        计时执行一个步骤（失败时记录失败次数后重新抛出异常）
+
+        Args:
+            name: 步骤名称
+        """
+        start = time.perf_counter()
+        try:
+            yield
+        except Exception:
+            self.errors[name] = self.errors.get(name, 0) + 1
+            raise
+        self.samples.setdefault(name, []).append((time.perf_counter() - start) * 1000)
+
+    def to_dict(self) -> dict:
+        """
+        转换为可在进程间传递的字典
+
+        Returns:
+            {"samples": ..., "errors": ..., "iterations": ...}
+        """
+        return {"samples": self.samples, "errors": self.errors, "iterations": self.iterations}
+
+
+def merge_results(results: list[dict]) -> dict:
+    """
+    合并多个进程的记录
+
+    Args:
+        results: StepRecorder.to_dict() 的列表
+
+    Returns:
+        合并后的记录（格式相同）
+    """
+    merged = {"samples": {}, "errors": {}, "iterations": 0}
+    for result in results:
+        for name, values in result["samples"].items():
+            merged["samples"].setdefault(name, []).extend(values)
+        for name, count in result["errors"].items():
+            merged["errors"][name] = merged["errors"].get(name, 0) + count
+        merged["iterations"] += result["iterations"]
+    return merged
+
+
+def percentile(values: list[float], pct: float) -> float:
+    """
+    计算百分位数（最近秩法）
+
+    Args:
+        values: 样本
+        pct: 百分位（0-100）
+
+    Returns:
+        百分位数，没有样本时为 0
+    """
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = max(math.ceil(pct / 100 * len(ordered)), 1)
+    return ordered[rank - 1]
+
+
+def histogram(values: list[float], bounds: tuple[float, ...] = HISTOGRAM_BOUNDS_MS) -> list[int]:
+    """
+    统计落在每个耗时区间的样本数
+
+    Args:
+        values: 耗时样本（毫秒）
+        bounds: 区间上界（升序）
+
+    Returns:
+        每个区间的样本数，长度为 len(bounds) + 1（最后一个为超过最大上界的样本）
+    """
+    counts = [0] * (len(bounds) + 1)
+    for value in values:
+        index = next((i for i, bound in enumerate(bounds) if value <= bound), len(bounds))
+        counts[index] += 1
+    return counts
+
+
+def summarize(result: dict, elapsed_s: float) -> dict:
+    """
+    汇总每个步骤的耗时分布和吞吐量
+
+    Args:
+        result: 合并后的记录
+        elapsed_s: 运行时长（秒）
+
+    Returns:
+        {"elapsed_s", "iterations", "iterations_per_s", "steps": {步骤: 统计}}
+    """
+    steps = {}
+    names = list(dict.fromkeys([*result["samples"], *result["errors"]]))
+    for name in names:
+        values = result["samples"].get(name, [])
+        errors = result["errors"].get(name, 0)
+        steps[name] = {
+            "count": len(values),
+            "errors": errors,
+            "error_rate": errors / (len(values) + errors),
+            "per_s": len(values) / elapsed_s if elapsed_s else 0.0,
+            "p50_ms": percentile(values, 50),
+            "p90_ms": percentile(values, 90),
+            "p99_ms": percentile(values, 99),
+            "max_ms": max(values, default=0.0),
+            "histogram": histogram(values),
+        }
+    return {
+        "elapsed_s": elapsed_s,
+        "iterations": result["iterations"],
+        "iterations_per_s": result["iterations"] / elapsed_s if elapsed_s else 0.0,
+        "steps": steps,
+    }
+
+
+# ==================== 虚拟用户 ====================
+
+
+async def run_user(
+    browser: Browser,
+    recorder: StepRecorder,
+    factory: DataFactory,
+    flow: str,
+    start_delay: float,
+    deadline: float | None,
+    iterations: int | None,
+) -> None:
+    """
+    运行一个虚拟用户：登录一次，然后循环执行流程直到时间结束或达到迭代次数
+
+    步骤失败时结束当前迭代，下一次迭代重新打开员工列表；登录失败时用户退出。
+
+    Args:
+        browser: 异步浏览器实例
+        recorder: 步骤记录
+        factory: 生成员工 ID 的数据生成器（每个进程一个）
+        flow: 流程名称（FLOWS 的键）
+        start_delay: 启动前等待的秒数（逐步加压）
+        deadline: 结束时间（time.monotonic()），None 表示只按迭代次数结束
+        iterations: 迭代次数，None 表示只按时间结束
+    """
+    await asyncio.sleep(start_delay)
+    context = await new_context_async(browser)
+    page = await context.new_page()
+    try:
+        with recorder.step("login"):
+            login = await AsyncLoginPage(page).open()
+            await login.login_as_admin()
+            await login.wait_for_login_complete()
+
+        done = 0
+        while (iterations is None or done < iterations) and (
+            deadline is None or time.monotonic() < deadline
+        ):
+            done += 1
+            try:
+                await run_iteration(page, recorder, factory, FLOWS[flow])
+                recorder.iterations += 1
+            except Exception as e:
+                logger.warning(f"虚拟用户迭代失败: {e}")
+    except Exception as e:
+        logger.error(f"虚拟用户登录失败，退出: {e}")
+    finally:
+        await close_context_async(context, "load_runner")
+
+
+async def run_iteration(
+    page: Page, recorder: StepRecorder, factory: DataFactory, steps: tuple[str, ...]
+) -> None:
+    """
+    执行一次流程
+
+    Args:
+        page: 已登录的异步页面
+        recorder: 步骤记录
+        factory: 数据生成器
+        steps: 要执行的步骤
+    """
+    pim = AsyncPIMPage(page)
+    employee_id = factory.employee_id()
+    with recorder.step("open_pim"):
+        await pim.open()
+    with recorder.step("search"):
+        await pim.search_by_employee_id("0001")
+        await pim.click_search()
+
+    if "create_employee" in steps:
+        with recorder.step("create_employee"):
+            await pim.click_add_button()
+            await AsyncEmployeeFormPage(page).create_new_employee(
+                factory.name("Load"), "", "User", employee_id
+            )
+        with recorder.step("delete_employee"):
+            await pim.open()
+            await pim.bulk_delete_employees([employee_id], employee_id)
+
+
+async def run_users(
+    process_index: int, user_indices: list[int], options: dict
+) -> StepRecorder:
+    """
+    在一个浏览器中并发运行分配给本进程的虚拟用户
+
+    Args:
+        process_index: 进程序号
+        user_indices: 本进程的虚拟用户序号（全局）
+        options: 运行参数
+
+    Returns:
+        步骤记录
+    """
+    recorder = StepRecorder()
+    # 每个进程使用不同的 worker 序号，避免不同进程生成相同的员工 ID
+    factory = DataFactory(run_id=options["run_id"], worker=process_index)
+
+    deadline = time.monotonic() + options["duration"] if options["duration"] else None
+    users = options["users"]
+    async with async_playwright() as playwright:
+        browser = await getattr(playwright, options["browser"]).launch(
+            **settings.browser_config
+        )
+        try:
+            await asyncio.gather(
+                *(
+                    run_user(
+                        browser,
+                        recorder,
+                        factory,
+                        options["flow"],
+                        options["ramp_up"] * index / users,
+                        deadline,
+                        options["iterations"],
+                    )
+                    for index in user_indices
+                )
+            )
+        finally:
+            await browser.close()
+    return recorder
+
+
+def run_process(process_index: int, user_indices: list[int], options: dict) -> dict:
+    """
+    进程入口：在指定的 BASE_URL 上运行虚拟用户
+
+    Args:
+        process_index: 进程序号
+        user_indices: 本进程的虚拟用户序号（全局）
+        options: 运行参数
+
+    Returns:
+        StepRecorder.to_dict()
+    """
+    with settings.override(BASE_URL=options["base_url"]):
+        recorder = asyncio.run(run_users(process_index, user_indices, options))
+    return recorder.to_dict()
+
+
+def run_load(options: dict) -> dict:
+    """
+    将虚拟用户分配到多个进程运行并汇总结果
+
+    Args:
+        options: 运行参数
+
+    Returns:
+        汇总结果（summarize 的返回值）
+    """
+    processes = min(options["processes"], options["users"])
+    assignments = [
+        (index, list(range(index, options["users"], processes)), options)
+        for index in range(processes)
+    ]
+    start = time.perf_counter()
+    # spawn 启动的进程不继承父进程中的 Playwright 和事件循环状态
+    with multiprocessing.get_context("spawn").Pool(processes) as pool:
+        results = pool.starmap(run_process, assignments)
+    elapsed = time.perf_counter() - start
+    return summarize(merge_results(results), elapsed)
+
+
+# ==================== 报告 ====================
+
+
+def print_report(report: dict) -> None:
+    """
+    打印每个步骤的耗时分布和吞吐量
+
+    Args:
+        report: 汇总结果
+    """
+    print(
+        f"运行 {report['elapsed_s']:.1f}s，完成 {report['iterations']} 次迭代"
+        f"（{report['iterations_per_s']:.2f} 次/s）\n"
+    )
+    print(
+        f"{'步骤':<18}{'次数':>8}{'失败':>6}{'次/s':>8}"
+        f"{'p50(ms)':>10}{'p90(ms)':>10}{'p99(ms)':>10}{'max(ms)':>10}"
+    )
+    for name, s in report["steps"].items():
+        print(
+            f"{name:<18}{s['count']:>8}{s['errors']:>6}{s['per_s']:>8.2f}"
+            f"{s['p50_ms']:>10.0f}{s['p90_ms']:>10.0f}{s['p99_ms']:>10.0f}{s['max_ms']:>10.0f}"
+        )
+
+    labels = [f"<={bound}" for bound in HISTOGRAM_BOUNDS_MS] + [f">{HISTOGRAM_BOUNDS_MS[-1]}"]
+    print(f"\n耗时分布（ms）\n{'步骤':<18}" + "".join(f"{label:>9}" for label in labels))
+    for name, s in report["steps"].items():
+        print(f"{name:<18}" + "".join(f"{count:>9}" for count in s["histogram"]))
+
+
+def main() -> None:
+    """解析参数、运行负载并输出结果"""
+    parser = argparse.ArgumentParser(description="以多个并发虚拟用户执行 PIM 流程")
+    parser.add_argument("--users", type=int, default=10, help="虚拟用户数")
+    parser.add_argument("--processes", type=int, default=2, help="进程数（每个进程一个浏览器）")
+    parser.add_argument("--ramp-up", type=float, default=10.0, help="所有用户启动完成的秒数")
+    parser.add_argument("--duration", type=float, default=60.0, help="运行秒数，0 表示不限")
+    parser.add_argument("--iterations", type=int, help="每个用户的迭代次数（默认不限）")
+    parser.add_argument("--flow", default="read", choices=list(FLOWS))
+    parser.add_argument(
+        "--browser", default="chromium", choices=["chromium", "firefox", "webkit"]
+    )
+    parser.add_argument("--base-url", help="被测系统地址（默认为 BASE_URL）")
+    parser.add_argument("--local-site", action="store_true", help="在本地测试站点上运行")
+    parser.add_argument("--json", type=Path, help="将结果保存为 JSON")
+    parser.add_argument(
+        "--max-error-rate", type=float, help="任一步骤失败率超过该值（0-1）时返回非 0"
+    )
+    args = parser.parse_args()
+
+    if args.users < 1 or args.processes < 1:
+        parser.error("--users 和 --processes 必须大于 0")
+    if args.processes > 36**WORKER_WIDTH:
+        # 每个进程占用员工 ID 中的一个 worker 序号
+        parser.error(f"--processes 不能超过 {36**WORKER_WIDTH}")
+    if not args.duration and args.iterations is None:
+        parser.error("--duration 为 0 时必须指定 --iterations")
+
+    options = {
+        "users": args.users,
+        "processes": args.processes,
+        "ramp_up": args.ramp_up,
+        "duration": args.duration,
+        "iterations": args.iterations,
+        "flow": args.flow,
+        "browser": args.browser,
+        # 所有进程使用同一个运行 ID，员工 ID 只在进程序号上不同
+        "run_id": data_factory.run_id,
+    }
+
+    with LocalSite() if args.local_site else contextlib.nullcontext() as site:
+        options["base_url"] = site.url if site else (args.base_url or settings.BASE_URL)
+        print(
+            f"{options['base_url']}: {args.users} 个用户 / {args.processes} 个进程，"
+            f"流程 {args.flow}\n"
+        )
+        report = run_load(options)
+
+    print_report(report)
+
+    if args.json:
+        args.json.parent.mkdir(parents=True, exist_ok=True)
+        args.json.write_text(json.dumps(report, indent=2), encoding="utf-8")
+        print(f"\n结果已保存: {args.json}")
+
+    if args.max_error_rate is not None:
+        failing = [
+            name for name, s in report["steps"].items() if s["error_rate"] > args.max_error_rate
+        ]
+        if failing:
+            print(f"\n失败率超过 {args.max_error_rate}: {failing}")
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
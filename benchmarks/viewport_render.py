@@ -0,0 +1,164 @@
+"""
+视口渲染开销基准
+比较不同视口和设备像素比下 PIM 员工列表的渲染和截图耗时，
+并检查侧边栏和员工表格是否完整显示，给出完整显示的最小视口（即 throughput 预设）
+
+运行：
+    python -m benchmarks.viewport_render
+    python -m benchmarks.viewport_render --rounds 10 --browser firefox
+"""
+
+import argparse
+import statistics
+import time
+
+from playwright.sync_api import Browser, sync_playwright
+
+from config.settings import VIEWPORT_PRESETS, settings
+from pages.login_page import LoginPage
+from pages.pim_page import PIMPage
+
+# 候选视口：(宽, 高, 设备像素比)，按面积从小到大排列
+CANDIDATES = [
+    (800, 600, 1.0),
+    (1024, 600, 1.0),
+    (1024, 768, 1.0),
+    (1280, 720, 1.0),
+    (1366, 768, 1.0),
+    (1920, 1080, 1.0),
+    (1920, 1080, 2.0),
+]
+
+# 检查侧边栏（含菜单文字）和员工表格（无横向滚动）是否完整显示
+LAYOUT_SCRIPT = """
+() => {
+    const visible = (el) => {
+        if (!el) return false;
+        const rect = el.getBoundingClientRect();
+        return rect.width > 0 && rect.height > 0 && getComputedStyle(el).visibility !== 'hidden';
+    };
+    const panel = document.querySelector('.oxd-sidepanel');
+    const menuText = document.querySelector('.oxd-main-menu-item--name');
+    const table = document.querySelector('.oxd-table');
+    const header = document.querySelector('.oxd-table-header');
+    return {
+        sidebar: visible(panel) && visible(menuText)
+            && panel.getBoundingClientRect().right <= window.innerWidth,
+        table: visible(header) && table.scrollWidth <= table.clientWidth + 1
+            && table.getBoundingClientRect().right <= window.innerWidth,
+    };
+}
+"""
+
+
+def login_state(browser: Browser) -> dict:
+    """
+    登录一次并返回登录状态，各视口共享
+
+    Args:
+        browser: 浏览器实例
+
+    Returns:
+        storage_state
+    """
+    context = browser.new_context(**settings.context_config)
+    try:
+        page = context.new_page()
+        login_page = LoginPage(page)
+        login_page.open().login_as_admin()
+        login_page.wait_for_login_complete()
+        return context.storage_state()
+    finally:
+        context.close()
+
+
+def measure(
+    browser: Browser, state: dict, width: int, height: int, scale: float, rounds: int
+) -> dict:
+    """
+    测量一个视口下的渲染和截图耗时
+
+    Args:
+        browser: 浏览器实例
+        state: 登录状态
+        width: 视口宽度
+        height: 视口高度
+        scale: 设备像素比
+        rounds: 测量轮数
+
+    Returns:
+        测量结果
+    """
+    context = browser.new_context(
+        viewport={"width": width, "height": height},
+        device_scale_factor=scale,
+        storage_state=state,
+        ignore_https_errors=True,
+    )
+    try:
+        page = context.new_page()
+        pim = PIMPage(page)
+        render, screenshot, size = [], [], 0
+        for _ in range(rounds):
+            start = time.perf_counter()
+            pim.open()
+            pim.wait_for_page_load()
+            render.append((time.perf_counter() - start) * 1000)
+
+            start = time.perf_counter()
+            size = len(page.screenshot(full_page=settings.FULL_PAGE_SCREENSHOTS))
+            screenshot.append((time.perf_counter() - start) * 1000)
+        layout = page.evaluate(LAYOUT_SCRIPT)
+    finally:
+        context.close()
+
+    return {
+        "viewport": f"{width}x{height}@{scale:g}x",
+        "area": width * height,
+        "scale": scale,
+        "render_ms": statistics.median(render),
+        "screenshot_ms": statistics.median(screenshot),
+        "screenshot_kb": size / 1024,
+        "full_layout": layout["sidebar"] and layout["table"],
+    }
+
+
+def main() -> None:
+    """运行基准并输出结果"""
+    parser = argparse.ArgumentParser(description="比较不同视口下的渲染和截图耗时")
+    parser.add_argument("--rounds", type=int, default=5, help="每个视口的测量轮数")
+    parser.add_argument(
+        "--browser", default="chromium", choices=["chromium", "firefox", "webkit"]
+    )
+    args = parser.parse_args()
+
+    with sync_playwright() as playwright:
+        browser = getattr(playwright, args.browser).launch(headless=True)
+        try:
+            state = login_state(browser)
+            results = [
+                measure(browser, state, width, height, scale, args.rounds)
+                for width, height, scale in CANDIDATES
+            ]
+        finally:
+            browser.close()
+
+    print(f"{'视口':<20}{'渲染(ms)':>12}{'截图(ms)':>12}{'截图(KB)':>12}  完整显示")
+    for r in results:
+        print(
+            f"{r['viewport']:<20}{r['render_ms']:>12.1f}{r['screenshot_ms']:>12.1f}"
+            f"{r['screenshot_kb']:>12.1f}  {'是' if r['full_layout'] else '否'}"
+        )
+
+    smallest = next((r for r in results if r["full_layout"] and r["scale"] == 1), None)
+    if smallest is None:
+        print("没有候选视口能完整显示侧边栏和员工表格")
+        return
+    print(f"\n完整显示的最小视口: {smallest['viewport']}")
+    width, height = VIEWPORT_PRESETS["throughput"]
+    if smallest["viewport"] != f"{width}x{height}@1x":
+        print(f"当前 throughput 预设为 {width}x{height}，请更新 config/settings.py 中的 VIEWPORT_PRESETS")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,271 @@
+"""
+页面对象封装开销基准
+在本地测试站点（utils/local_site.py）上分别通过 BasePage 封装和 Playwright 原生 API
+执行相同的操作，比较每个操作的耗时，用于发现封装层（allure.step、日志、
+_get_locator、自适应超时、异常重新抛出）的性能回退
+
+每轮交替执行封装和原生版本，取中位数；开销 = 封装中位数 - 原生中位数。
+在 pytest 之外运行，allure.step 没有注册报告监听器，测得的是步骤上下文本身的开销。
+
+运行：
+    python -m benchmarks.wrapper_overhead
+    python -m benchmarks.wrapper_overhead --rounds 200 --json reports/wrapper_overhead.json
+    python -m benchmarks.wrapper_overhead --baseline reports/wrapper_overhead.json  # 与基线比较
+"""
+
+import argparse
+import json
+import statistics
+import sys
+import time
+from collections.abc import Callable
+from pathlib import Path
+
+from playwright.sync_api import Page, sync_playwright
+
+from config.settings import settings
+from pages.login_page import LoginPage
+from pages.pim_page import PIMPage
+from utils.local_site import LocalSite
+
+ID_INPUT = PIMPage.INPUT_EMPLOYEE_ID
+ID_CELLS = f"{PIMPage.TABLE_ROW} {PIMPage.TABLE_CELL}:nth-child(2)"
+FIRST_ROW = f"{PIMPage.TABLE_ROW} >> nth=0"
+
+# 操作名称 -> (封装版本, 原生版本)，两个版本都在已加载的 PIM 员工列表页上执行
+Action = tuple[Callable[[PIMPage], object], Callable[[Page], object]]
+ACTIONS: dict[str, Action] = {
+    "fill": (
+        lambda pim: pim.fill(ID_INPUT, "0001"),
+        lambda page: page.locator(ID_INPUT).fill("0001"),
+    ),
+    "click": (
+        lambda pim: pim.click(ID_INPUT),
+        lambda page: page.locator(ID_INPUT).click(),
+    ),
+    "get_text": (
+        lambda pim: pim.get_text(PIMPage.RECORDS_COUNT),
+        lambda page: page.locator(PIMPage.RECORDS_COUNT).text_content(),
+    ),
+    "get_input_value": (
+        lambda pim: pim.get_input_value(ID_INPUT),
+        lambda page: page.locator(ID_INPUT).input_value(),
+    ),
+    "is_visible": (
+        lambda pim: pim.is_visible(PIMPage.TABLE),
+        lambda page: page.locator(PIMPage.TABLE).wait_for(state="visible"),
+    ),
+    "is_visible_now": (
+        lambda pim: pim.is_visible_now(PIMPage.TABLE),
+        lambda page: page.locator(PIMPage.TABLE).filter(visible=True).count() > 0,
+    ),
+    "wait_for_visible": (
+        lambda pim: pim.wait_for_visible(PIMPage.TABLE),
+        lambda page: page.locator(PIMPage.TABLE).wait_for(state="visible"),
+    ),
+    "get_element_count": (
+        lambda pim: pim.get_element_count(PIMPage.TABLE_ROW),
+        lambda page: page.locator(PIMPage.TABLE_ROW).count(),
+    ),
+    "get_all_texts": (
+        lambda pim: pim.get_all_texts(ID_CELLS),
+        lambda page: page.locator(ID_CELLS).all_text_contents(),
+    ),
+    # 操作序列：按员工 ID 搜索并等待结果
+    "search_sequence": (
+        lambda pim: (
+            pim.fill(ID_INPUT, "0001"),
+            pim.click(PIMPage.SEARCH_BUTTON),
+            pim.wait_for_visible(FIRST_ROW),
+        ),
+        lambda page: (
+            page.locator(ID_INPUT).fill("0001"),
+            page.locator(PIMPage.SEARCH_BUTTON).click(),
+            page.locator(FIRST_ROW).wait_for(state="visible"),
+        ),
+    ),
+    "navigate": (
+        lambda pim: (pim.navigate(pim.url), pim.wait_for_visible(FIRST_ROW)),
+        lambda page: (
+            page.goto(f"{settings.BASE_URL}/web/index.php/pim/viewEmployeeList"),
+            page.locator(FIRST_ROW).wait_for(state="visible"),
+        ),
+    ),
+}
+
+
+def _elapsed_ms(func: Callable, arg) -> float:
+    """执行一次并返回耗时（毫秒）"""
+    start = time.perf_counter()
+    func(arg)
+    return (time.perf_counter() - start) * 1000
+
+
+def measure_login(page: Page, rounds: int) -> dict:
+    """
+    测量登录序列（打开登录页、输入账号密码、等待登录完成）
+
+    Args:
+        page: 页面实例
+        rounds: 测量轮数
+
+    Returns:
+        测量结果
+    """
+
+    def wrapped(page: Page) -> None:
+        LoginPage(page).open().login_as_admin().wait_for_login_complete()
+
+    def raw(page: Page) -> None:
+        page.goto(f"{settings.BASE_URL}/web/index.php/auth/login")
+        page.locator(LoginPage.LOGIN_BUTTON).wait_for(state="visible")
+        page.locator(LoginPage.USERNAME_INPUT).fill(settings.ADMIN_USER)
+        page.locator(LoginPage.PASSWORD_INPUT).fill(settings.ADMIN_PASSWORD)
+        page.locator(LoginPage.LOGIN_BUTTON).click()
+        page.locator(LoginPage.USER_DROPDOWN).wait_for(state="visible")
+
+    wrapped_ms, raw_ms = [], []
+    for _ in range(rounds):
+        page.context.clear_cookies()
+        wrapped_ms.append(_elapsed_ms(wrapped, page))
+        page.context.clear_cookies()
+        raw_ms.append(_elapsed_ms(raw, page))
+    return summarize(wrapped_ms, raw_ms)
+
+
+def measure_action(pim: PIMPage, action: Action, rounds: int, warmup: int) -> dict:
+    """
+    测量一个操作的封装和原生耗时
+
+    Args:
+        pim: 已打开员工列表页的页面对象
+        action: (封装版本, 原生版本)
+        rounds: 测量轮数
+        warmup: 预热轮数（不计入结果）
+
+    Returns:
+        测量结果
+    """
+    wrapped, raw = action
+    wrapped_ms, raw_ms = [], []
+    for index in range(warmup + rounds):
+        # 交替执行，使两个版本受到相同的环境波动影响
+        w = _elapsed_ms(wrapped, pim)
+        r = _elapsed_ms(raw, pim.page)
+        if index >= warmup:
+            wrapped_ms.append(w)
+            raw_ms.append(r)
+    return summarize(wrapped_ms, raw_ms)
+
+
+def summarize(wrapped_ms: list[float], raw_ms: list[float]) -> dict:
+    """
+    汇总耗时样本
+
+    Args:
+        wrapped_ms: 封装版本耗时
+        raw_ms: 原生版本耗时
+
+    Returns:
+        中位数和开销（毫秒）
+    """
+    wrapped = statistics.median(wrapped_ms)
+    raw = statistics.median(raw_ms)
+    return {
+        "wrapped_ms": wrapped,
+        "raw_ms": raw,
+        "overhead_ms": wrapped - raw,
+        "overhead_pct": (wrapped - raw) / raw * 100 if raw else 0.0,
+    }
+
+
+def find_regressions(
+    results: dict, max_overhead_ms: float | None, baseline: dict | None, tolerance_ms: float
+) -> list[str]:
+    """
+    检查开销是否超出阈值或比基线增加过多
+
+    Args:
+        results: 测量结果
+        max_overhead_ms: 单个操作允许的最大开销，None 表示不检查
+        baseline: 基线结果（--json 保存的文件内容），None 表示不比较
+        tolerance_ms: 相对基线允许增加的开销
+
+    Returns:
+        回退描述列表
+    """
+    regressions = []
+    for name, result in results.items():
+        overhead = result["overhead_ms"]
+        if max_overhead_ms is not None and overhead > max_overhead_ms:
+            regressions.append(f"{name}: 开销 {overhead:.2f}ms 超过阈值 {max_overhead_ms}ms")
+        if baseline and name in baseline:
+            limit = baseline[name]["overhead_ms"] + tolerance_ms
+            if overhead > limit:
+                regressions.append(
+                    f"{name}: 开销 {overhead:.2f}ms 比基线 "
+                    f"{baseline[name]['overhead_ms']:.2f}ms 增加超过 {tolerance_ms}ms"
+                )
+    return regressions
+
+
+def main() -> None:
+    """运行基准并输出结果"""
+    parser = argparse.ArgumentParser(description="比较 BasePage 封装与 Playwright 原生 API 的耗时")
+    parser.add_argument("--rounds", type=int, default=50, help="每个操作的测量轮数")
+    parser.add_argument("--warmup", type=int, default=5, help="每个操作的预热轮数")
+    parser.add_argument(
+        "--browser", default="chromium", choices=["chromium", "firefox", "webkit"]
+    )
+    parser.add_argument("--json", type=Path, help="将结果保存为 JSON（可作为之后的基线）")
+    parser.add_argument("--baseline", type=Path, help="与之前保存的结果比较")
+    parser.add_argument(
+        "--tolerance-ms", type=float, default=0.5, help="相对基线允许增加的开销（毫秒）"
+    )
+    parser.add_argument(
+        "--max-overhead-ms", type=float, help="单个操作允许的最大开销（毫秒），超过时返回非 0"
+    )
+    args = parser.parse_args()
+
+    baseline = json.loads(args.baseline.read_text(encoding="utf-8")) if args.baseline else None
+
+    with (
+        LocalSite() as site,
+        settings.override(BASE_URL=site.url),
+        sync_playwright() as playwright,
+    ):
+        browser = getattr(playwright, args.browser).launch(headless=True)
+        try:
+            context = browser.new_context(**settings.context_config)
+            page = context.new_page()
+            results = {"login_sequence": measure_login(page, args.rounds)}
+
+            pim = PIMPage(page).open()
+            for name, action in ACTIONS.items():
+                results[name] = measure_action(pim, action, args.rounds, args.warmup)
+            context.close()
+        finally:
+            browser.close()
+
+    print(f"{'操作':<20}{'封装(ms)':>12}{'原生(ms)':>12}{'开销(ms)':>12}{'开销(%)':>10}")
+    for name, r in results.items():
+        print(
+            f"{name:<20}{r['wrapped_ms']:>12.2f}{r['raw_ms']:>12.2f}"
+            f"{r['overhead_ms']:>12.2f}{r['overhead_pct']:>10.1f}"
+        )
+
+    if args.json:
+        args.json.parent.mkdir(parents=True, exist_ok=True)
+        args.json.write_text(json.dumps(results, indent=2), encoding="utf-8")
+        print(f"\n结果已保存: {args.json}")
+
+    regressions = find_regressions(results, args.max_overhead_ms, baseline, args.tolerance_ms)
+    if regressions:
+        print("\n封装开销回退:")
+        for line in regressions:
+            print(f"  {line}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -12,18 +12,116 @@
 1. 复制 .env.example 为 .env
 2. 修改 .env 中的目标系统配置
 3. 框架会自动加载环境变量覆盖默认值
+
+配置快照：
+- 每个进程导入本模块时读取一次环境变量，创建全局实例 settings 时完成验证，
+  并预先计算浏览器启动配置和上下文配置，之后的访问不再读取环境变量或构建字典
+- settings 是只读的，测试中需要临时修改配置时使用 settings.override()
+- 设置 TEST_ENV 后，.env.<TEST_ENV> 中的配置覆盖 .env（进程环境变量优先级最高）
+
+运行配置档（RUN_PROFILE 或命令行参数 --profile）：
+一次切换一组配置，如 fast-ci（吞吐优先）和 debug（便于排查）。
+优先级：进程环境变量 > 配置档 > .env.<TEST_ENV> > .env > 代码中的默认值
 """
 
 import os
+from collections.abc import Iterator, Mapping
+from contextlib import contextmanager
+from functools import cache
 from pathlib import Path
+from types import MappingProxyType
 
-from dotenv import load_dotenv
-
-# 加载 .env 文件
-load_dotenv()
+from dotenv import dotenv_values
 
 # 项目根目录
-PROJECT_ROOT = Path(__file__).parent.parent
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+
+
+# 视口预设：名称 -> (宽, 高)，用于 @pytest.mark.viewport("名称")
+VIEWPORT_PRESETS: dict[str, tuple[int, int]] = {
+    "desktop": (1920, 1080),
+    "laptop": (1366, 768),
+    "compact": (1280, 720),
+    # OrangeHRM 完整显示侧边栏和员工表格（无横向滚动）的最小视口，
+    # 由 benchmarks/viewport_render.py 测得，系统版本升级后请重新测量
+    "throughput": (1024, 768),
+}
+
+# 运行配置档：名称 -> 配置项
+RUN_PROFILES: dict[str, dict[str, object]] = {
+    # CI 吞吐优先：无头、拦截图片和媒体、小视口、通过 API 准备前置数据、短超时、只截可视区域
+    "fast-ci": {
+        "HEADLESS": True,
+        "SLOW_MO": 0,
+        "BLOCK_RESOURCES": True,
+        "VIEWPORT_WIDTH": VIEWPORT_PRESETS["compact"][0],
+        "VIEWPORT_HEIGHT": VIEWPORT_PRESETS["compact"][1],
+        "API_SEEDING": True,
+        "TIMEOUT": 10000,
+        "FULL_PAGE_SCREENSHOTS": False,
+        "TRACING": False,
+    },
+    # 渲染开销最小：页面仍完整显示的最小视口、1 倍像素密度、拦截图片和媒体、只截可视区域
+    "throughput": {
+        "HEADLESS": True,
+        "SLOW_MO": 0,
+        "BLOCK_RESOURCES": True,
+        "VIEWPORT_WIDTH": VIEWPORT_PRESETS["throughput"][0],
+        "VIEWPORT_HEIGHT": VIEWPORT_PRESETS["throughput"][1],
+        "DEVICE_SCALE_FACTOR": 1.0,
+        "FULL_PAGE_SCREENSHOTS": False,
+        "TRACING": False,
+    },
+    # 本地排查：有头、慢动作、记录 Playwright 追踪
+    "debug": {
+        "HEADLESS": False,
+        "SLOW_MO": 250,
+        "BLOCK_RESOURCES": False,
+        "TRACING": True,
+        "FULL_PAGE_SCREENSHOTS": True,
+    },
+}
+
+
+def _load_environment() -> frozenset[str]:
+    """
+    将 .env 和环境覆盖文件 .env.<TEST_ENV> 中的配置加载到环境变量
+
+    优先级：进程环境变量 > .env.<TEST_ENV> > .env，已存在的环境变量不会被覆盖
+
+    Returns:
+        由文件加载的环境变量名（不包括进程中已存在的环境变量）
+    """
+    values = dotenv_values(PROJECT_ROOT / ".env")
+    test_env = os.getenv("TEST_ENV") or values.get("TEST_ENV")
+    if test_env:
+        values.update(dotenv_values(PROJECT_ROOT / f".env.{test_env}"))
+
+    loaded = set()
+    for key, value in values.items():
+        if value is not None and key not in os.environ:
+            os.environ[key] = value
+            loaded.add(key)
+    return frozenset(loaded)
+
+
+@cache
+def _ensure_dir(path: Path) -> Path:
+    """
+    创建目录（每个进程每个目录只执行一次）
+
+    Args:
+        path: 目录路径
+
+    Returns:
+        目录路径
+    """
+    path.mkdir(parents=True, exist_ok=True)
+    return path
+
+
+# 加载 .env 文件，记录由文件提供的配置项（配置档可以覆盖这些配置项）
+_DOTENV_KEYS = _load_environment()
 
 
 class Settings:
@@ -33,6 +131,15 @@ class Settings:
     # 目标系统配置（需要根据你的测试系统修改）
     # ==========================================================================
 
+    # 运行配置档名称（见 RUN_PROFILES），为空表示不使用配置档
+    # 可通过命令行参数 --profile 覆盖
+    RUN_PROFILE: str = os.getenv("RUN_PROFILE", "")
+
+    # 测试环境名称（如 staging），为空表示不区分环境
+    # 设置后会加载 .env.<TEST_ENV> 中的配置，
+    # 并合并 data/test_data.<TEST_ENV>.json 中的环境覆盖数据（文件存在时）
+    TEST_ENV: str = os.getenv("TEST_ENV", "")
+
     # 测试目标网站 URL
     # 示例默认值为 OrangeHRM Demo，请修改为你的测试系统 URL
     BASE_URL: str = os.getenv("BASE_URL", "https://opensource-demo.orangehrmlive.com")
@@ -60,6 +167,34 @@ class Settings:
     # 默认 30 秒，适用于大多数场景
     TIMEOUT: int = int(os.getenv("TIMEOUT", "30000"))
 
+    # 自适应超时
+    # 启用后根据历史操作耗时为每个操作推导超时时间（p99 × 系数，限制在下限和 TIMEOUT 之间），
+    # 出现故障时可在数秒内失败，而不是等待全局超时
+    ADAPTIVE_TIMEOUT: bool = os.getenv("ADAPTIVE_TIMEOUT", "false").lower() == "true"
+    ADAPTIVE_TIMEOUT_PERCENTILE: float = float(os.getenv("ADAPTIVE_TIMEOUT_PERCENTILE", "99"))
+    ADAPTIVE_TIMEOUT_FACTOR: float = float(os.getenv("ADAPTIVE_TIMEOUT_FACTOR", "3.0"))
+    ADAPTIVE_TIMEOUT_FLOOR: int = int(os.getenv("ADAPTIVE_TIMEOUT_FLOOR", "2000"))
+    ADAPTIVE_TIMEOUT_MIN_SAMPLES: int = int(os.getenv("ADAPTIVE_TIMEOUT_MIN_SAMPLES", "5"))
+    ADAPTIVE_TIMEOUT_FILE: Path = PROJECT_ROOT / "data" / "timing" / "action_latency.json"
+
+    # 定位器命中统计
+    # 启用后在会话结束时持久化每个逻辑元素的候选选择器命中统计，
+    # 后续运行中反复匹配失败的候选会被移到末尾（其余候选保持声明顺序）
+    LOCATOR_STATS: bool = os.getenv("LOCATOR_STATS", "false").lower() == "true"
+    LOCATOR_STATS_FILE: Path = PROJECT_ROOT / "data" / "timing" / "locator_stats.json"
+
+    # 页面性能指标
+    # 启用后每次页面导航完成时采集 Navigation/Resource Timing、LCP/CLS 和 CDP 指标（仅 Chromium），
+    # 附加到 Allure 报告，并在会话结束时按页面汇总到统计文件（保留最近 PAGE_METRICS_HISTORY 次运行）
+    PAGE_METRICS: bool = os.getenv("PAGE_METRICS", "false").lower() == "true"
+    PAGE_METRICS_HISTORY: int = int(os.getenv("PAGE_METRICS_HISTORY", "20"))
+    PAGE_METRICS_FILE: Path = PROJECT_ROOT / "data" / "timing" / "page_metrics.json"
+
+    # 参考数据缓存（国籍、国家、职位、雇佣状态等下拉选项）
+    # 每个会话只加载一次，缓存文件在有效期内供后续运行复用
+    REFERENCE_DATA_TTL: float = float(os.getenv("REFERENCE_DATA_TTL", "24"))  # 小时
+    REFERENCE_DATA_FILE: Path = PROJECT_ROOT / "data" / "cache" / "reference_data.json"
+
     # 无头模式
     # true: 后台运行，适用于 CI/CD
     # false: 显示浏览器窗口，适用于调试
@@ -74,9 +209,47 @@ class Settings:
     VIEWPORT_WIDTH: int = int(os.getenv("VIEWPORT_WIDTH", "1920"))
     VIEWPORT_HEIGHT: int = int(os.getenv("VIEWPORT_HEIGHT", "1080"))
 
+    # 设备像素比（大于 1 时截图和渲染的像素数成倍增加）
+    # 单个测试可通过 @pytest.mark.viewport(..., device_scale_factor=2) 覆盖
+    DEVICE_SCALE_FACTOR: float = float(os.getenv("DEVICE_SCALE_FACTOR", "1"))
+
     # 截图设置
     # 测试失败时自动截图，便于问题排查
     SCREENSHOT_ON_FAILURE: bool = os.getenv("SCREENSHOT_ON_FAILURE", "true").lower() == "true"
+    # 截取整个页面（false 时只截取可视区域，速度更快、文件更小）
+    FULL_PAGE_SCREENSHOTS: bool = os.getenv("FULL_PAGE_SCREENSHOTS", "true").lower() == "true"
+
+    # 拦截图片和媒体请求（不影响页面结构，减少带宽和渲染开销）
+    BLOCK_RESOURCES: bool = os.getenv("BLOCK_RESOURCES", "false").lower() == "true"
+
+    # 记录 Playwright 追踪（每个上下文一个 zip 文件，可用 playwright show-trace 查看）
+    TRACING: bool = os.getenv("TRACING", "false").lower() == "true"
+    TRACE_DIR: Path = PROJECT_ROOT / "reports" / "traces"
+
+    # 通过 API 创建测试前置数据（如待编辑的员工），比通过 UI 创建快得多
+    API_SEEDING: bool = os.getenv("API_SEEDING", "false").lower() == "true"
+
+    # ==========================================================================
+    # 数据集配置
+    # ==========================================================================
+
+    # JSONL/CSV 数据集目录（大规模数据驱动测试）
+    DATASET_DIR: Path = PROJECT_ROOT / "data" / "datasets"
+
+    # 数据集参数化分片，格式为 "序号/总数"（如 "2/4"），用于在多个 CI 任务间拆分用例
+    # 为空表示不分片
+    DATASET_SHARD: str = os.getenv("DATASET_SHARD", "")
+
+    # ==========================================================================
+    # 测试数据生成配置
+    # ==========================================================================
+
+    # 自动化测试创建的数据（员工姓名、员工 ID、用户名）的标识前缀
+    # 清理工具按此前缀识别测试遗留的数据，请勿与真实数据的命名冲突
+    TEST_DATA_PREFIX: str = os.getenv("TEST_DATA_PREFIX", "at")
+
+    # 运行 ID，同一次运行的所有 worker 共享；为空时使用 xdist 的测试运行 ID 或随机值
+    TEST_RUN_ID: str = os.getenv("TEST_RUN_ID", "")
 
     # ==========================================================================
     # Session 复用配置
@@ -93,31 +266,138 @@ class Settings:
     # 可通过命令行参数 --reuse-session 覆盖
     REUSE_SESSION: bool = os.getenv("REUSE_SESSION", "false").lower() == "true"
 
+    # ==========================================================================
+    # 页面复用配置
+    # ==========================================================================
+
+    # 是否在测试之间复用页面（重置后交给同一 worker 的下一个测试）
+    # 启用后可省去每个测试创建/关闭页面和上下文的开销
+    # 可通过命令行参数 --recycle-pages 覆盖
+    RECYCLE_PAGES: bool = os.getenv("RECYCLE_PAGES", "false").lower() == "true"
+
+    # 多标签页并发操作（utils/concurrent_tabs.py）时同一上下文最多同时打开的标签页数
+    MAX_CONCURRENT_TABS: int = int(os.getenv("MAX_CONCURRENT_TABS", "4"))
+
     # ==========================================================================
     # 方法
     # ==========================================================================
 
-    @classmethod
-    def get_browser_config(cls) -> dict:
-        """获取浏览器启动配置"""
-        return {
-            "headless": cls.HEADLESS,
-            "slow_mo": cls.SLOW_MO,
-        }
+    # 预先计算的浏览器启动配置和上下文配置（只读，创建实例时计算）
+    browser_config: Mapping
+    context_config: Mapping
 
-    @classmethod
-    def get_context_config(cls) -> dict:
-        """获取浏览器上下文配置"""
-        return {
+    def __init__(self):
+        """
+        创建配置快照：验证配置，并预先计算浏览器启动配置和上下文配置
+
+        Raises:
+            ValueError: 如果配置验证失败或配置档不存在
+        """
+        if self.RUN_PROFILE:
+            self._apply_profile(self.RUN_PROFILE)
+        self.validate()
+        self._precompute()
+
+    def __setattr__(self, name: str, value) -> None:
+        raise AttributeError(f"配置是只读的，不能修改 {name}；测试中请使用 settings.override()")
+
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError(f"配置是只读的，不能删除 {name}")
+
+    def _precompute(self) -> None:
+        """预先计算浏览器启动配置和上下文配置"""
+        browser_config = {
+            "headless": self.HEADLESS,
+            "slow_mo": self.SLOW_MO,
+        }
+        context_config = {
             "viewport": {
-                "width": cls.VIEWPORT_WIDTH,
-                "height": cls.VIEWPORT_HEIGHT,
+                "width": self.VIEWPORT_WIDTH,
+                "height": self.VIEWPORT_HEIGHT,
             },
+            "device_scale_factor": self.DEVICE_SCALE_FACTOR,
             "ignore_https_errors": True,
         }
+        # 浏览器启动配置（只读，可直接用于 browser_type.launch(**settings.browser_config)）
+        object.__setattr__(self, "browser_config", MappingProxyType(browser_config))
+        # 上下文配置（只读，可直接用于 browser.new_context(**settings.context_config)）
+        object.__setattr__(self, "context_config", MappingProxyType(context_config))
+
+    def _apply_profile(self, name: str) -> None:
+        """
+        应用运行配置档（进程环境变量中显式设置的配置项保持不变）
+
+        Args:
+            name: 配置档名称
 
-    @classmethod
-    def get_session_file_path(cls, username: str | None = None) -> Path:
+        Raises:
+            ValueError: 配置档不存在
+        """
+        if name not in RUN_PROFILES:
+            raise ValueError(f"运行配置档不存在: {name}，可用的配置档: {list(RUN_PROFILES)}")
+        for key, value in RUN_PROFILES[name].items():
+            if key in os.environ and key not in _DOTENV_KEYS:
+                continue
+            object.__setattr__(self, key, value)
+        object.__setattr__(self, "RUN_PROFILE", name)
+
+    def use_profile(self, name: str) -> None:
+        """
+        切换运行配置档（在会话开始前调用，如 pytest_configure 中处理 --profile 参数）
+
+        Args:
+            name: 配置档名称
+
+        Raises:
+            ValueError: 配置档不存在或应用后的配置验证失败
+        """
+        self._apply_profile(name)
+        self.validate()
+        self._precompute()
+
+    @contextmanager
+    def override(self, **values) -> Iterator["Settings"]:
+        """
+        临时覆盖配置项（用于测试），退出时恢复原值并重新计算派生配置
+
+        Args:
+            **values: 配置项名称 -> 临时值
+
+        Yields:
+            配置实例
+
+        Raises:
+            AttributeError: 配置项不存在
+            ValueError: 覆盖后的配置验证失败
+        """
+        unknown = [name for name in values if not (name.isupper() and hasattr(self, name))]
+        if unknown:
+            raise AttributeError(f"配置项不存在: {unknown}")
+
+        previous = {name: self.__dict__[name] for name in values if name in self.__dict__}
+        for name, value in values.items():
+            object.__setattr__(self, name, value)
+        try:
+            self.validate()
+            self._precompute()
+            yield self
+        finally:
+            for name in values:
+                if name in previous:
+                    object.__setattr__(self, name, previous[name])
+                else:
+                    object.__delattr__(self, name)
+            self._precompute()
+
+    def get_browser_config(self) -> dict:
+        """获取浏览器启动配置（可修改的副本）"""
+        return dict(self.browser_config)
+
+    def get_context_config(self) -> dict:
+        """获取浏览器上下文配置（可修改的副本，如添加 storage_state）"""
+        return {**self.context_config, "viewport": dict(self.context_config["viewport"])}
+
+    def get_session_file_path(self, username: str | None = None) -> Path:
         """
         获取 Session 文件路径
 
@@ -128,15 +408,14 @@ class Settings:
         Returns:
             Session 文件完整路径
         """
-        # 确保 session 目录存在
-        cls.SESSION_DIR.mkdir(parents=True, exist_ok=True)
+        # 确保 session 目录存在（每个进程只创建一次）
+        _ensure_dir(self.SESSION_DIR)
 
         if username:
-            return cls.SESSION_DIR / f"{username}_session.json"
-        return cls.SESSION_DIR / cls.SESSION_FILE
+            return self.SESSION_DIR / f"{username}_session.json"
+        return self.SESSION_DIR / self.SESSION_FILE
 
-    @classmethod
-    def validate(cls) -> None:
+    def validate(self) -> None:
         """
         验证配置有效性
 
@@ -145,17 +424,46 @@ class Settings:
         """
         errors = []
 
-        if not cls.BASE_URL.startswith(("http://", "https://")):
-            errors.append(f"BASE_URL 格式无效: {cls.BASE_URL}")
+        if not self.BASE_URL.startswith(("http://", "https://")):
+            errors.append(f"BASE_URL 格式无效: {self.BASE_URL}")
+
+        if self.TIMEOUT <= 0:
+            errors.append(f"TIMEOUT 必须大于 0: {self.TIMEOUT}")
+
+        if self.VIEWPORT_WIDTH <= 0 or self.VIEWPORT_HEIGHT <= 0:
+            errors.append(f"VIEWPORT 尺寸无效: {self.VIEWPORT_WIDTH}x{self.VIEWPORT_HEIGHT}")
+
+        if self.DEVICE_SCALE_FACTOR <= 0:
+            errors.append(f"DEVICE_SCALE_FACTOR 必须大于 0: {self.DEVICE_SCALE_FACTOR}")
+
+        if self.SLOW_MO < 0:
+            errors.append(f"SLOW_MO 不能为负数: {self.SLOW_MO}")
+
+        if not 0 < self.ADAPTIVE_TIMEOUT_PERCENTILE <= 100:
+            errors.append(
+                f"ADAPTIVE_TIMEOUT_PERCENTILE 必须在 (0, 100] 之间: {self.ADAPTIVE_TIMEOUT_PERCENTILE}"
+            )
+
+        if self.ADAPTIVE_TIMEOUT_FACTOR < 1:
+            errors.append(f"ADAPTIVE_TIMEOUT_FACTOR 不能小于 1: {self.ADAPTIVE_TIMEOUT_FACTOR}")
+
+        if self.MAX_CONCURRENT_TABS < 1:
+            errors.append(f"MAX_CONCURRENT_TABS 必须大于 0: {self.MAX_CONCURRENT_TABS}")
+
+        if self.PAGE_METRICS_HISTORY < 1:
+            errors.append(f"PAGE_METRICS_HISTORY 必须大于 0: {self.PAGE_METRICS_HISTORY}")
 
-        if cls.TIMEOUT <= 0:
-            errors.append(f"TIMEOUT 必须大于 0: {cls.TIMEOUT}")
+        if self.REFERENCE_DATA_TTL < 0:
+            errors.append(f"REFERENCE_DATA_TTL 不能为负数: {self.REFERENCE_DATA_TTL}")
 
-        if cls.VIEWPORT_WIDTH <= 0 or cls.VIEWPORT_HEIGHT <= 0:
-            errors.append(f"VIEWPORT 尺寸无效: {cls.VIEWPORT_WIDTH}x{cls.VIEWPORT_HEIGHT}")
+        # 生成的员工 ID 为 前缀 + "-" + 7 位，OrangeHRM 员工 ID 最长 10 个字符
+        if not (self.TEST_DATA_PREFIX.isalnum() and len(self.TEST_DATA_PREFIX) <= 2):
+            errors.append(f"TEST_DATA_PREFIX 必须是 1-2 位字母或数字: {self.TEST_DATA_PREFIX}")
 
-        if cls.SLOW_MO < 0:
-            errors.append(f"SLOW_MO 不能为负数: {cls.SLOW_MO}")
+        if self.DATASET_SHARD:
+            number, _, count = self.DATASET_SHARD.partition("/")
+            if not (number.isdigit() and count.isdigit() and 1 <= int(number) <= int(count)):
+                errors.append(f"DATASET_SHARD 格式无效（应为 序号/总数）: {self.DATASET_SHARD}")
 
         if errors:
             raise ValueError("配置验证失败:\n" + "\n".join(f"  - {e}" for e in errors))
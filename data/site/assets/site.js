@@ -0,0 +1,189 @@
+/*
+ * 本地测试站点的公共脚本
+ * 提供侧边栏、Toast、加载指示器、删除确认对话框、oxd-select 下拉框和员工 API 调用，
+ * 行为与 OrangeHRM 一致：操作期间显示 .oxd-loading-spinner，完成后显示 .oxd-toast
+ * 并在数秒后自动消失；保存后跳转的页面在加载时显示上一页留下的 Toast
+ */
+
+const LOADING_MS = 100;
+const TOAST_MS = 2000;
+const EMPLOYEE_API = "/web/index.php/api/v2/pim/employees";
+const MENU_ITEMS = [
+    ["Admin", "/web/index.php/admin/viewAdminModule"],
+    ["PIM", "/web/index.php/pim/viewEmployeeList"],
+    ["Leave", "/web/index.php/leave/viewLeaveModule"],
+    ["Time", "/web/index.php/time/viewTimeModule"],
+    ["Recruitment", "/web/index.php/recruitment/viewRecruitmentModule"],
+    ["My Info", "/web/index.php/pim/viewMyDetails"],
+    ["Performance", "/web/index.php/performance/viewPerformanceModule"],
+    ["Dashboard", "/web/index.php/dashboard/index"],
+    ["Directory", "/web/index.php/directory/viewDirectory"],
+    ["Maintenance", "/web/index.php/maintenance/viewMaintenanceModule"],
+    ["Claim", "/web/index.php/claim/viewClaimModule"],
+    ["Buzz", "/web/index.php/buzz/viewBuzz"],
+];
+
+function escapeHtml(text) {
+    const div = document.createElement("div");
+    div.textContent = text;
+    return div.innerHTML;
+}
+
+/* 渲染侧边栏菜单，active 为当前模块名称 */
+function renderSidebar(active) {
+    document.querySelector(".oxd-sidepanel").innerHTML = `
+        <div class="oxd-main-menu-search"><input class="oxd-input" placeholder="Search"></div>
+        <ul class="oxd-main-menu">${MENU_ITEMS.map(([name, href]) => `
+            <li class="oxd-main-menu-item-wrapper">
+                <a class="oxd-main-menu-item${name === active ? " active" : ""}" href="${href}">
+                    <span class="oxd-text oxd-text--span oxd-main-menu-item--name">${name}</span>
+                </a>
+            </li>`).join("")}
+        </ul>`;
+}
+
+/* ==================== Toast 和加载指示器 ==================== */
+
+function showToast(message, type = "success") {
+    let container = document.querySelector(".oxd-toast-container");
+    if (!container) {
+        container = document.createElement("div");
+        container.className = "oxd-toast-container";
+        document.body.appendChild(container);
+    }
+    const toast = document.createElement("div");
+    toast.className = `oxd-toast oxd-toast--${type}`;
+    toast.innerHTML = `<p class="oxd-text oxd-text--p oxd-text--toast-title">${
+        type === "success" ? "Success" : "Error"
+    }</p><p class="oxd-text oxd-text--p oxd-text--toast-message">${escapeHtml(message)}</p>`;
+    container.appendChild(toast);
+    setTimeout(() => toast.remove(), TOAST_MS);
+}
+
+/* 跳转到 url，并在新页面加载后显示 Toast */
+function redirectWithToast(url, message) {
+    sessionStorage.setItem("orangehrm.toast", message);
+    location.href = url;
+}
+
+function showPendingToast() {
+    const message = sessionStorage.getItem("orangehrm.toast");
+    if (message) {
+        sessionStorage.removeItem("orangehrm.toast");
+        showToast(message);
+    }
+}
+
+/* 在 target 中显示加载指示器，至少 LOADING_MS 后移除，返回 work 的结果 */
+async function withLoader(target, work) {
+    const spinner = document.createElement("div");
+    spinner.className = "oxd-loading-spinner";
+    target.appendChild(spinner);
+    try {
+        const [result] = await Promise.all([
+            work(),
+            new Promise((resolve) => setTimeout(resolve, LOADING_MS)),
+        ]);
+        return result;
+    } finally {
+        spinner.remove();
+    }
+}
+
+/* 显示删除确认对话框，确认时执行 onConfirm */
+function confirmDelete(onConfirm) {
+    const container = document.createElement("div");
+    container.className = "oxd-dialog-container";
+    container.innerHTML = `
+        <div class="oxd-dialog-sheet orangehrm-dialog-popup" role="dialog">
+            <p class="oxd-text oxd-text--p oxd-text--card-title">Are you Sure?</p>
+            <p class="oxd-text oxd-text--p oxd-text--card-body">
+                The selected record will be permanently deleted. Are you sure you want to continue?
+            </p>
+            <div class="orangehrm-modal-footer">
+                <button type="button" class="oxd-button oxd-button--medium oxd-button--text">
+                    No, Cancel
+                </button>
+                <button type="button" class="oxd-button oxd-button--medium oxd-button--label-danger">
+                    Yes, Delete
+                </button>
+            </div>
+        </div>`;
+    container.querySelector(".oxd-button--text").onclick = () => container.remove();
+    container.querySelector(".oxd-button--label-danger").onclick = () => {
+        container.remove();
+        onConfirm();
+    };
+    document.body.appendChild(container);
+}
+
+/* ==================== 员工 API ==================== */
+
+async function api(path, method = "GET", body = undefined) {
+    const response = await fetch(path, {
+        method,
+        headers: body === undefined ? {} : { "Content-Type": "application/json" },
+        body: body === undefined ? undefined : JSON.stringify(body),
+    });
+    const payload = await response.json();
+    if (!response.ok) throw new Error(payload.error || response.statusText);
+    return payload.data;
+}
+
+function fullName(employee) {
+    return [employee.firstName, employee.middleName, employee.lastName].filter(Boolean).join(" ");
+}
+
+/* ==================== oxd-select 下拉框 ==================== */
+
+/*
+ * 下拉框写法：<div class="oxd-select-wrapper" data-catalog="nationalities">
+ * 选项来自 reference.json 中的同名目录，第一个选项为 "-- Select --"
+ */
+const reference = fetch("/assets/reference.json").then((response) => response.json());
+
+function selectWrapper(catalog, value = "") {
+    return `
+        <div class="oxd-select-wrapper" data-catalog="${catalog}">
+            <div class="oxd-select-text oxd-select-text--active" tabindex="0">${
+                escapeHtml(value || "-- Select --")}</div>
+        </div>`;
+}
+
+function selectValue(wrapper) {
+    const text = wrapper.querySelector(".oxd-select-text").textContent.trim();
+    return text === "-- Select --" ? "" : text;
+}
+
+function closeDropdowns() {
+    document.querySelectorAll(".oxd-select-dropdown").forEach((dropdown) => dropdown.remove());
+}
+
+document.addEventListener("click", async (event) => {
+    const option = event.target.closest(".oxd-select-option");
+    if (option) {
+        const wrapper = option.closest(".oxd-select-wrapper");
+        wrapper.querySelector(".oxd-select-text").textContent = option.textContent.trim();
+        closeDropdowns();
+        wrapper.dispatchEvent(new Event("change", { bubbles: true }));
+        return;
+    }
+    const text = event.target.closest(".oxd-select-text");
+    const wasOpen = text && text.parentElement.querySelector(".oxd-select-dropdown");
+    closeDropdowns();
+    if (!text || wasOpen) return;
+
+    const wrapper = text.parentElement;
+    const options = ["-- Select --", ...(await reference)[wrapper.dataset.catalog]];
+    const dropdown = document.createElement("div");
+    dropdown.className = "oxd-select-dropdown";
+    dropdown.setAttribute("role", "listbox");
+    dropdown.innerHTML = options.map(
+        (name) => `<div class="oxd-select-option" role="option">${escapeHtml(name)}</div>`
+    ).join("");
+    wrapper.appendChild(dropdown);
+});
+
+document.addEventListener("keydown", (event) => {
+    if (event.key === "Escape") closeDropdowns();
+});
@@ -1,13 +1,39 @@
 """
 Page Objects 模块
 提供 OrangeHRM 系统各页面的页面对象
+
+页面模块在首次访问时才导入（如 `from pages import LoginPage` 或 `pages.PIMPage`），
+只用到登录页的测试不会为其他页面对象付出导入开销。
+
+Async* 为基于 playwright.async_api 的异步版本，与同名同步页面对象共用选择器。
 """
 
-from pages.base_page import BasePage
-from pages.dashboard_page import DashboardPage
-from pages.employee_form_page import EmployeeFormPage
-from pages.login_page import LoginPage
-from pages.pim_page import PIMPage
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from pages.async_base_page import AsyncBasePage
+    from pages.async_employee_form_page import AsyncEmployeeFormPage
+    from pages.async_login_page import AsyncLoginPage
+    from pages.async_pim_page import AsyncPIMPage
+    from pages.base_page import BasePage
+    from pages.dashboard_page import DashboardPage
+    from pages.employee_form_page import EmployeeFormPage
+    from pages.login_page import LoginPage
+    from pages.pim_page import PIMPage
+
+# 导出名称 -> 所在模块
+_LAZY_EXPORTS = {
+    "BasePage": "pages.base_page",
+    "LoginPage": "pages.login_page",
+    "DashboardPage": "pages.dashboard_page",
+    "PIMPage": "pages.pim_page",
+    "EmployeeFormPage": "pages.employee_form_page",
+    "AsyncBasePage": "pages.async_base_page",
+    "AsyncLoginPage": "pages.async_login_page",
+    "AsyncPIMPage": "pages.async_pim_page",
+    "AsyncEmployeeFormPage": "pages.async_employee_form_page",
+}
 
 __all__ = [
     "BasePage",
@@ -15,4 +41,34 @@ __all__ = [
     "DashboardPage",
     "PIMPage",
     "EmployeeFormPage",
+    "AsyncBasePage",
+    "AsyncLoginPage",
+    "AsyncPIMPage",
+    "AsyncEmployeeFormPage",
 ]
+
+
+def __getattr__(name: str):
+    """
+    首次访问页面对象时导入其模块
+
+    Args:
+        name: 导出名称
+
+    Returns:
+        页面对象类
+
+    Raises:
+        AttributeError: 名称不存在
+    """
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module 'pages' has no attribute '{name}'")
+    value = getattr(importlib.import_module(module_name), name)
+    # 缓存到模块命名空间，之后的访问不再经过 __getattr__
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
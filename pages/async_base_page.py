@@ -0,0 +1,627 @@
+"""
+AsyncBasePage - 异步 Page Object 基类
+
+[框架核心] 此文件是框架的核心组件，可直接复用于任何项目。
+
+功能说明：
+- 基于 playwright.async_api 提供与 BasePage 相同的页面交互接口（方法均为协程）
+- 与 BasePage 共用选择器描述、自适应超时和定位器注册表，日志格式一致
+- 多个页面的等待可以通过 asyncio.gather 交错进行，而不是逐个阻塞
+
+使用方法：
+异步页面对象继承此基类和对应同步页面的元素类，共用选择器，示例：
+
+    from pages.async_base_page import AsyncBasePage, async_step
+
+    class AsyncYourPage(YourElements, AsyncBasePage):
+        @async_step("打开页面")
+        async def open(self) -> "AsyncYourPage":
+            await self.navigate(self.url)
+            return self
+
+注意：allure.step 不支持协程函数，异步方法请使用 async_step。
+并发执行的多个协程的步骤会交替记录在同一个测试中。
+"""
+
+import functools
+import time
+from collections.abc import Callable
+
+import allure
+from allure_commons.utils import func_parameters, represent
+from playwright.async_api import Locator, Page, TimeoutError as PlaywrightTimeoutError, expect
+
+from config.settings import settings
+from pages.base_page import BasePage
+from utils.locator_registry import locator_registry
+from utils.logger import logger
+from utils.page_metrics import page_metrics
+
+# 定义选择器类型：支持字符串选择器或 Locator 对象
+SelectorType = str | Locator
+
+
+def async_step(title: str) -> Callable:
+    """
+    异步方法的 Allure 步骤装饰器
+
+    与 allure.step 相同，标题中可以引用参数，如 "输入员工 ID 搜索: {employee_id}"
+
+    Args:
+        title: 步骤标题
+
+    Returns:
+        装饰器
+    """
+
+    def decorator(func: Callable) -> Callable:
+        @functools.wraps(func)
+        async def wrapper(*args, **kwargs):
+            params = func_parameters(func, *args, **kwargs)
+            step_title = title.format(*map(represent, args), **params)
+            with allure.step(step_title):
+                return await func(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+class AsyncBasePage:
+    """异步页面对象基类"""
+
+    # 页面名称，子类可覆盖（与同步页面相同时共用自适应超时和定位器统计）
+    page_name: str = "BasePage"
+
+    # 与同步版本共用的逻辑（不调用 Playwright）
+    _get_selector_desc = staticmethod(BasePage._get_selector_desc)
+    _resolve_timeout = BasePage._resolve_timeout
+    _wait_timeout = BasePage._wait_timeout
+    _record_latency = BasePage._record_latency
+    _record_lookup = staticmethod(BasePage._record_lookup)
+
+    def __init__(self, page: Page):
+        """
+        初始化页面对象
+
+        Args:
+            page: Playwright 异步页面实例
+        """
+        self.page = page
+        self.timeout = settings.TIMEOUT
+        logger.debug(f"[{self.page_name}] 异步页面对象已初始化")
+
+    def _get_locator(self, selector: SelectorType) -> Locator:
+        """
+        统一处理选择器，支持字符串和 Locator 对象
+
+        Args:
+            selector: 字符串选择器或 Locator 对象
+
+        Returns:
+            Locator 对象
+        """
+        if isinstance(selector, Locator):
+            return selector
+        return self.page.locator(selector)
+
+    @async_step("导航到: {url}")
+    async def navigate(self, url: str | None = None) -> None:
+        """
+        导航到指定 URL
+
+        启用 PAGE_METRICS 时，导航完成后采集页面性能指标并附加到 Allure 报告
+
+        Args:
+            url: 目标 URL，默认使用配置中的 BASE_URL
+        """
+        target_url = url or settings.BASE_URL
+        logger.info(f"[{self.page_name}] 导航到: {target_url}")
+        try:
+            await self.page.goto(target_url, wait_until="domcontentloaded")
+            logger.debug(f"[{self.page_name}] 页面加载完成: {target_url}")
+            if settings.PAGE_METRICS:
+                metrics = await page_metrics.collect_async(self.page)
+                page_metrics.report(self.page_name, target_url, metrics)
+        except PlaywrightTimeoutError as e:
+            logger.error(f"[{self.page_name}] 导航超时: {target_url}")
+            raise e
+        except Exception as e:
+            logger.error(f"[{self.page_name}] 导航失败: {target_url}, 错误: {e}")
+            raise e
+
+    @async_step("点击元素")
+    async def click(self, selector: SelectorType) -> None:
+        """
+        点击元素
+
+        Args:
+            selector: 元素选择器（字符串或 Locator 对象）
+        """
+        selector_desc = self._get_selector_desc(selector)
+        logger.debug(f"[{self.page_name}] 点击元素: {selector_desc}")
+        try:
+            started = time.perf_counter()
+            await self._get_locator(selector).click(
+                timeout=self._resolve_timeout("click", selector_desc)
+            )
+            self._record_latency("click", selector_desc, started)
+            logger.info(f"[{self.page_name}] 点击成功: {selector_desc}")
+        except PlaywrightTimeoutError as e:
+            logger.error(f"[{self.page_name}] 点击超时，元素未找到: {selector_desc}")
+            raise e
+        except Exception as e:
+            logger.error(f"[{self.page_name}] 点击失败: {selector_desc}, 错误: {e}")
+            raise e
+
+    @async_step("输入文本")
+    async def fill(self, selector: SelectorType, text: str) -> None:
+        """
+        在输入框中填入文本
+
+        Args:
+            selector: 元素选择器（字符串或 Locator 对象）
+            text: 要输入的文本
+        """
+        selector_desc = self._get_selector_desc(selector)
+        # 敏感信息脱敏处理
+        masked_text = text if len(text) <= 3 else text[:2] + "*" * (len(text) - 2)
+        logger.debug(f"[{self.page_name}] 输入文本: {selector_desc} -> '{masked_text}'")
+        try:
+            started = time.perf_counter()
+            await self._get_locator(selector).fill(
+                text, timeout=self._resolve_timeout("fill", selector_desc)
+            )
+            self._record_latency("fill", selector_desc, started)
+            logger.info(f"[{self.page_name}] 输入成功: {selector_desc}")
+        except PlaywrightTimeoutError as e:
+            logger.error(f"[{self.page_name}] 输入超时，元素未找到: {selector_desc}")
+            raise e
+        except Exception as e:
+            logger.error(f"[{self.page_name}] 输入失败: {selector_desc}, 错误: {e}")
+            raise e
+
+    @async_step("清空并输入")
+    async def clear_and_fill(self, selector: SelectorType, text: str) -> None:
+        """
+        清空输入框并填入新文本
+
+        Args:
+            selector: 元素选择器（字符串或 Locator 对象）
+            text: 要输入的文本
+        """
+        selector_desc = self._get_selector_desc(selector)
+        logger.debug(f"[{self.page_name}] 清空并输入: {selector_desc}")
+        try:
+            element = self._get_locator(selector)
+            await element.clear()
+            await element.fill(text)
+            logger.info(f"[{self.page_name}] 清空并输入成功: {selector_desc}")
+        except Exception as e:
+            logger.error(f"[{self.page_name}] 清空并输入失败: {selector_desc}, 错误: {e}")
+            raise e
+
+    async def get_text(self, selector: SelectorType) -> str:
+        """
+        获取元素文本内容
+
+        Args:
+            selector: 元素选择器（字符串或 Locator 对象）
+
+        Returns:
+            元素的文本内容
+        """
+        selector_desc = self._get_selector_desc(selector)
+        logger.debug(f"[{self.page_name}] 获取文本: {selector_desc}")
+        try:
+            return await self._get_locator(selector).text_content() or ""
+        except Exception as e:
+            logger.error(f"[{self.page_name}] 获取文本失败: {selector_desc}, 错误: {e}")
+            raise e
+
+    async def get_input_value(self, selector: SelectorType) -> str:
+        """
+        获取输入框的值
+
+        Args:
+            selector: 元素选择器（字符串或 Locator 对象）
+
+        Returns:
+            输入框的值
+        """
+        selector_desc = self._get_selector_desc(selector)
+        logger.debug(f"[{self.page_name}] 获取输入框值: {selector_desc}")
+        try:
+            return await self._get_locator(selector).input_value()
+        except Exception as e:
+            logger.error(f"[{self.page_name}] 获取输入框值失败: {selector_desc}, 错误: {e}")
+            raise e
+
+    async def is_visible(self, selector: SelectorType, timeout: int | None = None) -> bool:
+        """
+        检查元素是否可见
+
+        Args:
+            selector: 元素选择器（字符串或 Locator 对象）
+            timeout: 等待超时时间（毫秒），为 0 时立即检查当前状态不等待
+
+        Returns:
+            元素是否可见
+        """
+        return await self._wait_state(selector, "visible", timeout)
+
+    async def is_hidden(self, selector: SelectorType, timeout: int | None = None) -> bool:
+        """
+        检查元素是否隐藏
+
+        Args:
+            selector: 元素选择器（字符串或 Locator 对象）
+            timeout: 等待超时时间（毫秒），为 0 时立即检查当前状态不等待
+
+        Returns:
+            元素是否隐藏
+        """
+        return await self._wait_state(selector, "hidden", timeout)
+
+    async def _wait_state(self, selector: SelectorType, state: str, timeout: int | None) -> bool:
+        """
+        等待元素达到可见或隐藏状态，超时返回 False
+
+        Args:
+            selector: 元素选择器（字符串或 Locator 对象）
+            state: visible / hidden
+            timeout: 等待超时时间（毫秒），为 0 时立即检查当前状态不等待
+
+        Returns:
+            是否达到目标状态
+        """
+        if timeout == 0:
+            visible = await self.is_visible_now(selector)
+            return visible if state == "visible" else not visible
+        selector_desc = self._get_selector_desc(selector)
+        wait_timeout = self._wait_timeout(state, selector_desc, timeout)
+        try:
+            started = time.perf_counter()
+            await self._get_locator(selector).wait_for(state=state, timeout=wait_timeout)
+            self._record_latency(state, selector_desc, started)
+            logger.debug(f"[{self.page_name}] 元素已达到状态 {state}: {selector_desc}")
+            return True
+        except PlaywrightTimeoutError:
+            logger.debug(f"[{self.page_name}] 元素未达到状态 {state}: {selector_desc}")
+            return False
+        except Exception as e:
+            logger.warning(f"[{self.page_name}] 检查元素状态异常: {selector_desc}, 错误: {e}")
+            return False
+
+    async def is_visible_now(self, selector: SelectorType) -> bool:
+        """
+        立即检查元素当前是否可见（不等待）
+
+        Args:
+            selector: 元素选择器（字符串或 Locator 对象）
+
+        Returns:
+            是否存在至少一个可见的匹配元素
+        """
+        selector_desc = self._get_selector_desc(selector)
+        try:
+            visible = await self._get_locator(selector).filter(visible=True).count() > 0
+            logger.debug(f"[{self.page_name}] 元素当前{'可见' if visible else '不可见'}: {selector_desc}")
+            return visible
+        except Exception as e:
+            logger.warning(f"[{self.page_name}] 检查可见性异常: {selector_desc}, 错误: {e}")
+            return False
+
+    async def is_hidden_now(self, selector: SelectorType) -> bool:
+        """
+        立即检查元素当前是否隐藏或不存在（不等待）
+
+        Args:
+            selector: 元素选择器（字符串或 Locator 对象）
+
+        Returns:
+            是否没有任何可见的匹配元素
+        """
+        return not await self.is_visible_now(selector)
+
+    async def wait_up_to(
+        self, selector: SelectorType, timeout: int, state: str = "visible"
+    ) -> bool:
+        """
+        最多等待指定时间直到元素达到目标状态，超时返回 False 而不抛出异常
+
+        Args:
+            selector: 元素选择器（字符串或 Locator 对象）
+            timeout: 最长等待时间（毫秒）
+            state: 目标状态，visible / hidden / attached / detached
+
+        Returns:
+            是否在时限内达到目标状态
+        """
+        if state == "visible" and await self.is_visible_now(selector):
+            return True
+        if state == "hidden" and await self.is_hidden_now(selector):
+            return True
+        if timeout <= 0:
+            return False
+        if state in ("visible", "hidden"):
+            return await self._wait_state(selector, state, timeout)
+
+        selector_desc = self._get_selector_desc(selector)
+        try:
+            await self._get_locator(selector).first.wait_for(state=state, timeout=timeout)
+            return True
+        except PlaywrightTimeoutError:
+            logger.debug(f"[{self.page_name}] {timeout}ms 内未达到状态 {state}: {selector_desc}")
+            return False
+
+    async def first_matching(
+        self, *selectors: SelectorType, state: str = "visible", timeout: int | None = None
+    ) -> Locator | None:
+        """
+        在多个候选选择器中并行查找，返回第一个达到目标状态的元素
+
+        Args:
+            *selectors: 候选选择器（按优先级排列）
+            state: 目标状态，visible / attached / hidden / detached
+            timeout: 最长等待时间（毫秒），为 0 时只检查当前状态不等待
+
+        Returns:
+            命中的元素定位器，超时未命中返回 None
+
+        Raises:
+            ValueError: 未提供候选选择器或状态无效
+        """
+        result = await self._race_candidates(selectors, state, timeout)
+        return result[1] if result else None
+
+    async def first_matching_selector(
+        self, *selectors: SelectorType, state: str = "visible", timeout: int | None = None
+    ) -> tuple[str, Locator] | None:
+        """
+        与 first_matching 相同地并行查找，同时返回命中的候选选择器（用于日志和报告）
+
+        Args:
+            *selectors: 候选选择器（按优先级排列）
+            state: 目标状态，visible / attached / hidden / detached
+            timeout: 最长等待时间（毫秒），为 0 时只检查当前状态不等待
+
+        Returns:
+            (命中候选的选择器描述, 元素定位器)，无法确定具体候选时选择器描述为
+            所有候选以 " | " 连接；超时未命中返回 None
+
+        Raises:
+            ValueError: 未提供候选选择器或状态无效
+        """
+        result = await self._race_candidates(selectors, state, timeout)
+        if result is None:
+            return None
+        index, locator = result
+        if index < 0:
+            return " | ".join(self._get_selector_desc(s) for s in selectors), locator
+        return self._get_selector_desc(selectors[index]), locator
+
+    async def locate(
+        self, name: str, *candidates: str, state: str = "visible", timeout: int | None = None
+    ) -> Locator | None:
+        """
+        通过定位器注册表解析逻辑元素（与同步页面共用命中统计）
+
+        Args:
+            name: 逻辑元素名称，如 "delete_dialog"
+            *candidates: 候选选择器（按默认优先级排列）
+            state: 目标状态，visible / attached
+            timeout: 最长等待时间（毫秒），为 0 时只检查当前状态不等待
+
+        Returns:
+            命中的元素定位器，超时未命中返回 None
+        """
+        element_name = f"{self.page_name}:{name}"
+        ordered = locator_registry.ordered(element_name, candidates)
+
+        result = await self._race_candidates(ordered, state, timeout)
+        self._record_lookup(element_name, ordered, state, result)
+        return result[1] if result else None
+
+    async def _race_candidates(
+        self, selectors: tuple | list, state: str, timeout: int | None
+    ) -> tuple[int, Locator] | None:
+        """
+        并行匹配候选选择器（逻辑与 BasePage._race_candidates 相同）
+
+        Args:
+            selectors: 候选选择器（按优先级排列）
+            state: 目标状态
+            timeout: 最长等待时间（毫秒），为 0 时只检查当前状态不等待
+
+        Returns:
+            (命中候选的索引, 元素定位器)，无法确定具体候选时索引为 -1；未命中返回 None
+
+        Raises:
+            ValueError: 未提供候选选择器或状态无效
+        """
+        if not selectors:
+            raise ValueError("first_matching 至少需要一个候选选择器")
+        if state not in ("visible", "attached", "hidden", "detached"):
+            raise ValueError(f"无效的元素状态: {state}")
+
+        selectors_desc = " | ".join(self._get_selector_desc(s) for s in selectors)
+        locators = [self._get_locator(s) for s in selectors]
+        if state in ("visible", "hidden"):
+            locators = [locator.filter(visible=True) for locator in locators]
+        want_present = state in ("visible", "attached")
+
+        combined = locators[0]
+        for locator in locators[1:]:
+            combined = combined.or_(locator)
+
+        if timeout == 0:
+            satisfied = (await combined.count() > 0) == want_present
+        else:
+            wait_timeout = self._wait_timeout("first_matching", selectors_desc, timeout)
+            wait_state = "attached" if want_present else "detached"
+            try:
+                started = time.perf_counter()
+                await combined.first.wait_for(state=wait_state, timeout=wait_timeout)
+                self._record_latency("first_matching", selectors_desc, started)
+                satisfied = True
+            except PlaywrightTimeoutError:
+                satisfied = False
+
+        if not satisfied:
+            logger.debug(f"[{self.page_name}] 没有候选达到状态 {state}: {selectors_desc}")
+            return None
+
+        if not want_present:
+            return -1, locators[0]
+
+        for index, locator in enumerate(locators):
+            if await locator.count() > 0:
+                logger.debug(
+                    f"[{self.page_name}] 命中候选选择器: {self._get_selector_desc(selectors[index])}"
+                )
+                return index, locator.first
+        return -1, combined.first
+
+    @async_step("等待元素可见")
+    async def wait_for_visible(
+        self, selector: SelectorType, timeout: int | None = None
+    ) -> Locator:
+        """
+        等待元素可见
+
+        Args:
+            selector: 元素选择器（字符串或 Locator 对象）
+            timeout: 等待超时时间（毫秒）
+
+        Returns:
+            定位到的元素
+        """
+        selector_desc = self._get_selector_desc(selector)
+        wait_timeout = self._wait_timeout("visible", selector_desc, timeout)
+        logger.debug(f"[{self.page_name}] 等待元素可见: {selector_desc}, 超时: {wait_timeout}ms")
+        try:
+            started = time.perf_counter()
+            element = self._get_locator(selector)
+            await element.wait_for(state="visible", timeout=wait_timeout)
+            self._record_latency("visible", selector_desc, started)
+            logger.info(f"[{self.page_name}] 元素已可见: {selector_desc}")
+            return element
+        except PlaywrightTimeoutError as e:
+            logger.error(f"[{self.page_name}] 等待元素可见超时: {selector_desc}")
+            raise e
+        except Exception as e:
+            logger.error(f"[{self.page_name}] 等待元素可见失败: {selector_desc}, 错误: {e}")
+            raise e
+
+    @async_step("等待元素消失")
+    async def wait_for_hidden(self, selector: SelectorType, timeout: int | None = None) -> None:
+        """
+        等待元素消失
+
+        Args:
+            selector: 元素选择器（字符串或 Locator 对象）
+            timeout: 等待超时时间（毫秒）
+        """
+        selector_desc = self._get_selector_desc(selector)
+        wait_timeout = self._wait_timeout("hidden", selector_desc, timeout)
+        logger.debug(f"[{self.page_name}] 等待元素消失: {selector_desc}, 超时: {wait_timeout}ms")
+        try:
+            started = time.perf_counter()
+            await self._get_locator(selector).wait_for(state="hidden", timeout=wait_timeout)
+            self._record_latency("hidden", selector_desc, started)
+            logger.info(f"[{self.page_name}] 元素已消失: {selector_desc}")
+        except PlaywrightTimeoutError as e:
+            logger.error(f"[{self.page_name}] 等待元素消失超时: {selector_desc}")
+            raise e
+        except Exception as e:
+            logger.error(f"[{self.page_name}] 等待元素消失失败: {selector_desc}, 错误: {e}")
+            raise e
+
+    async def get_element_count(self, selector: SelectorType) -> int:
+        """
+        获取匹配元素的数量
+
+        Args:
+            selector: 元素选择器（字符串或 Locator 对象）
+
+        Returns:
+            匹配元素的数量
+        """
+        count = await self._get_locator(selector).count()
+        logger.debug(f"[{self.page_name}] 元素数量: {self._get_selector_desc(selector)} -> {count}")
+        return count
+
+    async def get_all_texts(self, selector: SelectorType) -> list[str]:
+        """
+        获取所有匹配元素的文本内容
+
+        Args:
+            selector: 元素选择器（字符串或 Locator 对象）
+
+        Returns:
+            文本内容列表
+        """
+        return await self._get_locator(selector).all_text_contents()
+
+    @async_step("截图")
+    async def take_screenshot(self, name: str = "screenshot") -> bytes:
+        """
+        截取当前页面截图
+
+        Args:
+            name: 截图名称
+
+        Returns:
+            截图的字节数据
+        """
+        logger.info(f"[{self.page_name}] 截取页面截图: {name}")
+        screenshot = await self.page.screenshot(full_page=settings.FULL_PAGE_SCREENSHOTS)
+        allure.attach(screenshot, name=name, attachment_type=allure.attachment_type.PNG)
+        return screenshot
+
+    def get_current_url(self) -> str:
+        """
+        获取当前页面 URL
+
+        Returns:
+            当前页面 URL
+        """
+        return self.page.url
+
+    @async_step("刷新页面")
+    async def refresh(self) -> None:
+        """刷新当前页面"""
+        logger.info(f"[{self.page_name}] 刷新页面")
+        await self.page.reload()
+
+    async def expect_visible(self, selector: SelectorType) -> None:
+        """
+        断言元素可见
+
+        Args:
+            selector: 元素选择器（字符串或 Locator 对象）
+        """
+        selector_desc = self._get_selector_desc(selector)
+        try:
+            await expect(self._get_locator(selector)).to_be_visible()
+            logger.info(f"[{self.page_name}] 断言通过 - 元素可见: {selector_desc}")
+        except AssertionError as e:
+            logger.error(f"[{self.page_name}] 断言失败 - 元素不可见: {selector_desc}")
+            raise e
+
+    async def expect_url_contains(self, url_part: str) -> None:
+        """
+        断言 URL 包含指定字符串
+
+        Args:
+            url_part: URL 中应包含的字符串
+        """
+        try:
+            await expect(self.page).to_have_url(f"*{url_part}*")
+            logger.info(f"[{self.page_name}] 断言通过 - URL 包含: '{url_part}'")
+        except AssertionError as e:
+            logger.error(
+                f"[{self.page_name}] 断言失败 - URL 不包含: '{url_part}', 当前 URL: {self.page.url}"
+            )
+            raise e
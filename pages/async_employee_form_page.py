@@ -0,0 +1,425 @@
+"""
+AsyncEmployeeFormPage - OrangeHRM 员工表单的异步页面对象
+
+[示例代码] 此文件是针对 OrangeHRM Demo 系统的示例实现。
+
+选择器、表单描述、参考数据目录、页面脚本以及不操作页面的逻辑（选项查找、
+结果映射、回退字段选择等）与同步版本 EmployeeFormPage 共用（EmployeeFormElements），
+本文件只保留 Playwright 异步调用。参考数据与同步版本共用同一个缓存。
+提供创建员工和按表单描述填写员工档案的协程版本。
+"""
+
+from typing import Any
+
+from playwright.async_api import Locator
+
+from config.settings import settings
+from pages.async_base_page import AsyncBasePage, async_step
+from pages.employee_form_page import EmployeeFormElements
+from pages.form_schema import FormSchema, convert_date
+from utils.data_factory import data_factory
+from utils.data_models import ContactDetails, JobDetails, PersonalDetails
+from utils.logger import logger
+from utils.reference_data import reference_data
+
+
+class AsyncEmployeeFormPage(EmployeeFormElements, AsyncBasePage):
+    """OrangeHRM 员工表单异步页面对象"""
+
+    async def wait_for_form_load(self) -> "AsyncEmployeeFormPage":
+        """
+        等待表单加载完成
+
+        Returns:
+            self，支持链式调用
+        """
+        await self.wait_up_to(self.LOADER, 10000, state="hidden")
+        await self.wait_for_visible(self.INPUT_FIRST_NAME, timeout=10000)
+        return self
+
+    # ==================== 添加员工 ====================
+
+    @async_step("填写员工姓名: {first_name} {middle_name} {last_name}")
+    async def fill_employee_name(
+        self, first_name: str, middle_name: str = "", last_name: str = ""
+    ) -> "AsyncEmployeeFormPage":
+        """
+        填写员工姓名
+
+        Args:
+            first_name: 名
+            middle_name: 中间名
+            last_name: 姓
+
+        Returns:
+            self，支持链式调用
+        """
+        await self.fill(self.INPUT_FIRST_NAME, first_name)
+        if middle_name:
+            await self.fill(self.INPUT_MIDDLE_NAME, middle_name)
+        if last_name:
+            await self.fill(self.INPUT_LAST_NAME, last_name)
+        return self
+
+    @async_step("填写员工 ID: {employee_id}")
+    async def fill_employee_id(self, employee_id: str) -> "AsyncEmployeeFormPage":
+        """
+        填写员工 ID
+
+        Args:
+            employee_id: 员工 ID
+
+        Returns:
+            self，支持链式调用
+        """
+        await self.clear_and_fill(self.page.locator(self.INPUT_EMPLOYEE_ID).first, employee_id)
+        return self
+
+    async def get_generated_employee_id(self) -> str:
+        """
+        获取系统生成的员工 ID
+
+        Returns:
+            员工 ID
+        """
+        return await self.page.locator(self.INPUT_EMPLOYEE_ID).first.input_value()
+
+    @async_step("点击保存按钮")
+    async def click_save(self) -> "AsyncEmployeeFormPage":
+        """
+        点击保存按钮
+
+        Returns:
+            self，支持链式调用
+        """
+        await self.click(self.SAVE_BUTTON)
+        return self
+
+    @async_step("创建新员工")
+    async def create_new_employee(
+        self,
+        first_name: str,
+        middle_name: str = "",
+        last_name: str = "",
+        employee_id: str = "",
+    ) -> str:
+        """
+        创建新员工的快捷方法
+
+        Args:
+            first_name: 名
+            middle_name: 中间名
+            last_name: 姓
+            employee_id: 员工 ID（可选，不填则使用系统生成的）
+
+        Returns:
+            员工 ID
+        """
+        await self.wait_for_form_load()
+        await self.fill_employee_name(first_name, middle_name, last_name)
+        if employee_id:
+            await self.fill_employee_id(employee_id)
+
+        emp_id = await self.get_generated_employee_id()
+        await self.click_save()
+        # 登记创建的员工，测试未自行删除时在会话结束时统一清理
+        data_factory.register("employee", emp_id, f"{first_name} {last_name}".strip())
+        await self.wait_for_save_complete()
+        return emp_id
+
+    # ==================== 下拉框和参考数据 ====================
+
+    async def select_dropdown_option(
+        self, dropdown_selector: str, option_text: str
+    ) -> "AsyncEmployeeFormPage":
+        """
+        选择下拉选项（同一页面加载内按下拉框缓存选项文本）
+
+        Args:
+            dropdown_selector: 下拉框选择器
+            option_text: 选项文本（优先完全匹配，其次部分匹配）
+
+        Returns:
+            self，支持链式调用
+
+        Raises:
+            ValueError: 下拉框中不存在该选项
+        """
+        await self.page.locator(dropdown_selector).first.click()
+
+        options = self.page.locator(self.DROPDOWN_OPTIONS)
+        await options.first.wait_for(state="visible", timeout=5000)
+
+        index = self._cached_option_index(dropdown_selector, option_text)
+        if index < 0:
+            option_texts = self._cache_options(dropdown_selector, await options.all_inner_texts())
+            index = self._find_option_index(option_texts, option_text)
+
+        if index < 0:
+            await self.page.keyboard.press("Escape")
+            raise self._option_not_found(dropdown_selector, option_text)
+
+        logger.debug(f"[{self.page_name}] 选择下拉选项: {option_text} (索引 {index})")
+        await options.nth(index).click()
+        await self.page.locator(self.DROPDOWN_LISTBOX).wait_for(state="hidden", timeout=5000)
+        return self
+
+    async def get_options(self, catalog: str) -> list[str]:
+        """
+        获取参考数据目录的全部选项（与同步页面共用缓存）
+
+        Args:
+            catalog: 目录名，见 REFERENCE_CATALOGS
+
+        Returns:
+            选项列表，无法加载时返回空列表
+
+        Raises:
+            KeyError: 目录不存在
+        """
+        api_path, name_field, dropdown_selector = self._reference_catalog(catalog)
+
+        async def load() -> list[str] | None:
+            if api_path:
+                values = await self._load_options_from_api(api_path, name_field)
+                if values:
+                    return values
+            return await self._read_dropdown_options(dropdown_selector)
+
+        return await reference_data.get_async(catalog, load)
+
+    async def resolve_option(self, catalog: str, value: str) -> str:
+        """
+        校验选项是否存在，并解析为系统中的准确文本
+
+        Args:
+            catalog: 目录名
+            value: 测试数据中的选项
+
+        Returns:
+            系统中的选项文本
+
+        Raises:
+            ValueError: 选项不存在
+        """
+        return self._resolve_against(catalog, value, await self.get_options(catalog))
+
+    async def _load_options_from_api(self, api_path: str, name_field: str) -> list[str] | None:
+        """
+        通过系统 API 加载选项（复用当前页面的登录状态）
+
+        Args:
+            api_path: API 路径
+            name_field: 每条记录中的名称字段
+
+        Returns:
+            选项列表，请求失败时返回 None
+        """
+        try:
+            response = await self.page.request.get(
+                f"{settings.BASE_URL}{api_path}", params={"limit": 0}
+            )
+            if not response.ok:
+                logger.debug(f"[{self.page_name}] 参考数据 API 请求失败: {response.status}")
+                return None
+            return [item[name_field] for item in (await response.json())["data"]]
+        except Exception as e:
+            logger.debug(f"[{self.page_name}] 参考数据 API 不可用: {api_path}, 错误: {e}")
+            return None
+
+    async def _read_dropdown_options(self, dropdown_selector: str) -> list[str] | None:
+        """
+        展开当前页面的下拉框一次读取全部选项
+
+        Args:
+            dropdown_selector: 下拉框选择器
+
+        Returns:
+            选项列表（不含占位选项），下拉框不在当前页面时返回 None
+        """
+        if not await self.is_visible_now(dropdown_selector):
+            return None
+
+        await self.page.locator(dropdown_selector).first.click()
+        options = self.page.locator(self.DROPDOWN_OPTIONS)
+        await options.first.wait_for(state="visible", timeout=5000)
+        option_texts = self._cache_options(dropdown_selector, await options.all_inner_texts())
+        await self.page.keyboard.press("Escape")
+        return self._selectable_options(option_texts)
+
+    # ==================== 日期和批量填写 ====================
+
+    async def fill_date(self, date_input_selector: str, date_str: str) -> "AsyncEmployeeFormPage":
+        """
+        填写日期（直接赋值，赋值未生效时回退到键盘输入）
+
+        Args:
+            date_input_selector: 日期输入框选择器
+            date_str: 日期字符串 (YYYY-MM-DD 格式)
+
+        Returns:
+            self，支持链式调用
+        """
+        date_input = self.page.locator(date_input_selector).first
+        value = convert_date(date_str, await self._detect_date_format(date_input))
+
+        if await date_input.evaluate(self._SET_DATE_SCRIPT, value) != value:
+            logger.debug(f"[{self.page_name}] 日期赋值未生效，改用键盘输入: {value}")
+            await date_input.clear()
+            await date_input.fill(value)
+            await self.page.keyboard.press("Escape")
+        return self
+
+    @classmethod
+    async def _detect_date_format(cls, date_input: Locator) -> str:
+        """
+        识别系统日期格式（每个会话识别成功一次）
+
+        Args:
+            date_input: 任一日期输入框
+
+        Returns:
+            日期格式，无法识别时返回空字符串（不缓存，下次填写日期时重新识别）
+        """
+        if not cls._date_format:
+            return cls._remember_date_format(await date_input.get_attribute("placeholder"))
+        return cls._date_format
+
+    @async_step("批量填写表单字段")
+    async def fill_fields(
+        self, mapping: dict[str, str], scope: str | None = None
+    ) -> dict[str, bool]:
+        """
+        在一次页面调用中批量填写多个文本输入框
+
+        Args:
+            mapping: 字段标签 -> 要填写的值
+            scope: 限定查找范围的 CSS 选择器，默认为表单区域
+
+        Returns:
+            字段标签 -> 是否填写成功（字段存在且回读值与期望一致）
+        """
+        if not mapping:
+            return {}
+
+        values = await self.page.evaluate(
+            self._FILL_FIELDS_SCRIPT, self._fill_fields_args(mapping, scope)
+        )
+        return self._check_filled(mapping, values)
+
+    async def _fill_labeled_fields(
+        self, mapping: dict[str, str], optional: frozenset[str] = frozenset()
+    ) -> dict[str, bool]:
+        """
+        批量填写字段，批量未生效的必填字段逐个回退到普通输入
+
+        Args:
+            mapping: 字段标签 -> 要填写的值（空值会被忽略）
+            optional: 可选字段的标签
+
+        Returns:
+            字段标签 -> 是否填写成功
+        """
+        mapping = {label: value for label, value in mapping.items() if value}
+        results = await self.fill_fields(mapping)
+        for label in self._fallback_labels(results, optional):
+            await self.fill(self._labeled_input(label), mapping[label])
+            results[label] = True
+        return results
+
+    # ==================== 声明式表单填写 ====================
+
+    @async_step("填写表单")
+    async def fill_form(self, schema: FormSchema, data: Any) -> dict[str, bool]:
+        """
+        按表单描述填写当前 Tab（与 EmployeeFormPage.fill_form 步骤相同）
+
+        Args:
+            schema: 表单描述
+            data: 测试数据记录或字典，键与表单描述中的字段 key 对应
+
+        Returns:
+            数据键 -> 是否填写成功（可选字段不存在时为 False）
+        """
+        plan = schema.plan(data)
+        plan.steps = [
+            (f, await self.resolve_option(f.catalog, value) if f.catalog else value)
+            for f, value in plan.steps
+        ]
+
+        mapping, optional = self._text_fields(plan)
+        results = self._text_results(plan, await self._fill_labeled_fields(mapping, optional))
+
+        for form_field, value in plan.steps:
+            action, args = self._field_action(form_field, value)
+            await action(*args)
+            results[form_field.key] = True
+
+        return results
+
+    @async_step("填写员工档案")
+    async def fill_profile(
+        self,
+        personal: PersonalDetails | dict[str, str] | None = None,
+        contact: ContactDetails | dict[str, str] | None = None,
+        job: JobDetails | dict[str, str] | None = None,
+        save: bool = True,
+    ) -> dict[str, dict[str, bool]]:
+        """
+        在员工编辑页面依次填写个人详情、联系方式、工作信息
+
+        Args:
+            personal: 个人详情记录或同格式字典
+            contact: 联系方式记录或同格式字典
+            job: 工作信息记录或同格式字典
+            save: 是否保存每个 Tab
+
+        Returns:
+            表单名称 -> (数据键 -> 是否填写成功)
+        """
+        results = {}
+        for schema, data in self._profile_sections(personal, contact, job):
+            await self.click(schema.tab)
+            await self.wait_up_to(self.LOADER, 10000, state="hidden")
+            await self.wait_for_visible(self.page.locator(self.FORM_SECTION).first, timeout=10000)
+
+            results[schema.name] = await self.fill_form(schema, data)
+
+            if save:
+                form = self.page.locator(self.FORM_SECTION).first
+                await form.locator(self.SAVE_BUTTON).click()
+                await self.wait_for_save_complete()
+        return results
+
+    # ==================== 验证方法 ====================
+
+    async def get_field_error_message(self) -> str:
+        """
+        获取字段错误消息
+
+        Returns:
+            错误消息
+        """
+        if await self.is_visible(self.FIELD_ERROR, timeout=3000):
+            return await self.get_text(self.FIELD_ERROR)
+        return ""
+
+    async def is_success_toast_displayed(self) -> bool:
+        """
+        检查是否显示成功 Toast
+
+        Returns:
+            是否显示
+        """
+        return await self.is_visible(self.TOAST_SUCCESS, timeout=5000)
+
+    async def wait_for_save_complete(self) -> "AsyncEmployeeFormPage":
+        """
+        等待保存完成
+
+        Returns:
+            self，支持链式调用
+        """
+        await self.is_visible(self.TOAST_SUCCESS, timeout=10000)
+        await self.is_hidden(self.TOAST_MESSAGE, timeout=10000)
+        return self
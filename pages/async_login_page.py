@@ -0,0 +1,77 @@
+"""
+AsyncLoginPage - OrangeHRM 登录页面的异步页面对象
+
+[示例代码] 此文件是针对 OrangeHRM Demo 系统的示例实现。
+
+选择器与同步版本 LoginPage 共用（LoginElements），
+用于在异步测试中登录并创建已认证的浏览器上下文。
+"""
+
+from playwright.async_api import Page
+
+from config.settings import settings
+from pages.async_base_page import AsyncBasePage, async_step
+from pages.login_page import LoginElements
+
+
+class AsyncLoginPage(LoginElements, AsyncBasePage):
+    """OrangeHRM 登录页面异步页面对象"""
+
+    def __init__(self, page: Page):
+        """
+        初始化登录页面
+
+        Args:
+            page: Playwright 异步页面实例
+        """
+        super().__init__(page)
+        self.url = f"{settings.BASE_URL}{self.PAGE_PATH}"
+
+    @async_step("打开登录页面")
+    async def open(self) -> "AsyncLoginPage":
+        """
+        打开登录页面
+
+        Returns:
+            self，支持链式调用
+        """
+        await self.navigate(self.url)
+        await self.wait_for_visible(self.LOGIN_BUTTON)
+        return self
+
+    @async_step("使用账号 {username} 登录")
+    async def login(self, username: str, password: str) -> "AsyncLoginPage":
+        """
+        执行登录操作
+
+        Args:
+            username: 用户名
+            password: 密码
+
+        Returns:
+            self，支持链式调用
+        """
+        await self.fill(self.USERNAME_INPUT, username)
+        await self.fill(self.PASSWORD_INPUT, password)
+        await self.click(self.LOGIN_BUTTON)
+        return self
+
+    @async_step("使用管理员账号登录")
+    async def login_as_admin(self) -> "AsyncLoginPage":
+        """
+        使用管理员账号登录
+
+        Returns:
+            self，支持链式调用
+        """
+        return await self.login(settings.ADMIN_USER, settings.ADMIN_PASSWORD)
+
+    async def wait_for_login_complete(self) -> "AsyncLoginPage":
+        """
+        等待登录完成
+
+        Returns:
+            self，支持链式调用
+        """
+        await self.wait_for_visible(self.USER_DROPDOWN, timeout=15000)
+        return self
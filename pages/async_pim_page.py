@@ -0,0 +1,258 @@
+"""
+AsyncPIMPage - OrangeHRM PIM 员工列表的异步页面对象
+
+[示例代码] 此文件是针对 OrangeHRM Demo 系统的示例实现。
+
+选择器和记录数解析与同步版本 PIMPage 共用（PIMElements、parse_records_count），
+提供搜索、读取表格、批量删除等常用操作的协程版本。
+"""
+
+import contextlib
+
+from playwright.async_api import Page
+
+from config.settings import settings
+from pages.async_base_page import AsyncBasePage, async_step
+from pages.pim_page import PIMElements, parse_records_count
+
+
+class AsyncPIMPage(PIMElements, AsyncBasePage):
+    """OrangeHRM PIM 页面异步页面对象"""
+
+    def __init__(self, page: Page):
+        """
+        初始化 PIM 页面
+
+        Args:
+            page: Playwright 异步页面实例
+        """
+        super().__init__(page)
+        self.url = f"{settings.BASE_URL}{self.PAGE_PATH}"
+
+    @async_step("打开 PIM 员工列表页面")
+    async def open(self) -> "AsyncPIMPage":
+        """
+        打开 PIM 员工列表页面
+
+        Returns:
+            self，支持链式调用
+        """
+        await self.navigate(self.url)
+        await self.wait_for_page_load()
+        return self
+
+    async def wait_for_page_load(self) -> "AsyncPIMPage":
+        """
+        等待页面加载完成
+
+        Returns:
+            self，支持链式调用
+        """
+        await self.wait_up_to(self.LOADER, 10000, state="hidden")
+        await self.wait_for_visible(self.TABLE, timeout=10000)
+        return self
+
+    async def wait_for_table_update(self) -> "AsyncPIMPage":
+        """
+        等待表格更新完成
+
+        Returns:
+            self，支持链式调用
+        """
+        await self.page.wait_for_timeout(500)
+        await self.wait_up_to(self.LOADER, 10000, state="hidden")
+        return self
+
+    @async_step("点击添加按钮")
+    async def click_add_button(self) -> "AsyncPIMPage":
+        """
+        点击添加员工按钮
+
+        Returns:
+            self，支持链式调用
+        """
+        await self.click(self.ADD_BUTTON)
+        await self.page.wait_for_timeout(1000)
+        return self
+
+    # ==================== 搜索方法 ====================
+
+    @async_step("输入员工 ID 搜索: {employee_id}")
+    async def search_by_employee_id(self, employee_id: str) -> "AsyncPIMPage":
+        """
+        按员工 ID 搜索
+
+        Args:
+            employee_id: 员工 ID
+
+        Returns:
+            self，支持链式调用
+        """
+        id_input = self.page.locator(".oxd-table-filter .oxd-grid-item:nth-child(2) input")
+        await id_input.fill(employee_id)
+        return self
+
+    @async_step("点击搜索按钮")
+    async def click_search(self) -> "AsyncPIMPage":
+        """
+        点击搜索按钮
+
+        Returns:
+            self，支持链式调用
+        """
+        await self.click(self.SEARCH_BUTTON)
+        await self.wait_for_table_update()
+        return self
+
+    # ==================== 表格操作方法 ====================
+
+    async def get_employee_count(self) -> int:
+        """
+        获取员工记录数
+
+        Returns:
+            员工数量
+        """
+        return parse_records_count(await self.get_text(self.RECORDS_COUNT))
+
+    async def get_employee_ids(self) -> list[str]:
+        """
+        获取当前表格中的员工 ID
+
+        Returns:
+            员工 ID 列表（按表格顺序）
+        """
+        cells = self.page.locator(f"{self.TABLE_ROW} {self.TABLE_CELL}:nth-child(2)")
+        return [text.strip() for text in await cells.all_inner_texts()]
+
+    async def is_employee_in_list(self, employee_name: str) -> bool:
+        """
+        检查员工是否在列表中
+
+        Args:
+            employee_name: 员工姓名（可以是部分匹配）
+
+        Returns:
+            是否存在
+        """
+        rows = await self.page.locator(self.TABLE_ROW).all_inner_texts()
+        return any(employee_name.lower() in row.lower() for row in rows)
+
+    async def has_no_records(self) -> bool:
+        """
+        检查是否显示无记录
+
+        Returns:
+            是否无记录
+        """
+        await self.wait_up_to(self.LOADER, 10000, state="hidden")
+        if await self.page.locator(self.TABLE_ROW).count() == 0:
+            return True
+        if await self.first_matching(*self.NO_RECORDS_SELECTORS, timeout=0) is not None:
+            return True
+        if await self.is_visible_now(self.RECORDS_COUNT):
+            with contextlib.suppress(Exception):
+                if await self.get_employee_count() == 0:
+                    return True
+        return False
+
+    # ==================== 删除操作 ====================
+
+    @async_step("选择第 {row_index} 行的复选框")
+    async def select_row(self, row_index: int = 0) -> "AsyncPIMPage":
+        """
+        选择指定行的复选框
+
+        Args:
+            row_index: 行索引
+
+        Returns:
+            self，支持链式调用
+        """
+        row = self.page.locator(self.TABLE_ROW).nth(row_index)
+        await row.locator(self.CHECKBOX_ROW).click()
+        return self
+
+    @async_step("确认删除")
+    async def confirm_delete(self) -> "AsyncPIMPage":
+        """
+        在删除确认对话框中点击确认
+
+        Returns:
+            self，支持链式调用
+        """
+        confirm_btn = await self.locate(
+            "confirm_delete_button", *self.CONFIRM_DELETE_SELECTORS, timeout=5000
+        )
+        if confirm_btn is None:
+            confirm_btn = self.page.locator("button.oxd-button--label-danger").first
+        await confirm_btn.click()
+
+        await self.first_matching(*self.DIALOG_SELECTORS, state="hidden", timeout=5000)
+        await self.is_visible(self.TOAST_MESSAGE, timeout=3000)
+        await self.wait_for_table_update()
+        return self
+
+    async def go_to_next_results_page(self) -> bool:
+        """
+        翻到搜索结果的下一页
+
+        Returns:
+            是否已翻页（已是最后一页时返回 False）
+        """
+        next_button = self.page.locator(self.PAGINATION_NEXT).first
+        if not await self.is_visible_now(next_button):
+            return False
+        await next_button.click()
+        await self.wait_for_table_update()
+        return True
+
+    @async_step("批量删除员工")
+    async def bulk_delete_employees(self, employee_ids: list[str], search_text: str) -> int:
+        """
+        搜索后勾选所有目标员工并删除（逐页删除，与 PIMPage.bulk_delete_employees 相同）
+
+        Args:
+            employee_ids: 要删除的员工 ID
+            search_text: 员工 ID 搜索条件（目标员工 ID 的公共部分）
+
+        Returns:
+            删除的员工数
+        """
+        targets = set(employee_ids)
+        deleted = 0
+        while targets:
+            await self.search_by_employee_id(search_text)
+            await self.click_search()
+
+            # 当前页没有目标员工（如都是其他 worker 的员工）时向后翻页
+            selected = set()
+            while not await self.has_no_records():
+                for index, row_id in enumerate(await self.get_employee_ids()):
+                    if row_id in targets:
+                        await self.select_row(index)
+                        selected.add(row_id)
+                if selected or not await self.go_to_next_results_page():
+                    break
+            if not selected:
+                break
+
+            await self.click(self.DELETE_SELECTED_BUTTON)
+            await self.confirm_delete()
+            await self.wait_for_table_update()
+            targets -= selected
+            deleted += len(selected)
+        return deleted
+
+    # ==================== Toast 消息 ====================
+
+    async def get_toast_message(self) -> str:
+        """
+        获取 Toast 消息内容
+
+        Returns:
+            消息文本
+        """
+        if await self.is_visible(self.TOAST_MESSAGE, timeout=5000):
+            return await self.get_text(self.TOAST_MESSAGE)
+        return ""
@@ -7,6 +7,7 @@ BasePage - Page Object 模式基类
 - 封装 Playwright 常用操作，提供统一的页面交互接口
 - 支持字符串选择器和 Playwright 原生 Locator 对象
 - 集成日志记录和 Allure 报告功能
+- 可选：导航后采集页面性能指标（PAGE_METRICS）
 
 使用方法：
 所有页面对象应继承此基类，示例：
@@ -20,11 +21,16 @@ BasePage - Page Object 模式基类
             super().__init__(page)
 """
 
+import time
+
 import allure
 from playwright.sync_api import Locator, Page, TimeoutError as PlaywrightTimeoutError, expect
 
 from config.settings import settings
+from utils.adaptive_timeout import adaptive_timeouts
+from utils.locator_registry import locator_registry
 from utils.logger import logger
+from utils.page_metrics import page_metrics
 
 # 定义选择器类型：支持字符串选择器或 Locator 对象
 SelectorType = str | Locator
@@ -80,11 +86,63 @@ class BasePage:
             return selector
         return self.page.locator(selector)
 
+    def _resolve_timeout(
+        self, action: str, selector_desc: str, timeout: int | None = None
+    ) -> int | None:
+        """
+        计算操作的超时时间
+
+        启用自适应超时时，根据该操作的历史耗时推导超时时间（不超过给定的超时时间）；
+        否则原样返回给定的超时时间
+
+        Args:
+            action: 操作名称
+            selector_desc: 选择器描述
+            timeout: 调用方给定的超时时间（毫秒）
+
+        Returns:
+            超时时间（毫秒），为 None 时使用 Playwright 默认超时
+        """
+        if not settings.ADAPTIVE_TIMEOUT:
+            return timeout
+        key = adaptive_timeouts.make_key(self.page_name, action, selector_desc)
+        return adaptive_timeouts.get_timeout(key, self.timeout if timeout is None else timeout)
+
+    def _wait_timeout(self, action: str, selector_desc: str, timeout: int | None = None) -> int:
+        """
+        计算等待类操作的超时时间，未给定时使用页面默认超时（显式给定的 0 原样保留）
+
+        Args:
+            action: 操作名称
+            selector_desc: 选择器描述
+            timeout: 调用方给定的超时时间（毫秒）
+
+        Returns:
+            超时时间（毫秒）
+        """
+        resolved = self._resolve_timeout(action, selector_desc, timeout)
+        return self.timeout if resolved is None else resolved
+
+    def _record_latency(self, action: str, selector_desc: str, started: float) -> None:
+        """
+        记录操作耗时，供自适应超时使用
+
+        Args:
+            action: 操作名称
+            selector_desc: 选择器描述
+            started: 操作开始时间（time.perf_counter）
+        """
+        if settings.ADAPTIVE_TIMEOUT:
+            key = adaptive_timeouts.make_key(self.page_name, action, selector_desc)
+            adaptive_timeouts.record(key, (time.perf_counter() - started) * 1000)
+
     @allure.step("导航到: {url}")
     def navigate(self, url: str | None = None) -> None:
         """
         导航到指定 URL
 
+        启用 PAGE_METRICS 时，导航完成后采集页面性能指标并附加到 Allure 报告
+
         Args:
             url: 目标 URL，默认使用配置中的 BASE_URL
         """
@@ -93,6 +151,8 @@ class BasePage:
         try:
             self.page.goto(target_url, wait_until="domcontentloaded")
             logger.debug(f"[{self.page_name}] 页面加载完成: {target_url}")
+            if settings.PAGE_METRICS:
+                page_metrics.report(self.page_name, target_url, page_metrics.collect(self.page))
         except PlaywrightTimeoutError as e:
             logger.error(f"[{self.page_name}] 导航超时: {target_url}")
             raise e
@@ -111,7 +171,9 @@ class BasePage:
         selector_desc = self._get_selector_desc(selector)
         logger.debug(f"[{self.page_name}] 点击元素: {selector_desc}")
         try:
-            self._get_locator(selector).click()
+            started = time.perf_counter()
+            self._get_locator(selector).click(timeout=self._resolve_timeout("click", selector_desc))
+            self._record_latency("click", selector_desc, started)
             logger.info(f"[{self.page_name}] 点击成功: {selector_desc}")
         except PlaywrightTimeoutError as e:
             logger.error(f"[{self.page_name}] 点击超时，元素未找到: {selector_desc}")
@@ -134,7 +196,11 @@ class BasePage:
         masked_text = text if len(text) <= 3 else text[:2] + "*" * (len(text) - 2)
         logger.debug(f"[{self.page_name}] 输入文本: {selector_desc} -> '{masked_text}'")
         try:
-            self._get_locator(selector).fill(text)
+            started = time.perf_counter()
+            self._get_locator(selector).fill(
+                text, timeout=self._resolve_timeout("fill", selector_desc)
+            )
+            self._record_latency("fill", selector_desc, started)
             logger.info(f"[{self.page_name}] 输入成功: {selector_desc}")
         except PlaywrightTimeoutError as e:
             logger.error(f"[{self.page_name}] 输入超时，元素未找到: {selector_desc}")
@@ -211,15 +277,20 @@ class BasePage:
 
         Args:
             selector: 元素选择器（字符串或 Locator 对象）
-            timeout: 等待超时时间（毫秒）
+            timeout: 等待超时时间（毫秒），为 0 时立即检查当前状态不等待
 
         Returns:
             元素是否可见
         """
+        if timeout == 0:
+            return self.is_visible_now(selector)
         selector_desc = self._get_selector_desc(selector)
         logger.debug(f"[{self.page_name}] 检查元素可见性: {selector_desc}")
+        wait_timeout = self._wait_timeout("visible", selector_desc, timeout)
         try:
-            self._get_locator(selector).wait_for(state="visible", timeout=timeout or self.timeout)
+            started = time.perf_counter()
+            self._get_locator(selector).wait_for(state="visible", timeout=wait_timeout)
+            self._record_latency("visible", selector_desc, started)
             logger.debug(f"[{self.page_name}] 元素可见: {selector_desc}")
             return True
         except PlaywrightTimeoutError:
@@ -235,15 +306,20 @@ class BasePage:
 
         Args:
             selector: 元素选择器（字符串或 Locator 对象）
-            timeout: 等待超时时间（毫秒）
+            timeout: 等待超时时间（毫秒），为 0 时立即检查当前状态不等待
 
         Returns:
             元素是否隐藏
         """
+        if timeout == 0:
+            return self.is_hidden_now(selector)
         selector_desc = self._get_selector_desc(selector)
         logger.debug(f"[{self.page_name}] 检查元素是否隐藏: {selector_desc}")
+        wait_timeout = self._wait_timeout("hidden", selector_desc, timeout)
         try:
-            self._get_locator(selector).wait_for(state="hidden", timeout=timeout or self.timeout)
+            started = time.perf_counter()
+            self._get_locator(selector).wait_for(state="hidden", timeout=wait_timeout)
+            self._record_latency("hidden", selector_desc, started)
             logger.debug(f"[{self.page_name}] 元素已隐藏: {selector_desc}")
             return True
         except PlaywrightTimeoutError:
@@ -253,6 +329,232 @@ class BasePage:
             logger.warning(f"[{self.page_name}] 检查隐藏状态异常: {selector_desc}, 错误: {e}")
             return False
 
+    def is_visible_now(self, selector: SelectorType) -> bool:
+        """
+        立即检查元素当前是否可见（不等待）
+
+        基于可见元素计数实现，元素不存在或未渲染时立即返回 False，
+        适用于只需要页面快照的判断（如"是否显示无记录提示"）
+
+        Args:
+            selector: 元素选择器（字符串或 Locator 对象）
+
+        Returns:
+            是否存在至少一个可见的匹配元素
+        """
+        selector_desc = self._get_selector_desc(selector)
+        try:
+            visible = self._get_locator(selector).filter(visible=True).count() > 0
+            logger.debug(f"[{self.page_name}] 元素当前{'可见' if visible else '不可见'}: {selector_desc}")
+            return visible
+        except Exception as e:
+            logger.warning(f"[{self.page_name}] 检查可见性异常: {selector_desc}, 错误: {e}")
+            return False
+
+    def is_hidden_now(self, selector: SelectorType) -> bool:
+        """
+        立即检查元素当前是否隐藏或不存在（不等待）
+
+        Args:
+            selector: 元素选择器（字符串或 Locator 对象）
+
+        Returns:
+            是否没有任何可见的匹配元素
+        """
+        return not self.is_visible_now(selector)
+
+    def wait_up_to(self, selector: SelectorType, timeout: int, state: str = "visible") -> bool:
+        """
+        最多等待指定时间直到元素达到目标状态，超时返回 False 而不抛出异常
+
+        已处于目标状态时立即返回，不会消耗等待时间
+
+        Args:
+            selector: 元素选择器（字符串或 Locator 对象）
+            timeout: 最长等待时间（毫秒）
+            state: 目标状态，visible / hidden / attached / detached
+
+        Returns:
+            是否在时限内达到目标状态
+        """
+        if state == "visible" and self.is_visible_now(selector):
+            return True
+        if state == "hidden" and self.is_hidden_now(selector):
+            return True
+        if timeout <= 0:
+            return False
+        if state == "visible":
+            return self.is_visible(selector, timeout=timeout)
+        if state == "hidden":
+            return self.is_hidden(selector, timeout=timeout)
+
+        selector_desc = self._get_selector_desc(selector)
+        try:
+            self._get_locator(selector).first.wait_for(state=state, timeout=timeout)
+            return True
+        except PlaywrightTimeoutError:
+            logger.debug(f"[{self.page_name}] {timeout}ms 内未达到状态 {state}: {selector_desc}")
+            return False
+
+    def first_matching(
+        self, *selectors: SelectorType, state: str = "visible", timeout: int | None = None
+    ) -> Locator | None:
+        """
+        在多个候选选择器中并行查找，返回第一个达到目标状态的元素
+
+        所有候选通过 Locator.or_ 合并为一个定位器，只需一次等待即可覆盖全部候选，
+        而不是逐个候选串行等待超时。命中后按候选顺序返回优先级最高的那个。
+
+        Args:
+            *selectors: 候选选择器（按优先级排列）
+            state: 目标状态，visible / attached / hidden / detached
+                   （hidden / detached 表示所有候选都已隐藏 / 移除）
+            timeout: 最长等待时间（毫秒），为 0 时只检查当前状态不等待
+
+        Returns:
+            命中的元素定位器，超时未命中返回 None
+
+        Raises:
+            ValueError: 未提供候选选择器或状态无效
+        """
+        result = self._race_candidates(selectors, state, timeout)
+        return result[1] if result else None
+
+    def first_matching_selector(
+        self, *selectors: SelectorType, state: str = "visible", timeout: int | None = None
+    ) -> tuple[str, Locator] | None:
+        """
+        与 first_matching 相同地并行查找，同时返回命中的候选选择器（用于日志和报告）
+
+        Args:
+            *selectors: 候选选择器（按优先级排列）
+            state: 目标状态，visible / attached / hidden / detached
+            timeout: 最长等待时间（毫秒），为 0 时只检查当前状态不等待
+
+        Returns:
+            (命中候选的选择器描述, 元素定位器)，无法确定具体候选时选择器描述为
+            所有候选以 " | " 连接；超时未命中返回 None
+
+        Raises:
+            ValueError: 未提供候选选择器或状态无效
+        """
+        result = self._race_candidates(selectors, state, timeout)
+        if result is None:
+            return None
+        index, locator = result
+        if index < 0:
+            return " | ".join(self._get_selector_desc(s) for s in selectors), locator
+        return self._get_selector_desc(selectors[index]), locator
+
+    def locate(
+        self, name: str, *candidates: str, state: str = "visible", timeout: int | None = None
+    ) -> Locator | None:
+        """
+        通过定位器注册表解析逻辑元素
+
+        与 first_matching 相同地并行匹配所有候选，同时记录命中的候选；
+        候选保持声明的优先级，反复匹配失败的候选被移到末尾
+
+        Args:
+            name: 逻辑元素名称，如 "delete_dialog"
+            *candidates: 候选选择器（按默认优先级排列）
+            state: 目标状态，visible / attached
+            timeout: 最长等待时间（毫秒），为 0 时只检查当前状态不等待
+
+        Returns:
+            命中的元素定位器，超时未命中返回 None
+        """
+        element_name = f"{self.page_name}:{name}"
+        ordered = locator_registry.ordered(element_name, candidates)
+        result = self._race_candidates(ordered, state, timeout)
+        self._record_lookup(element_name, ordered, state, result)
+        return result[1] if result else None
+
+    @staticmethod
+    def _record_lookup(
+        element_name: str, ordered: list[str], state: str, result: tuple[int, Locator] | None
+    ) -> None:
+        """
+        将一次 locate 的结果记录到定位器注册表
+
+        只记录能确定结果的查找：hidden / detached 查找和无法确定命中候选（索引 -1）时不记录。
+
+        Args:
+            element_name: 逻辑元素名称（含页面名称）
+            ordered: 本次使用的候选顺序
+            state: 目标状态
+            result: _race_candidates 的返回值
+        """
+        if state not in ("visible", "attached"):
+            return
+        if result is None:
+            locator_registry.record(element_name, None)
+        elif result[0] >= 0:
+            index = result[0]
+            locator_registry.record(element_name, ordered[index], failed=ordered[:index])
+
+    def _race_candidates(
+        self, selectors: tuple | list, state: str, timeout: int | None
+    ) -> tuple[int, Locator] | None:
+        """
+        并行匹配候选选择器
+
+        Args:
+            selectors: 候选选择器（按优先级排列）
+            state: 目标状态
+            timeout: 最长等待时间（毫秒），为 0 时只检查当前状态不等待
+
+        Returns:
+            (命中候选的索引, 元素定位器)，无法确定具体候选时索引为 -1；未命中返回 None
+
+        Raises:
+            ValueError: 未提供候选选择器或状态无效
+        """
+        if not selectors:
+            raise ValueError("first_matching 至少需要一个候选选择器")
+        if state not in ("visible", "attached", "hidden", "detached"):
+            raise ValueError(f"无效的元素状态: {state}")
+
+        selectors_desc = " | ".join(self._get_selector_desc(s) for s in selectors)
+        locators = [self._get_locator(s) for s in selectors]
+        if state in ("visible", "hidden"):
+            # 按可见性过滤后，visible 等价于"存在"，hidden 等价于"全部移除"
+            locators = [locator.filter(visible=True) for locator in locators]
+        want_present = state in ("visible", "attached")
+
+        combined = locators[0]
+        for locator in locators[1:]:
+            combined = combined.or_(locator)
+
+        if timeout == 0:
+            satisfied = (combined.count() > 0) == want_present
+        else:
+            wait_timeout = self._wait_timeout("first_matching", selectors_desc, timeout)
+            wait_state = "attached" if want_present else "detached"
+            try:
+                started = time.perf_counter()
+                combined.first.wait_for(state=wait_state, timeout=wait_timeout)
+                self._record_latency("first_matching", selectors_desc, started)
+                satisfied = True
+            except PlaywrightTimeoutError:
+                satisfied = False
+
+        if not satisfied:
+            logger.debug(f"[{self.page_name}] 没有候选达到状态 {state}: {selectors_desc}")
+            return None
+
+        if not want_present:
+            return -1, locators[0]
+
+        for index, locator in enumerate(locators):
+            if locator.count() > 0:
+                logger.debug(
+                    f"[{self.page_name}] 命中候选选择器: {self._get_selector_desc(selectors[index])}"
+                )
+                return index, locator.first
+        # 命中的元素在检查期间消失，返回合并定位器由调用方继续处理
+        return -1, combined.first
+
     @allure.step("等待元素可见")
     def wait_for_visible(self, selector: SelectorType, timeout: int | None = None) -> Locator:
         """
@@ -266,11 +568,13 @@ class BasePage:
             定位到的元素
         """
         selector_desc = self._get_selector_desc(selector)
-        wait_timeout = timeout or self.timeout
+        wait_timeout = self._wait_timeout("visible", selector_desc, timeout)
         logger.debug(f"[{self.page_name}] 等待元素可见: {selector_desc}, 超时: {wait_timeout}ms")
         try:
+            started = time.perf_counter()
             element = self._get_locator(selector)
             element.wait_for(state="visible", timeout=wait_timeout)
+            self._record_latency("visible", selector_desc, started)
             logger.info(f"[{self.page_name}] 元素已可见: {selector_desc}")
             return element
         except PlaywrightTimeoutError as e:
@@ -290,10 +594,12 @@ class BasePage:
             timeout: 等待超时时间（毫秒）
         """
         selector_desc = self._get_selector_desc(selector)
-        wait_timeout = timeout or self.timeout
+        wait_timeout = self._wait_timeout("hidden", selector_desc, timeout)
         logger.debug(f"[{self.page_name}] 等待元素消失: {selector_desc}, 超时: {wait_timeout}ms")
         try:
+            started = time.perf_counter()
             self._get_locator(selector).wait_for(state="hidden", timeout=wait_timeout)
+            self._record_latency("hidden", selector_desc, started)
             logger.info(f"[{self.page_name}] 元素已消失: {selector_desc}")
         except PlaywrightTimeoutError as e:
             logger.error(f"[{self.page_name}] 等待元素消失超时: {selector_desc}")
@@ -381,7 +687,7 @@ class BasePage:
         """
         logger.info(f"[{self.page_name}] 截取页面截图: {name}")
         try:
-            screenshot = self.page.screenshot(full_page=True)
+            screenshot = self.page.screenshot(full_page=settings.FULL_PAGE_SCREENSHOTS)
             allure.attach(screenshot, name=name, attachment_type=allure.attachment_type.PNG)
             logger.debug(f"[{self.page_name}] 截图完成: {name}")
             return screenshot
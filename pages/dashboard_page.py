@@ -89,8 +89,8 @@ class DashboardPage(BasePage):
         Returns:
             self，支持链式调用
         """
-        # 等待加载器消失
-        self.is_hidden(self.LOADER, timeout=10000)
+        # 等待加载器消失（加载器未渲染时立即返回）
+        self.wait_up_to(self.LOADER, 10000, state="hidden")
         # 等待侧边栏可见
         self.wait_for_visible(self.SIDEBAR)
         return self
@@ -102,9 +102,9 @@ class DashboardPage(BasePage):
         Returns:
             是否在仪表盘页面
         """
-        return (
-            self.is_visible(self.DASHBOARD_GRID, timeout=5000)
-            or "dashboard" in self.get_current_url()
+        # 先检查 URL（无需等待），再等待仪表盘内容出现
+        return "dashboard" in self.get_current_url() or self.is_visible(
+            self.DASHBOARD_GRID, timeout=5000
         )
 
     # ==================== 导航方法 ====================
@@ -15,14 +15,39 @@ EmployeeFormPage - OrangeHRM 员工表单页面对象
 OrangeHRM Demo: https://opensource-demo.orangehrmlive.com
 """
 
+import json
+from collections.abc import Callable
+from typing import Any
+
 import allure
-from playwright.sync_api import Page
+from playwright.sync_api import Locator
 
+from config.settings import settings
 from pages.base_page import BasePage
-
-
-class EmployeeFormPage(BasePage):
-    """OrangeHRM 员工表单页面对象"""
+from pages.form_schema import (
+    FIELD_DATE,
+    FIELD_RADIO,
+    FIELD_SELECT,
+    FIELD_TEXT,
+    FillPlan,
+    FormField,
+    FormSchema,
+    convert_date,
+)
+from utils.data_factory import data_factory
+from utils.data_models import ContactDetails, JobDetails, PersonalDetails
+from utils.logger import logger
+from utils.page_pool import add_listener
+from utils.reference_data import reference_data
+
+
+class EmployeeFormElements:
+    """
+    员工表单页面元素、表单描述和脚本（同步和异步页面对象共用）
+
+    选项查找、填写计划拆分、结果映射、回退字段选择等不操作页面的逻辑也放在这里，
+    同步和异步页面对象只保留各自的 Playwright 调用。
+    """
 
     # 页面名称
     page_name = "EmployeeFormPage"
@@ -128,6 +153,7 @@ class EmployeeFormPage(BasePage):
     # ==================== 通用元素 ====================
 
     # 下拉选项
+    DROPDOWN_LISTBOX = ".oxd-select-dropdown"
     DROPDOWN_OPTIONS = ".oxd-select-dropdown .oxd-select-option"
 
     # 日期选择器
@@ -149,15 +175,417 @@ class EmployeeFormPage(BasePage):
     # 错误消息
     FIELD_ERROR = ".oxd-input-field-error-message"
 
-    def __init__(self, page: Page):
+    # 性别单选按钮（按标签文本定位）
+    RADIO_GENDER = ".oxd-radio-wrapper label:text-is('{value}')"
+
+    # ==================== 参考数据目录 ====================
+
+    # 目录名 -> (API 路径, 名称字段, 下拉框选择器)
+    # API 路径为 None 的目录通过一次读取下拉框选项获取
+    REFERENCE_CATALOGS = {
+        "nationalities": ("/web/index.php/api/v2/admin/nationalities", "name", SELECT_NATIONALITY),
+        "countries": (None, None, SELECT_COUNTRY),
+        "job_titles": ("/web/index.php/api/v2/admin/job-titles", "title", SELECT_JOB_TITLE),
+        "employment_statuses": (
+            "/web/index.php/api/v2/admin/employment-statuses",
+            "name",
+            SELECT_EMPLOYMENT_STATUS,
+        ),
+    }
+
+    # ==================== 表单描述（键与 test_data.json 一致） ====================
+
+    PERSONAL_DETAILS_FORM = FormSchema(
+        name="personal_details",
+        tab=TAB_PERSONAL_DETAILS,
+        fields=(
+            # 新版 OrangeHRM 已移除昵称字段
+            FormField("nickname", FIELD_TEXT, "Nickname", optional=True),
+            FormField("driver_license_number", FIELD_TEXT, "Driver's License Number"),
+            FormField(
+                "license_expiry_date", FIELD_DATE, "License Expiry Date", INPUT_LICENSE_EXPIRY
+            ),
+            FormField(
+                "nationality",
+                FIELD_SELECT,
+                "Nationality",
+                SELECT_NATIONALITY,
+                catalog="nationalities",
+            ),
+            FormField("marital_status", FIELD_SELECT, "Marital Status", SELECT_MARITAL_STATUS),
+            FormField("date_of_birth", FIELD_DATE, "Date of Birth", INPUT_DATE_OF_BIRTH),
+            FormField("gender", FIELD_RADIO, "Gender", RADIO_GENDER),
+        ),
+    )
+
+    CONTACT_DETAILS_FORM = FormSchema(
+        name="contact_details",
+        tab=TAB_CONTACT_DETAILS,
+        fields=(
+            FormField("street1", FIELD_TEXT, "Street 1"),
+            FormField("street2", FIELD_TEXT, "Street 2"),
+            FormField("city", FIELD_TEXT, "City"),
+            FormField("state", FIELD_TEXT, "State/Province"),
+            FormField("zip", FIELD_TEXT, "Zip/Postal Code"),
+            FormField("country", FIELD_SELECT, "Country", SELECT_COUNTRY, catalog="countries"),
+            FormField("home_phone", FIELD_TEXT, "Home"),
+            FormField("mobile", FIELD_TEXT, "Mobile"),
+            FormField("work_phone", FIELD_TEXT, "Work"),
+            FormField("work_email", FIELD_TEXT, "Work Email"),
+            FormField("other_email", FIELD_TEXT, "Other Email"),
+        ),
+    )
+
+    JOB_DETAILS_FORM = FormSchema(
+        name="job_details",
+        tab=TAB_JOB,
+        fields=(
+            FormField("joined_date", FIELD_DATE, "Joined Date", INPUT_JOINED_DATE),
+            FormField(
+                "job_title", FIELD_SELECT, "Job Title", SELECT_JOB_TITLE, catalog="job_titles"
+            ),
+            FormField("job_category", FIELD_SELECT, "Job Category", SELECT_JOB_CATEGORY),
+            FormField("sub_unit", FIELD_SELECT, "Sub Unit", SELECT_SUB_UNIT),
+            FormField("location", FIELD_SELECT, "Location", SELECT_LOCATION),
+            FormField(
+                "employment_status",
+                FIELD_SELECT,
+                "Employment Status",
+                SELECT_EMPLOYMENT_STATUS,
+                catalog="employment_statuses",
+            ),
+        ),
+    )
+
+    # 日期赋值脚本：直接设置输入框的值并派发事件，等待一帧（组件在 blur 后重新渲染）
+    # 再回读输入框的值；组件拒绝或改写该值时回读结果与赋值不同，由调用方回退到键盘输入
+    _SET_DATE_SCRIPT = """
+    async (input, value) => {
+        const setter = Object.getOwnPropertyDescriptor(HTMLInputElement.prototype, "value").set;
+        setter.call(input, value);
+        for (const type of ["input", "change", "blur"]) {
+            input.dispatchEvent(new Event(type, { bubbles: true }));
+        }
+        await new Promise((resolve) => requestAnimationFrame(resolve));
+        return input.value;
+    }
+    """
+
+    # 系统日期格式（日期输入框占位符），首次识别成功后同一会话内共享
+    _date_format: str = ""
+
+    # 批量填写脚本：按标签定位输入框，通过原生 setter 赋值并派发 input/change 事件
+    # （Vue 的 v-model 监听 input 事件），等待一帧后回读每个字段的值用于校验
+    _FILL_FIELDS_SCRIPT = """
+    async ({ scope, fields }) => {
+        const inputs = new Map();
+        for (const group of document.querySelectorAll(`${scope} .oxd-input-group`)) {
+            const label = group.querySelector("label");
+            const input = group.querySelector("input, textarea");
+            const text = label ? label.textContent.trim() : "";
+            if (input && text && !inputs.has(text)) {
+                inputs.set(text, input);
+            }
+        }
+        for (const [label, value] of fields) {
+            const input = inputs.get(label);
+            if (!input) {
+                continue;
+            }
+            const setter = Object.getOwnPropertyDescriptor(
+                Object.getPrototypeOf(input), "value"
+            ).set;
+            setter.call(input, value);
+            input.dispatchEvent(new Event("input", { bubbles: true }));
+            input.dispatchEvent(new Event("change", { bubbles: true }));
+        }
+        await new Promise((resolve) => requestAnimationFrame(resolve));
+        const values = {};
+        for (const [label] of fields) {
+            const input = inputs.get(label);
+            values[label] = input ? input.value : null;
+        }
+        return values;
+    }
+    """
+
+    @staticmethod
+    def _find_option_index(option_texts: list[str], option_text: str) -> int:
+        """
+        查找选项索引
+
+        Args:
+            option_texts: 下拉框的全部选项文本
+            option_text: 目标选项文本
+
+        Returns:
+            选项索引，不存在时返回 -1
+        """
+        if option_text in option_texts:
+            return option_texts.index(option_text)
+        for index, text in enumerate(option_texts):
+            if option_text in text:
+                return index
+        return -1
+
+    @staticmethod
+    def _labeled_input(label: str) -> str:
+        """
+        获取指定标签对应输入框的选择器
+
+        Args:
+            label: 字段标签
+
+        Returns:
+            选择器
+        """
+        # 标签作为 CSS 字符串引用，转义其中的引号（如 "Driver's License Number"）
+        quoted = json.dumps(label, ensure_ascii=False)
+        return f".oxd-input-group:has(label:text-is({quoted})) :is(input, textarea)"
+
+    # ==================== 共用逻辑（不操作页面） ====================
+
+    def __init__(self, page: Any):
         """
         初始化员工表单页面
 
         Args:
-            page: Playwright 页面实例
+            page: Playwright 页面实例（同步或异步）
         """
         super().__init__(page)
 
+        # 下拉框选择器 -> 选项文本，页面重新加载后失效
+        self._option_cache: dict[str, list[str]] = {}
+        add_listener(page, "load", self._clear_option_cache)
+
+    def _clear_option_cache(self, *_) -> None:
+        """页面重新加载后清空下拉选项缓存"""
+        self._option_cache.clear()
+
+    def _cached_option_index(self, dropdown_selector: str, option_text: str) -> int:
+        """
+        在缓存的下拉选项中查找选项索引
+
+        Args:
+            dropdown_selector: 下拉框选择器
+            option_text: 目标选项文本
+
+        Returns:
+            选项索引，未缓存或不存在时返回 -1
+        """
+        return self._find_option_index(self._option_cache.get(dropdown_selector, []), option_text)
+
+    def _cache_options(self, dropdown_selector: str, inner_texts: list[str]) -> list[str]:
+        """
+        缓存展开下拉框后读取的选项文本
+
+        Args:
+            dropdown_selector: 下拉框选择器
+            inner_texts: 全部选项的原始文本
+
+        Returns:
+            去除首尾空白的选项文本（含占位选项）
+        """
+        option_texts = [text.strip() for text in inner_texts]
+        self._option_cache[dropdown_selector] = option_texts
+        return option_texts
+
+    def _option_not_found(self, dropdown_selector: str, option_text: str) -> ValueError:
+        """
+        构造下拉选项不存在的异常
+
+        Args:
+            dropdown_selector: 下拉框选择器
+            option_text: 目标选项文本
+
+        Returns:
+            异常（由调用方在收起下拉框后抛出）
+        """
+        option_texts = self._option_cache.get(dropdown_selector)
+        return ValueError(f"下拉选项不存在: {option_text}，可选项: {option_texts}")
+
+    def _reference_catalog(self, catalog: str) -> tuple[str | None, str | None, str]:
+        """
+        获取参考数据目录的加载方式
+
+        Args:
+            catalog: 目录名
+
+        Returns:
+            (API 路径, 名称字段, 下拉框选择器)，没有 API 时前两项为 None
+
+        Raises:
+            KeyError: 目录不存在
+        """
+        if catalog not in self.REFERENCE_CATALOGS:
+            raise KeyError(f"参考数据目录不存在: {catalog}")
+        return self.REFERENCE_CATALOGS[catalog]
+
+    @staticmethod
+    def _selectable_options(option_texts: list[str]) -> list[str]:
+        """
+        去掉下拉框中的占位选项（如 "-- Select --"）
+
+        Args:
+            option_texts: 全部选项文本
+
+        Returns:
+            可选择的选项文本
+        """
+        return [text for text in option_texts if not text.startswith("--")]
+
+    @staticmethod
+    def _resolve_against(catalog: str, value: str, values: list[str]) -> str:
+        """
+        在已加载的目录中解析选项，目录无法加载时不做校验，原样返回
+
+        Args:
+            catalog: 目录名
+            value: 测试数据中的选项
+            values: 目录中的全部选项
+
+        Returns:
+            系统中的选项文本
+
+        Raises:
+            ValueError: 选项不存在
+        """
+        if not values:
+            return value
+        return reference_data.resolve(catalog, value, values)
+
+    @classmethod
+    def _remember_date_format(cls, placeholder: str | None) -> str:
+        """
+        记录从日期输入框占位符识别到的系统日期格式
+
+        Args:
+            placeholder: 日期输入框的占位符
+
+        Returns:
+            日期格式，占位符为空时返回空字符串（不缓存，下次填写日期时重新识别）
+        """
+        if not placeholder:
+            logger.debug(f"[{cls.page_name}] 未识别到系统日期格式")
+            return ""
+        cls._date_format = placeholder
+        logger.info(f"[{cls.page_name}] 系统日期格式: {placeholder}")
+        return placeholder
+
+    def _fill_fields_args(self, mapping: dict[str, str], scope: str | None) -> dict[str, Any]:
+        """
+        构造批量填写脚本的参数
+
+        Args:
+            mapping: 字段标签 -> 要填写的值
+            scope: 限定查找范围的 CSS 选择器，默认为表单区域
+
+        Returns:
+            _FILL_FIELDS_SCRIPT 的参数
+        """
+        logger.debug(f"[{self.page_name}] 批量填写 {len(mapping)} 个字段: {list(mapping)}")
+        return {
+            "scope": scope or self.FORM_SECTION,
+            "fields": [[label, value] for label, value in mapping.items()],
+        }
+
+    def _check_filled(self, mapping: dict[str, str], values: dict[str, Any]) -> dict[str, bool]:
+        """
+        比较批量填写后回读的值与期望值
+
+        Args:
+            mapping: 字段标签 -> 期望的值
+            values: 字段标签 -> 回读的值（字段不存在时为 None）
+
+        Returns:
+            字段标签 -> 是否填写成功
+        """
+        results = {label: values.get(label) == value for label, value in mapping.items()}
+        failed = [label for label, ok in results.items() if not ok]
+        if failed:
+            logger.warning(f"[{self.page_name}] 批量填写未生效的字段: {failed}")
+        else:
+            logger.info(f"[{self.page_name}] 批量填写成功: {len(mapping)} 个字段")
+        return results
+
+    @staticmethod
+    def _fallback_labels(results: dict[str, bool], optional: frozenset[str]) -> list[str]:
+        """
+        选出需要逐个回退到普通输入的字段（批量未生效的必填字段）
+
+        Args:
+            results: 字段标签 -> 批量填写是否成功
+            optional: 可选字段的标签
+
+        Returns:
+            字段标签列表
+        """
+        return [label for label, ok in results.items() if not ok and label not in optional]
+
+    @staticmethod
+    def _text_fields(plan: FillPlan) -> tuple[dict[str, str], frozenset[str]]:
+        """
+        将填写计划中的文本字段转换为批量填写的参数
+
+        Args:
+            plan: 填写计划
+
+        Returns:
+            (字段标签 -> 值, 可选字段的标签)
+        """
+        mapping = {f.label: value for f, value in plan.text.items()}
+        return mapping, frozenset(f.label for f in plan.text if f.optional)
+
+    @staticmethod
+    def _text_results(plan: FillPlan, label_results: dict[str, bool]) -> dict[str, bool]:
+        """
+        将按字段标签的填写结果映射为按数据键的结果
+
+        Args:
+            plan: 填写计划
+            label_results: 字段标签 -> 是否填写成功
+
+        Returns:
+            数据键 -> 是否填写成功
+        """
+        return {f.key: label_results[f.label] for f in plan.text}
+
+    def _field_action(self, form_field: FormField, value: str) -> tuple[Callable, tuple]:
+        """
+        选择按顺序填写的字段对应的操作
+
+        同步页面返回普通方法，异步页面返回协程函数，由调用方执行（或 await）。
+
+        Args:
+            form_field: 日期、下拉框或单选按钮字段
+            value: 要填写的值
+
+        Returns:
+            (操作, 参数)
+        """
+        if form_field.kind == FIELD_DATE:
+            return self.fill_date, (form_field.locator, value)
+        if form_field.kind == FIELD_SELECT:
+            return self.select_dropdown_option, (form_field.locator, value)
+        return self.page.locator(form_field.locator.format(value=value)).first.click, ()
+
+    def _profile_sections(self, *records: Any) -> list[tuple[FormSchema, Any]]:
+        """
+        选出员工档案中需要填写的 Tab
+
+        Args:
+            *records: 个人详情、联系方式、工作信息记录（不填写的为 None）
+
+        Returns:
+            (表单描述, 记录) 列表，按 Tab 顺序
+        """
+        schemas = (self.PERSONAL_DETAILS_FORM, self.CONTACT_DETAILS_FORM, self.JOB_DETAILS_FORM)
+        return [(schema, data) for schema, data in zip(schemas, records) if data]
+
+
+class EmployeeFormPage(EmployeeFormElements, BasePage):
+    """OrangeHRM 员工表单页面对象"""
+
     def wait_for_form_load(self) -> "EmployeeFormPage":
         """
         等待表单加载完成
@@ -165,7 +593,7 @@ class EmployeeFormPage(BasePage):
         Returns:
             self，支持链式调用
         """
-        self.is_hidden(self.LOADER, timeout=10000)
+        self.wait_up_to(self.LOADER, 10000, state="hidden")
         self.wait_for_visible(self.INPUT_FIRST_NAME, timeout=10000)
         return self
 
@@ -418,37 +846,128 @@ class EmployeeFormPage(BasePage):
         """
         选择下拉选项
 
+        展开下拉框后一次读取全部选项文本（同一页面加载内按下拉框缓存），
+        按索引点击目标选项，并等待菜单收起，不使用固定等待。
+
         Args:
             dropdown_selector: 下拉框选择器
-            option_text: 选项文本
+            option_text: 选项文本（优先完全匹配，其次部分匹配）
 
         Returns:
             self，支持链式调用
+
+        Raises:
+            ValueError: 下拉框中不存在该选项
         """
         # 点击下拉框 - 使用 .first 避免 strict mode violation
-        dropdown = self.page.locator(dropdown_selector).first
-        dropdown.click()
-        self.page.wait_for_timeout(500)
+        self.page.locator(dropdown_selector).first.click()
 
-        # 等待下拉菜单出现
-        self.page.locator(".oxd-select-dropdown").wait_for(state="visible", timeout=5000)
+        options = self.page.locator(self.DROPDOWN_OPTIONS)
+        options.first.wait_for(state="visible", timeout=5000)
 
-        # 选择选项 - 使用更精确的选择器
-        option = self.page.locator(
-            f".oxd-select-dropdown .oxd-select-option span:text-is('{option_text}')"
-        ).first
-        if option.is_visible():
-            option.click()
-        else:
-            # 尝试部分匹配
-            option_partial = self.page.locator(
-                f".oxd-select-option:has-text('{option_text}')"
-            ).first
-            option_partial.click()
+        index = self._cached_option_index(dropdown_selector, option_text)
+        if index < 0:
+            # 首次打开或缓存过期（选项有变化）时重新读取
+            option_texts = self._cache_options(dropdown_selector, options.all_inner_texts())
+            index = self._find_option_index(option_texts, option_text)
+
+        if index < 0:
+            self.page.keyboard.press("Escape")
+            raise self._option_not_found(dropdown_selector, option_text)
 
-        self.page.wait_for_timeout(300)
+        logger.debug(f"[{self.page_name}] 选择下拉选项: {option_text} (索引 {index})")
+        options.nth(index).click()
+        self.page.locator(self.DROPDOWN_LISTBOX).wait_for(state="hidden", timeout=5000)
         return self
 
+    # ==================== 参考数据 ====================
+
+    def get_options(self, catalog: str) -> list[str]:
+        """
+        获取参考数据目录的全部选项（每个会话只加载一次）
+
+        Args:
+            catalog: 目录名，见 REFERENCE_CATALOGS
+
+        Returns:
+            选项列表，无法加载时返回空列表
+
+        Raises:
+            KeyError: 目录不存在
+        """
+        api_path, name_field, dropdown_selector = self._reference_catalog(catalog)
+
+        def load() -> list[str] | None:
+            if api_path:
+                values = self._load_options_from_api(api_path, name_field)
+                if values:
+                    return values
+            return self._read_dropdown_options(dropdown_selector)
+
+        return reference_data.get(catalog, load)
+
+    def resolve_option(self, catalog: str, value: str) -> str:
+        """
+        校验选项是否存在，并解析为系统中的准确文本
+
+        目录无法加载时不做校验，原样返回。
+
+        Args:
+            catalog: 目录名
+            value: 测试数据中的选项
+
+        Returns:
+            系统中的选项文本
+
+        Raises:
+            ValueError: 选项不存在
+        """
+        return self._resolve_against(catalog, value, self.get_options(catalog))
+
+    def _load_options_from_api(self, api_path: str, name_field: str) -> list[str] | None:
+        """
+        通过系统 API 加载选项（复用当前页面的登录状态）
+
+        Args:
+            api_path: API 路径
+            name_field: 每条记录中的名称字段
+
+        Returns:
+            选项列表，请求失败时返回 None
+        """
+        try:
+            response = self.page.request.get(
+                f"{settings.BASE_URL}{api_path}", params={"limit": 0}
+            )
+            if not response.ok:
+                logger.debug(f"[{self.page_name}] 参考数据 API 请求失败: {response.status}")
+                return None
+            return [item[name_field] for item in response.json()["data"]]
+        except Exception as e:
+            logger.debug(f"[{self.page_name}] 参考数据 API 不可用: {api_path}, 错误: {e}")
+            return None
+
+    def _read_dropdown_options(self, dropdown_selector: str) -> list[str] | None:
+        """
+        展开当前页面的下拉框一次读取全部选项
+
+        Args:
+            dropdown_selector: 下拉框选择器
+
+        Returns:
+            选项列表（不含占位选项），下拉框不在当前页面时返回 None
+        """
+        if not self.is_visible_now(dropdown_selector):
+            return None
+
+        self.page.locator(dropdown_selector).first.click()
+        options = self.page.locator(self.DROPDOWN_OPTIONS)
+        options.first.wait_for(state="visible", timeout=5000)
+        # 顺便填充下拉选项缓存，后续选择时无需再次读取
+        option_texts = self._cache_options(dropdown_selector, options.all_inner_texts())
+        self.page.keyboard.press("Escape")
+        return self._selectable_options(option_texts)
+
     @allure.step("选择国籍: {nationality}")
     def select_nationality(self, nationality: str) -> "EmployeeFormPage":
         """
@@ -460,6 +979,7 @@ class EmployeeFormPage(BasePage):
         Returns:
             self，支持链式调用
         """
+        nationality = self.resolve_option("nationalities", nationality)
         return self.select_dropdown_option(self.SELECT_NATIONALITY, nationality)
 
     @allure.step("选择婚姻状况: {status}")
@@ -479,7 +999,10 @@ class EmployeeFormPage(BasePage):
 
     def fill_date(self, date_input_selector: str, date_str: str) -> "EmployeeFormPage":
         """
-        填写日期（直接输入）
+        填写日期（直接赋值，不打开日历控件）
+
+        按系统配置的日期格式转换后赋值，并派发 input/change/blur 事件使表单同步。
+        赋值未生效时回退到键盘输入。
 
         Args:
             date_input_selector: 日期输入框选择器
@@ -490,13 +1013,33 @@ class EmployeeFormPage(BasePage):
         """
         # 使用 .first 避免 strict mode violation
         date_input = self.page.locator(date_input_selector).first
-        date_input.clear()
-        date_input.fill(date_str)
-        # 点击其他地方关闭日期选择器
-        self.page.keyboard.press("Escape")
-        self.page.wait_for_timeout(300)
+        value = convert_date(date_str, self._detect_date_format(date_input))
+
+        if date_input.evaluate(self._SET_DATE_SCRIPT, value) != value:
+            logger.debug(f"[{self.page_name}] 日期赋值未生效，改用键盘输入: {value}")
+            date_input.clear()
+            date_input.fill(value)
+            # 关闭输入时弹出的日期选择器
+            self.page.keyboard.press("Escape")
         return self
 
+    @classmethod
+    def _detect_date_format(cls, date_input: Locator) -> str:
+        """
+        识别系统日期格式（每个会话识别成功一次）
+
+        OrangeHRM 日期输入框的占位符即为管理员配置的日期格式，如 "yyyy-dd-mm"。
+
+        Args:
+            date_input: 任一日期输入框
+
+        Returns:
+            日期格式，无法识别时返回空字符串（不缓存，下次填写日期时重新识别）
+        """
+        if not cls._date_format:
+            return cls._remember_date_format(date_input.get_attribute("placeholder"))
+        return cls._date_format
+
     @allure.step("填写出生日期: {date_str}")
     def fill_date_of_birth(self, date_str: str) -> "EmployeeFormPage":
         """
@@ -529,6 +1072,56 @@ class EmployeeFormPage(BasePage):
             self.page.locator("label:has-text('Female')").click()
         return self
 
+    # ==================== 批量填写 ====================
+
+    @allure.step("批量填写表单字段")
+    def fill_fields(
+        self, mapping: dict[str, str], scope: str | None = None
+    ) -> dict[str, bool]:
+        """
+        在一次页面调用中批量填写多个文本输入框
+
+        按字段标签定位输入框（如 "Street 1"、"Work Email"），赋值后派发
+        input/change 事件使 Vue 表单同步，并回读每个字段的值进行校验。
+
+        Args:
+            mapping: 字段标签 -> 要填写的值
+            scope: 限定查找范围的 CSS 选择器，默认为表单区域
+
+        Returns:
+            字段标签 -> 是否填写成功（字段存在且回读值与期望一致）
+        """
+        if not mapping:
+            return {}
+
+        values = self.page.evaluate(
+            self._FILL_FIELDS_SCRIPT, self._fill_fields_args(mapping, scope)
+        )
+        return self._check_filled(mapping, values)
+
+    def _fill_labeled_fields(
+        self, mapping: dict[str, str], optional: frozenset[str] = frozenset()
+    ) -> dict[str, bool]:
+        """
+        批量填写字段，批量未生效的字段逐个回退到普通输入
+
+        回退使用 BasePage.fill，元素不存在时按原有方式超时报错；
+        可选字段不回退，直接返回未填写。
+
+        Args:
+            mapping: 字段标签 -> 要填写的值（空值会被忽略）
+            optional: 可选字段的标签
+
+        Returns:
+            字段标签 -> 是否填写成功
+        """
+        mapping = {label: value for label, value in mapping.items() if value}
+        results = self.fill_fields(mapping)
+        for label in self._fallback_labels(results, optional):
+            self.fill(self._labeled_input(label), mapping[label])
+            results[label] = True
+        return results
+
     # ==================== 联系方式填写 ====================
 
     @allure.step("填写地址信息")
@@ -547,17 +1140,17 @@ class EmployeeFormPage(BasePage):
         Returns:
             self，支持链式调用
         """
-        if street1:
-            self.fill(self.INPUT_STREET1, street1)
-        if street2:
-            self.fill(self.INPUT_STREET2, street2)
-        if city:
-            self.fill(self.INPUT_CITY, city)
-        if state:
-            self.fill(self.INPUT_STATE, state)
-        if zip_code:
-            self.fill(self.INPUT_ZIP, zip_code)
+        self._fill_labeled_fields(
+            {
+                "Street 1": street1,
+                "Street 2": street2,
+                "City": city,
+                "State/Province": state,
+                "Zip/Postal Code": zip_code,
+            }
+        )
         if country:
+            country = self.resolve_option("countries", country)
             self.select_dropdown_option(self.SELECT_COUNTRY, country)
         return self
 
@@ -571,12 +1164,7 @@ class EmployeeFormPage(BasePage):
         Returns:
             self，支持链式调用
         """
-        if home:
-            self.fill(self.INPUT_HOME_PHONE, home)
-        if mobile:
-            self.fill(self.INPUT_MOBILE, mobile)
-        if work:
-            self.fill(self.INPUT_WORK_PHONE, work)
+        self._fill_labeled_fields({"Home": home, "Mobile": mobile, "Work": work})
         return self
 
     @allure.step("填写邮箱信息")
@@ -587,12 +1175,92 @@ class EmployeeFormPage(BasePage):
         Returns:
             self，支持链式调用
         """
-        if work_email:
-            self.fill(self.INPUT_WORK_EMAIL, work_email)
-        if other_email:
-            self.fill(self.INPUT_OTHER_EMAIL, other_email)
+        self._fill_labeled_fields({"Work Email": work_email, "Other Email": other_email})
         return self
 
+    @allure.step("填写联系方式")
+    def fill_contact_details(self, contact: ContactDetails | dict[str, str]) -> dict[str, bool]:
+        """
+        填写整个联系方式标签页
+
+        Args:
+            contact: 联系方式记录，或键与 test_data.json 中 contact_details 一致的字典
+
+        Returns:
+            数据键 -> 是否填写成功
+        """
+        return self.fill_form(self.CONTACT_DETAILS_FORM, contact)
+
+    # ==================== 声明式表单填写 ====================
+
+    @allure.step("填写表单")
+    def fill_form(self, schema: FormSchema, data: Any) -> dict[str, bool]:
+        """
+        按表单描述填写当前 Tab
+
+        先按参考数据校验下拉选项，再一次批量填写文本字段，
+        最后依次操作日期、下拉框、单选按钮。
+
+        Args:
+            schema: 表单描述
+            data: 测试数据记录或字典，键与表单描述中的字段 key 对应
+
+        Returns:
+            数据键 -> 是否填写成功（可选字段不存在时为 False）
+        """
+        plan = schema.plan(data)
+
+        # 操作 UI 之前校验所有下拉选项，测试数据有误时立即失败
+        plan.steps = [
+            (f, self.resolve_option(f.catalog, value) if f.catalog else value)
+            for f, value in plan.steps
+        ]
+
+        mapping, optional = self._text_fields(plan)
+        results = self._text_results(plan, self._fill_labeled_fields(mapping, optional))
+
+        for form_field, value in plan.steps:
+            action, args = self._field_action(form_field, value)
+            action(*args)
+            results[form_field.key] = True
+
+        return results
+
+    @allure.step("填写员工档案")
+    def fill_profile(
+        self,
+        personal: PersonalDetails | dict[str, str] | None = None,
+        contact: ContactDetails | dict[str, str] | None = None,
+        job: JobDetails | dict[str, str] | None = None,
+        save: bool = True,
+    ) -> dict[str, dict[str, bool]]:
+        """
+        在员工编辑页面依次填写个人详情、联系方式、工作信息
+
+        每个 Tab 切换后只等待加载指示器消失，填写后可选地保存并等待保存完成。
+
+        Args:
+            personal: 个人详情记录（TestDataLoader.get_personal_details）或同格式字典
+            contact: 联系方式记录（TestDataLoader.get_contact_details）或同格式字典
+            job: 工作信息记录（TestDataLoader.get_job_details）或同格式字典
+            save: 是否保存每个 Tab
+
+        Returns:
+            表单名称 -> (数据键 -> 是否填写成功)
+        """
+        results = {}
+        for schema, data in self._profile_sections(personal, contact, job):
+            self.click(schema.tab)
+            self.wait_up_to(self.LOADER, 10000, state="hidden")
+            self.wait_for_visible(self.page.locator(self.FORM_SECTION).first, timeout=10000)
+
+            results[schema.name] = self.fill_form(schema, data)
+
+            if save:
+                self.page.locator(self.FORM_SECTION).first.locator(self.SAVE_BUTTON).click()
+                self.wait_for_save_complete()
+        return results
+
     # ==================== 工作信息填写 ====================
 
     @allure.step("选择职位: {job_title}")
@@ -606,6 +1274,7 @@ class EmployeeFormPage(BasePage):
         Returns:
             self，支持链式调用
         """
+        job_title = self.resolve_option("job_titles", job_title)
         return self.select_dropdown_option(self.SELECT_JOB_TITLE, job_title)
 
     @allure.step("选择雇佣状态: {status}")
@@ -619,6 +1288,7 @@ class EmployeeFormPage(BasePage):
         Returns:
             self，支持链式调用
         """
+        status = self.resolve_option("employment_statuses", status)
         return self.select_dropdown_option(self.SELECT_EMPLOYMENT_STATUS, status)
 
     @allure.step("填写入职日期: {date_str}")
@@ -710,6 +1380,8 @@ class EmployeeFormPage(BasePage):
         emp_id = self.get_generated_employee_id()
 
         self.click_save()
+        # 登记创建的员工，测试未自行删除时在会话结束时统一清理
+        data_factory.register("employee", emp_id, f"{first_name} {last_name}".strip())
         self.wait_for_save_complete()
 
         return emp_id
@@ -0,0 +1,158 @@
+"""
+声明式表单描述
+
+[框架核心] 此文件是框架的核心组件，可直接复用于任何项目。
+
+用数据描述表单：每个字段声明对应的测试数据键、字段类型、表单标签和定位器，
+由页面对象根据填写计划一次完成整个表单：
+- 文本字段合并为一次批量填写
+- 日期、下拉框、单选按钮按顺序逐个操作
+
+使用示例：
+
+    CONTACT_FORM = FormSchema(
+        name="contact_details",
+        tab="a:has-text('Contact Details')",
+        fields=(
+            FormField("street1", FIELD_TEXT, "Street 1"),
+            FormField("country", FIELD_SELECT, "Country", ".oxd-select-text"),
+        ),
+    )
+
+    plan = CONTACT_FORM.plan({"street1": "123 Test Street", "country": "United States"})
+"""
+
+from dataclasses import asdict, dataclass, field, is_dataclass
+from datetime import datetime
+from typing import Any
+
+# 字段类型
+FIELD_TEXT = "text"
+FIELD_DATE = "date"
+FIELD_SELECT = "select"
+FIELD_RADIO = "radio"
+
+# 需要逐个操作的字段类型及其执行顺序
+_SEQUENCED_KINDS = (FIELD_DATE, FIELD_SELECT, FIELD_RADIO)
+
+# 日期格式占位符 -> strftime 指令（按长度从长到短替换）
+_DATE_TOKENS = (("yyyy", "%Y"), ("mm", "%m"), ("dd", "%d"))
+
+
+def convert_date(date_str: str, date_format: str) -> str:
+    """
+    将 YYYY-MM-DD 格式的日期转换为系统配置的日期格式
+
+    Args:
+        date_str: 日期字符串 (YYYY-MM-DD 格式)
+        date_format: 系统日期格式，即日期输入框的占位符，如 "yyyy-dd-mm"、"mm/dd/yyyy"
+
+    Returns:
+        转换后的日期字符串；格式无法识别或日期不是 YYYY-MM-DD 格式时原样返回
+    """
+    pattern = date_format.strip().lower()
+    if not all(token in pattern for token, _ in _DATE_TOKENS):
+        return date_str
+    for token, directive in _DATE_TOKENS:
+        pattern = pattern.replace(token, directive)
+    try:
+        return datetime.strptime(date_str, "%Y-%m-%d").strftime(pattern)
+    except ValueError:
+        return date_str
+
+
+@dataclass(frozen=True)
+class FormField:
+    """表单字段描述"""
+
+    # 测试数据中的键，如 "street1"
+    key: str
+    # 字段类型：FIELD_TEXT / FIELD_DATE / FIELD_SELECT / FIELD_RADIO
+    kind: str
+    # 表单上显示的字段标签，文本字段按标签批量定位
+    label: str
+    # 日期和下拉框的选择器；单选按钮为包含 {value} 占位符的选择器模板
+    locator: str = ""
+    # 字段在部分版本的系统中不存在时设为 True，找不到时跳过而不是报错
+    optional: bool = False
+    # 下拉框对应的参考数据目录（如 "nationalities"），用于在操作 UI 前校验选项
+    catalog: str = ""
+
+    def __post_init__(self):
+        if self.kind != FIELD_TEXT and self.kind not in _SEQUENCED_KINDS:
+            raise ValueError(f"不支持的字段类型: {self.key} -> {self.kind}")
+        if self.kind != FIELD_TEXT and not self.locator:
+            raise ValueError(f"{self.kind} 类型字段必须提供定位器: {self.key}")
+
+
+@dataclass
+class FillPlan:
+    """表单填写计划"""
+
+    # 批量填写的文本字段：字段描述 -> 值
+    text: dict[FormField, str] = field(default_factory=dict)
+    # 按顺序执行的字段：(字段描述, 值)
+    steps: list[tuple[FormField, str]] = field(default_factory=list)
+
+
+@dataclass(frozen=True)
+class FormSchema:
+    """表单描述"""
+
+    # 表单名称，与测试数据中的分组键一致，如 "contact_details"
+    name: str
+    # 表单所在 Tab 的选择器
+    tab: str
+    # 字段描述
+    fields: tuple[FormField, ...]
+
+    def get_field(self, key: str) -> FormField:
+        """
+        获取字段描述
+
+        Args:
+            key: 测试数据键
+
+        Returns:
+            字段描述
+
+        Raises:
+            KeyError: 字段不存在
+        """
+        for form_field in self.fields:
+            if form_field.key == key:
+                return form_field
+        raise KeyError(f"表单 {self.name} 中不存在字段: {key}")
+
+    def plan(self, data: Any) -> FillPlan:
+        """
+        根据测试数据生成填写计划
+
+        空值字段会被跳过；顺序字段按 日期 -> 下拉框 -> 单选按钮 排列，
+        同类字段保持表单中声明的顺序。
+
+        Args:
+            data: 测试数据字典或测试数据记录（如 ContactDetails），键与字段描述的 key 对应
+
+        Returns:
+            填写计划
+
+        Raises:
+            KeyError: 测试数据中包含表单未声明的字段
+        """
+        if is_dataclass(data):
+            data = asdict(data)
+
+        unknown = [key for key in data if key not in {f.key for f in self.fields}]
+        if unknown:
+            raise KeyError(f"表单 {self.name} 中不存在字段: {unknown}")
+
+        plan = FillPlan()
+        for kind in _SEQUENCED_KINDS:
+            plan.steps.extend(
+                (f, data[f.key]) for f in self.fields if f.kind == kind and data.get(f.key)
+            )
+        plan.text = {
+            f: data[f.key] for f in self.fields if f.kind == FIELD_TEXT and data.get(f.key)
+        }
+        return plan
@@ -18,12 +18,15 @@ from config.settings import settings
 from pages.base_page import BasePage
 
 
-class LoginPage(BasePage):
-    """OrangeHRM 登录页面对象"""
+class LoginElements:
+    """登录页面元素（同步和异步页面对象共用）"""
 
     # 页面名称
     page_name = "LoginPage"
 
+    # 页面路径
+    PAGE_PATH = "/web/index.php/auth/login"
+
     # 页面元素定位器
     USERNAME_INPUT = "input[name='username']"
     PASSWORD_INPUT = "input[name='password']"
@@ -38,6 +41,10 @@ class LoginPage(BasePage):
     DASHBOARD_HEADER = ".oxd-topbar-header-title"
     USER_DROPDOWN = ".oxd-userdropdown"
 
+
+class LoginPage(LoginElements, BasePage):
+    """OrangeHRM 登录页面对象"""
+
     def __init__(self, page: Page):
         """
         初始化登录页面
@@ -46,7 +53,7 @@ class LoginPage(BasePage):
             page: Playwright 页面实例
         """
         super().__init__(page)
-        self.url = f"{settings.BASE_URL}/web/index.php/auth/login"
+        self.url = f"{settings.BASE_URL}{self.PAGE_PATH}"
 
     @allure.step("打开登录页面")
     def open(self) -> "LoginPage":
@@ -133,12 +140,10 @@ class LoginPage(BasePage):
         Returns:
             错误消息文本
         """
-        # 首先检查 alert 类型的错误消息
-        if self.is_visible(self.ERROR_MESSAGE, timeout=3000):
-            return self.get_text(self.ERROR_MESSAGE)
-        # 然后检查输入框下的错误消息
-        if self.is_visible(self.ERROR_ICON, timeout=1000):
-            return self.get_text(self.ERROR_ICON)
+        # 同时等待 alert 类型和输入框下的错误消息，优先返回 alert
+        error = self.first_matching(self.ERROR_MESSAGE, self.ERROR_ICON, timeout=3000)
+        if error is not None:
+            return error.text_content() or ""
         return ""
 
     def get_field_error(self, field_name: str = "username") -> str:
@@ -166,9 +171,7 @@ class LoginPage(BasePage):
         Returns:
             是否显示错误消息
         """
-        return self.is_visible(self.ERROR_MESSAGE, timeout=3000) or self.is_visible(
-            self.ERROR_ICON, timeout=1000
-        )
+        return self.first_matching(self.ERROR_MESSAGE, self.ERROR_ICON, timeout=3000) is not None
 
     def is_login_page(self) -> bool:
         """
@@ -17,6 +17,7 @@ OrangeHRM Demo: https://opensource-demo.orangehrmlive.com
 """
 
 import contextlib
+import re
 
 import allure
 from playwright.sync_api import Page
@@ -25,12 +26,32 @@ from config.settings import settings
 from pages.base_page import BasePage
 
 
-class PIMPage(BasePage):
-    """OrangeHRM PIM 页面对象"""
+def parse_records_count(text: str) -> int:
+    """
+    解析 "(X) Records Found" 格式的记录数
+
+    Args:
+        text: 记录数文本
+
+    Returns:
+        记录数，无法解析时返回 0
+    """
+    if "Records Found" in text:
+        match = re.search(r"\((\d+)\)", text)
+        if match:
+            return int(match.group(1))
+    return 0
+
+
+class PIMElements:
+    """PIM 页面元素（同步和异步页面对象共用）"""
 
     # 页面名称
     page_name = "PIMPage"
 
+    # 页面路径
+    PAGE_PATH = "/web/index.php/pim/viewEmployeeList"
+
     # 页面标题和导航
     PAGE_TITLE = ".oxd-topbar-header-breadcrumb"
     TOPBAR_MENU = ".oxd-topbar-body-nav"
@@ -75,6 +96,26 @@ class PIMPage(BasePage):
     CONFIRM_DELETE_BUTTON = ".oxd-dialog-sheet button.oxd-button--label-danger"
     CANCEL_DELETE_BUTTON = ".oxd-dialog-sheet button.oxd-button--text"
 
+    # 删除确认对话框的候选选择器（按默认优先级排列，通过 locate 并行匹配并记录命中统计）
+    DIALOG_SELECTORS = (
+        ".oxd-dialog-sheet",
+        ".orangehrm-dialog-popup",
+        "div[role='dialog']",
+    )
+    CONFIRM_DELETE_SELECTORS = (
+        ".oxd-dialog-sheet button.oxd-button--label-danger",
+        ".orangehrm-modal-footer button.oxd-button--label-danger",
+        "button.oxd-button--label-danger:has-text('Yes, Delete')",
+        "button:has-text('Yes, Delete')",
+        ".oxd-dialog-sheet button:last-child",  # 通常确认按钮在右边
+    )
+    CANCEL_DELETE_SELECTORS = (
+        ".oxd-dialog-sheet button.oxd-button--text",
+        ".orangehrm-modal-footer button.oxd-button--text",
+        "button.oxd-button--text:has-text('No, Cancel')",
+        "button:has-text('No, Cancel')",
+    )
+
     # Toast 消息
     TOAST_MESSAGE = ".oxd-toast"
     TOAST_SUCCESS = ".oxd-toast--success"
@@ -93,6 +134,15 @@ class PIMPage(BasePage):
 
     # 无记录提示
     NO_RECORDS = ".oxd-table-body .oxd-text--span"
+    NO_RECORDS_SELECTORS = (
+        ".oxd-table-body span:has-text('No Records Found')",
+        ".oxd-table-body .oxd-text--span:has-text('No Records')",
+        "text=No Records Found",
+    )
+
+
+class PIMPage(PIMElements, BasePage):
+    """OrangeHRM PIM 页面对象"""
 
     def __init__(self, page: Page):
         """
@@ -102,7 +152,7 @@ class PIMPage(BasePage):
             page: Playwright 页面实例
         """
         super().__init__(page)
-        self.url = f"{settings.BASE_URL}/web/index.php/pim/viewEmployeeList"
+        self.url = f"{settings.BASE_URL}{self.PAGE_PATH}"
 
     @allure.step("打开 PIM 员工列表页面")
     def open(self) -> "PIMPage":
@@ -123,8 +173,8 @@ class PIMPage(BasePage):
         Returns:
             self，支持链式调用
         """
-        # 等待加载器消失
-        self.is_hidden(self.LOADER, timeout=10000)
+        # 等待加载器消失（加载器未渲染时立即返回）
+        self.wait_up_to(self.LOADER, 10000, state="hidden")
         # 等待表格可见
         self.wait_for_visible(self.TABLE, timeout=10000)
         return self
@@ -138,7 +188,7 @@ class PIMPage(BasePage):
         """
         # 等待可能的加载指示器
         self.page.wait_for_timeout(500)
-        self.is_hidden(self.LOADER, timeout=10000)
+        self.wait_up_to(self.LOADER, 10000, state="hidden")
         return self
 
     def is_on_pim_page(self) -> bool:
@@ -264,15 +314,7 @@ class PIMPage(BasePage):
         Returns:
             员工数量
         """
-        count_text = self.get_text(self.RECORDS_COUNT)
-        # 解析 "(X) Records Found" 格式
-        if "Records Found" in count_text:
-            import re
-
-            match = re.search(r"\((\d+)\)", count_text)
-            if match:
-                return int(match.group(1))
-        return 0
+        return parse_records_count(self.get_text(self.RECORDS_COUNT))
 
     def get_table_rows(self) -> list:
         """
@@ -283,6 +325,16 @@ class PIMPage(BasePage):
         """
         return self.page.locator(self.TABLE_ROW).all()
 
+    def get_employee_ids(self) -> list[str]:
+        """
+        获取当前表格中的员工 ID
+
+        Returns:
+            员工 ID 列表（按表格顺序）
+        """
+        cells = self.page.locator(f"{self.TABLE_ROW} {self.TABLE_CELL}:nth-child(2)")
+        return [text.strip() for text in cells.all_inner_texts()]
+
     def get_employee_data_from_row(self, row_index: int = 0) -> dict:
         """
         从指定行获取员工数据
@@ -329,38 +381,28 @@ class PIMPage(BasePage):
         """
         检查是否显示无记录
 
+        只读取当前页面快照，不会在"没有该元素"的情况下等待超时
+
         Returns:
             是否无记录
         """
-        # 等待页面稳定
-        self.page.wait_for_timeout(500)
+        # 等待可能仍在进行的表格加载
+        self.wait_up_to(self.LOADER, 10000, state="hidden")
 
         # 方法1: 检查表格行数是否为0
-        rows = self.page.locator(self.TABLE_ROW).all()
-        if len(rows) == 0:
+        if self.page.locator(self.TABLE_ROW).count() == 0:
             return True
 
-        # 方法2: 检查 "No Records Found" 文本
-        # 使用更精确的选择器
-        no_records_selectors = [
-            ".oxd-table-body span:has-text('No Records Found')",
-            ".oxd-table-body .oxd-text--span:has-text('No Records')",
-            "text=No Records Found",
-        ]
-
-        for selector in no_records_selectors:
-            try:
-                locator = self.page.locator(selector)
-                if locator.count() > 0 and locator.first.is_visible():
-                    return True
-            except Exception:
-                continue
+        # 方法2: 检查 "No Records Found" 文本（所有候选一次性检查；有记录时本就不会出现，
+        # 不通过 locate 记录，以免每次查询到数据都给候选记一次 miss）
+        if self.first_matching(*self.NO_RECORDS_SELECTORS, timeout=0) is not None:
+            return True
 
         # 方法3: 检查记录数
-        with contextlib.suppress(Exception):
-            count = self.get_employee_count()
-            if count == 0:
-                return True
+        if self.is_visible_now(self.RECORDS_COUNT):
+            with contextlib.suppress(Exception):
+                if self.get_employee_count() == 0:
+                    return True
 
         return False
 
@@ -410,62 +452,24 @@ class PIMPage(BasePage):
         Returns:
             self，支持链式调用
         """
-        # 等待对话框出现
-        dialog_selectors = [
-            ".oxd-dialog-sheet",
-            ".orangehrm-dialog-popup",
-            "div[role='dialog']",
-        ]
-
-        dialog_visible = False
-        for selector in dialog_selectors:
-            try:
-                dialog = self.page.locator(selector)
-                dialog.wait_for(state="visible", timeout=5000)
-                dialog_visible = True
-                break
-            except Exception:
-                continue
-
-        if not dialog_visible:
+        # 等待对话框出现（所有候选并行匹配）
+        if self.locate("delete_dialog", *self.DIALOG_SELECTORS, timeout=5000) is None:
             # 如果对话框没出现，可能已经点击了，等待一下
             self.page.wait_for_timeout(1000)
 
-        # 尝试不同的选择器找到确认删除按钮
-        confirm_selectors = [
-            ".oxd-dialog-sheet button.oxd-button--label-danger",
-            ".orangehrm-modal-footer button.oxd-button--label-danger",
-            "button.oxd-button--label-danger:has-text('Yes, Delete')",
-            "button:has-text('Yes, Delete')",
-            ".oxd-dialog-sheet button:last-child",  # 通常确认按钮在右边
-        ]
-
-        clicked = False
-        for selector in confirm_selectors:
-            try:
-                confirm_btn = self.page.locator(selector).first
-                if confirm_btn.is_visible():
-                    confirm_btn.click()
-                    clicked = True
-                    break
-            except Exception:
-                continue
-
-        if not clicked:
+        # 找到确认删除按钮
+        confirm_btn = self.locate(
+            "confirm_delete_button", *self.CONFIRM_DELETE_SELECTORS, timeout=5000
+        )
+        if confirm_btn is not None:
+            confirm_btn.click()
+        else:
             # 最后尝试：直接点击对话框中的危险按钮
             with contextlib.suppress(Exception):
                 self.page.locator("button.oxd-button--label-danger").first.click()
 
-        # 等待删除操作完成
-        self.page.wait_for_timeout(1500)
-
         # 等待对话框消失
-        for selector in dialog_selectors:
-            try:
-                self.page.locator(selector).wait_for(state="hidden", timeout=5000)
-                break
-            except Exception:
-                continue
+        self.first_matching(*self.DIALOG_SELECTORS, state="hidden", timeout=5000)
 
         # 等待可能的 Toast 消息
         with contextlib.suppress(Exception):
@@ -482,27 +486,17 @@ class PIMPage(BasePage):
         Returns:
             self，支持链式调用
         """
-        # 等待对话框出现
-        self.page.wait_for_timeout(1000)
-
-        # 尝试不同的选择器找到取消按钮
-        cancel_selectors = [
-            ".oxd-dialog-sheet button.oxd-button--text",
-            ".orangehrm-modal-footer button.oxd-button--text",
-            "button.oxd-button--text:has-text('No, Cancel')",
-            "button:has-text('No, Cancel')",
-        ]
-
-        for selector in cancel_selectors:
-            cancel_btn = self.page.locator(selector).first
-            if cancel_btn.is_visible():
-                cancel_btn.click()
-                self.page.wait_for_timeout(500)
-                return self
-
-        # 如果都找不到，尝试最后一个选择器
-        self.page.locator(cancel_selectors[-1]).first.click()
-        self.page.wait_for_timeout(500)
+        # 等待取消按钮出现（所有候选并行匹配）
+        cancel_btn = self.locate(
+            "cancel_delete_button", *self.CANCEL_DELETE_SELECTORS, timeout=5000
+        )
+        if cancel_btn is None:
+            # 如果都找不到，尝试最后一个选择器
+            cancel_btn = self.page.locator(self.CANCEL_DELETE_SELECTORS[-1]).first
+        cancel_btn.click()
+
+        # 等待对话框关闭
+        self.first_matching(*self.DIALOG_SELECTORS, state="hidden", timeout=5000)
         return self
 
     @allure.step("选择第 {row_index} 行的复选框")
@@ -543,6 +537,60 @@ class PIMPage(BasePage):
         self.click(self.DELETE_SELECTED_BUTTON)
         return self
 
+    def go_to_next_results_page(self) -> bool:
+        """
+        翻到搜索结果的下一页
+
+        Returns:
+            是否已翻页（已是最后一页时返回 False）
+        """
+        next_button = self.page.locator(self.PAGINATION_NEXT).first
+        if not self.is_visible_now(next_button):
+            return False
+        next_button.click()
+        self.wait_for_table_update()
+        return True
+
+    @allure.step("批量删除员工")
+    def bulk_delete_employees(self, employee_ids: list[str], search_text: str) -> int:
+        """
+        搜索后勾选所有目标员工并删除
+
+        结果分页显示，每轮勾选一页中的目标员工并删除，然后重新搜索，
+        直到所有页面中都不再有目标员工。每个员工最多删除一次，删除未生效时不会无限重试。
+
+        Args:
+            employee_ids: 要删除的员工 ID
+            search_text: 员工 ID 搜索条件（目标员工 ID 的公共部分）
+
+        Returns:
+            删除的员工数
+        """
+        targets = set(employee_ids)
+        deleted = 0
+        while targets:
+            self.search_by_employee_id(search_text)
+            self.click_search()
+
+            # 当前页没有目标员工（如都是其他 worker 的员工）时向后翻页
+            selected = set()
+            while not self.has_no_records():
+                for index, row_id in enumerate(self.get_employee_ids()):
+                    if row_id in targets:
+                        self.select_row(index)
+                        selected.add(row_id)
+                if selected or not self.go_to_next_results_page():
+                    break
+            if not selected:
+                break
+
+            self.delete_selected()
+            self.confirm_delete()
+            self.wait_for_table_update()
+            targets -= selected
+            deleted += len(selected)
+        return deleted
+
     # ==================== Toast 消息 ====================
 
     def get_toast_message(self) -> str:
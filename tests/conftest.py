@@ -8,24 +8,50 @@ Pytest fixtures 配置文件
 如果你要测试自己的系统：
 - 框架核心 fixtures 可直接使用，无需修改
 - 参考 OrangeHRM 示例 fixtures 创建你自己的页面对象 fixtures
+
+导入开销：页面对象、allure 和清理工具在首次使用时才导入，
+`pytest --collect-only` 和只运行部分测试的 worker 不会为未用到的模块付出导入开销。
 """
 
+from __future__ import annotations
+
+import asyncio
 import contextlib
-from collections.abc import Generator
+from collections.abc import Callable, Coroutine, Generator
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from typing import TYPE_CHECKING
 
-import allure
 import pytest
 from playwright.sync_api import Browser, BrowserContext, Page, Playwright, sync_playwright
 
-from config.settings import settings
-from pages.dashboard_page import DashboardPage
-from pages.employee_form_page import EmployeeFormPage
-from pages.login_page import LoginPage
-from pages.pim_page import PIMPage
+import pages
+from config.settings import RUN_PROFILES, settings
+from utils.adaptive_timeout import adaptive_timeouts
+from utils.browser_context import (
+    close_context,
+    close_context_async,
+    new_context,
+    new_context_async,
+    viewport_overrides,
+)
+from utils.data_loader import TestDataLoader
+from utils.data_models import Employee
+from utils.locator_registry import locator_registry
 from utils.logger import logger
+from utils.page_metrics import page_metrics
+from utils.page_pool import PagePool
 from utils.session_manager import validate_session_file
 
+if TYPE_CHECKING:
+    from playwright.async_api import (
+        Browser as AsyncBrowser,
+        BrowserContext as AsyncBrowserContext,
+        Page as AsyncPage,
+    )
+
+    from utils.local_site import LocalSite
+
 
 # ==============================================================================
 # [框架核心] 命令行参数
@@ -53,6 +79,31 @@ def pytest_addoption(parser):
         default=False,
         help="Save session state after login for future reuse",
     )
+    parser.addoption(
+        "--recycle-pages",
+        action="store_true",
+        default=False,
+        help="Reset and reuse pages between tests on the same worker instead of reopening",
+    )
+    parser.addoption(
+        "--profile",
+        action="store",
+        default=None,
+        choices=list(RUN_PROFILES),
+        help="Run profile: fast-ci, throughput (smallest full layout) or debug (headed, tracing)",
+    )
+    parser.addoption(
+        "--local-site",
+        action="store_true",
+        default=False,
+        help="Run against the bundled local copy of the OrangeHRM pages instead of BASE_URL",
+    )
+    parser.addoption(
+        "--sweep-test-data",
+        action="store_true",
+        default=False,
+        help="Delete leftover test employees from earlier runs at session end",
+    )
 
 
 # ==============================================================================
@@ -91,6 +142,48 @@ def save_session(request) -> bool:
     return request.config.getoption("--save-session", default=False)
 
 
+@pytest.fixture(scope="session")
+def recycle_pages(request) -> bool:
+    """获取是否复用页面"""
+    cli_option = request.config.getoption("--recycle-pages", default=False)
+    return cli_option or settings.RECYCLE_PAGES
+
+
+# ==============================================================================
+# [框架核心] 本地测试站点 Fixtures
+# ==============================================================================
+
+
+@pytest.fixture(scope="session")
+def local_site() -> Generator[LocalSite, None, None]:
+    """
+    启动本地测试站点（data/site 中 OrangeHRM 页面的副本和内存中的员工 API）
+
+    Yields:
+        LocalSite 实例，site.url 为站点地址，site.reset() 恢复初始员工数据
+    """
+    from utils.local_site import LocalSite
+
+    with LocalSite() as site:
+        yield site
+
+
+@pytest.fixture(scope="session", autouse=True)
+def use_local_site(request) -> Generator[None, None, None]:
+    """
+    使用 --local-site 时将 BASE_URL 切换到本地测试站点（在任何页面对象创建之前）
+
+    每个 xdist worker 启动自己的站点，员工数据互不影响。
+    """
+    if not request.config.getoption("--local-site"):
+        yield
+        return
+
+    site = request.getfixturevalue("local_site")
+    with settings.override(BASE_URL=site.url):
+        yield
+
+
 # ==============================================================================
 # [框架核心] 浏览器和页面 Fixtures
 # ==============================================================================
@@ -129,34 +222,99 @@ def browser(
     browser.close()
 
 
+@pytest.fixture(scope="session")
+def page_pool(browser: Browser, recycle_pages: bool) -> Generator[PagePool | None, None, None]:
+    """
+    未认证页面的复用池（仅在启用页面复用时创建）
+
+    Args:
+        browser: 浏览器实例
+        recycle_pages: 是否复用页面
+
+    Yields:
+        页面复用池，未启用时为 None
+    """
+    if not recycle_pages:
+        yield None
+        return
+
+    pool = PagePool(browser)
+    yield pool
+    pool.close()
+
+
 @pytest.fixture(scope="function")
-def context(browser: Browser) -> Generator[BrowserContext, None, None]:
+def context_overrides(request) -> dict:
+    """
+    当前测试的上下文配置覆盖
+
+    来自 @pytest.mark.viewport 标记（可标记在测试、类或模块上），如：
+        @pytest.mark.viewport("throughput")
+        @pytest.mark.viewport(1280, 720, device_scale_factor=2)
+
+    Args:
+        request: pytest 请求对象
+
+    Returns:
+        上下文配置覆盖，没有标记时为空字典
+    """
+    marker = request.node.get_closest_marker("viewport")
+    if marker is None:
+        return {}
+    return viewport_overrides(*marker.args, **marker.kwargs)
+
+
+@pytest.fixture(scope="function")
+def context(
+    request, browser: Browser, page_pool: PagePool | None, context_overrides: dict
+) -> Generator[BrowserContext, None, None]:
     """
     创建浏览器上下文
 
+    启用页面复用时返回 worker 内共享的上下文（Cookie 在每个测试后清除）；
+    测试覆盖了视口等上下文配置时总是创建独立的上下文
+
     Args:
+        request: pytest 请求对象
         browser: 浏览器实例
+        page_pool: 页面复用池
+        context_overrides: 上下文配置覆盖
 
     Yields:
         浏览器上下文
     """
-    context_config = settings.get_context_config()
-    context = browser.new_context(**context_config)
+    if page_pool is not None and not context_overrides:
+        yield page_pool.context
+        return
+
+    context = new_context(browser, **context_overrides)
     yield context
-    context.close()
+    close_context(context, request.node.nodeid)
 
 
 @pytest.fixture(scope="function")
-def page(context: BrowserContext) -> Generator[Page, None, None]:
+def page(
+    context: BrowserContext, page_pool: PagePool | None, context_overrides: dict
+) -> Generator[Page, None, None]:
     """
     创建页面实例
 
+    启用页面复用时从复用池获取页面，测试结束后重置并归还
+
     Args:
         context: 浏览器上下文
+        page_pool: 页面复用池
+        context_overrides: 上下文配置覆盖
 
     Yields:
         页面实例
     """
+    if page_pool is not None and not context_overrides:
+        page = page_pool.acquire()
+        yield page
+        page_pool.release(page)
+        return
+
     page = context.new_page()
     page.set_default_timeout(settings.TIMEOUT)
     yield page
@@ -220,13 +378,12 @@ def auth_state(
     if save_session or reuse_session:
         logger.info("执行登录以创建 Session...")
 
-        context_config = settings.get_context_config()
-        context = browser.new_context(**context_config)
+        context = new_context(browser)
         page = context.new_page()
 
         try:
             # [示例] OrangeHRM 登录逻辑 - 如果你的系统不同，请修改此处
-            login_page = LoginPage(page)
+            login_page = pages.LoginPage(page)
             login_page.open().login_as_admin()
 
             # 等待登录成功
@@ -243,9 +400,43 @@ def auth_state(
         yield None
 
 
+@pytest.fixture(scope="session")
+def auth_page_pool(
+    browser: Browser, auth_state: Path | None, recycle_pages: bool
+) -> Generator[PagePool | None, None, None]:
+    """
+    已认证页面的复用池（仅在启用页面复用时创建）
+
+    共享上下文从 session 状态创建，归还页面时保留 Cookie 以维持登录状态
+
+    Args:
+        browser: 浏览器实例
+        auth_state: session 文件路径
+        recycle_pages: 是否复用页面
+
+    Yields:
+        页面复用池，未启用时为 None
+    """
+    if not recycle_pages:
+        yield None
+        return
+
+    context_config = {}
+    if auth_state and _is_session_valid(auth_state, browser):
+        context_config["storage_state"] = str(auth_state)
+
+    pool = PagePool(browser, context_config=context_config, clear_cookies=False)
+    yield pool
+    pool.close()
+
+
 @pytest.fixture(scope="function")
 def auth_context(
-    browser: Browser, auth_state: Path | None
+    request,
+    browser: Browser,
+    auth_state: Path | None,
+    auth_page_pool: PagePool | None,
+    context_overrides: dict,
 ) -> Generator[BrowserContext, None, None]:
     """
     创建已认证的浏览器上下文
@@ -254,25 +445,33 @@ def auth_context(
     否则创建普通上下文
 
     Args:
+        request: pytest 请求对象
         browser: 浏览器实例
         auth_state: session 文件路径
+        auth_page_pool: 已认证页面的复用池
+        context_overrides: 上下文配置覆盖
 
     Yields:
         已认证的浏览器上下文
     """
-    context_config = settings.get_context_config()
+    if auth_page_pool is not None and not context_overrides:
+        yield auth_page_pool.context
+        return
 
+    storage_state = None
     if auth_state and _is_session_valid(auth_state, browser):
-        context_config["storage_state"] = str(auth_state)
+        storage_state = str(auth_state)
         logger.debug("使用保存的 Session 状态创建上下文")
 
-    context = browser.new_context(**context_config)
+    context = new_context(browser, **context_overrides, storage_state=storage_state)
     yield context
-    context.close()
+    close_context(context, request.node.nodeid)
 
 
 @pytest.fixture(scope="function")
-def auth_page(auth_context: BrowserContext) -> Generator[Page, None, None]:
+def auth_page(
+    auth_context: BrowserContext, auth_page_pool: PagePool | None, context_overrides: dict
+) -> Generator[Page, None, None]:
     """
     创建已认证的页面实例
 
@@ -280,16 +479,164 @@ def auth_page(auth_context: BrowserContext) -> Generator[Page, None, None]:
 
     Args:
         auth_context: 已认证的浏览器上下文
+        auth_page_pool: 已认证页面的复用池
+        context_overrides: 上下文配置覆盖
 
     Yields:
         已认证的页面实例
     """
+    if auth_page_pool is not None and not context_overrides:
+        page = auth_page_pool.acquire()
+        yield page
+        auth_page_pool.release(page)
+        return
+
     page = auth_context.new_page()
     page.set_default_timeout(settings.TIMEOUT)
     yield page
     page.close()
 
 
+# ==============================================================================
+# [框架核心] 异步 Fixtures
+# 与异步页面对象（pages.AsyncPIMPage 等）配合使用，多个页面的等待可以交错进行。
+# 异步对象都在 run_async 提供的会话级事件循环中创建，测试通过 run_async 运行协程
+# ==============================================================================
+
+
+@pytest.fixture(scope="session")
+def run_async() -> Generator[Callable[[Coroutine], object], None, None]:
+    """
+    提供会话级的事件循环，返回在其中运行协程直到完成的函数
+
+    同步 Playwright 会在主线程上登记正在运行的事件循环，之后主线程中的 asyncio.run()
+    会报错，因此每次调用都在新线程中驱动事件循环，结果与测试执行顺序无关。
+    事件循环在整个会话中复用，会话级的异步对象（如异步浏览器）可以跨测试使用；
+    每次调用使用新线程，协程中的 allure 步骤记录到当前测试下。
+
+    Yields:
+        run(coro)：运行协程并返回其结果（协程抛出的异常原样抛出）
+    """
+    loop = asyncio.new_event_loop()
+
+    def run(coro: Coroutine) -> object:
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            return executor.submit(loop.run_until_complete, coro).result()
+
+    yield run
+    run(loop.shutdown_asyncgens())
+    loop.close()
+
+
+@pytest.fixture(scope="session")
+def async_browser(
+    run_async: Callable[[Coroutine], object],
+    browser_type_name: str,
+    is_headed: bool,
+    slow_mo: int,
+) -> Generator[AsyncBrowser, None, None]:
+    """
+    创建异步浏览器实例（与同步的 browser 使用相同的启动参数）
+
+    Args:
+        run_async: 在会话事件循环中运行协程的函数
+        browser_type_name: 浏览器类型名称
+        is_headed: 是否有头模式
+        slow_mo: 慢动作延迟时间
+
+    Yields:
+        异步浏览器实例
+    """
+    from playwright.async_api import async_playwright
+
+    headless = not is_headed and settings.HEADLESS
+    slow_mo_value = slow_mo if slow_mo > 0 else settings.SLOW_MO
+
+    playwright = run_async(async_playwright().start())
+    try:
+        browser_type = getattr(playwright, browser_type_name)
+        browser = run_async(browser_type.launch(headless=headless, slow_mo=slow_mo_value))
+        yield browser
+        run_async(browser.close())
+    finally:
+        run_async(playwright.stop())
+
+
+@pytest.fixture(scope="session")
+def async_auth_state(run_async: Callable[[Coroutine], object], async_browser: AsyncBrowser) -> dict:
+    """
+    [OrangeHRM 示例] 登录一次并返回认证状态（storage state），供异步上下文复用
+
+    Args:
+        run_async: 在会话事件循环中运行协程的函数
+        async_browser: 异步浏览器实例
+
+    Returns:
+        认证状态
+    """
+
+    async def login() -> dict:
+        context = await new_context_async(async_browser)
+        try:
+            login_page = pages.AsyncLoginPage(await context.new_page())
+            await login_page.open()
+            await login_page.login_as_admin()
+            await login_page.wait_for_login_complete()
+            return await context.storage_state()
+        finally:
+            await context.close()
+
+    return run_async(login())
+
+
+@pytest.fixture
+def async_auth_context(
+    request,
+    run_async: Callable[[Coroutine], object],
+    async_browser: AsyncBrowser,
+    async_auth_state: dict,
+    context_overrides: dict,
+) -> Generator[AsyncBrowserContext, None, None]:
+    """
+    创建已认证的异步浏览器上下文，同一上下文中的多个页面共享登录状态
+
+    Args:
+        request: pytest 请求对象
+        run_async: 在会话事件循环中运行协程的函数
+        async_browser: 异步浏览器实例
+        async_auth_state: 认证状态
+        context_overrides: 上下文配置覆盖
+
+    Yields:
+        已认证的异步浏览器上下文
+    """
+    context = run_async(
+        new_context_async(async_browser, **context_overrides, storage_state=async_auth_state)
+    )
+    context.set_default_timeout(settings.TIMEOUT)
+    yield context
+    run_async(close_context_async(context, request.node.nodeid))
+
+
+@pytest.fixture
+def async_auth_page(
+    run_async: Callable[[Coroutine], object], async_auth_context: AsyncBrowserContext
+) -> Generator[AsyncPage, None, None]:
+    """
+    创建已认证的异步页面实例
+
+    Args:
+        run_async: 在会话事件循环中运行协程的函数
+        async_auth_context: 已认证的异步浏览器上下文
+
+    Yields:
+        已认证的异步页面实例
+    """
+    page = run_async(async_auth_context.new_page())
+    yield page
+    run_async(page.close())
+
+
 # ==============================================================================
 # [示例代码] OrangeHRM 页面对象 Fixtures
 # 以下 fixtures 是针对 OrangeHRM Demo 的示例，如果测试其他系统请参考创建自己的 fixtures
@@ -297,7 +644,7 @@ def auth_page(auth_context: BrowserContext) -> Generator[Page, None, None]:
 
 
 @pytest.fixture(scope="function")
-def login_page(page: Page) -> LoginPage:
+def login_page(page: Page) -> pages.LoginPage:
     """
     [OrangeHRM 示例] 创建登录页面对象
 
@@ -307,11 +654,11 @@ def login_page(page: Page) -> LoginPage:
     Returns:
         登录页面对象
     """
-    return LoginPage(page)
+    return pages.LoginPage(page)
 
 
 @pytest.fixture(scope="function")
-def dashboard_page(page: Page) -> DashboardPage:
+def dashboard_page(page: Page) -> pages.DashboardPage:
     """
     [OrangeHRM 示例] 创建仪表盘页面对象
 
@@ -321,11 +668,11 @@ def dashboard_page(page: Page) -> DashboardPage:
     Returns:
         仪表盘页面对象
     """
-    return DashboardPage(page)
+    return pages.DashboardPage(page)
 
 
 @pytest.fixture(scope="function")
-def pim_page(page: Page) -> PIMPage:
+def pim_page(page: Page) -> pages.PIMPage:
     """
     [OrangeHRM 示例] 创建 PIM 页面对象
 
@@ -335,11 +682,11 @@ def pim_page(page: Page) -> PIMPage:
     Returns:
         PIM 页面对象
     """
-    return PIMPage(page)
+    return pages.PIMPage(page)
 
 
 @pytest.fixture(scope="function")
-def employee_form_page(page: Page) -> EmployeeFormPage:
+def employee_form_page(page: Page) -> pages.EmployeeFormPage:
     """
     [OrangeHRM 示例] 创建员工表单页面对象
 
@@ -349,7 +696,7 @@ def employee_form_page(page: Page) -> EmployeeFormPage:
     Returns:
         员工表单页面对象
     """
-    return EmployeeFormPage(page)
+    return pages.EmployeeFormPage(page)
 
 
 # ==============================================================================
@@ -368,14 +715,14 @@ def logged_in_page(page: Page) -> Generator[Page, None, None]:
     Yields:
         已登录的页面实例
     """
-    login_page = LoginPage(page)
+    login_page = pages.LoginPage(page)
     login_page.open().login_as_admin()
     login_page.wait_for_login_complete()
     yield page
 
 
 @pytest.fixture(scope="function")
-def logged_in_dashboard(logged_in_page: Page) -> DashboardPage:
+def logged_in_dashboard(logged_in_page: Page) -> pages.DashboardPage:
     """
     [OrangeHRM 示例] 已登录状态的仪表盘页面
 
@@ -385,11 +732,11 @@ def logged_in_dashboard(logged_in_page: Page) -> DashboardPage:
     Returns:
         仪表盘页面对象
     """
-    return DashboardPage(logged_in_page)
+    return pages.DashboardPage(logged_in_page)
 
 
 @pytest.fixture(scope="function")
-def logged_in_pim(logged_in_page: Page) -> PIMPage:
+def logged_in_pim(logged_in_page: Page) -> pages.PIMPage:
     """
     [OrangeHRM 示例] 已登录状态的 PIM 页面
 
@@ -399,13 +746,31 @@ def logged_in_pim(logged_in_page: Page) -> PIMPage:
     Returns:
         PIM 页面对象
     """
-    pim = PIMPage(logged_in_page)
+    pim = pages.PIMPage(logged_in_page)
     pim.open()
     return pim
 
 
 @pytest.fixture(scope="function")
-def employee_form(logged_in_page: Page) -> EmployeeFormPage:
+def seeded_employee(logged_in_page: Page) -> Employee:
+    """
+    [OrangeHRM 示例] 测试专用的员工（API_SEEDING 启用时通过 API 创建，否则通过 UI 创建）
+
+    员工已登记到 data_factory，会话结束时统一清理
+
+    Args:
+        logged_in_page: 已登录的页面实例
+
+    Returns:
+        创建的员工记录
+    """
+    from utils.seeding import seed_employee
+
+    return seed_employee(logged_in_page)
+
+
+@pytest.fixture(scope="function")
+def employee_form(logged_in_page: Page) -> pages.EmployeeFormPage:
     """
     [OrangeHRM 示例] 已登录状态下的员工表单页面
     （导航到添加员工页面）
@@ -416,10 +781,10 @@ def employee_form(logged_in_page: Page) -> EmployeeFormPage:
     Returns:
         员工表单页面对象
     """
-    pim = PIMPage(logged_in_page)
+    pim = pages.PIMPage(logged_in_page)
     pim.open()
     pim.click_add_employee_tab()
-    return EmployeeFormPage(logged_in_page)
+    return pages.EmployeeFormPage(logged_in_page)
 
 
 # ==============================================================================
@@ -445,7 +810,9 @@ def pytest_runtest_makereport(item, call):
 
         if page and settings.SCREENSHOT_ON_FAILURE:
             with contextlib.suppress(Exception):
-                screenshot = page.screenshot(full_page=True)
+                import allure
+
+                screenshot = page.screenshot(full_page=settings.FULL_PAGE_SCREENSHOTS)
                 allure.attach(
                     screenshot, name="失败截图", attachment_type=allure.attachment_type.PNG
                 )
@@ -457,7 +824,53 @@ def pytest_configure(config):
     config.addinivalue_line("markers", "smoke: 冒烟测试")
     config.addinivalue_line("markers", "regression: 回归测试")
     config.addinivalue_line("markers", "e2e: 端到端测试")
+    config.addinivalue_line(
+        "markers", "viewport(preset_or_width, height, device_scale_factor): 覆盖视口和像素比"
+    )
 
     # OrangeHRM 示例标记
     config.addinivalue_line("markers", "login: 登录相关测试")
     config.addinivalue_line("markers", "pim: PIM 员工管理相关测试")
+
+    # 切换运行配置档（在任何浏览器和页面创建之前）
+    profile = config.getoption("--profile")
+    if profile:
+        try:
+            settings.use_profile(profile)
+        except ValueError as e:
+            raise pytest.UsageError(str(e)) from e
+        logger.info(f"使用运行配置档: {profile}")
+
+    # 在收集测试之前编译并校验测试数据，数据有误时立即报告全部错误
+    try:
+        TestDataLoader.load()
+    except (FileNotFoundError, ValueError) as e:
+        raise pytest.UsageError(str(e)) from e
+
+
+def pytest_sessionfinish(session, exitstatus):
+    """pytest 会话结束钩子"""
+    # 持久化本次运行观测到的操作耗时，供后续运行推导自适应超时
+    if settings.ADAPTIVE_TIMEOUT:
+        adaptive_timeouts.save()
+    # 持久化定位器命中统计，供后续运行调整候选顺序
+    if settings.LOCATOR_STATS:
+        locator_registry.save()
+    # 合并本进程的页面性能指标；主进程在所有 worker 写入后输出本次运行的按页面汇总
+    if settings.PAGE_METRICS:
+        page_metrics.save()
+        if not hasattr(session.config, "workerinput"):
+            page_metrics.log_summary(page_metrics.latest_run_id())
+
+    # 本地测试站点的数据随站点停止而丢弃，无需清理
+    if session.config.getoption("--local-site"):
+        return
+
+    from utils.cleanup import cleanup_session_data
+
+    # 批量删除测试创建但未清理的员工（每个 worker 清理自己登记的员工）
+    # 清扫以往运行的遗留数据只在主进程执行一次
+    sweep = session.config.getoption("--sweep-test-data") and not hasattr(
+        session.config, "workerinput"
+    )
+    cleanup_session_data(session.config.getoption("--browser-type"), sweep=sweep)
@@ -0,0 +1,102 @@
+"""
+自适应超时服务测试用例
+
+[框架核心] 此文件测试 utils/adaptive_timeout.py，不依赖浏览器和被测系统。
+"""
+
+from pathlib import Path
+
+import allure
+import pytest
+
+from config.settings import settings
+from pages import base_page
+from pages.base_page import BasePage
+from utils.adaptive_timeout import AdaptiveTimeoutService
+
+
+@pytest.fixture
+def timeout_service(tmp_path: Path) -> AdaptiveTimeoutService:
+    """创建使用临时统计文件的自适应超时服务"""
+    return AdaptiveTimeoutService(
+        stats_file=tmp_path / "latency.json",
+        percentile=99,
+        factor=3.0,
+        floor_ms=500,
+        ceiling_ms=30000,
+        min_samples=5,
+    )
+
+
+@allure.feature("框架核心")
+@allure.story("自适应超时")
+class TestAdaptiveTimeout:
+    """自适应超时测试类"""
+
+    @allure.title("样本不足时使用给定超时")
+    def test_falls_back_without_samples(self, timeout_service: AdaptiveTimeoutService):
+        """样本数少于阈值时返回调用方给定的超时时间"""
+        for _ in range(4):
+            timeout_service.record("LoginPage:click:#login", 100)
+
+        assert timeout_service.get_timeout("LoginPage:click:#login", 30000) == 30000
+
+    @allure.title("根据分位数耗时推导超时")
+    def test_derives_timeout_from_percentile(self, timeout_service: AdaptiveTimeoutService):
+        """超时 = p99 × 系数，且不超过调用方给定的超时时间"""
+        for latency in [100, 120, 130, 150, 400]:
+            timeout_service.record("PIMPage:visible:.oxd-table", latency)
+
+        assert timeout_service.get_timeout("PIMPage:visible:.oxd-table", 30000) == 1200
+        assert timeout_service.get_timeout("PIMPage:visible:.oxd-table", 1000) == 1000
+
+    @allure.title("超时时间不低于下限")
+    def test_respects_floor(self, timeout_service: AdaptiveTimeoutService):
+        """耗时极短的操作也至少保留下限超时"""
+        for _ in range(10):
+            timeout_service.record("PIMPage:hidden:.oxd-loading-spinner", 1)
+
+        assert timeout_service.get_timeout("PIMPage:hidden:.oxd-loading-spinner", 10000) == 500
+
+    @allure.title("统计数据持久化并合并")
+    def test_save_merges_with_existing_file(self, tmp_path: Path):
+        """多个进程保存的数据合并到同一文件"""
+        stats_file = tmp_path / "latency.json"
+        first = AdaptiveTimeoutService(stats_file=stats_file, min_samples=4, floor_ms=1)
+        second = AdaptiveTimeoutService(stats_file=stats_file, min_samples=4, floor_ms=1)
+        for _ in range(2):
+            first.record("key", 100)
+            second.record("key", 200)
+        first.save()
+        second.save()
+
+        reloaded = AdaptiveTimeoutService(
+            stats_file=stats_file, factor=1.0, min_samples=4, floor_ms=1
+        )
+        assert reloaded.get_timeout("key", 30000) == 200
+
+    @allure.title("上限在使用时读取配置")
+    def test_ceiling_follows_settings(self, tmp_path: Path):
+        """未显式指定上限时使用当前的 TIMEOUT（配置档和 settings.override 之后仍然生效）"""
+        service = AdaptiveTimeoutService(
+            stats_file=tmp_path / "latency.json", factor=100.0, min_samples=1, floor_ms=1
+        )
+        service.record("key", 1000)
+
+        with settings.override(TIMEOUT=10000):
+            assert service.get_timeout("key", 60000) == 10000
+        with settings.override(TIMEOUT=20000):
+            assert service.get_timeout("key", 60000) == 20000
+
+    @allure.title("显式给定的超时 0 不被替换为默认值")
+    def test_explicit_zero_timeout_kept(self, timeout_service: AdaptiveTimeoutService, monkeypatch):
+        """只有未给定超时（None）时才使用页面默认超时"""
+        monkeypatch.setattr(base_page, "adaptive_timeouts", timeout_service)
+        page = BasePage(object())
+
+        with settings.override(ADAPTIVE_TIMEOUT=True):
+            assert page._resolve_timeout("visible", ".toast", 0) == 0
+            assert page._wait_timeout("visible", ".toast", 0) == 0
+            assert page._wait_timeout("visible", ".toast") == page.timeout
+        assert page._resolve_timeout("click", ".toast") is None
+        assert page._wait_timeout("visible", ".toast", 0) == 0
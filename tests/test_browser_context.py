@@ -0,0 +1,50 @@
+"""
+浏览器上下文配置测试用例
+
+[框架核心] 此文件测试 utils/browser_context.py 的视口覆盖解析，不依赖浏览器和被测系统。
+"""
+
+import allure
+import pytest
+
+from config.settings import VIEWPORT_PRESETS
+from utils.browser_context import viewport_overrides
+
+
+@allure.feature("框架核心")
+@allure.story("视口覆盖")
+class TestViewportOverrides:
+    """视口覆盖测试类"""
+
+    @allure.title("按预设名称覆盖视口")
+    def test_preset(self):
+        """预设名称转换为视口尺寸"""
+        width, height = VIEWPORT_PRESETS["throughput"]
+
+        assert viewport_overrides("throughput") == {
+            "viewport": {"width": width, "height": height}
+        }
+
+    @allure.title("按宽高和像素比覆盖")
+    def test_size_and_scale(self):
+        """可以同时覆盖视口和像素比，也可以只覆盖像素比"""
+        assert viewport_overrides(1280, 720, device_scale_factor=2) == {
+            "viewport": {"width": 1280, "height": 720},
+            "device_scale_factor": 2,
+        }
+        assert viewport_overrides(device_scale_factor=1.5) == {"device_scale_factor": 1.5}
+
+    @allure.title("无效的视口参数")
+    @pytest.mark.parametrize(
+        "args, kwargs",
+        [
+            (("tiny",), {}),
+            ((1280,), {}),
+            ((0, 720), {}),
+            ((), {"device_scale_factor": 0}),
+        ],
+    )
+    def test_invalid(self, args: tuple, kwargs: dict):
+        """不存在的预设、缺少高度、非正数都会报错"""
+        with pytest.raises(ValueError):
+            viewport_overrides(*args, **kwargs)
@@ -0,0 +1,165 @@
+"""
+测试数据清理测试用例
+
+[框架核心] 此文件测试 utils/cleanup.py 的清理逻辑，使用内存中的员工列表代替被测系统 API。
+"""
+
+import allure
+import pytest
+
+from pages.pim_page import PIMPage
+from utils.cleanup import EmployeeCleanup
+from utils.data_factory import DataFactory
+
+
+class FakeResponse:
+    """API 响应"""
+
+    def __init__(self, data: dict | None = None, status: int = 200):
+        self.status = status
+        self.ok = status < 400
+        self._data = data or {}
+
+    def json(self) -> dict:
+        return self._data
+
+
+class FakeRequest:
+    """模拟 OrangeHRM 员工 API 的请求上下文"""
+
+    def __init__(self, employee_ids: list[str]):
+        self.employees = [
+            {"empNumber": number, "employeeId": employee_id}
+            for number, employee_id in enumerate(employee_ids, start=1)
+        ]
+        self.delete_calls = []
+
+    def get(self, url: str, params: dict) -> FakeResponse:
+        matched = [e for e in self.employees if params["nameOrId"] in e["employeeId"]]
+        return FakeResponse({"data": matched})
+
+    def delete(self, url: str, data: dict) -> FakeResponse:
+        self.delete_calls.append(sorted(data["ids"]))
+        self.employees = [e for e in self.employees if e["empNumber"] not in data["ids"]]
+        return FakeResponse()
+
+
+class FakePage:
+    """只提供 request 属性的页面"""
+
+    def __init__(self, request: FakeRequest):
+        self.request = request
+
+
+class PagedPIMPage(PIMPage):
+    """用内存中的分页员工列表代替 PIM 列表页的界面操作"""
+
+    PAGE_SIZE = 2
+
+    def __init__(self, employee_ids: list[str]):
+        super().__init__(page=None)
+        self.employees = list(employee_ids)
+        self.search_text = ""
+        self.page_index = 0
+        self.selected: list[int] = []
+        self.rounds = 0
+
+    def search_by_employee_id(self, employee_id):
+        self.search_text = employee_id
+        return self
+
+    def click_search(self):
+        self.rounds += 1
+        self.page_index = 0
+        self.selected = []
+        return self
+
+    def go_to_next_results_page(self):
+        matched = [e for e in self.employees if self.search_text in e]
+        if (self.page_index + 1) * self.PAGE_SIZE >= len(matched):
+            return False
+        self.page_index += 1
+        return True
+
+    def wait_for_table_update(self):
+        return self
+
+    def has_no_records(self):
+        return not self.get_employee_ids()
+
+    def get_employee_ids(self):
+        matched = [e for e in self.employees if self.search_text in e]
+        start = self.page_index * self.PAGE_SIZE
+        return matched[start : start + self.PAGE_SIZE]
+
+    def select_row(self, row_index=0):
+        self.selected.append(row_index)
+        return self
+
+    def delete_selected(self):
+        return self
+
+    def confirm_delete(self):
+        rows = self.get_employee_ids()
+        for index in self.selected:
+            self.employees.remove(rows[index])
+        return self
+
+
+@pytest.fixture
+def factory() -> DataFactory:
+    """创建独立的数据生成器"""
+    return DataFactory(prefix="at", run_id="current-run")
+
+
+@allure.feature("框架核心")
+@allure.story("测试数据清理")
+class TestEmployeeCleanup:
+    """测试数据清理测试类"""
+
+    @allure.title("登记的员工一次批量删除")
+    def test_cleanup_registered_in_one_request(self, factory: DataFactory):
+        """同一 worker 生成的员工 ID 一次查询、一次删除，并取消登记"""
+        ids = [factory.employee_id() for _ in range(3)]
+        for employee_id in ids:
+            factory.register("employee", employee_id)
+        request = FakeRequest(ids + ["0042"])
+
+        deleted = EmployeeCleanup(FakePage(request), factory).cleanup_registered()
+
+        assert deleted == 3
+        assert request.delete_calls == [[1, 2, 3]]
+        assert [e["employeeId"] for e in request.employees] == ["0042"]
+        assert factory.created("employee") == []
+
+    @allure.title("清扫只删除以往运行的测试员工")
+    def test_sweep_skips_current_run_and_real_data(self, factory: DataFactory):
+        """保留本次运行的员工和不符合命名规则的真实员工"""
+        previous = DataFactory(prefix="at", run_id="previous-run").employee_id()
+        current = factory.employee_id()
+        lookalikes = ["at12345678", "at-1234", "at-12345678"]
+        request = FakeRequest([previous, current, "0042", "attic", *lookalikes])
+
+        deleted = EmployeeCleanup(FakePage(request), factory).sweep()
+
+        assert deleted == 1
+        assert previous not in [e["employeeId"] for e in request.employees]
+        remaining = [e["employeeId"] for e in request.employees]
+        assert current in remaining
+        # 与生成格式相似的真实员工 ID 不会被删除
+        assert set(lookalikes) <= set(remaining)
+
+    @allure.title("界面删除逐页处理分页的搜索结果")
+    def test_ui_bulk_delete_pages_through_results(self):
+        """每轮删除一页中的目标员工后重新搜索，第一页没有目标员工时向后翻页"""
+        targets = ["at-3", "at-4", "at-5", "at-6"]
+        pim = PagedPIMPage(["at-1", "at-2", *targets, "at-7", "0042"])
+
+        deleted = pim.bulk_delete_employees(targets, "at-")
+
+        assert deleted == 4
+        assert pim.employees == ["at-1", "at-2", "at-7", "0042"]
+        # 每轮翻过只有非目标员工的第一页，删除第二页中的目标员工
+        assert pim.rounds == 2
+        # 没有目标员工时翻到最后一页后停止
+        assert pim.bulk_delete_employees(["at-9"], "at-") == 0
@@ -0,0 +1,98 @@
+"""
+多标签页并发工具测试用例
+
+[框架核心] 此文件测试 utils/concurrent_tabs.py 的调度逻辑，使用内存中的上下文代替浏览器。
+"""
+
+import asyncio
+
+import allure
+import pytest
+
+from utils.concurrent_tabs import run_in_tabs
+
+
+class FakePage:
+    """记录是否关闭的标签页"""
+
+    def __init__(self):
+        self.closed = False
+
+    async def close(self) -> None:
+        self.closed = True
+
+
+class FakeContext:
+    """记录打开的标签页"""
+
+    def __init__(self):
+        self.pages: list[FakePage] = []
+
+    async def new_page(self) -> FakePage:
+        page = FakePage()
+        self.pages.append(page)
+        return page
+
+
+def make_job(value: int, running: list, peak: list):
+    """创建记录并发数的任务，返回 value 的平方"""
+
+    async def job(page: FakePage) -> int:
+        assert not page.closed
+        running.append(value)
+        peak[0] = max(peak[0], len(running))
+        await asyncio.sleep(0.01)
+        running.remove(value)
+        if value < 0:
+            raise RuntimeError(f"任务 {value} 失败")
+        return value * value
+
+    return job
+
+
+@allure.feature("框架核心")
+@allure.story("多标签页并发")
+class TestRunInTabs:
+    """多标签页并发测试类"""
+
+    @allure.title("限制并发数并复用标签页")
+    def test_bounded_concurrency(self, run_async):
+        """同时执行的任务数不超过 max_tabs，结果与任务顺序一致，结束后关闭所有标签页"""
+        context, running, peak = FakeContext(), [], [0]
+        jobs = [make_job(value, running, peak) for value in range(7)]
+
+        results = run_async(run_in_tabs(context, jobs, max_tabs=3))
+
+        assert results == [value * value for value in range(7)]
+        assert peak[0] == 3
+        assert len(context.pages) == 3
+        assert all(page.closed for page in context.pages)
+
+    @allure.title("任务失败时其余任务继续执行")
+    def test_failure_raised_after_all_jobs(self, run_async):
+        """失败的任务不影响其他任务，全部结束后抛出第一个失败任务的异常"""
+        context, running, executed = FakeContext(), [], []
+        peak = [0]
+
+        def tracked(value: int):
+            job = make_job(value, running, peak)
+
+            async def run(page: FakePage) -> int:
+                executed.append(value)
+                return await job(page)
+
+            return run
+
+        with pytest.raises(RuntimeError, match="任务 -1 失败"):
+            run_async(run_in_tabs(context, [tracked(v) for v in (1, -1, 2, -2)], max_tabs=2))
+        assert sorted(executed) == [-2, -1, 1, 2]
+        assert all(page.closed for page in context.pages)
+
+    @allure.title("并发数无效")
+    def test_invalid_max_tabs(self, run_async):
+        """max_tabs 小于 1 时报错，没有任务时不打开标签页"""
+        context = FakeContext()
+        with pytest.raises(ValueError):
+            run_async(run_in_tabs(context, [make_job(1, [], [0])], max_tabs=0))
+        assert run_async(run_in_tabs(context, [], max_tabs=2)) == []
+        assert context.pages == []
@@ -0,0 +1,89 @@
+"""
+唯一测试数据生成器测试用例
+
+[框架核心] 此文件测试 utils/data_factory.py，不依赖浏览器和被测系统。
+"""
+
+import allure
+import pytest
+
+from utils.data_factory import DataFactory, to_base36
+from utils.data_models import Employee
+
+
+@pytest.fixture
+def factory(monkeypatch: pytest.MonkeyPatch) -> DataFactory:
+    """创建模拟 xdist worker gw3 的数据生成器"""
+    monkeypatch.setenv("PYTEST_XDIST_WORKER", "gw3")
+    monkeypatch.setenv("PYTEST_XDIST_WORKER_COUNT", "4")
+    return DataFactory(prefix="at", run_id="run-1")
+
+
+@allure.feature("框架核心")
+@allure.story("测试数据生成")
+class TestDataFactory:
+    """唯一测试数据生成器测试类"""
+
+    @allure.title("base36 编码")
+    def test_to_base36(self):
+        """补齐最小宽度"""
+        assert to_base36(0, 2) == "00"
+        assert to_base36(35) == "z"
+        assert to_base36(36, 3) == "010"
+
+    @allure.title("标识在 worker 之间不冲突")
+    def test_tokens_unique_across_workers(self, factory: DataFactory, monkeypatch):
+        """同一运行 ID 下，不同 worker 生成的标识互不重复"""
+        monkeypatch.setenv("PYTEST_XDIST_WORKER", "gw0")
+        other = DataFactory(prefix="at", run_id="run-1")
+
+        tokens = [factory.token() for _ in range(500)] + [other.token() for _ in range(500)]
+
+        assert len(set(tokens)) == len(tokens)
+        assert factory.run_id == other.run_id
+
+    @allure.title("标识各字段宽度固定")
+    def test_token_fields_have_fixed_width(self, factory: DataFactory, monkeypatch):
+        """worker 序号和计数定宽，不同 worker 的标识不会拼接出相同的值；计数用尽时报错"""
+        tenth = DataFactory(prefix="at", run_id="run-1", worker=10)
+
+        assert factory.token() == f"{factory.run_prefix()}3000"
+        assert tenth.token() == f"{factory.run_prefix()}a000"
+        assert len({len(factory.token()), len(tenth.token())}) == 1
+
+        monkeypatch.setattr(tenth, "_counter", iter([36**3]))
+        with pytest.raises(RuntimeError):
+            tenth.token()
+        with pytest.raises(ValueError):
+            DataFactory(prefix="at", run_id="run-1", worker=36)
+
+    @allure.title("员工 ID 不超过 10 个字符且可被识别")
+    def test_employee_id(self, factory: DataFactory):
+        """员工 ID 满足 OrangeHRM 长度限制，并能按前缀识别"""
+        employee_id = factory.employee_id()
+
+        assert len(employee_id) <= 10
+        assert factory.is_generated(employee_id)
+        assert not factory.is_generated("0042")
+        # 形似生成值的真实员工 ID：缺少分隔符或字段宽度不符
+        assert not factory.is_generated("at12345678")
+        assert not factory.is_generated(f"{employee_id}0")
+        assert not factory.is_generated(f"x{employee_id}")
+
+    @allure.title("基于模板生成员工")
+    def test_employee_from_template(self, factory: DataFactory):
+        """名字加上唯一标识，员工 ID 使用同一标识"""
+        employee = factory.employee(Employee(first_name="Test", last_name="Employee"))
+
+        assert employee.first_name == f"Test{employee.employee_id}"
+        assert employee.last_name == "Employee"
+
+    @allure.title("登记已创建实体")
+    def test_registry(self, factory: DataFactory):
+        """登记后可查询，测试自行删除后取消登记"""
+        factory.register("employee", "at0001", "Batch")
+        factory.register("user", "userat0002")
+        factory.unregister("user", "userat0002")
+
+        assert [e.key for e in factory.created("employee")] == ["at0001"]
+        assert factory.created("user") == []
@@ -0,0 +1,126 @@
+"""
+测试数据加载器测试用例
+
+[框架核心] 此文件测试 utils/data_loader.py 和 utils/data_models.py，不依赖浏览器和被测系统。
+"""
+
+import dataclasses
+import json
+import os
+import time
+from collections.abc import Iterator
+from pathlib import Path
+
+import allure
+import pytest
+
+from config.settings import settings
+from utils.data_loader import TestDataLoader
+from utils.data_models import PersonalDetails, User, compile_record
+
+
+@allure.feature("框架核心")
+@allure.story("测试数据加载")
+class TestDataLoading:
+    """测试数据加载测试类"""
+
+    @allure.title("测试数据编译为只读记录")
+    def test_returns_frozen_records(self):
+        """get_* 返回类型化的只读记录"""
+        admin = TestDataLoader.get_user("admin")
+
+        assert isinstance(admin, User)
+        assert admin.username
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            admin.username = "other"
+
+    @allure.title("不存在的条目报 KeyError")
+    def test_missing_entry(self):
+        """错误信息包含条目名称"""
+        with pytest.raises(KeyError, match="nobody"):
+            TestDataLoader.get_user("nobody")
+
+    @allure.title("校验字段声明")
+    def test_compile_record_reports_all_errors(self):
+        """未声明的字段、缺少必填字段、类型错误、日期格式错误一次全部报告"""
+        errors: list[str] = []
+
+        user = compile_record(User, {"username": 1, "role": "admin"}, "users.bad", errors)
+        details = compile_record(
+            PersonalDetails, {"date_of_birth": "15/01/1990"}, "personal_details.bad", errors
+        )
+
+        assert user is None and details is None
+        assert len(errors) == 4
+        assert any("role" in e for e in errors)
+        assert any("password" in e for e in errors)
+        assert any("username" in e for e in errors)
+        assert any("date_of_birth" in e for e in errors)
+
+
+@pytest.fixture
+def data_dir(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Iterator[Path]:
+    """将测试数据加载器指向临时目录，并使用独立的缓存"""
+    base = {
+        "users": {"admin": {"username": "Admin", "password": "admin123"}},
+        "error_messages": {"required": "Required"},
+    }
+    (tmp_path / "test_data.json").write_text(json.dumps(base), encoding="utf-8")
+    monkeypatch.setattr(TestDataLoader, "_data_file", tmp_path / "test_data.json")
+    monkeypatch.setattr(TestDataLoader, "_file_cache", {})
+    monkeypatch.setattr(TestDataLoader, "_dataset", None)
+    monkeypatch.setattr(TestDataLoader, "_dataset_key", ())
+    monkeypatch.setattr(TestDataLoader, "_raw_data", {})
+    with settings.override(TEST_ENV=""):
+        yield tmp_path
+
+
+def write_json(path: Path, data: dict) -> None:
+    """写入 JSON 文件，并推进修改时间以确保变化可被检测到"""
+    mtime = path.stat().st_mtime_ns if path.exists() else time.time_ns()
+    path.write_text(json.dumps(data), encoding="utf-8")
+    os.utime(path, ns=(mtime + 10**9, mtime + 10**9))
+
+
+@allure.feature("框架核心")
+@allure.story("测试数据加载")
+class TestDataReloading:
+    """测试数据缓存与环境覆盖测试类"""
+
+    @allure.title("文件未变化时复用编译结果")
+    def test_unchanged_file_is_not_recompiled(self, data_dir: Path):
+        """同一文件重复加载返回同一对象；只被 touch 时也不重新编译"""
+        first = TestDataLoader.load()
+        path = data_dir / "test_data.json"
+        mtime = path.stat().st_mtime_ns + 10**9
+        os.utime(path, ns=(mtime, mtime))
+
+        assert TestDataLoader.load() is first
+
+    @allure.title("文件变化后自动重新加载")
+    def test_changed_file_is_reloaded(self, data_dir: Path):
+        """修改数据文件后无需重启即可读到新数据"""
+        assert TestDataLoader.get_user("admin").password == "admin123"
+
+        write_json(
+            data_dir / "test_data.json",
+            {
+                "users": {"admin": {"username": "Admin", "password": "changed"}},
+                "error_messages": {},
+            },
+        )
+
+        assert TestDataLoader.get_user("admin").password == "changed"
+
+    @allure.title("合并环境覆盖数据")
+    def test_environment_overlay(self, data_dir: Path):
+        """覆盖文件只需写出不同的字段，修改覆盖文件同样触发重新加载"""
+        overlay = data_dir / "test_data.staging.json"
+        write_json(overlay, {"users": {"admin": {"password": "staging"}}})
+
+        with settings.override(TEST_ENV="staging"):
+            admin = TestDataLoader.get_user("admin")
+            assert (admin.username, admin.password) == ("Admin", "staging")
+
+            write_json(overlay, {"users": {"admin": {"password": "staging-2"}}})
+            assert TestDataLoader.get_user("admin").password == "staging-2"
@@ -0,0 +1,88 @@
+"""
+数据集流式读取测试用例
+
+[框架核心] 此文件测试 utils/datasets.py，不依赖浏览器和被测系统。
+"""
+
+from pathlib import Path
+
+import allure
+import pytest
+
+from utils.datasets import Dataset
+
+
+@pytest.fixture
+def jsonl_file(tmp_path: Path) -> Path:
+    """创建包含 10 行数据（含空行和注释）的 JSONL 文件"""
+    path = tmp_path / "employees.jsonl"
+    lines = ["# 示例数据", ""]
+    lines += [f'{{"first_name": "Emp{i}", "index": {i}}}' for i in range(10)]
+    path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+    return path
+
+
+@pytest.fixture
+def csv_file(tmp_path: Path) -> Path:
+    """创建 CSV 文件"""
+    path = tmp_path / "credentials.csv"
+    path.write_text(
+        "username,password,description\n"
+        "invalid_user,wrong,unknown_user\n"
+        '"Admin, Jr",secret,comma_in_value\n',
+        encoding="utf-8",
+    )
+    return path
+
+
+@allure.feature("框架核心")
+@allure.story("数据集")
+class TestDataset:
+    """数据集测试类"""
+
+    @allure.title("逐行读取 JSONL")
+    def test_iterates_jsonl(self, jsonl_file: Path):
+        """跳过空行和注释行"""
+        records = list(Dataset(jsonl_file))
+
+        assert len(records) == 10
+        assert records[0] == {"first_name": "Emp0", "index": 0}
+
+    @allure.title("逐行读取 CSV")
+    def test_iterates_csv(self, csv_file: Path):
+        """按表头生成字典，支持带引号的值"""
+        records = list(Dataset(csv_file))
+
+        assert records[1] == {
+            "username": "Admin, Jr",
+            "password": "secret",
+            "description": "comma_in_value",
+        }
+
+    @allure.title("分片互不重叠且覆盖全部数据")
+    def test_shards_partition_dataset(self, jsonl_file: Path):
+        """所有分片合起来正好是完整数据集"""
+        dataset = Dataset(jsonl_file)
+        shards = [[r["index"] for r in dataset.shard(i, 3)] for i in range(3)]
+
+        assert shards[0] == [0, 3, 6, 9]
+        assert sorted(sum(shards, [])) == list(range(10))
+
+    @allure.title("参数化只保存行位置")
+    def test_parametrize_loads_rows_lazily(self, csv_file: Path):
+        """参数值是行位置，load() 读取该行；用例 ID 取自指定字段"""
+        mark = Dataset(csv_file).parametrize("case", id_field="description")
+        argname, params = mark.args
+
+        assert argname == "case"
+        assert [p.id for p in params] == ["unknown_user", "comma_in_value"]
+        assert params[1].values[0].load()["username"] == "Admin, Jr"
+
+    @allure.title("不支持的格式报错")
+    def test_rejects_unknown_format(self, tmp_path: Path):
+        """只支持 JSONL 和 CSV"""
+        path = tmp_path / "data.xml"
+        path.write_text("<data/>", encoding="utf-8")
+
+        with pytest.raises(ValueError):
+            Dataset(path)
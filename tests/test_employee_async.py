@@ -0,0 +1,94 @@
+"""
+异步页面对象测试用例
+
+[示例代码] 此文件是针对 OrangeHRM Demo 系统的示例测试用例。
+
+演示如何使用异步页面对象（AsyncPIMPage、AsyncEmployeeFormPage）
+在同一个已认证上下文中打开多个页面，通过 asyncio.gather 同时创建员工，
+每个页面等待保存时其他页面继续操作；以及通过 create_employees_in_tabs
+限制同时打开的标签页数批量创建员工。
+
+协程通过 run_async fixture 在会话级事件循环中运行。
+
+OrangeHRM Demo: https://opensource-demo.orangehrmlive.com
+"""
+
+import asyncio
+
+import allure
+import pytest
+
+from pages.async_employee_form_page import AsyncEmployeeFormPage
+from pages.async_pim_page import AsyncPIMPage
+from utils.concurrent_tabs import create_employees_in_tabs
+from utils.data_factory import data_factory
+
+
+@allure.feature("员工管理")
+@allure.story("异步页面对象")
+class TestAsyncEmployee:
+    """异步页面对象测试类"""
+
+    @allure.title("在多个页面中同时创建员工")
+    @pytest.mark.e2e
+    @pytest.mark.pim
+    def test_create_employees_concurrently(self, async_auth_context, run_async):
+        """
+        测试在同一上下文的多个页面中同时创建员工
+
+        步骤:
+        1. 打开 3 个页面，各自进入添加员工页面并创建员工（员工 ID 唯一）
+        2. 在员工列表中按 ID 搜索，验证所有员工都已创建
+        """
+
+        async def create_employee() -> str:
+            page = await async_auth_context.new_page()
+            try:
+                pim = await AsyncPIMPage(page).open()
+                await pim.click_add_button()
+                form = AsyncEmployeeFormPage(page)
+                return await form.create_new_employee(
+                    data_factory.name("Async"), "Test", "Employee", data_factory.employee_id()
+                )
+            finally:
+                await page.close()
+
+        async def create_employees() -> list[str]:
+            return await asyncio.gather(*(create_employee() for _ in range(3)))
+
+        with allure.step("同时创建 3 个员工"):
+            employee_ids = run_async(create_employees())
+
+        with allure.step("验证所有员工已创建"):
+            listed = run_async(self._listed_employee_ids(async_auth_context))
+            for employee_id in employee_ids:
+                assert employee_id in listed, f"未找到员工 (ID: {employee_id})"
+
+    @allure.title("在多个标签页中批量创建员工")
+    @pytest.mark.e2e
+    @pytest.mark.pim
+    def test_batch_create_in_tabs(self, async_auth_context, run_async):
+        """
+        测试批量创建员工（最多同时打开 3 个标签页，标签页在任务之间复用）
+
+        步骤:
+        1. 在 3 个标签页中并发创建 6 个员工
+        2. 在员工列表中按 ID 搜索，验证所有员工都已创建
+        """
+        with allure.step("在 3 个标签页中创建 6 个员工"):
+            employees = run_async(
+                create_employees_in_tabs(async_auth_context, count=6, max_tabs=3)
+            )
+
+        with allure.step("验证所有员工已创建"):
+            listed = run_async(self._listed_employee_ids(async_auth_context))
+            for employee in employees:
+                assert employee.employee_id in listed, f"未找到员工 {employee.first_name}"
+
+    @staticmethod
+    async def _listed_employee_ids(context) -> list[str]:
+        """在新页面中按当前 worker 的 ID 前缀搜索，返回列表中的员工 ID"""
+        pim = await AsyncPIMPage(await context.new_page()).open()
+        await pim.search_by_employee_id(data_factory.worker_prefix())
+        await pim.click_search()
+        return await pim.get_employee_ids()
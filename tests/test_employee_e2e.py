@@ -16,13 +16,12 @@
 OrangeHRM Demo: https://opensource-demo.orangehrmlive.com
 """
 
-import time
-
 import allure
 import pytest
 
 from pages.employee_form_page import EmployeeFormPage
 from pages.pim_page import PIMPage
+from utils.data_factory import data_factory
 from utils.data_loader import TestDataLoader
 
 
@@ -46,17 +45,16 @@ class TestCreateEmployee:
         4. 验证保存成功
         """
         form = employee_form
-        employee_data = TestDataLoader.get_employee("new_employee")
-        # 使用时间戳确保唯一性
-        timestamp = str(int(time.time()))[-6:]
-        first_name = f"{employee_data['first_name']}{timestamp}"
+        # 生成在并行 worker 之间唯一的员工姓名
+        employee_data = data_factory.employee(TestDataLoader.get_employee("new_employee"))
+        first_name = employee_data.first_name
 
         with allure.step("填写员工基本信息"):
             form.wait_for_form_load()
             form.fill_employee_name(
                 first_name=first_name,
-                middle_name=employee_data["middle_name"],
-                last_name=employee_data["last_name"],
+                middle_name=employee_data.middle_name,
+                last_name=employee_data.last_name,
             )
 
         with allure.step("获取自动生成的员工 ID"):
@@ -65,6 +63,7 @@ class TestCreateEmployee:
 
         with allure.step("保存员工"):
             form.click_save()
+            data_factory.register("employee", employee_id, first_name)
 
         with allure.step("验证保存成功"):
             # 保存成功后会跳转到员工详情页面
@@ -205,35 +204,22 @@ class TestDeleteEmployee:
 
         with allure.step("点击删除按钮"):
             pim.click_delete_on_row(0)
-            # 等待对话框出现
-            pim.page.wait_for_timeout(1500)
 
         with allure.step("取消删除"):
-            # 使用多种选择器尝试点击取消按钮
-            cancel_clicked = False
-            cancel_selectors = [
-                ".oxd-dialog-sheet button.oxd-button--text",
-                ".orangehrm-modal-footer button.oxd-button--text",
-                "button:has-text('No, Cancel')",
-                "button.oxd-button--text",
-            ]
-
-            for selector in cancel_selectors:
-                try:
-                    cancel_btn = pim.page.locator(selector).first
-                    if cancel_btn.is_visible():
-                        cancel_btn.click()
-                        cancel_clicked = True
-                        allure.attach(
-                            f"使用选择器: {selector}",
-                            name="取消按钮选择器",
-                            attachment_type=allure.attachment_type.TEXT,
-                        )
-                        break
-                except Exception:
-                    continue
+            # 所有候选选择器并行匹配，找到第一个可见的取消按钮
+            match = pim.first_matching_selector(
+                *pim.CANCEL_DELETE_SELECTORS, "button.oxd-button--text", timeout=5000
+            )
 
-            if not cancel_clicked:
+            if match is not None:
+                selector, cancel_btn = match
+                cancel_btn.click()
+                allure.attach(
+                    f"使用选择器: {selector}",
+                    name="取消按钮选择器",
+                    attachment_type=allure.attachment_type.TEXT,
+                )
+            else:
                 # 最后尝试按 Escape 键关闭对话框
                 pim.page.keyboard.press("Escape")
                 allure.attach(
@@ -281,9 +267,8 @@ class TestEmployeeE2E:
         """
         pim = logged_in_pim
 
-        # 使用时间戳生成唯一的员工名
-        timestamp = str(int(time.time()))[-6:]
-        first_name = f"E2E{timestamp}"
+        # 生成唯一的员工名
+        first_name = data_factory.name("E2E")
         middle_name = "Test"
         last_name = "Employee"
         full_name = f"{first_name} {middle_name} {last_name}"
@@ -304,6 +289,7 @@ class TestEmployeeE2E:
             allure.attach(full_name, name="员工姓名", attachment_type=allure.attachment_type.TEXT)
 
             form.click_save()
+            data_factory.register("employee", employee_id, full_name)
 
             # 等待保存完成
             form.page.wait_for_timeout(2000)
@@ -343,7 +329,7 @@ class TestEmployeeE2E:
             assert "viewPersonalDetails" in form.get_current_url(), "未进入编辑页面"
 
             # 修改员工姓名
-            new_first_name = f"Updated{timestamp}"
+            new_first_name = data_factory.name("Updated")
 
             # 编辑姓名 - 使用多种选择器尝试
             first_name_selectors = [
@@ -424,6 +410,7 @@ class TestEmployeeE2E:
 
             # 验证找不到该员工
             assert pim.has_no_records(), f"员工 (ID: {employee_id}) 未被成功删除"
+            data_factory.unregister("employee", employee_id)
 
         allure.attach(
             f"成功完成员工 '{full_name}' (ID: {employee_id}) 的完整生命周期测试",
@@ -445,7 +432,6 @@ class TestEmployeeE2E:
         3. 逐个删除
         """
         pim = logged_in_pim
-        timestamp = str(int(time.time()))[-4:]
         created_employees = []
 
         # 创建 2 个员工进行批量测试
@@ -458,12 +444,13 @@ class TestEmployeeE2E:
                 form = EmployeeFormPage(pim.page)
                 form.wait_for_form_load()
 
-                first_name = f"Batch{timestamp}{i}"
+                first_name = data_factory.name("Batch")
                 form.fill_employee_name(first_name, "Test", "Employee")
                 emp_id = form.get_generated_employee_id()
                 created_employees.append({"id": emp_id, "name": first_name})
 
                 form.click_save()
+                data_factory.register("employee", emp_id, first_name)
                 form.page.wait_for_timeout(2000)
 
                 # 返回列表
@@ -507,5 +494,6 @@ class TestEmployeeE2E:
                     attachment_type=allure.attachment_type.TEXT,
                 )
                 assert is_deleted, f"员工 {emp['name']} 未被删除"
+                data_factory.unregister("employee", emp["id"])
                 pim.click_reset()
                 pim.wait_for_table_update()
@@ -16,14 +16,14 @@
 OrangeHRM Demo: https://opensource-demo.orangehrmlive.com
 """
 
-import time
-
 import allure
 import pytest
 
 from pages.employee_form_page import EmployeeFormPage
 from pages.pim_page import PIMPage
+from utils.data_factory import data_factory
 from utils.data_loader import TestDataLoader
+from utils.data_models import Employee
 
 
 @allure.feature("复杂表单")
@@ -124,22 +124,21 @@ class TestFormElements:
         3. 保存员工
         """
         form = employee_form
-        timestamp = str(int(time.time()))[-6:]
-
         with allure.step("填写完整员工信息"):
             form.wait_for_form_load()
             form.fill_employee_name(
-                first_name=f"Full{timestamp}",
+                first_name=data_factory.name("Full"),
                 middle_name="Info",
                 last_name="Employee",
             )
 
         with allure.step("设置自定义员工 ID"):
-            custom_id = f"EMP{timestamp}"
+            custom_id = data_factory.employee_id()
             form.fill_employee_id(custom_id)
 
         with allure.step("保存员工"):
             form.click_save()
+            data_factory.register("employee", custom_id)
 
         with allure.step("验证保存成功"):
             form.page.wait_for_timeout(2000)
@@ -157,6 +156,7 @@ class TestFormElements:
             if not pim.has_no_records():
                 pim.click_delete_on_row(0)
                 pim.confirm_delete()
+                data_factory.unregister("employee", custom_id)
 
 
 @allure.feature("复杂表单")
@@ -213,21 +213,25 @@ class TestFormTabs:
     @allure.title("编辑员工 - 联系方式")
     @allure.severity(allure.severity_level.NORMAL)
     @pytest.mark.pim
-    def test_edit_employee_contact_details(self, logged_in_pim: PIMPage):
+    def test_edit_employee_contact_details(
+        self, logged_in_pim: PIMPage, seeded_employee: Employee
+    ):
         """
         测试编辑员工联系方式
 
         步骤:
-        1. 进入员工编辑页面
+        1. 进入测试员工的编辑页面
         2. 切换到联系方式 Tab
         3. 填写联系信息
         4. 保存并验证
         """
         pim = logged_in_pim
 
-        with allure.step("检查是否有员工"):
-            if pim.has_no_records():
-                pytest.skip("没有员工记录")
+        with allure.step("搜索测试员工"):
+            pim.open()
+            pim.search_by_employee_id(seeded_employee.employee_id)
+            pim.click_search()
+            pim.wait_for_table_update()
 
         with allure.step("进入编辑页面"):
             pim.click_edit_on_row(0)
@@ -238,13 +242,11 @@ class TestFormTabs:
             form.go_to_contact_details()
             form.page.wait_for_timeout(2000)
 
-        with allure.step("填写地址信息"):
+        with allure.step("填写联系信息"):
             contact_data = TestDataLoader.get_contact_details()
-            form.fill_address(
-                street1=contact_data["street1"],
-                city=contact_data["city"],
-                zip_code=contact_data["zip"],
-            )
+            results = form.fill_contact_details(contact_data)
+            failed = [label for label, ok in results.items() if not ok]
+            assert not failed, f"以下字段填写未生效: {failed}"
 
         with allure.step("保存"):
             form.click_save()
@@ -341,7 +343,7 @@ class TestDatePicker:
 
         with allure.step("填写出生日期"):
             personal_data = TestDataLoader.get_personal_details()
-            date_str = personal_data.get("date_of_birth", "1990-01-15")
+            date_str = personal_data.date_of_birth or "1990-01-15"
 
             # 使用 .first 获取第一个匹配的日期输入框
             date_input = form.page.locator(form.INPUT_DATE_OF_BIRTH).first
@@ -385,13 +387,12 @@ class TestLoginDetails:
         4. 保存并验证
         """
         form = employee_form
-        timestamp = str(int(time.time()))[-6:]
-        username = f"user{timestamp}"
+        username = data_factory.username()
 
         with allure.step("填写基本信息"):
             form.wait_for_form_load()
             form.fill_employee_name(
-                first_name=f"Login{timestamp}",
+                first_name=data_factory.name("Login"),
                 last_name="TestUser",
             )
             emp_id = form.get_generated_employee_id()
@@ -411,6 +412,7 @@ class TestLoginDetails:
             # 使用 .first 点击保存按钮
             save_btn = form.page.locator(form.SAVE_BUTTON).first
             save_btn.click()
+            data_factory.register("employee", emp_id, username)
             form.page.wait_for_timeout(3000)
 
         with allure.step("验证保存成功"):
@@ -434,3 +436,4 @@ class TestLoginDetails:
             if not pim.has_no_records():
                 pim.click_delete_on_row(0)
                 pim.confirm_delete()
+                data_factory.unregister("employee", emp_id)
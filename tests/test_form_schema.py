@@ -0,0 +1,180 @@
+"""
+声明式表单描述测试用例
+
+[框架核心] 此文件测试 pages/form_schema.py 及员工表单的表单描述，不依赖浏览器和被测系统。
+"""
+
+import dataclasses
+
+import allure
+import pytest
+
+from pages.employee_form_page import EmployeeFormPage
+from pages.form_schema import (
+    FIELD_DATE,
+    FIELD_RADIO,
+    FIELD_SELECT,
+    FIELD_TEXT,
+    FormField,
+    convert_date,
+)
+from utils.data_loader import TestDataLoader
+
+
+class FakeLocator:
+    """记录点击的假定位器"""
+
+    def __init__(self, page, selector):
+        self.page = page
+        self.selector = selector
+        self.first = self
+
+    def click(self):
+        self.page.clicked.append(self.selector)
+
+
+class FakeDateInput:
+    """按顺序返回占位符的假日期输入框"""
+
+    def __init__(self, *placeholders):
+        self.placeholders = list(placeholders)
+
+    def get_attribute(self, name):
+        return self.placeholders.pop(0)
+
+
+class FakePage:
+    """只实现 fill_form 用到的接口的假页面"""
+
+    def __init__(self):
+        self.clicked: list[str] = []
+
+    def on(self, event, handler):
+        pass
+
+    def locator(self, selector):
+        return FakeLocator(self, selector)
+
+
+@allure.feature("框架核心")
+@allure.story("声明式表单")
+class TestFormSchema:
+    """声明式表单描述测试类"""
+
+    @allure.title("表单描述覆盖测试数据中的所有字段")
+    @pytest.mark.parametrize(
+        "schema",
+        [
+            EmployeeFormPage.PERSONAL_DETAILS_FORM,
+            EmployeeFormPage.CONTACT_DETAILS_FORM,
+            EmployeeFormPage.JOB_DETAILS_FORM,
+        ],
+        ids=lambda schema: schema.name,
+    )
+    def test_schema_covers_test_data(self, schema):
+        """test_data.json 中每个字段都能生成填写计划"""
+        data = dataclasses.asdict(getattr(TestDataLoader.load(), schema.name)["valid"])
+        plan = schema.plan(data)
+
+        planned = {f.key for f in plan.text} | {f.key for f, _ in plan.steps}
+        assert planned == {key for key, value in data.items() if value}
+
+    @allure.title("文本字段批量填写，其余字段按类型排序")
+    def test_plan_orders_sequenced_fields(self):
+        """文本字段进入批量填写，日期 -> 下拉框 -> 单选按钮依次执行"""
+        data = TestDataLoader.get_personal_details()
+        plan = EmployeeFormPage.PERSONAL_DETAILS_FORM.plan(data)
+
+        assert {f.kind for f in plan.text} == {FIELD_TEXT}
+        kinds = [f.kind for f, _ in plan.steps]
+        assert kinds == sorted(kinds, key=[FIELD_DATE, FIELD_SELECT, FIELD_RADIO].index)
+
+    @allure.title("按标签定位输入框时转义标签中的引号")
+    def test_labeled_input_quotes_label(self):
+        """含引号的标签（如 Driver's License Number）生成合法的 CSS 字符串"""
+        single = EmployeeFormPage._labeled_input("Driver's License Number")
+        double = EmployeeFormPage._labeled_input('Say "hi"')
+
+        assert "label:text-is(\"Driver's License Number\")" in single
+        assert 'label:text-is("Say \\"hi\\"")' in double
+
+    @allure.title("通过 Allure 步骤调用按表单描述填写")
+    def test_fill_form_through_step(self):
+        """fill_form 经过 allure.step 装饰器调用，按字段类型分派到对应的填写方法"""
+        form = EmployeeFormPage(FakePage())
+        calls = []
+        form.resolve_option = lambda catalog, value: value
+        form._fill_labeled_fields = lambda mapping, optional: dict.fromkeys(mapping, True)
+        form.fill_date = lambda locator, value: calls.append((FIELD_DATE, value))
+        form.select_dropdown_option = lambda locator, value: calls.append((FIELD_SELECT, value))
+        data = TestDataLoader.get_personal_details()
+
+        results = form.fill_form(EmployeeFormPage.PERSONAL_DETAILS_FORM, data)
+
+        plan = EmployeeFormPage.PERSONAL_DETAILS_FORM.plan(data)
+        assert all(results.values())
+        assert set(results) == {f.key for f in plan.text} | {f.key for f, _ in plan.steps}
+        assert calls == [(f.kind, v) for f, v in plan.steps if f.kind != FIELD_RADIO]
+        assert len(form.page.clicked) == sum(f.kind == FIELD_RADIO for f, _ in plan.steps)
+
+    @allure.title("下拉选项缓存的查找与失效")
+    def test_option_cache_lookup(self):
+        """读取的选项去除空白后缓存，按完全匹配优先查找，页面重新加载后清空"""
+        form = EmployeeFormPage(FakePage())
+        selector = EmployeeFormPage.SELECT_NATIONALITY
+
+        assert form._cached_option_index(selector, "British") == -1
+        options = form._cache_options(selector, ["-- Select --", " American ", "British"])
+        assert form._selectable_options(options) == ["American", "British"]
+        assert form._cached_option_index(selector, "British") == 2
+        assert form._cached_option_index(selector, "Ameri") == 1
+        assert "Martian" in str(form._option_not_found(selector, "Martian"))
+
+        form._clear_option_cache()
+        assert form._cached_option_index(selector, "British") == -1
+
+    @allure.title("空值字段不进入填写计划")
+    def test_plan_skips_empty_values(self):
+        """只填写有值的字段"""
+        plan = EmployeeFormPage.CONTACT_DETAILS_FORM.plan({"street1": "Main St", "country": ""})
+
+        assert [f.key for f in plan.text] == ["street1"]
+        assert plan.steps == []
+
+    @allure.title("未声明的字段报错")
+    def test_plan_rejects_unknown_keys(self):
+        """测试数据中的拼写错误在填写前即可发现"""
+        with pytest.raises(KeyError, match="stret1"):
+            EmployeeFormPage.CONTACT_DETAILS_FORM.plan({"stret1": "Main St"})
+
+    @allure.title("非文本字段必须提供定位器")
+    def test_field_requires_locator(self):
+        """日期、下拉框、单选按钮字段缺少定位器时报错"""
+        with pytest.raises(ValueError):
+            FormField("country", FIELD_SELECT, "Country")
+
+    @allure.title("只缓存识别成功的日期格式")
+    def test_detect_date_format_retries_until_known(self, monkeypatch):
+        """占位符为空时不缓存，下次重新识别；识别成功后不再读取占位符"""
+        monkeypatch.setattr(EmployeeFormPage, "_date_format", "")
+        date_input = FakeDateInput(None, "yyyy-dd-mm")
+
+        assert EmployeeFormPage._detect_date_format(date_input) == ""
+        assert EmployeeFormPage._detect_date_format(date_input) == "yyyy-dd-mm"
+        assert EmployeeFormPage._detect_date_format(date_input) == "yyyy-dd-mm"
+
+    @allure.title("日期按系统格式转换")
+    @pytest.mark.parametrize(
+        ("date_format", "expected"),
+        [
+            ("yyyy-mm-dd", "1990-01-15"),
+            ("yyyy-dd-mm", "1990-15-01"),
+            ("mm/dd/yyyy", "01/15/1990"),
+            ("dd.mm.yyyy", "15.01.1990"),
+            ("", "1990-01-15"),
+            ("D, d M Y", "1990-01-15"),
+        ],
+    )
+    def test_convert_date(self, date_format: str, expected: str):
+        """YYYY-MM-DD 转换为日期输入框占位符描述的格式，无法识别时原样返回"""
+        assert convert_date("1990-01-15", date_format) == expected
@@ -0,0 +1,78 @@
+"""
+导入开销测试用例
+
+[框架核心] 此文件测试 tests/conftest.py 的导入开销，不依赖浏览器和被测系统。
+
+每个 xdist worker 和每次 `pytest --collect-only` 都会导入 conftest，
+页面对象、清理工具和日志文件应在首次使用时才加载或创建。
+检查的是导入了哪些模块而不是耗时，结果不受机器负载影响。
+"""
+
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import allure
+import pytest
+
+PROJECT_ROOT = Path(__file__).parent.parent
+
+# 只有异步页面对象和负载测试使用的模块，同步用例的 conftest 不应导入
+ASYNC_ONLY_MODULES = ("playwright.async_api", "benchmarks")
+
+# 在独立进程中导入 conftest，输出已导入的模块
+_PROBE = """
+import json, sys
+import allure, playwright.sync_api, pytest
+import tests.conftest
+print(json.dumps({"modules": sorted(sys.modules)}))
+"""
+
+
+@pytest.fixture(scope="module")
+def probe(tmp_path_factory: pytest.TempPathFactory) -> dict:
+    """在空目录中导入 conftest，返回已导入模块和工作目录"""
+    workdir = tmp_path_factory.mktemp("import_probe")
+    env = {**os.environ, "PYTHONPATH": str(PROJECT_ROOT)}
+    result = subprocess.run(
+        [sys.executable, "-c", _PROBE],
+        cwd=workdir,
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return {**json.loads(result.stdout.splitlines()[-1]), "workdir": workdir}
+
+
+@allure.feature("框架核心")
+@allure.story("导入开销")
+class TestImportTime:
+    """导入开销测试类"""
+
+    @allure.title("conftest 不导入异步 API 和负载测试模块")
+    def test_async_modules_not_imported(self, probe: dict):
+        """导入这些模块通常意味着新增了模块级的重量级导入"""
+        eager = [
+            name
+            for name in probe["modules"]
+            if any(name == m or name.startswith(f"{m}.") for m in ASYNC_ONLY_MODULES)
+        ]
+        assert eager == []
+
+    @allure.title("页面对象和清理工具延迟导入")
+    def test_page_modules_not_imported(self, probe: dict):
+        """导入 conftest 不应导入任何页面模块和清理工具"""
+        eager = [
+            name
+            for name in probe["modules"]
+            if name.startswith("pages.") or name == "utils.cleanup"
+        ]
+        assert eager == []
+
+    @allure.title("导入时不创建日志文件")
+    def test_log_file_created_lazily(self, probe: dict):
+        """日志目录和文件在第一条日志写入时才创建"""
+        assert not (probe["workdir"] / "logs").exists()
@@ -0,0 +1,44 @@
+"""
+JSON 统计文件工具测试用例
+
+[框架核心] 此文件测试 utils/json_store.py 的加锁合并保存，不依赖浏览器和被测系统。
+"""
+
+import json
+import threading
+from pathlib import Path
+
+import allure
+
+from utils.adaptive_timeout import AdaptiveTimeoutService
+
+
+@allure.feature("框架核心")
+@allure.story("统计文件")
+class TestJsonStore:
+    """JSON 统计文件工具测试类"""
+
+    @allure.title("多个实例同时保存时不丢失样本")
+    def test_concurrent_saves_keep_all_samples(self, tmp_path: Path):
+        """模拟多个 worker 在会话结束时同时保存：每个实例的每次保存都必须保留下来"""
+        stats_file = tmp_path / "action_latency.json"
+        workers, saves = 8, 25
+        barrier = threading.Barrier(workers)
+
+        def worker(index: int) -> None:
+            service = AdaptiveTimeoutService(stats_file=stats_file)
+            barrier.wait()
+            for _ in range(saves):
+                service.record(f"Page:click:#button{index}", 10.0)
+                service.save()
+
+        threads = [threading.Thread(target=worker, args=(i,)) for i in range(workers)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        data = json.loads(stats_file.read_text(encoding="utf-8"))
+        assert {key: len(values) for key, values in data.items()} == {
+            f"Page:click:#button{i}": saves for i in range(workers)
+        }
@@ -0,0 +1,62 @@
+"""
+负载运行器统计测试
+
+[框架核心] 此文件测试负载运行器（benchmarks/load_runner.py）的步骤计时、
+多进程结果合并和耗时分布汇总，不依赖浏览器和被测系统。
+"""
+
+import allure
+import pytest
+
+from benchmarks.load_runner import (
+    HISTOGRAM_BOUNDS_MS,
+    StepRecorder,
+    histogram,
+    merge_results,
+    percentile,
+    summarize,
+)
+
+
+@allure.feature("框架核心")
+@allure.story("负载运行器")
+class TestLoadRunnerStats:
+    """负载运行器统计测试类"""
+
+    @allure.title("步骤计时记录成功耗时和失败次数")
+    def test_step_recorder(self):
+        recorder = StepRecorder()
+        with recorder.step("search"):
+            pass
+        with pytest.raises(RuntimeError), recorder.step("search"):
+            raise RuntimeError("timeout")
+
+        assert len(recorder.samples["search"]) == 1
+        assert recorder.errors == {"search": 1}
+
+    @allure.title("合并多个进程的记录并汇总分布和吞吐量")
+    def test_merge_and_summarize(self):
+        first = {"samples": {"login": [80.0, 300.0]}, "errors": {}, "iterations": 3}
+        second = {"samples": {"login": [20000.0]}, "errors": {"login": 1}, "iterations": 1}
+
+        report = summarize(merge_results([first, second]), elapsed_s=2.0)
+        login = report["steps"]["login"]
+
+        assert report["iterations"] == 4
+        assert report["iterations_per_s"] == 2.0
+        assert login["count"] == 3
+        assert login["error_rate"] == 0.25
+        assert login["per_s"] == 1.5
+        assert login["p50_ms"] == 300.0
+        assert login["max_ms"] == 20000.0
+        assert len(login["histogram"]) == len(HISTOGRAM_BOUNDS_MS) + 1
+        assert login["histogram"][0] == 1 and login["histogram"][-1] == 1
+
+    @allure.title("百分位数和直方图边界")
+    def test_percentile_and_histogram(self):
+        values = [float(v) for v in range(1, 101)]
+
+        assert percentile(values, 90) == 90.0
+        assert percentile(values, 100) == 100.0
+        assert percentile([], 50) == 0.0
+        assert histogram([100.0, 100.1], bounds=(100,)) == [1, 1]
@@ -0,0 +1,114 @@
+"""
+本地测试站点测试用例
+
+[框架核心] 此文件测试 utils/local_site.py 的路由、静态文件服务和员工 API，不依赖浏览器和被测系统。
+"""
+
+import json
+from urllib.error import HTTPError
+from urllib.parse import quote
+from urllib.request import Request, urlopen
+
+import allure
+import pytest
+
+from utils.local_site import EMPLOYEE_API, LocalSite, resolve_route
+
+
+@pytest.fixture(scope="module")
+def site():
+    """启动本地测试站点"""
+    with LocalSite() as site:
+        yield site
+
+
+def call_api(url: str, method: str = "GET", data: dict | None = None) -> tuple[int, dict]:
+    """
+    调用站点 API
+
+    Returns:
+        (状态码, 响应数据)
+    """
+    body = json.dumps(data).encode("utf-8") if data is not None else None
+    headers = {"Content-Type": "application/json"}
+    request = Request(url, data=body, method=method, headers=headers)
+    try:
+        with urlopen(request) as response:
+            return response.status, json.loads(response.read())
+    except HTTPError as e:
+        return e.code, json.loads(e.read())
+
+
+@allure.feature("框架核心")
+@allure.story("本地测试站点")
+class TestLocalSite:
+    """本地测试站点测试类"""
+
+    @allure.title("OrangeHRM 路径映射到站点页面")
+    @pytest.mark.parametrize(
+        "path, expected",
+        [
+            ("/", "/login.html"),
+            ("/web/index.php/auth/login", "/login.html"),
+            ("/web/index.php/pim/viewEmployeeList?limit=50", "/pim.html"),
+            ("/web/index.php/pim/contactDetails/empNumber/7", "/employee.html"),
+            ("/assets/site.css", "/assets/site.css"),
+        ],
+    )
+    def test_resolve_route(self, path, expected):
+        """页面路由忽略查询参数，静态资源原样返回"""
+        assert resolve_route(path) == expected
+
+    @allure.title("站点通过 HTTP 提供页面")
+    def test_serves_pages(self):
+        """启动后可以访问页面和静态资源，未知路径返回 404，退出后停止"""
+        with LocalSite() as site:
+            with urlopen(f"{site.url}/web/index.php/pim/viewEmployeeList") as response:
+                assert response.status == 200
+                assert b"oxd-table" in response.read()
+            with urlopen(f"{site.url}/assets/site.js") as response:
+                assert response.status == 200
+            with pytest.raises(HTTPError) as error:
+                urlopen(f"{site.url}/web/index.php/unknown")
+            assert error.value.code == 404
+
+        with pytest.raises(RuntimeError):
+            _ = site.url
+
+
+@allure.feature("框架核心")
+@allure.story("本地测试站点")
+class TestEmployeeApi:
+    """本地测试站点员工 API 测试类"""
+
+    @allure.title("创建、查询、修改和删除员工")
+    def test_employee_lifecycle(self, site):
+        """与 OrangeHRM 相同的查询/创建/批量删除接口，员工 ID 重复时返回 422"""
+        api = f"{site.url}{EMPLOYEE_API}"
+        employee = {"firstName": "Ann", "lastName": "Lee", "employeeId": "x001"}
+        status, created = call_api(api, "POST", employee)
+        assert status == 200
+        emp_number = created["data"]["empNumber"]
+
+        assert call_api(api, "POST", employee)[0] == 422
+        found = call_api(f"{api}?nameOrId={quote('ann lee')}")[1]["data"]
+        assert [e["employeeId"] for e in found] == ["x001"]
+
+        status, updated = call_api(f"{api}/{emp_number}", "PUT", {"details": {"City": "Paris"}})
+        assert status == 200 and updated["data"]["details"] == {"City": "Paris"}
+
+        assert call_api(api, "DELETE", {"ids": [emp_number]})[1]["data"] == [emp_number]
+        assert call_api(f"{api}/{emp_number}")[0] == 404
+
+    @allure.title("重置员工数据")
+    def test_reset(self, site):
+        """reset() 之后恢复为固定的初始数据"""
+        api = f"{site.url}{EMPLOYEE_API}?limit=0"
+        initial = call_api(api)[1]["data"]
+        deleted = [e["empNumber"] for e in initial[:5]]
+        call_api(f"{site.url}{EMPLOYEE_API}", "DELETE", {"ids": deleted})
+        assert len(call_api(api)[1]["data"]) == len(initial) - 5
+
+        site.reset()
+
+        assert call_api(api)[1]["data"] == initial
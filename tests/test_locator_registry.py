@@ -0,0 +1,162 @@
+"""
+定位器注册表测试用例
+
+[框架核心] 此文件测试 utils/locator_registry.py，不依赖浏览器和被测系统。
+"""
+
+from pathlib import Path
+
+import allure
+import pytest
+
+from pages import base_page
+from pages.base_page import BasePage
+from pages.pim_page import PIMPage
+from utils.locator_registry import LocatorRegistry
+
+CANDIDATES = (".primary", ".secondary", ".fallback")
+
+
+class FakeLocator:
+    """模拟 Locator：按页面上存在的选择器计数，支持 filter / or_"""
+
+    def __init__(self, page: "FakePage", selectors: tuple[str, ...]):
+        self.page = page
+        self.selectors = selectors
+
+    @property
+    def first(self) -> "FakeLocator":
+        return self
+
+    def filter(self, **_):
+        return self
+
+    def or_(self, other: "FakeLocator") -> "FakeLocator":
+        return FakeLocator(self.page, self.selectors + other.selectors)
+
+    def count(self) -> int:
+        return sum(selector in self.page.present for selector in self.selectors)
+
+
+class FakePage:
+    """模拟页面：只包含 present 中的元素"""
+
+    def __init__(self, *present: str):
+        self.present = set(present)
+
+    def locator(self, selector: str) -> FakeLocator:
+        return FakeLocator(self, (selector,))
+
+
+@pytest.fixture
+def registry(tmp_path: Path) -> LocatorRegistry:
+    """创建使用临时统计文件的定位器注册表"""
+    return LocatorRegistry(stats_file=tmp_path / "locator_stats.json")
+
+
+@allure.feature("框架核心")
+@allure.story("定位器注册表")
+class TestLocatorRegistry:
+    """定位器注册表测试类"""
+
+    @allure.title("无统计数据时保持声明顺序")
+    def test_keeps_declared_order_without_stats(self, registry: LocatorRegistry):
+        """新元素的候选顺序与声明顺序一致"""
+        assert registry.ordered("Page:dialog", CANDIDATES) == list(CANDIDATES)
+
+    @allure.title("一次快速命中不会让后备候选排到前面")
+    def test_hit_does_not_promote_fallback(self, registry: LocatorRegistry):
+        """命中只计数，不改变声明的优先级"""
+        registry.record("Page:dialog", ".fallback", failed=[".primary", ".secondary"])
+
+        assert registry.ordered("Page:dialog", CANDIDATES) == list(CANDIDATES)
+
+    @allure.title("反复匹配失败的候选被移到末尾")
+    def test_repeated_misses_demote(self, registry: LocatorRegistry):
+        """miss 达到阈值且多于 hit 时降级，其余候选保持声明顺序"""
+        for _ in range(LocatorRegistry.DEMOTE_AFTER_MISSES):
+            registry.record("Page:dialog", ".secondary", failed=[".primary"])
+
+        assert registry.ordered("Page:dialog", CANDIDATES) == [
+            ".secondary",
+            ".fallback",
+            ".primary",
+        ]
+        assert registry.get_stats("Page:dialog")["candidates"][".primary"]["demoted"]
+
+    @allure.title("命中次数多于失败次数的候选不降级")
+    def test_hits_keep_candidate(self, registry: LocatorRegistry):
+        """偶尔失败的候选仍保持原位置"""
+        for _ in range(4):
+            registry.record("Page:dialog", ".primary")
+        for _ in range(LocatorRegistry.DEMOTE_AFTER_MISSES):
+            registry.record("Page:dialog", ".secondary", failed=[".primary"])
+
+        assert registry.ordered("Page:dialog", CANDIDATES) == list(CANDIDATES)
+
+    @allure.title("统计命中率")
+    def test_hit_rate(self, registry: LocatorRegistry):
+        """命中率 = 找到元素的次数 / 解析次数"""
+        registry.record("Page:dialog", ".primary")
+        registry.record("Page:dialog", ".primary")
+        registry.record("Page:dialog", None)
+        registry.record("Page:dialog", ".secondary", failed=[".primary"])
+
+        stats = registry.get_stats("Page:dialog")
+        assert stats["lookups"] == 4
+        assert stats["misses"] == 1
+        assert stats["hit_rate"] == 0.75
+        assert stats["candidates"][".primary"] == {"hits": 2, "misses": 1, "demoted": False}
+
+    @allure.title("统计数据持久化后影响下一次运行的顺序")
+    def test_persisted_stats_reorder_next_run(self, tmp_path: Path):
+        """保存的统计与已有文件合并，新实例按合并后的数据排序"""
+        stats_file = tmp_path / "locator_stats.json"
+        first = LocatorRegistry(stats_file=stats_file)
+        second = LocatorRegistry(stats_file=stats_file)
+        first.record("Page:dialog", ".secondary", failed=[".primary"])
+        first.record("Page:dialog", ".secondary", failed=[".primary"])
+        second.record("Page:dialog", ".secondary", failed=[".primary"])
+        first.save()
+        second.save()
+
+        reloaded = LocatorRegistry(stats_file=stats_file)
+        assert reloaded.ordered("Page:dialog", CANDIDATES)[-1] == ".primary"
+        assert reloaded.get_stats("Page:dialog")["candidates"][".secondary"]["hits"] == 3
+
+    @allure.title("只记录能确定结果的查找")
+    def test_undetermined_lookups_not_recorded(self, registry: LocatorRegistry, monkeypatch):
+        """hidden 查找和无法确定命中候选（索引 -1）不计入统计"""
+        monkeypatch.setattr(base_page, "locator_registry", registry)
+        ordered = list(CANDIDATES)
+
+        BasePage._record_lookup("Page:dialog", ordered, "visible", (-1, object()))
+        BasePage._record_lookup("Page:dialog", ordered, "hidden", None)
+        BasePage._record_lookup("Page:dialog", ordered, "visible", (1, object()))
+
+        stats = registry.get_stats("Page:dialog")
+        assert stats["lookups"] == 1
+        assert stats["candidates"][".primary"]["misses"] == 1
+
+    @allure.title("无记录探测不计入统计")
+    def test_no_records_probe_not_recorded(self, registry: LocatorRegistry, monkeypatch):
+        """表格有数据时"无记录"提示本就不存在，检查它不应给候选记 miss"""
+        monkeypatch.setattr(base_page, "locator_registry", registry)
+        pim = PIMPage(FakePage(PIMPage.TABLE_ROW))
+
+        assert not pim.has_no_records()
+        assert registry.get_stats("PIMPage:no_records")["lookups"] == 0
+
+        pim.page.present = {PIMPage.TABLE_ROW, PIMPage.NO_RECORDS_SELECTORS[-1]}
+        assert pim.has_no_records()
+        assert registry.get_stats("PIMPage:no_records")["lookups"] == 0
+
+    @allure.title("并行匹配返回命中的候选选择器")
+    def test_first_matching_selector(self):
+        """返回优先级最高的命中候选的选择器字符串，全部未命中返回 None"""
+        page = BasePage(FakePage(".secondary", ".fallback"))
+
+        selector, locator = page.first_matching_selector(*CANDIDATES, timeout=0)
+        assert selector == ".secondary"
+        assert locator.selectors == (".secondary",)
+        assert page.first_matching_selector(".primary", timeout=0) is None
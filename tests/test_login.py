@@ -165,6 +165,28 @@ class TestLogin:
             )
             assert has_error or has_field_error, "未显示任何错误消息"
 
+    @allure.story("登录失败")
+    @allure.severity(allure.severity_level.NORMAL)
+    @pytest.mark.login
+    @TestDataLoader.parametrize_dataset("invalid_credentials", id_field="description")
+    def test_login_rejects_invalid_credentials(self, login_page: LoginPage, case):
+        """
+        数据驱动测试：无效凭证登录
+
+        用例来自 data/datasets/invalid_credentials.csv，
+        数据集按行流式读取，可扩展到大量凭证组合。
+        """
+        credentials = case.load()
+        allure.dynamic.title(f"无效凭证登录：{credentials['description']}")
+
+        with allure.step("使用无效凭证登录"):
+            login_page.open()
+            login_page.login(credentials["username"], credentials["password"])
+
+        with allure.step("验证显示凭证错误"):
+            expected = TestDataLoader.get_error_message("invalid_credentials")
+            assert expected in login_page.get_error_message()
+
 
 @allure.feature("登录功能")
 @allure.story("退出登录")
@@ -0,0 +1,68 @@
+"""
+页面性能指标测试用例
+
+[框架核心] 此文件测试 utils/page_metrics.py 的指标合并和按页面汇总，不依赖浏览器和被测系统。
+"""
+
+from pathlib import Path
+
+import allure
+
+from utils.page_metrics import PageMetricsCollector, build_metrics
+
+
+@allure.feature("框架核心")
+@allure.story("页面性能指标")
+class TestPageMetrics:
+    """页面性能指标测试类"""
+
+    @allure.title("合并采集脚本和 CDP 指标")
+    def test_build_metrics(self):
+        """浏览器不支持的指标被去掉，CDP 指标换算为毫秒/MB"""
+        raw = {"ttfb_ms": 12.5, "lcp_ms": None, "cls": 0.02, "slowest_resources": []}
+        cdp = [
+            {"name": "ScriptDuration", "value": 0.1234},
+            {"name": "JSHeapUsedSize", "value": 8 * 1024 * 1024},
+            {"name": "Documents", "value": 3},
+        ]
+
+        metrics = build_metrics(raw, cdp)
+
+        assert "lcp_ms" not in metrics
+        assert metrics["script_ms"] == 123.4
+        assert metrics["js_heap_mb"] == 8.0
+        assert "Documents" not in metrics
+
+    @allure.title("并行 worker 的样本合并到同一运行记录并按页面汇总")
+    def test_workers_merge_into_run(self, tmp_path: Path):
+        """同一运行 ID 的多个采集器写入同一记录，非数值指标不参与汇总"""
+        metrics_file = tmp_path / "page_metrics.json"
+        first = PageMetricsCollector(metrics_file, run_id="run1")
+        second = PageMetricsCollector(metrics_file, run_id="run1")
+        first.record("PIMPage", {"ttfb_ms": 10, "slowest_resources": [{"name": "app.js"}]})
+        second.record("PIMPage", {"ttfb_ms": 30})
+        second.record("LoginPage", {"ttfb_ms": 5, "cls": 0.1})
+        first.save()
+        second.save()
+
+        controller = PageMetricsCollector(metrics_file, run_id="other")
+        assert controller.latest_run_id() == "run1"
+        summary = controller.summary("run1")
+
+        assert summary["PIMPage"]["ttfb_ms"] == {"count": 2, "p50": 10, "p90": 30, "max": 30}
+        assert "slowest_resources" not in summary["PIMPage"]
+        assert summary["LoginPage"]["cls"]["max"] == 0.1
+
+    @allure.title("统计文件只保留最近几次运行，趋势按运行顺序给出")
+    def test_history_and_trend(self, tmp_path: Path):
+        """超过保留次数时丢弃最早的运行"""
+        metrics_file = tmp_path / "page_metrics.json"
+        for run_id, lcp in (("run1", 900), ("run2", 700), ("run3", 500)):
+            collector = PageMetricsCollector(metrics_file, run_id=run_id, history=2)
+            collector.record("PIMPage", {"lcp_ms": lcp})
+            collector.save()
+
+        trend = collector.trend("PIMPage", "lcp_ms")
+
+        assert [p50 for _, p50 in trend] == [700, 500]
+        assert collector.trend("PIMPage", "cls") == []
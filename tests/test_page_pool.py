@@ -0,0 +1,148 @@
+"""
+页面复用池测试用例
+
+[框架核心] 此文件测试 utils/page_pool.py 的页面重置，使用内存中的假页面代替浏览器，
+不依赖浏览器和被测系统。
+"""
+
+import allure
+
+from config.settings import settings
+from utils.browser_context import BLOCKED_RESOURCES
+from utils.page_pool import PagePool, add_listener, reset_page, watch_listeners
+
+
+class FakePage:
+    """只实现 reset_page 用到的接口的假页面"""
+
+    def __init__(self):
+        self.url = "about:blank"
+        self.listeners: list[tuple[str, object]] = []
+
+    def on(self, event, handler):
+        self.listeners.append((event, handler))
+
+    def once(self, event, handler):
+        self.listeners.append((event, handler))
+
+    def emit(self, event, payload):
+        # 与 Playwright 相同：once 监听器触发前先被移除
+        for registered, handler in list(self.listeners):
+            if registered == event:
+                handler(payload)
+
+    def remove_listener(self, event, handler):
+        self.listeners.remove((event, handler))
+
+    def is_closed(self):
+        return False
+
+    def unroute_all(self, behavior=None):
+        pass
+
+    def goto(self, url):
+        self.url = url
+
+    def set_default_timeout(self, timeout):
+        pass
+
+    def set_default_navigation_timeout(self, timeout):
+        pass
+
+
+class FakeContext:
+    """记录路由的假上下文"""
+
+    def __init__(self):
+        self.routes: list = []
+        self.pages: list[FakePage] = []
+
+    def route(self, url, handler):
+        self.routes.append(url)
+
+    def unroute_all(self, behavior=None):
+        self.routes.clear()
+
+    def new_page(self):
+        page = FakePage()
+        self.pages.append(page)
+        return page
+
+    def clear_cookies(self):
+        pass
+
+    def clear_permissions(self):
+        pass
+
+
+class FakeBrowser:
+    """只创建假上下文的假浏览器"""
+
+    def new_context(self, **config):
+        return FakeContext()
+
+
+@allure.feature("框架核心")
+@allure.story("页面复用")
+class TestPagePool:
+    """页面复用池测试类"""
+
+    @allure.title("重置页面时移除通过 add_listener 注册的监听器")
+    def test_reset_removes_tracked_listeners(self):
+        page = FakePage()
+        page.on("close", print)
+        assert watch_listeners(page)
+        add_listener(page, "load", print)
+        add_listener(page, "load", repr)
+
+        assert reset_page(page)
+        # 只移除登记过的监听器，其他监听器保持不变
+        assert page.listeners == [("close", print)]
+        # 再次重置时没有需要移除的监听器
+        assert reset_page(page)
+        assert page.listeners == [("close", print)]
+
+    @allure.title("测试遗留未登记的监听器时不复用页面")
+    def test_reset_discards_page_with_leaked_listeners(self):
+        """直接通过 page.on 注册且未移除的监听器视为泄漏，移除后页面可以复用"""
+        page = FakePage()
+        watch_listeners(page)
+        page.on("dialog", print)
+
+        assert not reset_page(page)
+
+        page.remove_listener("dialog", print)
+        assert reset_page(page)
+
+    @allure.title("已触发的 once 监听器不算泄漏")
+    def test_fired_once_listener_is_not_leaked(self):
+        """once 监听器触发后从记录中移除，未触发的仍视为泄漏"""
+        page = FakePage()
+        watch_listeners(page)
+        seen = []
+        page.once("dialog", seen.append)
+        assert not reset_page(page)
+
+        # FakePage 不会自动移除 once 监听器，这里模拟 Playwright 触发后的状态
+        page.emit("dialog", "alert")
+        page.listeners.clear()
+        assert seen == ["alert"]
+        assert reset_page(page)
+
+    @allure.title("未记录监听器的页面不复用")
+    def test_reset_discards_unwatched_page(self):
+        """无法确认监听器状态的页面不放回池中"""
+        assert not reset_page(FakePage())
+
+    @allure.title("归还页面后保留资源拦截路由")
+    def test_release_keeps_resource_blocking(self):
+        """归还页面时清除测试添加的上下文路由，并重新安装 BLOCK_RESOURCES 的拦截路由"""
+        with settings.override(BLOCK_RESOURCES=True, TRACING=False):
+            pool = PagePool(FakeBrowser())
+            page = pool.acquire()
+            pool.context.route("**/api/**", print)
+
+            pool.release(page)
+
+            assert pool.context.routes == [BLOCKED_RESOURCES]
+            assert pool.acquire() is page
@@ -0,0 +1,129 @@
+"""
+参考数据缓存测试用例
+
+[框架核心] 此文件测试 utils/reference_data.py，不依赖浏览器和被测系统。
+"""
+
+import threading
+from pathlib import Path
+
+import allure
+import pytest
+
+from config.settings import settings
+from utils.reference_data import ReferenceDataCache
+
+NATIONALITIES = ["American", "British", "Chinese"]
+
+
+@pytest.fixture
+def cache(tmp_path: Path) -> ReferenceDataCache:
+    """创建使用临时缓存文件的参考数据缓存"""
+    return ReferenceDataCache(
+        cache_file=tmp_path / "reference_data.json",
+        ttl_seconds=3600,
+        environment="https://example.test",
+    )
+
+
+@allure.feature("框架核心")
+@allure.story("参考数据缓存")
+class TestReferenceData:
+    """参考数据缓存测试类"""
+
+    @allure.title("每个会话只加载一次")
+    def test_loads_once(self, cache: ReferenceDataCache):
+        """同一目录多次获取只调用一次加载函数"""
+        calls = []
+
+        def loader():
+            calls.append(1)
+            return NATIONALITIES
+
+        assert cache.get("nationalities", loader) == NATIONALITIES
+        assert cache.get("nationalities", loader) == NATIONALITIES
+        assert len(calls) == 1
+
+    @allure.title("有效期内复用缓存文件")
+    def test_reuses_persisted_catalog(self, tmp_path: Path, cache: ReferenceDataCache):
+        """新实例在有效期内直接读取缓存文件，过期后重新加载"""
+        cache.get("nationalities", lambda: NATIONALITIES)
+
+        fresh = ReferenceDataCache(
+            cache_file=cache.cache_file, ttl_seconds=3600, environment=cache.environment
+        )
+        assert fresh.get("nationalities", lambda: None) == NATIONALITIES
+
+        expired = ReferenceDataCache(
+            cache_file=cache.cache_file, ttl_seconds=-1, environment=cache.environment
+        )
+        assert expired.get("nationalities", lambda: ["Reloaded"]) == ["Reloaded"]
+
+    @allure.title("加载失败不缓存")
+    def test_failed_load_is_retried(self, cache: ReferenceDataCache):
+        """加载函数返回 None 时返回空列表，下次获取重新加载"""
+        assert cache.get("countries", lambda: None) == []
+        assert cache.get("countries", lambda: ["Japan"]) == ["Japan"]
+
+    @allure.title("异步加载函数")
+    def test_get_async(self, cache: ReferenceDataCache, run_async):
+        """异步获取与同步获取共用缓存，已加载的目录不再调用加载函数"""
+        calls = []
+
+        async def loader():
+            calls.append(1)
+            return NATIONALITIES
+
+        assert run_async(cache.get_async("nationalities", loader)) == NATIONALITIES
+        assert run_async(cache.get_async("nationalities", loader)) == NATIONALITIES
+        assert cache.get("nationalities", lambda: None) == NATIONALITIES
+        assert len(calls) == 1
+
+    @allure.title("未固定环境时按当前的 BASE_URL 区分数据")
+    def test_environment_follows_base_url(self, tmp_path: Path, run_async):
+        """切换 BASE_URL 后重新加载，切回后复用原环境的数据"""
+        cache = ReferenceDataCache(cache_file=tmp_path / "reference_data.json", ttl_seconds=3600)
+
+        with settings.override(BASE_URL="https://first.test"):
+            assert cache.get("countries", lambda: ["Japan"]) == ["Japan"]
+        with settings.override(BASE_URL="https://second.test"):
+            assert cache.environment == "https://second.test"
+            assert cache.get("countries", lambda: ["Brazil"]) == ["Brazil"]
+            assert run_async(cache.get_async("countries", self._fail_async)) == ["Brazil"]
+        with settings.override(BASE_URL="https://first.test"):
+            assert cache.get("countries", lambda: None) == ["Japan"]
+            fresh = ReferenceDataCache(cache_file=cache.cache_file, ttl_seconds=3600)
+            assert fresh.get("countries", lambda: None) == ["Japan"]
+
+    @staticmethod
+    async def _fail_async():
+        raise AssertionError("已缓存的目录不应再次加载")
+
+    @allure.title("并行写入不同目录时不丢失数据")
+    def test_concurrent_writes_keep_all_catalogs(self, tmp_path: Path):
+        """多个缓存实例（模拟 xdist worker）同时写入同一缓存文件，每个目录都被保留"""
+        cache_file = tmp_path / "reference_data.json"
+        catalogs = [f"catalog{index}" for index in range(8)]
+
+        def load(catalog: str) -> None:
+            cache = ReferenceDataCache(cache_file, ttl_seconds=3600, environment="env")
+            cache.get(catalog, lambda: [catalog])
+
+        threads = [threading.Thread(target=load, args=(catalog,)) for catalog in catalogs]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        fresh = ReferenceDataCache(cache_file, ttl_seconds=3600, environment="env")
+        assert all(fresh.get(catalog, lambda: None) == [catalog] for catalog in catalogs)
+
+    @allure.title("解析选项文本")
+    def test_resolve(self, cache: ReferenceDataCache):
+        """完全匹配、忽略大小写匹配、唯一部分匹配依次尝试，不存在时报错"""
+        assert cache.resolve("nationalities", "American", NATIONALITIES) == "American"
+        assert cache.resolve("nationalities", "british", NATIONALITIES) == "British"
+        assert cache.resolve("nationalities", "Chin", NATIONALITIES) == "Chinese"
+
+        with pytest.raises(ValueError, match="不存在"):
+            cache.resolve("nationalities", "Martian", NATIONALITIES)
@@ -0,0 +1,95 @@
+"""
+配置模块测试用例
+
+[框架核心] 此文件测试 config/settings.py，不依赖浏览器和被测系统。
+"""
+
+import allure
+import pytest
+
+from config.settings import RUN_PROFILES, Settings, settings
+
+
+@allure.feature("框架核心")
+@allure.story("配置管理")
+class TestSettings:
+    """配置快照测试类"""
+
+    @allure.title("配置是只读的")
+    def test_settings_are_read_only(self):
+        """直接修改配置项和预先计算的配置都会报错"""
+        with pytest.raises(AttributeError):
+            settings.TIMEOUT = 1
+        with pytest.raises(TypeError):
+            settings.context_config["ignore_https_errors"] = False
+
+    @allure.title("上下文配置只计算一次")
+    def test_context_config_is_precomputed(self):
+        """热路径返回同一个对象；get_context_config 返回可修改的副本"""
+        assert settings.context_config is settings.context_config
+
+        config = settings.get_context_config()
+        config["viewport"]["width"] = 1
+        assert settings.context_config["viewport"]["width"] == settings.VIEWPORT_WIDTH
+
+    @allure.title("临时覆盖配置并恢复")
+    def test_override_restores_values(self):
+        """覆盖期间派生配置随之更新，退出后恢复原值"""
+        width = settings.VIEWPORT_WIDTH
+
+        with settings.override(VIEWPORT_WIDTH=1280):
+            assert settings.context_config["viewport"]["width"] == 1280
+
+        assert settings.VIEWPORT_WIDTH == width
+        assert settings.context_config["viewport"]["width"] == width
+
+    @allure.title("覆盖的配置同样经过验证")
+    def test_override_validates(self):
+        """无效的覆盖值和不存在的配置项都会报错，且不影响原配置"""
+        timeout = settings.TIMEOUT
+
+        with pytest.raises(ValueError, match="TIMEOUT"), settings.override(TIMEOUT=0):
+            pass
+        with (
+            pytest.raises(AttributeError, match="NO_SUCH_SETTING"),
+            settings.override(NO_SUCH_SETTING=1),
+        ):
+            pass
+
+        assert settings.TIMEOUT == timeout
+
+
+@allure.feature("框架核心")
+@allure.story("配置管理")
+class TestRunProfiles:
+    """运行配置档测试类"""
+
+    @allure.title("应用运行配置档")
+    def test_use_profile(self, monkeypatch: pytest.MonkeyPatch):
+        """配置档一次切换一组配置，并更新派生配置"""
+        monkeypatch.delenv("VIEWPORT_WIDTH", raising=False)
+        snapshot = Settings()
+
+        snapshot.use_profile("fast-ci")
+
+        assert snapshot.RUN_PROFILE == "fast-ci"
+        assert snapshot.BLOCK_RESOURCES is True
+        assert snapshot.FULL_PAGE_SCREENSHOTS is False
+        width = RUN_PROFILES["fast-ci"]["VIEWPORT_WIDTH"]
+        assert snapshot.context_config["viewport"]["width"] == width
+
+    @allure.title("环境变量优先于运行配置档")
+    def test_environment_wins_over_profile(self, monkeypatch: pytest.MonkeyPatch):
+        """进程环境变量中显式设置的配置项不被配置档覆盖"""
+        monkeypatch.setenv("TIMEOUT", str(Settings.TIMEOUT))
+        snapshot = Settings()
+
+        snapshot.use_profile("fast-ci")
+
+        assert snapshot.TIMEOUT == Settings.TIMEOUT
+
+    @allure.title("不存在的运行配置档")
+    def test_unknown_profile(self):
+        """错误信息列出可用的配置档"""
+        with pytest.raises(ValueError, match="fast-ci"):
+            Settings().use_profile("turbo")
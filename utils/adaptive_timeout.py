@@ -0,0 +1,209 @@
+"""
+自适应超时服务
+根据历史观测到的操作耗时，为每个选择器/操作推导合理的超时时间
+通用的多系统端到端测试框架
+
+原理：
+- 每次操作成功后记录耗时（按 "页面:操作:选择器" 分组）
+- 超时时间 = 分位数耗时（默认 p99）× 放大系数，并限制在 [下限, 上限] 之间
+- 样本数不足时回退到调用方给定的超时时间
+- 统计数据在测试会话结束时持久化，供后续运行使用
+"""
+
+import json
+import math
+import threading
+from pathlib import Path
+
+from config.settings import settings
+from utils.json_store import update_json_file
+from utils.logger import logger
+
+
+class AdaptiveTimeoutService:
+    """自适应超时服务"""
+
+    # 每个操作最多保留的样本数（滑动窗口）
+    MAX_SAMPLES = 200
+
+    def __init__(
+        self,
+        stats_file: Path | None = None,
+        percentile: float | None = None,
+        factor: float | None = None,
+        floor_ms: int | None = None,
+        ceiling_ms: int | None = None,
+        min_samples: int | None = None,
+    ):
+        """
+        初始化自适应超时服务
+
+        Args:
+            stats_file: 统计数据文件路径
+            percentile: 使用的分位数（0-100）
+            factor: 放大系数
+            floor_ms: 超时下限（毫秒）
+            ceiling_ms: 超时上限（毫秒）
+            min_samples: 启用自适应超时所需的最少样本数
+        """
+        self.stats_file = stats_file or settings.ADAPTIVE_TIMEOUT_FILE
+
+        # 未显式指定的参数在使用时读取配置（--profile、settings.override 之后仍然生效）
+        self._percentile = percentile
+        self._factor = factor
+        self._floor_ms = floor_ms
+        self._ceiling_ms = ceiling_ms
+        self._min_samples = min_samples
+
+        self._samples: dict[str, list[float]] = {}
+        self._new_samples: dict[str, list[float]] = {}
+        # 已推导的超时时间，推导参数变化时清空
+        self._cache: dict[str, int] = {}
+        self._cache_params: tuple | None = None
+        self._loaded = False
+        self._lock = threading.Lock()
+
+    @property
+    def percentile(self) -> float:
+        """使用的分位数（0-100）"""
+        return self._percentile or settings.ADAPTIVE_TIMEOUT_PERCENTILE
+
+    @property
+    def factor(self) -> float:
+        """放大系数"""
+        return self._factor or settings.ADAPTIVE_TIMEOUT_FACTOR
+
+    @property
+    def floor_ms(self) -> int:
+        """超时下限（毫秒）"""
+        return self._floor_ms or settings.ADAPTIVE_TIMEOUT_FLOOR
+
+    @property
+    def ceiling_ms(self) -> int:
+        """超时上限（毫秒），默认为当前的 TIMEOUT 配置"""
+        return self._ceiling_ms or settings.TIMEOUT
+
+    @property
+    def min_samples(self) -> int:
+        """启用自适应超时所需的最少样本数"""
+        return self._min_samples or settings.ADAPTIVE_TIMEOUT_MIN_SAMPLES
+
+    @staticmethod
+    def make_key(page_name: str, action: str, selector_desc: str) -> str:
+        """
+        生成操作的统计键
+
+        Args:
+            page_name: 页面名称
+            action: 操作名称，如 click / fill / visible
+            selector_desc: 选择器描述
+
+        Returns:
+            统计键
+        """
+        return f"{page_name}:{action}:{selector_desc}"
+
+    def _ensure_loaded(self) -> None:
+        """首次使用时从文件加载历史统计数据"""
+        if self._loaded:
+            return
+        self._loaded = True
+        self._samples = self._read_file()
+        if self._samples:
+            logger.debug(f"已加载 {len(self._samples)} 个操作的历史耗时统计")
+
+    def _read_file(self) -> dict[str, list[float]]:
+        """
+        读取统计数据文件
+
+        Returns:
+            操作键 -> 耗时样本列表
+        """
+        if not self.stats_file.exists():
+            return {}
+        try:
+            with open(self.stats_file, encoding="utf-8") as f:
+                data = json.load(f)
+            return {key: [float(v) for v in values] for key, values in data.items()}
+        except (json.JSONDecodeError, OSError, TypeError, ValueError, AttributeError) as e:
+            logger.warning(f"耗时统计文件无效，已忽略: {self.stats_file}, 错误: {e}")
+            return {}
+
+    def record(self, key: str, latency_ms: float) -> None:
+        """
+        记录一次成功操作的耗时
+
+        Args:
+            key: 统计键
+            latency_ms: 耗时（毫秒）
+        """
+        with self._lock:
+            self._ensure_loaded()
+            samples = self._samples.setdefault(key, [])
+            samples.append(latency_ms)
+            if len(samples) > self.MAX_SAMPLES:
+                del samples[: len(samples) - self.MAX_SAMPLES]
+            self._new_samples.setdefault(key, []).append(latency_ms)
+            self._cache.pop(key, None)
+
+    def get_timeout(self, key: str, default: int) -> int:
+        """
+        获取操作的自适应超时时间
+
+        Args:
+            key: 统计键
+            default: 样本不足时使用的超时时间，同时作为上限
+
+        Returns:
+            超时时间（毫秒）
+        """
+        percentile, factor, floor_ms, ceiling_ms, min_samples = params = (
+            self.percentile,
+            self.factor,
+            self.floor_ms,
+            self.ceiling_ms,
+            self.min_samples,
+        )
+        with self._lock:
+            self._ensure_loaded()
+            if params != self._cache_params:
+                self._cache.clear()
+                self._cache_params = params
+            if key not in self._cache:
+                samples = self._samples.get(key, [])
+                if len(samples) < min_samples:
+                    return default
+                ordered = sorted(samples)
+                index = max(0, math.ceil(len(ordered) * percentile / 100) - 1)
+                learned = ordered[index] * factor
+                self._cache[key] = int(min(max(learned, floor_ms), ceiling_ms))
+            return min(self._cache[key], default)
+
+    def save(self) -> None:
+        """
+        持久化统计数据
+
+        在文件锁内与文件中已有的数据合并（并行执行时其他 worker 可能同时保存），
+        只追加本进程新增的样本。
+        """
+        with self._lock:
+            if not self._new_samples:
+                return
+
+            def merge(merged: dict[str, list[float]]) -> dict[str, list[float]]:
+                for key, values in self._new_samples.items():
+                    samples = merged.setdefault(key, [])
+                    samples.extend(values)
+                    if len(samples) > self.MAX_SAMPLES:
+                        del samples[: len(samples) - self.MAX_SAMPLES]
+                return merged
+
+            if not update_json_file(self.stats_file, self._read_file, merge):
+                return
+
+            logger.debug(f"耗时统计已保存: {self.stats_file}")
+            self._new_samples.clear()
+
+
+# 创建全局实例
+adaptive_timeouts = AdaptiveTimeoutService()
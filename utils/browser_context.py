@@ -0,0 +1,194 @@
+"""
+浏览器上下文工具模块
+按当前配置（含运行配置档）创建和关闭浏览器上下文
+通用的多系统端到端测试框架
+
+创建上下文时：
+- 使用 settings.context_config（视口等），单个测试可通过 @pytest.mark.viewport 覆盖视口
+- BLOCK_RESOURCES 启用时拦截图片和媒体请求（只拦截匹配的 URL，其余请求不经过 Python）
+- TRACING 启用时开始记录追踪，关闭上下文时保存到 TRACE_DIR
+
+new_context_async / close_context_async 为异步页面对象使用的同等版本（playwright.async_api）
+"""
+
+from __future__ import annotations
+
+import contextlib
+import re
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from playwright.sync_api import Browser, BrowserContext, Route
+
+from config.settings import VIEWPORT_PRESETS, settings
+from utils.logger import logger
+
+if TYPE_CHECKING:
+    from playwright.async_api import (
+        Browser as AsyncBrowser,
+        BrowserContext as AsyncBrowserContext,
+        Route as AsyncRoute,
+    )
+
+# 被拦截的静态资源（图片和媒体；字体用于显示图标，不拦截）
+BLOCKED_RESOURCES = re.compile(
+    r"\.(png|jpe?g|gif|webp|svg|ico|bmp|mp4|webm|ogg|mp3|wav)(\?.*)?$", re.IGNORECASE
+)
+
+
+def _abort(route: Route) -> None:
+    """中止被拦截的请求"""
+    route.abort()
+
+
+async def _abort_async(route: AsyncRoute) -> None:
+    """中止被拦截的请求（异步上下文）"""
+    await route.abort()
+
+
+def install_resource_blocking(context: BrowserContext) -> None:
+    """
+    BLOCK_RESOURCES 启用时在上下文上安装静态资源拦截路由
+
+    创建上下文时调用；清除上下文路由（如页面复用池归还页面时的 unroute_all）后需重新调用。
+
+    Args:
+        context: 浏览器上下文
+    """
+    if settings.BLOCK_RESOURCES:
+        context.route(BLOCKED_RESOURCES, _abort)
+
+
+async def install_resource_blocking_async(context: AsyncBrowserContext) -> None:
+    """
+    BLOCK_RESOURCES 启用时在异步上下文上安装静态资源拦截路由
+
+    Args:
+        context: 异步浏览器上下文
+    """
+    if settings.BLOCK_RESOURCES:
+        await context.route(BLOCKED_RESOURCES, _abort_async)
+
+
+def _trace_file(trace_name: str) -> Path:
+    """
+    获取追踪文件路径
+
+    Args:
+        trace_name: 追踪文件名（不含扩展名），如测试节点 ID
+
+    Returns:
+        TRACE_DIR 下的追踪文件路径
+    """
+    file_name = re.sub(r"[^\w.-]+", "_", trace_name).strip("_") or "trace"
+    return settings.TRACE_DIR / f"{file_name}.zip"
+
+
+def viewport_overrides(*args, device_scale_factor: float | None = None) -> dict:
+    """
+    将视口标记的参数转换为上下文配置覆盖
+
+    支持的写法：
+        @pytest.mark.viewport("throughput")                      # 预设名称
+        @pytest.mark.viewport(1280, 720)                         # 宽, 高
+        @pytest.mark.viewport(1280, 720, device_scale_factor=2)  # 同时指定像素比
+        @pytest.mark.viewport(device_scale_factor=2)             # 只指定像素比
+
+    Args:
+        *args: 预设名称，或宽和高
+        device_scale_factor: 设备像素比
+
+    Returns:
+        上下文配置覆盖，如 {"viewport": {...}, "device_scale_factor": 2}
+
+    Raises:
+        ValueError: 参数无效
+    """
+    overrides: dict = {}
+    if len(args) == 1 and isinstance(args[0], str):
+        if args[0] not in VIEWPORT_PRESETS:
+            raise ValueError(f"视口预设不存在: {args[0]}，可用的预设: {list(VIEWPORT_PRESETS)}")
+        width, height = VIEWPORT_PRESETS[args[0]]
+        overrides["viewport"] = {"width": width, "height": height}
+    elif len(args) == 2 and all(isinstance(a, int) and a > 0 for a in args):
+        overrides["viewport"] = {"width": args[0], "height": args[1]}
+    elif args:
+        raise ValueError(f"视口参数无效: {args}，应为预设名称或 (宽, 高)")
+
+    if device_scale_factor is not None:
+        if device_scale_factor <= 0:
+            raise ValueError(f"device_scale_factor 必须大于 0: {device_scale_factor}")
+        overrides["device_scale_factor"] = device_scale_factor
+    return overrides
+
+
+def new_context(browser: Browser, **overrides) -> BrowserContext:
+    """
+    按当前配置创建浏览器上下文
+
+    Args:
+        browser: 浏览器实例
+        **overrides: 覆盖或补充的上下文配置，如 storage_state
+
+    Returns:
+        浏览器上下文
+    """
+    config = {**settings.context_config, **overrides} if overrides else settings.context_config
+    context = browser.new_context(**config)
+    install_resource_blocking(context)
+    if settings.TRACING:
+        context.tracing.start(screenshots=True, snapshots=True, sources=True)
+    return context
+
+
+def close_context(context: BrowserContext, trace_name: str = "trace") -> None:
+    """
+    关闭浏览器上下文（启用追踪时先保存追踪文件）
+
+    Args:
+        context: 浏览器上下文
+        trace_name: 追踪文件名（不含扩展名），如测试节点 ID
+    """
+    if settings.TRACING:
+        trace_file = _trace_file(trace_name)
+        with contextlib.suppress(Exception):
+            settings.TRACE_DIR.mkdir(parents=True, exist_ok=True)
+            context.tracing.stop(path=str(trace_file))
+            logger.info(f"追踪已保存: {trace_file}")
+    context.close()
+
+
+async def new_context_async(browser: AsyncBrowser, **overrides) -> AsyncBrowserContext:
+    """
+    按当前配置创建异步浏览器上下文（与 new_context 相同的配置）
+
+    Args:
+        browser: 异步浏览器实例
+        **overrides: 覆盖或补充的上下文配置，如 storage_state
+
+    Returns:
+        异步浏览器上下文
+    """
+    config = {**settings.context_config, **overrides} if overrides else settings.context_config
+    context = await browser.new_context(**config)
+    await install_resource_blocking_async(context)
+    if settings.TRACING:
+        await context.tracing.start(screenshots=True, snapshots=True, sources=True)
+    return context
+
+
+async def close_context_async(context: AsyncBrowserContext, trace_name: str = "trace") -> None:
+    """
+    关闭异步浏览器上下文（启用追踪时先保存追踪文件）
+
+    Args:
+        context: 异步浏览器上下文
+        trace_name: 追踪文件名（不含扩展名），如测试节点 ID
+    """
+    if settings.TRACING:
+        trace_file = _trace_file(trace_name)
+        with contextlib.suppress(Exception):
+            settings.TRACE_DIR.mkdir(parents=True, exist_ok=True)
+            await context.tracing.stop(path=str(trace_file))
+            logger.info(f"追踪已保存: {trace_file}")
+    await context.close()
@@ -0,0 +1,217 @@
+"""
+测试数据清理工具模块
+在会话结束时批量删除测试创建但未清理的员工，并可清扫以往运行遗留的测试数据
+通用的多系统端到端测试框架
+
+清理来源：
+1. 登记表：EmployeeFormPage.create_new_employee 及测试中 data_factory.register 登记的员工
+2. 清扫（可选，--sweep-test-data）：员工 ID 符合 data_factory 生成规则、但不属于本次运行的员工
+
+删除方式：
+- 优先通过 OrangeHRM API 一次删除全部目标员工
+- API 不可用时回退到 UI：按员工 ID 公共部分搜索，勾选目标行后一次删除
+
+注意：清扫会删除其他运行创建的测试员工，多个运行同时使用同一测试环境时请勿启用。
+"""
+
+from collections.abc import Iterable
+
+from playwright.sync_api import Page, sync_playwright
+
+from config.settings import settings
+from pages.login_page import LoginPage
+from pages.pim_page import PIMPage
+from utils.browser_context import close_context, new_context
+from utils.data_factory import SEPARATOR, DataFactory, data_factory
+from utils.logger import logger
+
+# OrangeHRM 员工 API
+EMPLOYEE_API_PATH = "/web/index.php/api/v2/pim/employees"
+
+
+class EmployeeCleanup:
+    """员工批量清理"""
+
+    def __init__(self, page: Page, factory: DataFactory | None = None):
+        """
+        初始化员工清理
+
+        Args:
+            page: 已登录的页面
+            factory: 数据生成器（提供登记表和标识规则），默认为全局实例
+        """
+        self.page = page
+        self.factory = factory or data_factory
+        self.api_url = f"{settings.BASE_URL}{EMPLOYEE_API_PATH}"
+
+    def find(self, name_or_id: str) -> list[dict] | None:
+        """
+        通过 API 按姓名或员工 ID（部分匹配）查找员工
+
+        Args:
+            name_or_id: 姓名或员工 ID 的一部分
+
+        Returns:
+            员工列表（包含 empNumber, employeeId, firstName 等），API 不可用时返回 None
+        """
+        try:
+            response = self.page.request.get(
+                self.api_url, params={"nameOrId": name_or_id, "limit": 500}
+            )
+            if not response.ok:
+                logger.debug(f"员工查询 API 请求失败: {response.status}")
+                return None
+            return response.json()["data"]
+        except Exception as e:
+            logger.debug(f"员工查询 API 不可用: {e}")
+            return None
+
+    def delete_by_api(self, employees: list[dict]) -> bool:
+        """
+        通过 API 一次删除多个员工
+
+        Args:
+            employees: find() 返回的员工列表
+
+        Returns:
+            是否删除成功
+        """
+        if not employees:
+            return True
+        try:
+            response = self.page.request.delete(
+                self.api_url, data={"ids": [e["empNumber"] for e in employees]}
+            )
+            if not response.ok:
+                logger.warning(f"批量删除员工失败: HTTP {response.status}")
+            return response.ok
+        except Exception as e:
+            logger.warning(f"批量删除员工 API 不可用: {e}")
+            return False
+
+    def delete_by_ui(self, employee_ids: list[str], search_text: str) -> int:
+        """
+        通过 PIM 列表页一次删除多个员工
+
+        Args:
+            employee_ids: 员工 ID
+            search_text: 员工 ID 的公共部分（搜索条件）
+
+        Returns:
+            删除的员工数
+        """
+        pim = PIMPage(self.page)
+        pim.open()
+        pim.wait_for_page_load()
+        return pim.bulk_delete_employees(employee_ids, search_text)
+
+    def cleanup_registered(self) -> int:
+        """
+        删除登记表中尚未清理的员工
+
+        Returns:
+            删除的员工数
+        """
+        entities = self.factory.created("employee")
+        if not entities:
+            return 0
+        employee_ids = {entity.key for entity in entities}
+        logger.info(f"清理测试创建的员工: {sorted(employee_ids)}")
+
+        # 本进程生成的员工 ID 有公共部分，一次查询即可覆盖；其余员工 ID 逐个查询
+        worker_prefix = self.factory.worker_prefix()
+        search_terms = {
+            worker_prefix if employee_id.startswith(worker_prefix) else employee_id
+            for employee_id in employee_ids
+        }
+
+        found: list[dict] = []
+        for search_text in search_terms:
+            result = self.find(search_text)
+            if result is None:
+                break
+            found.extend(e for e in result if e["employeeId"] in employee_ids)
+        else:
+            if self.delete_by_api(found):
+                # 查询不到的员工已被删除，同样取消登记
+                self._unregister(employee_ids)
+                return len(found)
+
+        deleted = 0
+        for search_text in search_terms:
+            deleted += self.delete_by_ui(sorted(employee_ids), search_text)
+        if deleted:
+            self._unregister(employee_ids)
+        return deleted
+
+    def sweep(self) -> int:
+        """
+        清扫以往运行遗留的测试员工（员工 ID 符合生成规则且不属于本次运行）
+
+        Returns:
+            删除的员工数
+        """
+        found = self.find(f"{self.factory.prefix}{SEPARATOR}")
+        if found is None:
+            logger.warning("员工 API 不可用，跳过测试数据清扫")
+            return 0
+
+        current_run = self.factory.run_prefix()
+        stale = [
+            e
+            for e in found
+            if self.factory.is_generated(e["employeeId"])
+            and not e["employeeId"].startswith(current_run)
+        ]
+        if stale and self.delete_by_api(stale):
+            logger.info(f"已清扫遗留的测试员工: {[e['employeeId'] for e in stale]}")
+            return len(stale)
+        return 0
+
+    def _unregister(self, employee_ids: Iterable[str]) -> None:
+        """
+        取消登记已删除的员工
+
+        Args:
+            employee_ids: 员工 ID
+        """
+        for employee_id in employee_ids:
+            self.factory.unregister("employee", employee_id)
+
+
+def cleanup_session_data(browser_type_name: str = "chromium", sweep: bool = False) -> None:
+    """
+    会话结束时清理测试数据（在 pytest_sessionfinish 中调用）
+
+    没有需要清理的数据时不启动浏览器。
+
+    Args:
+        browser_type_name: 浏览器类型
+        sweep: 是否清扫以往运行遗留的测试数据
+    """
+    if not data_factory.created("employee") and not sweep:
+        return
+
+    with sync_playwright() as playwright:
+        browser = getattr(playwright, browser_type_name).launch(headless=True)
+        context = new_context(browser)
+        try:
+            page = context.new_page()
+            login_page = LoginPage(page)
+            login_page.open().login_as_admin()
+            login_page.wait_for_login_complete()
+
+            cleanup = EmployeeCleanup(page)
+            deleted = cleanup.cleanup_registered()
+            if sweep:
+                deleted += cleanup.sweep()
+
+            leftovers = data_factory.created("employee")
+            if leftovers:
+                logger.warning(f"以下测试员工未能清理: {[e.key for e in leftovers]}")
+            logger.info(f"测试数据清理完成，共删除 {deleted} 个员工")
+        except Exception as e:
+            logger.error(f"测试数据清理失败: {e}")
+        finally:
+            close_context(context, "session_cleanup")
+            browser.close()
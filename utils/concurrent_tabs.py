@@ -0,0 +1,140 @@
+"""
+多标签页并发工具模块
+在同一个（已认证的）浏览器上下文中打开多个标签页，并发执行互相独立的页面操作
+通用的多系统端到端测试框架
+
+原理：
+- 基于异步页面对象（pages/async_*_page.py），每个标签页等待页面响应时其他标签页继续操作
+- 最多同时打开 max_tabs 个标签页，每个标签页依次执行队列中的任务，任务之间复用标签页
+- 同一上下文中的标签页共享 Cookie，只需登录一次
+
+示例：
+    employees = await create_employees_in_tabs(async_auth_context, count=6, max_tabs=3)
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Awaitable, Callable, Sequence
+from typing import TYPE_CHECKING, TypeVar
+
+from config.settings import settings
+from utils.data_factory import data_factory
+from utils.data_loader import TestDataLoader
+from utils.data_models import Employee
+from utils.logger import logger
+
+if TYPE_CHECKING:
+    from playwright.async_api import BrowserContext, Page
+
+T = TypeVar("T")
+
+# 标签页任务：接收一个标签页，返回任务结果
+TabJob = Callable[["Page"], Awaitable[T]]
+
+
+async def run_in_tabs(
+    context: BrowserContext, jobs: Sequence[TabJob], max_tabs: int | None = None
+) -> list:
+    """
+    在多个标签页中并发执行任务
+
+    所有任务都会执行完；有任务失败时，在全部任务结束后抛出第一个失败任务的异常。
+
+    Args:
+        context: 异步浏览器上下文
+        jobs: 任务列表
+        max_tabs: 最多同时打开的标签页数，默认为 MAX_CONCURRENT_TABS
+
+    Returns:
+        各任务的结果（与 jobs 顺序一致）
+
+    Raises:
+        ValueError: max_tabs 小于 1
+    """
+    if max_tabs is None:
+        max_tabs = settings.MAX_CONCURRENT_TABS
+    if max_tabs < 1:
+        raise ValueError(f"max_tabs 必须大于 0: {max_tabs}")
+    if not jobs:
+        return []
+
+    queue: asyncio.Queue[int] = asyncio.Queue()
+    for index in range(len(jobs)):
+        queue.put_nowait(index)
+
+    results: list = [None] * len(jobs)
+    errors: dict[int, BaseException] = {}
+
+    async def worker(tab_number: int) -> None:
+        page = await context.new_page()
+        try:
+            while not queue.empty():
+                index = queue.get_nowait()
+                try:
+                    results[index] = await jobs[index](page)
+                except Exception as e:
+                    logger.error(f"标签页 {tab_number} 执行任务 {index} 失败: {e}")
+                    errors[index] = e
+        finally:
+            await page.close()
+
+    tab_count = min(max_tabs, len(jobs))
+    logger.info(f"在 {tab_count} 个标签页中并发执行 {len(jobs)} 个任务")
+    await asyncio.gather(*(worker(number) for number in range(tab_count)))
+
+    if errors:
+        raise errors[min(errors)]
+    return results
+
+
+async def create_employees_in_tabs(
+    context: BrowserContext,
+    count: int | None = None,
+    employees: Sequence[Employee] | None = None,
+    max_tabs: int | None = None,
+) -> list[Employee]:
+    """
+    [OrangeHRM 示例] 在多个标签页中通过 UI 并发创建员工
+
+    每个员工使用唯一的员工 ID（不依赖系统生成的 ID，避免多个标签页同时打开
+    添加页面时拿到相同的 ID），创建后登记到 data_factory，会话结束时统一清理。
+
+    Args:
+        context: 已认证的异步浏览器上下文
+        count: 按测试数据中的 new_employee 生成的员工数（与 employees 二选一）
+        employees: 员工模板，名字和员工 ID 会被替换为唯一值
+        max_tabs: 最多同时打开的标签页数，默认为 MAX_CONCURRENT_TABS
+
+    Returns:
+        创建的员工记录（与输入顺序一致）
+
+    Raises:
+        ValueError: count 和 employees 都未提供
+    """
+    from pages.async_employee_form_page import AsyncEmployeeFormPage
+    from pages.async_pim_page import AsyncPIMPage
+
+    if employees is None:
+        if count is None:
+            raise ValueError("count 和 employees 必须提供其中一个")
+        employees = [TestDataLoader.get_employee("new_employee")] * count
+    records = [data_factory.employee(template) for template in employees]
+
+    def job(employee: Employee) -> TabJob:
+        async def create(page: Page) -> Employee:
+            pim = await AsyncPIMPage(page).open()
+            await pim.click_add_button()
+            await AsyncEmployeeFormPage(page).create_new_employee(
+                employee.first_name,
+                employee.middle_name,
+                employee.last_name,
+                employee.employee_id,
+            )
+            return employee
+
+        return create
+
+    created = await run_in_tabs(context, [job(record) for record in records], max_tabs)
+    logger.info(f"已在多个标签页中创建 {len(created)} 个员工")
+    return created
@@ -0,0 +1,262 @@
+"""
+唯一测试数据生成工具模块
+为员工姓名、员工 ID、用户名等生成短小、可搜索、在并行 worker 和多次运行之间不冲突的值
+通用的多系统端到端测试框架
+
+唯一标识的组成（均为小写 base36，各字段宽度固定，拼接结果不会有歧义）：
+    前缀(TEST_DATA_PREFIX) + "-" + 运行 ID(3 位) + worker 序号(1 位) + 进程内递增计数(3 位)
+例如 "at-7kq0" + "003" -> "at-7kq0003"
+
+- 运行 ID：同一次运行的所有 worker 相同（取自 TEST_RUN_ID 或 xdist 的测试运行 ID）
+- worker 序号：区分同一次运行中的并行 worker（最多 36 个）
+- 计数：进程内单调递增，线程安全；超出宽度（46656 个）时报错而不是变长
+
+员工 ID 直接使用唯一标识，清理工具按完整的生成格式（前缀、分隔符、定宽字段）
+识别自动化测试遗留的数据，不会误删形如 "at12345678" 的真实员工。
+"""
+
+import os
+import re
+import threading
+import uuid
+from dataclasses import dataclass
+from itertools import count
+
+from config.settings import settings
+from utils.data_models import Employee
+from utils.datasets import worker_shard
+from utils.logger import logger
+
+_BASE36 = "0123456789abcdefghijklmnopqrstuvwxyz"
+
+# 前缀与其余字段之间的分隔符（base36 字段中不会出现，真实员工 ID 通常也不使用）
+SEPARATOR = "-"
+
+# 唯一标识中各字段的宽度（base36 位数）
+RUN_ID_WIDTH = 3
+WORKER_WIDTH = 1
+COUNTER_WIDTH = 3
+
+
+def to_base36(number: int, width: int = 1) -> str:
+    """
+    将非负整数转换为小写 base36 字符串
+
+    Args:
+        number: 非负整数
+        width: 最小宽度，不足时左侧补 0
+
+    Returns:
+        base36 字符串
+    """
+    digits = ""
+    while True:
+        number, remainder = divmod(number, 36)
+        digits = _BASE36[remainder] + digits
+        if number == 0:
+            break
+    return digits.rjust(width, "0")
+
+
+@dataclass(frozen=True, slots=True)
+class CreatedEntity:
+    """测试中创建的实体"""
+
+    # 实体类型，如 "employee"
+    kind: str
+    # 用于定位实体的标识，如员工 ID
+    key: str
+    # 显示名称（用于日志和报告）
+    name: str = ""
+    # 创建该实体的测试
+    test: str = ""
+
+
+class DataFactory:
+    """唯一测试数据生成器"""
+
+    def __init__(
+        self, prefix: str | None = None, run_id: str | None = None, worker: int | None = None
+    ):
+        """
+        初始化数据生成器
+
+        Args:
+            prefix: 标识前缀，默认为 TEST_DATA_PREFIX
+            run_id: 运行 ID 来源，默认依次使用 TEST_RUN_ID、xdist 测试运行 ID、随机值
+            worker: worker 序号，默认为当前 xdist worker 的序号
+
+        Raises:
+            ValueError: worker 序号超出固定宽度（36 个及以上）
+        """
+        self.prefix = (prefix if prefix is not None else settings.TEST_DATA_PREFIX).lower()
+        source = (
+            run_id
+            or settings.TEST_RUN_ID
+            or os.getenv("PYTEST_XDIST_TESTRUNUID")
+            or uuid.uuid4().hex
+        )
+        digest = int(uuid.uuid5(uuid.NAMESPACE_OID, source).hex, 16)
+        self.run_id = to_base36(digest % 36**RUN_ID_WIDTH, RUN_ID_WIDTH)
+
+        worker = worker_shard()[0] if worker is None else worker
+        if not 0 <= worker < 36**WORKER_WIDTH:
+            raise ValueError(f"worker 序号超出范围（0-{36**WORKER_WIDTH - 1}）: {worker}")
+        self.worker = to_base36(worker, WORKER_WIDTH)
+
+        self._counter = count()
+        self._lock = threading.Lock()
+
+        # (实体类型, 实体标识) -> 实体
+        self._entities: dict[tuple[str, str], CreatedEntity] = {}
+
+    def run_prefix(self) -> str:
+        """
+        获取本次运行生成的标识的公共部分
+
+        Returns:
+            前缀 + 分隔符 + 运行 ID
+        """
+        return f"{self.prefix}{SEPARATOR}{self.run_id}"
+
+    def worker_prefix(self) -> str:
+        """
+        获取当前 worker 生成的标识的公共部分
+
+        Returns:
+            前缀 + 分隔符 + 运行 ID + worker 序号
+        """
+        return f"{self.run_prefix()}{self.worker}"
+
+    def is_generated(self, value: str) -> bool:
+        """
+        判断值是否为本前缀生成的完整标识（任意运行、任意 worker），如员工 ID
+
+        Args:
+            value: 待判断的值
+
+        Returns:
+            是否为生成的标识
+        """
+        width = RUN_ID_WIDTH + WORKER_WIDTH + COUNTER_WIDTH
+        pattern = rf"{re.escape(self.prefix + SEPARATOR)}[0-9a-z]{{{width}}}"
+        return re.fullmatch(pattern, value) is not None
+
+    def token(self) -> str:
+        """
+        生成唯一标识
+
+        Returns:
+            唯一标识，如 "at-7kq0003"
+
+        Raises:
+            RuntimeError: 本进程生成的标识数超出计数宽度
+        """
+        with self._lock:
+            number = next(self._counter)
+        if number >= 36**COUNTER_WIDTH:
+            raise RuntimeError(f"本进程生成的唯一标识已用尽（{36**COUNTER_WIDTH} 个）")
+        return f"{self.worker_prefix()}{to_base36(number, COUNTER_WIDTH)}"
+
+    def name(self, base: str = "Test") -> str:
+        """
+        生成唯一名称（可用于员工名等可搜索字段）
+
+        Args:
+            base: 名称前缀，便于在报告中区分用途
+
+        Returns:
+            唯一名称，如 "Batchat-7kq0003"
+        """
+        return f"{base}{self.token()}"
+
+    def employee_id(self) -> str:
+        """
+        生成唯一员工 ID（OrangeHRM 员工 ID 最长 10 个字符）
+
+        Returns:
+            唯一员工 ID
+        """
+        return self.token()
+
+    def username(self, base: str = "user") -> str:
+        """
+        生成唯一用户名
+
+        Args:
+            base: 用户名前缀
+
+        Returns:
+            唯一用户名（小写）
+        """
+        return f"{base}{self.token()}".lower()
+
+    def employee(self, template: Employee | None = None, base: str = "Test") -> Employee:
+        """
+        基于模板生成名字和员工 ID 唯一的员工记录
+
+        Args:
+            template: 员工模板（如 TestDataLoader.get_employee("new_employee")）
+            base: 模板没有名字时使用的名称前缀
+
+        Returns:
+            员工记录
+        """
+        template = template or Employee()
+        token = self.token()
+        return Employee(
+            first_name=f"{template.first_name or base}{token}",
+            middle_name=template.middle_name,
+            last_name=template.last_name,
+            employee_id=token,
+            description=template.description,
+        )
+
+    # ==================== 已创建实体登记 ====================
+
+    def register(self, kind: str, key: str, name: str = "") -> CreatedEntity:
+        """
+        登记测试中创建的实体，供会话结束时清理
+
+        Args:
+            kind: 实体类型，如 "employee"
+            key: 实体标识，如员工 ID
+            name: 显示名称
+
+        Returns:
+            登记的实体
+        """
+        test = os.getenv("PYTEST_CURRENT_TEST", "").split(" ")[0]
+        entity = CreatedEntity(kind, key, name, test)
+        with self._lock:
+            self._entities[(kind, key)] = entity
+        logger.debug(f"登记测试实体: {kind} {key} {name}")
+        return entity
+
+    def unregister(self, kind: str, key: str) -> None:
+        """
+        取消登记（实体已被测试自行删除）
+
+        Args:
+            kind: 实体类型
+            key: 实体标识
+        """
+        with self._lock:
+            self._entities.pop((kind, key), None)
+
+    def created(self, kind: str | None = None) -> list[CreatedEntity]:
+        """
+        获取尚未清理的已登记实体
+
+        Args:
+            kind: 实体类型，None 表示全部
+
+        Returns:
+            实体列表（按登记顺序）
+        """
+        with self._lock:
+            return [e for e in self._entities.values() if kind in (None, e.kind)]
+
+
+# 创建全局实例
+data_factory = DataFactory()
@@ -2,37 +2,180 @@
 测试数据加载工具模块
 从 test_data.json 加载测试数据，支持数据驱动测试
 通用的多系统端到端测试框架
+
+数据文件按 utils/data_models.py 中的记录类型校验并编译为只读记录，之后的访问都是字典查找；
+数据有误时在收集测试阶段即报告全部错误。
+
+数据文件：
+- data/test_data.json：基础数据
+- data/test_data.<TEST_ENV>.json：环境覆盖数据（可选），按条目合并到基础数据上，
+  只需写出与基础数据不同的字段
+
+缓存按文件路径和修改时间/大小缓存解析结果，文件变化时才重新读取；内容哈希未变时
+（如只是被 touch）沿用已编译的数据。长时间运行的进程无需重启即可使用最新数据。
 """
 
+import hashlib
 import json
-from functools import lru_cache
+from dataclasses import dataclass
 from pathlib import Path
 
+import pytest
+
+from config.settings import settings
+from utils.data_models import (
+    ContactDetails,
+    Employee,
+    JobDetails,
+    PersonalDetails,
+    User,
+    compile_group,
+)
+from utils.datasets import Dataset
+
+# 数据分组 -> 记录类型
+_RECORD_GROUPS = {
+    "users": User,
+    "employees": Employee,
+    "personal_details": PersonalDetails,
+    "contact_details": ContactDetails,
+    "job_details": JobDetails,
+}
+
+# 文本分组（名称 -> 字符串）
+_TEXT_GROUPS = ("error_messages", "menu_items")
+
+
+@dataclass(frozen=True, slots=True)
+class CompiledTestData:
+    """编译后的测试数据"""
+
+    users: dict[str, User]
+    employees: dict[str, Employee]
+    personal_details: dict[str, PersonalDetails]
+    contact_details: dict[str, ContactDetails]
+    job_details: dict[str, JobDetails]
+    error_messages: dict[str, str]
+    menu_items: dict[str, str]
+
+
+@dataclass(frozen=True, slots=True)
+class CachedFile:
+    """已解析的数据文件"""
+
+    # (修改时间纳秒, 文件大小)，用于廉价地判断文件是否变化
+    stat_key: tuple[int, int]
+    # 文件内容哈希
+    digest: str
+    # 解析后的数据
+    data: dict
+
+
+def merge_data(base: dict, overlay: dict) -> dict:
+    """
+    将覆盖数据递归合并到基础数据上（返回新字典，不修改参数）
+
+    Args:
+        base: 基础数据
+        overlay: 覆盖数据
+
+    Returns:
+        合并后的数据
+    """
+    merged = dict(base)
+    for key, value in overlay.items():
+        if isinstance(value, dict) and isinstance(merged.get(key), dict):
+            merged[key] = merge_data(merged[key], value)
+        else:
+            merged[key] = value
+    return merged
+
 
 class TestDataLoader:
     """测试数据加载器"""
 
-    _data: dict | None = None
+    _dataset: CompiledTestData | None = None
+    # 编译 _dataset 时合并后的原始数据
+    _raw_data: dict = {}
+    # 编译 _dataset 时各数据文件的 (路径, 内容哈希)
+    _dataset_key: tuple[tuple[Path, str], ...] = ()
     _data_file: Path = Path(__file__).parent.parent / "data" / "test_data.json"
+    # 文件路径 -> 已解析的数据文件
+    _file_cache: dict[Path, CachedFile] = {}
 
     @classmethod
-    @lru_cache(maxsize=1)
-    def _load_data(cls) -> dict:
+    def data_files(cls) -> list[Path]:
         """
-        加载测试数据文件（带缓存和验证）
+        获取参与合并的数据文件（基础数据在前，环境覆盖数据在后）
 
         Returns:
-            测试数据字典
+            数据文件路径列表
+        """
+        files = [cls._data_file]
+        if settings.TEST_ENV:
+            overlay = cls._data_file.with_name(
+                f"{cls._data_file.stem}.{settings.TEST_ENV}{cls._data_file.suffix}"
+            )
+            if overlay.exists():
+                files.append(overlay)
+        return files
+
+    @classmethod
+    def _read_file(cls, path: Path) -> CachedFile:
+        """
+        读取数据文件（文件未变化时直接返回缓存）
+
+        Args:
+            path: 数据文件路径
+
+        Returns:
+            已解析的数据文件
 
         Raises:
-            FileNotFoundError: 测试数据文件不存在
-            ValueError: 测试数据文件缺少必需的键
+            FileNotFoundError: 数据文件不存在
+            ValueError: 数据文件不是 JSON 对象
         """
-        if not cls._data_file.exists():
-            raise FileNotFoundError(f"测试数据文件不存在: {cls._data_file}")
+        try:
+            stat = path.stat()
+        except FileNotFoundError:
+            raise FileNotFoundError(f"测试数据文件不存在: {path}") from None
+
+        stat_key = (stat.st_mtime_ns, stat.st_size)
+        cached = cls._file_cache.get(path)
+        if cached is not None and cached.stat_key == stat_key:
+            return cached
+
+        content = path.read_bytes()
+        digest = hashlib.sha256(content).hexdigest()
+        if cached is not None and cached.digest == digest:
+            # 内容未变（如只是被 touch），只更新文件状态
+            data = cached.data
+        else:
+            data = json.loads(content.decode("utf-8"))
+            if not isinstance(data, dict):
+                raise ValueError(f"测试数据文件必须是 JSON 对象: {path}")
+
+        cached = CachedFile(stat_key, digest, data)
+        cls._file_cache[path] = cached
+        return cached
 
-        with open(cls._data_file, encoding="utf-8") as f:
-            data = json.load(f)
+    @classmethod
+    def _load_data(cls, files: list[CachedFile]) -> dict:
+        """
+        合并数据文件并验证数据结构
+
+        Args:
+            files: 已解析的数据文件（基础数据在前）
+
+        Returns:
+            测试数据字典
+
+        Raises:
+            ValueError: 测试数据缺少必需的键
+        """
+        data = files[0].data
+        for overlay in files[1:]:
+            data = merge_data(data, overlay.data)
 
         # 验证数据结构
         required_keys = ["users", "error_messages"]
@@ -43,7 +186,89 @@ class TestDataLoader:
         return data
 
     @classmethod
-    def get_user(cls, user_type: str = "admin") -> dict:
+    def load(cls) -> CompiledTestData:
+        """
+        加载并编译测试数据（数据文件变化时重新编译）
+
+        Returns:
+            编译后的测试数据
+
+        Raises:
+            FileNotFoundError: 测试数据文件不存在
+            ValueError: 测试数据校验失败（包含全部错误）
+        """
+        paths = cls.data_files()
+        files = [cls._read_file(path) for path in paths]
+        cache_key = tuple(zip(paths, (f.digest for f in files), strict=True))
+        if cls._dataset is not None and cache_key == cls._dataset_key:
+            return cls._dataset
+
+        data = cls._load_data(files)
+        errors: list[str] = []
+        groups = {
+            key: compile_group(record_cls, data.get(key, {}), key, errors)
+            for key, record_cls in _RECORD_GROUPS.items()
+        }
+        for key in _TEXT_GROUPS:
+            texts = data.get(key, {})
+            invalid = [name for name, value in texts.items() if not isinstance(value, str)]
+            if invalid:
+                errors.append(f"{key}: 以下条目必须是字符串 {invalid}")
+            groups[key] = texts
+
+        if errors:
+            sources = ", ".join(str(path) for path in paths)
+            raise ValueError(
+                f"测试数据校验失败: {sources}\n" + "\n".join(f"  - {e}" for e in errors)
+            )
+
+        cls._dataset = CompiledTestData(**groups)
+        cls._dataset_key = cache_key
+        cls._raw_data = data
+        return cls._dataset
+
+    @classmethod
+    def get_raw_data(cls) -> dict:
+        """
+        获取合并后的原始测试数据（用于没有声明记录类型的自定义数据分组）
+
+        Returns:
+            测试数据字典（请勿修改）
+        """
+        cls.load()
+        return cls._raw_data
+
+    @classmethod
+    def clear_cache(cls) -> None:
+        """清空缓存，下次访问时重新读取所有数据文件"""
+        cls._file_cache.clear()
+        cls._dataset = None
+        cls._dataset_key = ()
+        cls._raw_data = {}
+
+    @staticmethod
+    def _lookup(group: dict, key: str, message: str):
+        """
+        从分组中查找条目
+
+        Args:
+            group: 数据分组
+            key: 条目名称
+            message: 条目不存在时的错误信息
+
+        Returns:
+            条目
+
+        Raises:
+            KeyError: 条目不存在
+        """
+        try:
+            return group[key]
+        except KeyError:
+            raise KeyError(message) from None
+
+    @classmethod
+    def get_user(cls, user_type: str = "admin") -> User:
         """
         获取用户信息
 
@@ -51,29 +276,25 @@ class TestDataLoader:
             user_type: 用户类型，默认为 'admin'
 
         Returns:
-            包含 username, password, description 的字典
+            用户记录（username, password, description）
 
         Raises:
             KeyError: 用户类型不存在
         """
-        data = cls._load_data()
-        if user_type not in data["users"]:
-            raise KeyError(f"用户类型不存在: {user_type}")
-        return data["users"][user_type]
+        return cls._lookup(cls.load().users, user_type, f"用户类型不存在: {user_type}")
 
     @classmethod
-    def get_all_users(cls) -> dict:
+    def get_all_users(cls) -> dict[str, User]:
         """
         获取所有用户信息
 
         Returns:
-            用户信息字典
+            用户类型 -> 用户记录
         """
-        data = cls._load_data()
-        return data["users"]
+        return cls.load().users
 
     @classmethod
-    def get_employee(cls, employee_type: str = "new_employee") -> dict:
+    def get_employee(cls, employee_type: str = "new_employee") -> Employee:
         """
         获取员工信息
 
@@ -81,18 +302,17 @@ class TestDataLoader:
             employee_type: 员工类型，如 'new_employee', 'edit_employee' 等
 
         Returns:
-            员工信息字典
+            员工信息记录
 
         Raises:
             KeyError: 员工类型不存在
         """
-        data = cls._load_data()
-        if employee_type not in data["employees"]:
-            raise KeyError(f"员工类型不存在: {employee_type}")
-        return data["employees"][employee_type]
+        return cls._lookup(
+            cls.load().employees, employee_type, f"员工类型不存在: {employee_type}"
+        )
 
     @classmethod
-    def get_personal_details(cls, detail_type: str = "valid") -> dict:
+    def get_personal_details(cls, detail_type: str = "valid") -> PersonalDetails:
         """
         获取个人详情信息
 
@@ -100,15 +320,14 @@ class TestDataLoader:
             detail_type: 详情类型
 
         Returns:
-            个人详情字典
+            个人详情记录
         """
-        data = cls._load_data()
-        if detail_type not in data["personal_details"]:
-            raise KeyError(f"个人详情类型不存在: {detail_type}")
-        return data["personal_details"][detail_type]
+        return cls._lookup(
+            cls.load().personal_details, detail_type, f"个人详情类型不存在: {detail_type}"
+        )
 
     @classmethod
-    def get_contact_details(cls, detail_type: str = "valid") -> dict:
+    def get_contact_details(cls, detail_type: str = "valid") -> ContactDetails:
         """
         获取联系方式信息
 
@@ -116,15 +335,14 @@ class TestDataLoader:
             detail_type: 详情类型
 
         Returns:
-            联系方式字典
+            联系方式记录
         """
-        data = cls._load_data()
-        if detail_type not in data["contact_details"]:
-            raise KeyError(f"联系方式类型不存在: {detail_type}")
-        return data["contact_details"][detail_type]
+        return cls._lookup(
+            cls.load().contact_details, detail_type, f"联系方式类型不存在: {detail_type}"
+        )
 
     @classmethod
-    def get_job_details(cls, detail_type: str = "valid") -> dict:
+    def get_job_details(cls, detail_type: str = "valid") -> JobDetails:
         """
         获取工作信息
 
@@ -132,12 +350,11 @@ class TestDataLoader:
             detail_type: 详情类型
 
         Returns:
-            工作信息字典
+            工作信息记录
         """
-        data = cls._load_data()
-        if detail_type not in data["job_details"]:
-            raise KeyError(f"工作信息类型不存在: {detail_type}")
-        return data["job_details"][detail_type]
+        return cls._lookup(
+            cls.load().job_details, detail_type, f"工作信息类型不存在: {detail_type}"
+        )
 
     @classmethod
     def get_error_message(cls, error_type: str) -> str:
@@ -153,21 +370,19 @@ class TestDataLoader:
         Raises:
             KeyError: 错误类型不存在
         """
-        data = cls._load_data()
-        if error_type not in data["error_messages"]:
-            raise KeyError(f"错误消息类型不存在: {error_type}")
-        return data["error_messages"][error_type]
+        return cls._lookup(
+            cls.load().error_messages, error_type, f"错误消息类型不存在: {error_type}"
+        )
 
     @classmethod
-    def get_all_error_messages(cls) -> dict:
+    def get_all_error_messages(cls) -> dict[str, str]:
         """
         获取所有错误消息
 
         Returns:
             错误消息字典
         """
-        data = cls._load_data()
-        return data["error_messages"]
+        return cls.load().error_messages
 
     @classmethod
     def get_menu_item(cls, menu_name: str) -> str:
@@ -180,10 +395,7 @@ class TestDataLoader:
         Returns:
             菜单显示名称
         """
-        data = cls._load_data()
-        if menu_name not in data["menu_items"]:
-            raise KeyError(f"菜单项不存在: {menu_name}")
-        return data["menu_items"][menu_name]
+        return cls._lookup(cls.load().menu_items, menu_name, f"菜单项不存在: {menu_name}")
 
     @classmethod
     def get_login_failure_test_cases(cls) -> list[tuple]:
@@ -193,21 +405,69 @@ class TestDataLoader:
         Returns:
             测试用例列表，每个元素为 (username, password, error_key, description)
         """
-        data = cls._load_data()
-        admin = data["users"]["admin"]
+        admin = cls.get_user("admin")
 
         test_cases = [
             # 空用户名
-            ("", admin["password"], "empty_username", "空用户名登录"),
+            ("", admin.password, "empty_username", "空用户名登录"),
             # 空密码
-            (admin["username"], "", "empty_password", "空密码登录"),
+            (admin.username, "", "empty_password", "空密码登录"),
             # 错误凭证
             ("invalid_user", "wrong_password", "invalid_credentials", "错误凭证登录"),
             # 错误密码
-            (admin["username"], "wrong_password", "invalid_credentials", "错误密码登录"),
+            (admin.username, "wrong_password", "invalid_credentials", "错误密码登录"),
         ]
         return test_cases
 
+    @classmethod
+    def dataset(cls, name: str) -> Dataset:
+        """
+        获取 JSONL/CSV 数据集（流式读取，不加载整个文件）
+
+        Args:
+            name: 数据集名称（DATASET_DIR 下的文件名，可省略 .jsonl/.csv 后缀）
+
+        Returns:
+            数据集
+
+        Raises:
+            FileNotFoundError: 数据集文件不存在
+        """
+        if Path(name).suffix:
+            return Dataset(name)
+        for suffix in (".jsonl", ".csv"):
+            if (settings.DATASET_DIR / f"{name}{suffix}").exists():
+                return Dataset(f"{name}{suffix}")
+        raise FileNotFoundError(f"数据集文件不存在: {settings.DATASET_DIR / name}.jsonl/.csv")
+
+    @classmethod
+    def parametrize_dataset(
+        cls,
+        name: str,
+        argname: str = "case",
+        id_field: str | None = None,
+        limit: int | None = None,
+    ) -> pytest.MarkDecorator:
+        """
+        使用数据集参数化测试（用于大规模数据驱动测试）
+
+        测试参数只保存行位置，测试中调用 load() 读取该行数据，示例：
+
+            @TestDataLoader.parametrize_dataset("invalid_credentials", id_field="description")
+            def test_xxx(case):
+                row = case.load()
+
+        Args:
+            name: 数据集名称
+            argname: 参数名
+            id_field: 用作用例 ID 的字段
+            limit: 最多生成的用例数
+
+        Returns:
+            pytest.mark.parametrize 装饰器
+        """
+        return cls.dataset(name).parametrize(argname, id_field=id_field, limit=limit)
+
 
 # 创建全局实例便于导入
 test_data = TestDataLoader()
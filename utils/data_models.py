@@ -0,0 +1,155 @@
+"""
+测试数据记录类型
+将 test_data.json 中的各类数据编译为只读的类型化记录，并在加载时按字段声明校验
+通用的多系统端到端测试框架
+
+字段声明即校验规则：
+- 没有默认值的字段为必填字段
+- 所有字段的值必须是字符串
+- metadata 中标记 date=True 的字段必须是 YYYY-MM-DD 格式（允许为空）
+- 数据中出现未声明的字段视为错误（通常是拼写错误）
+"""
+
+from dataclasses import MISSING, dataclass, field, fields
+from datetime import datetime
+from typing import Any, TypeVar
+
+# 日期字段声明
+_DATE = {"date": True}
+
+RecordType = TypeVar("RecordType")
+
+
+@dataclass(frozen=True, slots=True)
+class User:
+    """用户"""
+
+    username: str
+    password: str
+    description: str = ""
+
+
+@dataclass(frozen=True, slots=True)
+class Employee:
+    """员工基本信息（搜索用数据只包含 employee_name）"""
+
+    first_name: str = ""
+    middle_name: str = ""
+    last_name: str = ""
+    employee_id: str = ""
+    employee_name: str = ""
+    description: str = ""
+
+
+@dataclass(frozen=True, slots=True)
+class PersonalDetails:
+    """个人详情"""
+
+    nickname: str = ""
+    driver_license_number: str = ""
+    license_expiry_date: str = field(default="", metadata=_DATE)
+    nationality: str = ""
+    marital_status: str = ""
+    date_of_birth: str = field(default="", metadata=_DATE)
+    gender: str = ""
+
+
+@dataclass(frozen=True, slots=True)
+class ContactDetails:
+    """联系方式"""
+
+    street1: str = ""
+    street2: str = ""
+    city: str = ""
+    state: str = ""
+    zip: str = ""
+    country: str = ""
+    home_phone: str = ""
+    mobile: str = ""
+    work_phone: str = ""
+    work_email: str = ""
+    other_email: str = ""
+
+
+@dataclass(frozen=True, slots=True)
+class JobDetails:
+    """工作信息"""
+
+    joined_date: str = field(default="", metadata=_DATE)
+    job_title: str = ""
+    job_category: str = ""
+    sub_unit: str = ""
+    location: str = ""
+    employment_status: str = ""
+
+
+def compile_record(
+    record_cls: type[RecordType], raw: Any, path: str, errors: list[str]
+) -> RecordType | None:
+    """
+    将一条原始数据校验并编译为记录
+
+    Args:
+        record_cls: 记录类型
+        raw: 原始数据
+        path: 数据位置（用于错误信息），如 "users.admin"
+        errors: 错误列表，校验失败的原因会追加到此列表
+
+    Returns:
+        记录实例，校验失败时返回 None
+    """
+    if not isinstance(raw, dict):
+        errors.append(f"{path}: 必须是对象，实际为 {type(raw).__name__}")
+        return None
+
+    declared = {f.name: f for f in fields(record_cls)}
+    error_count = len(errors)
+
+    unknown = sorted(set(raw) - set(declared))
+    if unknown:
+        errors.append(f"{path}: 未声明的字段 {unknown}")
+
+    for name, record_field in declared.items():
+        if name not in raw:
+            if record_field.default is MISSING:
+                errors.append(f"{path}.{name}: 缺少必填字段")
+            continue
+        value = raw[name]
+        if not isinstance(value, str):
+            errors.append(f"{path}.{name}: 必须是字符串，实际为 {type(value).__name__}")
+        elif value and record_field.metadata.get("date"):
+            try:
+                datetime.strptime(value, "%Y-%m-%d")
+            except ValueError:
+                errors.append(f"{path}.{name}: 日期格式必须是 YYYY-MM-DD，实际为 '{value}'")
+
+    if len(errors) > error_count:
+        return None
+    return record_cls(**{name: raw[name] for name in declared if name in raw})
+
+
+def compile_group(
+    record_cls: type[RecordType], raw: Any, path: str, errors: list[str]
+) -> dict[str, RecordType]:
+    """
+    将一组原始数据（名称 -> 数据）编译为记录字典
+
+    Args:
+        record_cls: 记录类型
+        raw: 原始数据
+        path: 数据位置（用于错误信息），如 "users"
+        errors: 错误列表
+
+    Returns:
+        名称 -> 记录
+    """
+    if not isinstance(raw, dict):
+        errors.append(f"{path}: 必须是对象，实际为 {type(raw).__name__}")
+        return {}
+
+    records = {}
+    for name, item in raw.items():
+        record = compile_record(record_cls, item, f"{path}.{name}", errors)
+        if record is not None:
+            records[name] = record
+    return records
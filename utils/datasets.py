@@ -0,0 +1,229 @@
+"""
+大数据集流式读取工具模块
+从 JSONL/CSV 文件逐行读取数据驱动测试用例，不把整个文件加载到内存
+通用的多系统端到端测试框架
+
+用法：
+- 迭代：for record in Dataset(path): ...
+- 按 xdist worker 分片迭代（如批量准备数据）：for record in Dataset(path).for_worker(): ...
+- 参数化：@Dataset(path).parametrize("case", id_field="description")
+  收集阶段只记录每行在文件中的偏移量和用例 ID，测试执行时通过 case.load() 读取该行
+
+注意：
+- CSV 文件的字段中不能包含换行（按行定位）
+- 参数化按 DATASET_SHARD（如 "2/4"）分片，供 CI 多任务拆分使用；
+  pytest-xdist 要求所有 worker 收集到相同的用例，因此参数化不按 worker 分片，
+  用例在 worker 之间的分配由 xdist 完成
+"""
+
+import csv
+import json
+import os
+from collections.abc import Iterator
+from itertools import islice
+from pathlib import Path
+
+import pytest
+
+from config.settings import settings
+
+# 支持的文件格式
+_SUFFIXES = (".jsonl", ".csv")
+
+
+def worker_shard() -> tuple[int, int]:
+    """
+    获取当前 xdist worker 的分片位置
+
+    Returns:
+        (分片索引, 分片总数)，未使用 xdist 时为 (0, 1)
+    """
+    worker = os.getenv("PYTEST_XDIST_WORKER", "")
+    count = int(os.getenv("PYTEST_XDIST_WORKER_COUNT", "1"))
+    if not worker.startswith("gw"):
+        return 0, 1
+    return int(worker[2:]), count
+
+
+def configured_shard() -> tuple[int, int]:
+    """
+    获取配置的分片位置（DATASET_SHARD，格式为 "序号/总数"，序号从 1 开始）
+
+    Returns:
+        (分片索引, 分片总数)，未配置时为 (0, 1)
+    """
+    if not settings.DATASET_SHARD:
+        return 0, 1
+    number, count = settings.DATASET_SHARD.split("/")
+    return int(number) - 1, int(count)
+
+
+class DatasetRow:
+    """数据集中的一行（只保存位置，使用时再读取）"""
+
+    __slots__ = ("path", "offset", "header")
+
+    def __init__(self, path: Path, offset: int, header: tuple[str, ...] | None = None):
+        """
+        初始化数据行
+
+        Args:
+            path: 数据集文件路径
+            offset: 该行在文件中的字节偏移量
+            header: CSV 表头，JSONL 为 None
+        """
+        self.path = path
+        self.offset = offset
+        self.header = header
+
+    def load(self) -> dict:
+        """
+        读取该行数据
+
+        Returns:
+            该行数据字典
+        """
+        with open(self.path, "rb") as f:
+            f.seek(self.offset)
+            line = f.readline().decode("utf-8")
+        return _parse_line(line, self.header)
+
+    def __repr__(self) -> str:
+        return f"DatasetRow({self.path.name}@{self.offset})"
+
+
+def _parse_line(line: str, header: tuple[str, ...] | None) -> dict:
+    """
+    解析一行数据
+
+    Args:
+        line: 行文本
+        header: CSV 表头，JSONL 为 None
+
+    Returns:
+        数据字典
+    """
+    if header is None:
+        return json.loads(line)
+    values = next(csv.reader([line]))
+    return dict(zip(header, values, strict=False))
+
+
+class Dataset:
+    """JSONL/CSV 数据集"""
+
+    def __init__(self, path: str | Path):
+        """
+        初始化数据集
+
+        Args:
+            path: 数据集文件路径；相对路径相对于 DATASET_DIR
+
+        Raises:
+            FileNotFoundError: 文件不存在
+            ValueError: 文件格式不支持
+        """
+        path = Path(path)
+        self.path = path if path.is_absolute() else settings.DATASET_DIR / path
+        if self.path.suffix not in _SUFFIXES:
+            raise ValueError(f"不支持的数据集格式: {self.path.name}，支持 {_SUFFIXES}")
+        if not self.path.exists():
+            raise FileNotFoundError(f"数据集文件不存在: {self.path}")
+
+    def _scan(self) -> Iterator[tuple[int, str, tuple[str, ...] | None]]:
+        """
+        逐行扫描文件，跳过空行（JSONL 还跳过 # 开头的注释行）
+
+        Yields:
+            (字节偏移量, 行文本, CSV 表头)
+        """
+        header = None
+        with open(self.path, "rb") as f:
+            if self.path.suffix == ".csv":
+                header = tuple(next(csv.reader([f.readline().decode("utf-8-sig")])))
+            while True:
+                offset = f.tell()
+                raw = f.readline()
+                if not raw:
+                    break
+                line = raw.decode("utf-8")
+                if not line.strip() or (header is None and line.lstrip().startswith("#")):
+                    continue
+                yield offset, line, header
+
+    def rows(self) -> Iterator[DatasetRow]:
+        """
+        迭代数据行的位置（不解析内容）
+
+        Yields:
+            数据行
+        """
+        for offset, _, header in self._scan():
+            yield DatasetRow(self.path, offset, header)
+
+    def __iter__(self) -> Iterator[dict]:
+        """
+        逐行迭代数据
+
+        Yields:
+            每行数据字典
+        """
+        for _, line, header in self._scan():
+            yield _parse_line(line, header)
+
+    def shard(self, index: int, count: int) -> Iterator[dict]:
+        """
+        迭代指定分片的数据（第 index, index+count, index+2*count... 行）
+
+        Args:
+            index: 分片索引（从 0 开始）
+            count: 分片总数
+
+        Yields:
+            每行数据字典
+
+        Raises:
+            ValueError: 分片参数无效
+        """
+        if count < 1 or not 0 <= index < count:
+            raise ValueError(f"分片参数无效: {index}/{count}")
+        return islice(iter(self), index, None, count)
+
+    def for_worker(self) -> Iterator[dict]:
+        """
+        迭代当前 xdist worker 负责的分片
+
+        Yields:
+            每行数据字典
+        """
+        return self.shard(*worker_shard())
+
+    def parametrize(
+        self, argname: str, id_field: str | None = None, limit: int | None = None
+    ) -> pytest.MarkDecorator:
+        """
+        生成参数化装饰器
+
+        收集阶段流式扫描文件，每个用例只保存行偏移量和用例 ID；
+        测试中通过参数的 load() 方法读取该行数据。
+
+        Args:
+            argname: 参数名
+            id_field: 用作用例 ID 的字段，默认使用行号
+            limit: 最多生成的用例数（按分片过滤后计数）
+
+        Returns:
+            pytest.mark.parametrize 装饰器
+        """
+        index, count = configured_shard()
+        params = []
+        for number, (offset, line, header) in enumerate(self._scan()):
+            if number % count != index:
+                continue
+            if limit is not None and len(params) >= limit:
+                break
+            case_id = f"{self.path.stem}-{number + 1}"
+            if id_field:
+                case_id = str(_parse_line(line, header).get(id_field, case_id))
+            params.append(pytest.param(DatasetRow(self.path, offset, header), id=case_id))
+        return pytest.mark.parametrize(argname, params)
@@ -0,0 +1,83 @@
+"""
+JSON 统计文件工具模块
+在进程间文件锁的保护下读取、合并并原子写回 JSON 统计文件
+通用的多系统端到端测试框架
+
+并行执行（xdist）时多个 worker 几乎同时在会话结束时保存统计数据，
+不加锁的 读取 -> 合并 -> 替换 会互相覆盖，丢失其他 worker 的样本。
+自适应超时、定位器注册表和页面性能指标都通过 update_json_file 保存。
+
+锁文件与统计文件位于同一目录（<文件名>.lock），POSIX 上使用 fcntl.flock，Windows 上使用 msvcrt.locking。
+"""
+
+import contextlib
+import json
+import os
+from collections.abc import Callable, Iterator
+from pathlib import Path
+from typing import Any
+
+from utils.logger import logger
+
+if os.name == "nt":
+    import msvcrt
+else:
+    import fcntl
+
+
+@contextlib.contextmanager
+def file_lock(path: Path) -> Iterator[None]:
+    """
+    获取文件对应的进程间排他锁（阻塞等待）
+
+    Args:
+        path: 被保护的文件路径
+    """
+    lock_path = path.with_name(f"{path.name}.lock")
+    lock_path.parent.mkdir(parents=True, exist_ok=True)
+    with open(lock_path, "a+") as f:
+        if os.name == "nt":
+            f.seek(0)
+            # LK_LOCK 最多重试 10 秒，超时抛出 OSError
+            msvcrt.locking(f.fileno(), msvcrt.LK_LOCK, 1)
+            try:
+                yield
+            finally:
+                f.seek(0)
+                msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
+        else:
+            fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+
+
+def update_json_file(
+    path: Path, read: Callable[[], Any], update: Callable[[Any], Any], **dump_options
+) -> bool:
+    """
+    在文件锁内读取统计文件、合并本进程的数据并原子写回
+
+    Args:
+        path: 统计文件路径
+        read: 读取并校验文件内容的函数（文件不存在或无效时返回空结构）
+        update: 接收文件中的现有数据，返回合并后的数据
+        **dump_options: 传给 json.dump 的参数，如 indent
+
+    Returns:
+        是否保存成功（失败时已记录警告）
+    """
+    tmp_file = path.with_suffix(f".{os.getpid()}.tmp")
+    try:
+        with file_lock(path):
+            merged = update(read())
+            with open(tmp_file, "w", encoding="utf-8") as f:
+                json.dump(merged, f, ensure_ascii=False, **dump_options)
+            os.replace(tmp_file, path)
+    except OSError as e:
+        logger.warning(f"保存统计文件失败: {path}, 错误: {e}")
+        with contextlib.suppress(OSError):
+            tmp_file.unlink()
+        return False
+    return True
@@ -0,0 +1,468 @@
+"""
+本地测试站点工具模块
+在本机 HTTP 服务上提供 OrangeHRM 页面的副本（data/site）和内存中的员工 API，
+用于不依赖网络的页面对象性能基准和离线 CI
+通用的多系统端到端测试框架
+
+站点只复刻页面对象使用的 DOM 结构（oxd-table、oxd-select、对话框、Toast 等）和基本交互，
+URL 和 API 路径与 OrangeHRM 一致，因此只需把 BASE_URL 指向站点地址即可复用现有页面对象：
+
+    with LocalSite() as site, settings.override(BASE_URL=site.url):
+        LoginPage(page).open().login_as_admin()
+
+pytest 中使用 --local-site 参数，由 local_site fixture 启动站点并切换 BASE_URL。
+
+- 登录账号为 Admin / admin123（与默认的 ADMIN_USER / ADMIN_PASSWORD 一致）
+- 员工数据保存在站点进程内存中，启动时和调用 reset() 时恢复为固定的初始数据
+- 下拉选项来自 data/site/assets/reference.json，页面和参考数据 API 共用
+- 员工 API 支持查询、创建、批量删除（与 OrangeHRM 相同）以及按员工读取和修改
+  （站点自有格式，供员工详情页使用）
+"""
+
+import json
+import re
+import threading
+from functools import partial
+from http import HTTPStatus
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib.parse import parse_qs, urlsplit
+
+from config.settings import PROJECT_ROOT
+from utils.logger import logger
+
+# 站点文件目录
+SITE_DIR = PROJECT_ROOT / "data" / "site"
+
+# OrangeHRM 页面路径 -> 站点页面文件（按顺序匹配，不含查询参数）
+ROUTES = (
+    (re.compile(r"/(web/index\.php(/auth/login)?/?)?"), "login.html"),
+    (re.compile(r"/web/index\.php/dashboard/index"), "dashboard.html"),
+    (re.compile(r"/web/index\.php/pim/viewEmployeeList"), "pim.html"),
+    (re.compile(r"/web/index\.php/pim/addEmployee"), "add_employee.html"),
+    (
+        re.compile(
+            r"/web/index\.php/pim/(viewPersonalDetails|contactDetails|viewJobDetails)"
+            r"/empNumber/\d+"
+        ),
+        "employee.html",
+    ),
+)
+
+API_PREFIX = "/web/index.php/api/v2/"
+EMPLOYEE_API = "/web/index.php/api/v2/pim/employees"
+
+# 参考数据 API 路径 -> (reference.json 中的目录, 名称字段)
+REFERENCE_APIS = {
+    "/web/index.php/api/v2/admin/nationalities": ("nationalities", "name"),
+    "/web/index.php/api/v2/admin/job-titles": ("job_titles", "title"),
+    "/web/index.php/api/v2/admin/employment-statuses": ("employment_statuses", "name"),
+}
+
+# 员工记录中可以通过 API 修改的字段（其余表单字段按标签保存在 details 中）
+EMPLOYEE_FIELDS = (
+    "employeeId",
+    "firstName",
+    "middleName",
+    "lastName",
+    "jobTitle",
+    "employmentStatus",
+    "subUnit",
+    "supervisor",
+)
+
+
+def resolve_route(path: str) -> str:
+    """
+    将请求路径转换为站点内的文件路径
+
+    Args:
+        path: 请求路径（可含查询参数）
+
+    Returns:
+        站点内的文件路径，如 "/pim.html"；不是页面路由时原样返回（如 /assets/site.css）
+    """
+    route = path.split("?", 1)[0].split("#", 1)[0]
+    for pattern, file_name in ROUTES:
+        if pattern.fullmatch(route):
+            return f"/{file_name}"
+    return route
+
+
+def seed_employees(reference: dict[str, list[str]]) -> list[dict]:
+    """
+    生成固定的初始员工数据
+
+    Args:
+        reference: 下拉选项（reference.json 的内容）
+
+    Returns:
+        员工记录列表
+    """
+    first_names = ("Linda", "Peter", "Odis", "Rebecca", "Charlie", "Fiona", "Garry", "Joe")
+    last_names = ("Anderson", "Mac Anderson", "Adalwin", "Harmony", "Carter", "Grace")
+    job_titles = reference["job_titles"]
+    statuses = reference["employment_statuses"]
+    sub_units = reference["sub_units"]
+    return [
+        {
+            "empNumber": number,
+            "employeeId": f"{number:04d}",
+            "firstName": first_names[number % len(first_names)],
+            "middleName": "Jane" if number % 3 == 0 else "",
+            "lastName": last_names[number % len(last_names)],
+            "jobTitle": job_titles[number % len(job_titles)],
+            "employmentStatus": statuses[number % len(statuses)],
+            "subUnit": sub_units[number % len(sub_units)],
+            "supervisor": "Linda Anderson" if number > 1 else "",
+            "details": {},
+        }
+        for number in range(1, 41)
+    ]
+
+
+class EmployeeStore:
+    """站点的员工数据（内存中，线程安全）"""
+
+    def __init__(self, reference: dict[str, list[str]]):
+        """
+        初始化员工数据
+
+        Args:
+            reference: 下拉选项，用于生成初始数据
+        """
+        self._reference = reference
+        self._lock = threading.Lock()
+        self._employees: dict[int, dict] = {}
+        self._next_number = 1
+        self.reset()
+
+    def reset(self) -> None:
+        """恢复为初始数据"""
+        with self._lock:
+            self._employees = {e["empNumber"]: e for e in seed_employees(self._reference)}
+            self._next_number = max(self._employees) + 1
+
+    def search(self, name_or_id: str = "", employment_status: str = "") -> list[dict]:
+        """
+        按姓名或员工 ID（部分匹配，不区分大小写）和雇佣状态查询员工
+
+        Args:
+            name_or_id: 姓名或员工 ID 的一部分
+            employment_status: 雇佣状态（完全匹配）
+
+        Returns:
+            员工记录列表（按 empNumber 排序）
+        """
+        text = name_or_id.strip().lower()
+        with self._lock:
+            employees = list(self._employees.values())
+        return [
+            dict(e)
+            for e in employees
+            if (not text or text in e["employeeId"].lower() or text in self.full_name(e).lower())
+            and (not employment_status or e["employmentStatus"] == employment_status)
+        ]
+
+    def get(self, emp_number: int) -> dict | None:
+        """
+        获取员工
+
+        Args:
+            emp_number: 员工编号
+
+        Returns:
+            员工记录，不存在时返回 None
+        """
+        with self._lock:
+            employee = self._employees.get(emp_number)
+            return dict(employee) if employee else None
+
+    def create(self, data: dict) -> dict:
+        """
+        创建员工
+
+        Args:
+            data: 员工字段（firstName、lastName 必填）
+
+        Returns:
+            创建的员工记录
+
+        Raises:
+            ValueError: 必填字段为空或员工 ID 已存在
+        """
+        if not data.get("firstName") or not data.get("lastName"):
+            raise ValueError("Required")
+        with self._lock:
+            employee_id = data.get("employeeId") or f"{self._next_number:04d}"
+            if any(e["employeeId"] == employee_id for e in self._employees.values()):
+                raise ValueError("Employee Id already exists")
+            employee = {field: "" for field in EMPLOYEE_FIELDS}
+            employee.update({k: v for k, v in data.items() if k in EMPLOYEE_FIELDS and v})
+            employee.update(
+                empNumber=self._next_number, employeeId=employee_id, details={}
+            )
+            self._employees[self._next_number] = employee
+            self._next_number += 1
+            return dict(employee)
+
+    def update(self, emp_number: int, data: dict) -> dict | None:
+        """
+        修改员工
+
+        Args:
+            emp_number: 员工编号
+            data: 要修改的字段；details 中的表单字段合并到已有字段
+
+        Returns:
+            修改后的员工记录，员工不存在时返回 None
+        """
+        with self._lock:
+            employee = self._employees.get(emp_number)
+            if employee is None:
+                return None
+            employee.update({k: v for k, v in data.items() if k in EMPLOYEE_FIELDS})
+            employee["details"] = {**employee["details"], **data.get("details", {})}
+            return dict(employee)
+
+    def delete(self, emp_numbers: list[int]) -> list[int]:
+        """
+        批量删除员工
+
+        Args:
+            emp_numbers: 员工编号列表
+
+        Returns:
+            实际删除的员工编号
+        """
+        with self._lock:
+            return [n for n in emp_numbers if self._employees.pop(n, None) is not None]
+
+    @staticmethod
+    def full_name(employee: dict) -> str:
+        """拼接员工全名（名 中间名 姓）"""
+        parts = (employee["firstName"], employee["middleName"], employee["lastName"])
+        return " ".join(part for part in parts if part)
+
+
+class _SiteServer(ThreadingHTTPServer):
+    """带有站点数据的 HTTP 服务"""
+
+    daemon_threads = True
+
+    def __init__(self, address, handler, store: EmployeeStore, reference: dict):
+        super().__init__(address, handler)
+        self.store = store
+        self.reference = reference
+
+
+class _SiteRequestHandler(SimpleHTTPRequestHandler):
+    """页面按 ROUTES 映射到静态文件，/web/index.php/api/v2/ 下的请求由员工 API 处理"""
+
+    server: _SiteServer
+
+    def translate_path(self, path: str) -> str:
+        """将 OrangeHRM 路径映射到页面文件后再交给默认实现"""
+        return super().translate_path(resolve_route(path))
+
+    def end_headers(self) -> None:
+        """禁用缓存，每次导航都重新加载页面"""
+        self.send_header("Cache-Control", "no-store")
+        super().end_headers()
+
+    def log_message(self, format: str, *args) -> None:
+        """访问日志写入 DEBUG 级别，不输出到标准错误"""
+        logger.debug(f"[LocalSite] {format % args}")
+
+    # ==================== 请求分发 ====================
+
+    def do_GET(self) -> None:
+        if self.path.startswith(API_PREFIX):
+            self._handle_api("GET")
+        else:
+            super().do_GET()
+
+    def do_HEAD(self) -> None:
+        if self.path.startswith(API_PREFIX):
+            self.send_error(HTTPStatus.METHOD_NOT_ALLOWED)
+        else:
+            super().do_HEAD()
+
+    def do_POST(self) -> None:
+        self._handle_api("POST")
+
+    def do_PUT(self) -> None:
+        self._handle_api("PUT")
+
+    def do_DELETE(self) -> None:
+        self._handle_api("DELETE")
+
+    # ==================== API ====================
+
+    def _handle_api(self, method: str) -> None:
+        """
+        处理 API 请求
+
+        Args:
+            method: 请求方法
+        """
+        url = urlsplit(self.path)
+        params = {key: values[0] for key, values in parse_qs(url.query).items()}
+        store = self.server.store
+        try:
+            body = self._read_json()
+            if url.path in REFERENCE_APIS and method == "GET":
+                catalog, name_field = REFERENCE_APIS[url.path]
+                items = [
+                    {"id": index, name_field: name}
+                    for index, name in enumerate(self.server.reference[catalog], start=1)
+                ]
+                self._send_json(HTTPStatus.OK, {"data": items, "meta": {"total": len(items)}})
+            elif url.path == EMPLOYEE_API and method == "GET":
+                employees = store.search(
+                    params.get("nameOrId", ""), params.get("employmentStatus", "")
+                )
+                offset = int(params.get("offset", 0))
+                limit = int(params.get("limit", 50)) or len(employees)
+                self._send_json(
+                    HTTPStatus.OK,
+                    {
+                        "data": employees[offset : offset + limit],
+                        "meta": {"total": len(employees)},
+                    },
+                )
+            elif url.path == EMPLOYEE_API and method == "POST":
+                self._send_json(HTTPStatus.OK, {"data": store.create(body)})
+            elif url.path == EMPLOYEE_API and method == "DELETE":
+                self._send_json(HTTPStatus.OK, {"data": store.delete(body.get("ids", []))})
+            elif match := re.fullmatch(rf"{EMPLOYEE_API}/(\d+)", url.path):
+                emp_number = int(match.group(1))
+                if method == "GET":
+                    employee = store.get(emp_number)
+                elif method == "PUT":
+                    employee = store.update(emp_number, body)
+                else:
+                    self.send_error(HTTPStatus.METHOD_NOT_ALLOWED)
+                    return
+                if employee is None:
+                    self._send_json(HTTPStatus.NOT_FOUND, {"error": "Record Not Found"})
+                else:
+                    self._send_json(HTTPStatus.OK, {"data": employee})
+            else:
+                self.send_error(HTTPStatus.NOT_FOUND)
+        except ValueError as e:
+            self._send_json(HTTPStatus.UNPROCESSABLE_ENTITY, {"error": str(e)})
+
+    def _read_json(self) -> dict:
+        """
+        读取 JSON 请求体
+
+        Returns:
+            请求数据，没有请求体时为空字典
+
+        Raises:
+            ValueError: 请求体不是 JSON 对象
+        """
+        length = int(self.headers.get("Content-Length") or 0)
+        if not length:
+            return {}
+        data = json.loads(self.rfile.read(length))
+        if not isinstance(data, dict):
+            raise ValueError("Invalid Parameter")
+        return data
+
+    def _send_json(self, status: HTTPStatus, payload: dict) -> None:
+        """
+        发送 JSON 响应
+
+        Args:
+            status: 状态码
+            payload: 响应数据
+        """
+        content = json.dumps(payload).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(content)))
+        self.end_headers()
+        self.wfile.write(content)
+
+
+class LocalSite:
+    """在后台线程中运行的本地测试站点"""
+
+    def __init__(self, root: Path = SITE_DIR, host: str = "127.0.0.1", port: int = 0):
+        """
+        初始化本地站点
+
+        Args:
+            root: 站点文件目录
+            host: 监听地址
+            port: 监听端口，0 表示自动选择空闲端口
+        """
+        self.root = root
+        self.host = host
+        self.port = port
+        self.store: EmployeeStore | None = None
+        self._server: _SiteServer | None = None
+        self._thread: threading.Thread | None = None
+
+    @property
+    def url(self) -> str:
+        """
+        站点地址（可作为 BASE_URL）
+
+        Raises:
+            RuntimeError: 站点未启动
+        """
+        if self._server is None:
+            raise RuntimeError("本地站点未启动")
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> "LocalSite":
+        """
+        启动站点
+
+        Returns:
+            self
+
+        Raises:
+            FileNotFoundError: 站点文件目录不存在
+        """
+        if self._server is not None:
+            return self
+        if not self.root.is_dir():
+            raise FileNotFoundError(f"本地站点目录不存在: {self.root}")
+
+        reference = json.loads((self.root / "assets" / "reference.json").read_text("utf-8"))
+        self.store = EmployeeStore(reference)
+        handler = partial(_SiteRequestHandler, directory=str(self.root))
+        self._server = _SiteServer((self.host, self.port), handler, self.store, reference)
+        self._thread = threading.Thread(
+            target=self._server.serve_forever, name="local-site", daemon=True
+        )
+        self._thread.start()
+        logger.info(f"本地测试站点已启动: {self.url}")
+        return self
+
+    def reset(self) -> None:
+        """将员工数据恢复为初始数据（使每次测量或测试从相同状态开始）"""
+        if self.store is not None:
+            self.store.reset()
+
+    def stop(self) -> None:
+        """停止站点"""
+        if self._server is None:
+            return
+        self._server.shutdown()
+        self._server.server_close()
+        self._thread.join()
+        self._server = None
+        self._thread = None
+        logger.info("本地测试站点已停止")
+
+    def __enter__(self) -> "LocalSite":
+        return self.start()
+
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
@@ -0,0 +1,217 @@
+"""
+定位器注册表
+记录每个逻辑元素的候选选择器命中情况，把反复匹配失败的候选移到后面
+通用的多系统端到端测试框架
+
+原理：
+- 每个逻辑元素（如 "PIMPage:delete_dialog"）对应一组按优先级排列的候选选择器
+- 元素找到时，命中的候选记一次 hit，排在它前面但没有匹配的候选各记一次 miss；
+  所有候选都没有匹配时，元素记一次 miss
+- 候选始终保持声明的优先级，只有 miss 达到 DEMOTE_AFTER_MISSES 次且多于 hit 的候选
+  被降级到末尾（降级的候选之间仍保持声明顺序）
+- 不按解析耗时排序：所有候选在一次等待中并行匹配，耗时反映的是元素何时出现，与候选无关
+- 启用 LOCATOR_STATS 时统计数据在测试会话结束时持久化，供后续运行使用
+"""
+
+import json
+import threading
+from collections.abc import Sequence
+from pathlib import Path
+
+from config.settings import settings
+from utils.json_store import update_json_file
+from utils.logger import logger
+
+
+def _empty_element_stats() -> dict:
+    """创建空的元素统计结构"""
+    return {"lookups": 0, "misses": 0, "candidates": {}}
+
+
+def _empty_candidate_stats() -> dict:
+    """创建空的候选统计结构"""
+    return {"hits": 0, "misses": 0}
+
+
+class LocatorRegistry:
+    """定位器注册表"""
+
+    # 候选被降级所需的最少 miss 次数
+    DEMOTE_AFTER_MISSES = 3
+
+    def __init__(self, stats_file: Path | None = None):
+        """
+        初始化定位器注册表
+
+        Args:
+            stats_file: 统计数据文件路径
+        """
+        self.stats_file = stats_file or settings.LOCATOR_STATS_FILE
+
+        # 已持久化的统计 + 本进程新增的统计（保存时只合并新增部分）
+        self._stats: dict[str, dict] = {}
+        self._delta: dict[str, dict] = {}
+        self._loaded = False
+        self._lock = threading.Lock()
+
+    def _ensure_loaded(self) -> None:
+        """首次使用时从文件加载历史统计数据"""
+        if self._loaded:
+            return
+        self._loaded = True
+        self._stats = self._read_file()
+
+    def _read_file(self) -> dict[str, dict]:
+        """
+        读取统计数据文件
+
+        Returns:
+            元素名 -> 统计数据
+        """
+        if not self.stats_file.exists():
+            return {}
+        try:
+            with open(self.stats_file, encoding="utf-8") as f:
+                data = json.load(f)
+            if not isinstance(data, dict):
+                raise ValueError("顶层结构必须是对象")
+            # 兼容旧格式（候选记录解析耗时、没有 misses）
+            for element in data.values():
+                element["candidates"] = {
+                    candidate: {"hits": stats.get("hits", 0), "misses": stats.get("misses", 0)}
+                    for candidate, stats in element.get("candidates", {}).items()
+                }
+            return data
+        except (json.JSONDecodeError, OSError, ValueError, TypeError, AttributeError) as e:
+            logger.warning(f"定位器统计文件无效，已忽略: {self.stats_file}, 错误: {e}")
+            return {}
+
+    @staticmethod
+    def _add(
+        target: dict[str, dict], name: str, candidate: str | None, failed: Sequence[str]
+    ) -> None:
+        """
+        将一次解析结果累加到统计结构中
+
+        Args:
+            target: 统计结构
+            name: 元素名
+            candidate: 命中的候选选择器，未命中为 None
+            failed: 在命中的候选之前检查过但没有匹配的候选
+        """
+        element = target.setdefault(name, _empty_element_stats())
+        element["lookups"] += 1
+        if candidate is None:
+            element["misses"] += 1
+            return
+        element["candidates"].setdefault(candidate, _empty_candidate_stats())["hits"] += 1
+        for other in failed:
+            element["candidates"].setdefault(other, _empty_candidate_stats())["misses"] += 1
+
+    def _is_demoted(self, stats: dict | None) -> bool:
+        """
+        判断候选是否因反复匹配失败被降级
+
+        Args:
+            stats: 候选的统计数据
+
+        Returns:
+            是否降级
+        """
+        if not stats:
+            return False
+        misses = stats.get("misses", 0)
+        return misses >= self.DEMOTE_AFTER_MISSES and misses > stats.get("hits", 0)
+
+    def ordered(self, name: str, candidates: tuple[str, ...] | list[str]) -> list[str]:
+        """
+        获取调整后的候选选择器顺序（声明顺序，降级的候选排在末尾）
+
+        Args:
+            name: 元素名
+            candidates: 声明的候选选择器（按默认优先级排列）
+
+        Returns:
+            调整后的候选选择器
+        """
+        with self._lock:
+            self._ensure_loaded()
+            stats = self._stats.get(name, {}).get("candidates", {})
+            demoted = [c for c in candidates if self._is_demoted(stats.get(c))]
+        return [c for c in candidates if c not in demoted] + demoted
+
+    def record(self, name: str, candidate: str | None, failed: Sequence[str] = ()) -> None:
+        """
+        记录一次解析结果
+
+        Args:
+            name: 元素名
+            candidate: 命中的候选选择器，所有候选都没有匹配时为 None
+            failed: 在命中的候选之前检查过但没有匹配的候选
+        """
+        with self._lock:
+            self._ensure_loaded()
+            self._add(self._stats, name, candidate, failed)
+            self._add(self._delta, name, candidate, failed)
+
+    def get_stats(self, name: str) -> dict:
+        """
+        获取元素的统计数据
+
+        Args:
+            name: 元素名
+
+        Returns:
+            包含 lookups, misses, hit_rate 及每个候选 hits, misses, demoted 的字典
+        """
+        with self._lock:
+            self._ensure_loaded()
+            element = self._stats.get(name, _empty_element_stats())
+            lookups = element["lookups"]
+            return {
+                "lookups": lookups,
+                "misses": element["misses"],
+                "hit_rate": (lookups - element["misses"]) / lookups if lookups else 0.0,
+                "candidates": {
+                    candidate: {
+                        "hits": stats["hits"],
+                        "misses": stats["misses"],
+                        "demoted": self._is_demoted(stats),
+                    }
+                    for candidate, stats in element["candidates"].items()
+                },
+            }
+
+    def save(self) -> None:
+        """
+        持久化统计数据
+
+        在文件锁内与文件中已有的数据合并（并行执行时其他 worker 可能同时保存），
+        只累加本进程新增的统计。
+        """
+        with self._lock:
+            if not self._delta:
+                return
+
+            def merge(merged: dict[str, dict]) -> dict[str, dict]:
+                for name, element in self._delta.items():
+                    target = merged.setdefault(name, _empty_element_stats())
+                    target["lookups"] += element["lookups"]
+                    target["misses"] += element["misses"]
+                    for candidate, stats in element["candidates"].items():
+                        target_stats = target["candidates"].setdefault(
+                            candidate, _empty_candidate_stats()
+                        )
+                        target_stats["hits"] += stats["hits"]
+                        target_stats["misses"] += stats["misses"]
+                return merged
+
+            if not update_json_file(self.stats_file, self._read_file, merge, indent=2):
+                return
+
+            logger.debug(f"定位器统计已保存: {self.stats_file}")
+            self._delta.clear()
+
+
+# 创建全局实例
+locator_registry = LocatorRegistry()
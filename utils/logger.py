@@ -2,6 +2,8 @@
 日志工具模块
 提供统一的日志记录功能
 支持日志轮转和环境变量配置
+
+日志文件（及 logs/ 目录）在第一条日志写入时才创建，导入本模块不产生文件系统操作。
 """
 
 import logging
@@ -22,6 +24,32 @@ LOG_LEVELS = {
 }
 
 
+class LazyRotatingFileHandler(RotatingFileHandler):
+    """第一条日志写入时才创建日志目录和文件的轮转文件处理器"""
+
+    def __init__(self, filename: Path, max_bytes: int, backup_count: int):
+        """
+        初始化处理器（不打开文件）
+
+        Args:
+            filename: 日志文件路径
+            max_bytes: 单个日志文件的最大字节数
+            backup_count: 保留的轮转文件数
+        """
+        super().__init__(
+            filename,
+            maxBytes=max_bytes,
+            backupCount=backup_count,
+            encoding="utf-8",
+            delay=True,
+        )
+
+    def _open(self):
+        """打开日志文件，目录不存在时先创建"""
+        Path(self.baseFilename).parent.mkdir(parents=True, exist_ok=True)
+        return super()._open()
+
+
 class Logger:
     """日志记录器（单例模式）"""
 
@@ -83,21 +111,16 @@ class Logger:
         self._logger.addHandler(console_handler)
 
     def _setup_file_handler(self) -> None:
-        """设置文件日志处理器（带轮转）"""
+        """设置文件日志处理器（带轮转，延迟到第一条日志写入时创建文件）"""
         file_level = self._get_log_level("FILE_LOG_LEVEL", self.DEFAULT_FILE_LOG_LEVEL)
         max_bytes = int(os.getenv("LOG_MAX_BYTES", str(self.DEFAULT_MAX_BYTES)))
         backup_count = int(os.getenv("LOG_BACKUP_COUNT", str(self.DEFAULT_BACKUP_COUNT)))
 
-        log_dir = Path("logs")
-        log_dir.mkdir(exist_ok=True)
-
         # 使用日期作为日志文件名
-        log_file = log_dir / f"test_{datetime.now().strftime('%Y%m%d')}.log"
+        log_file = Path("logs") / f"test_{datetime.now().strftime('%Y%m%d')}.log"
 
         # 使用 RotatingFileHandler 实现日志轮转
-        file_handler = RotatingFileHandler(
-            log_file, maxBytes=max_bytes, backupCount=backup_count, encoding="utf-8"
-        )
+        file_handler = LazyRotatingFileHandler(log_file, max_bytes, backup_count)
         file_handler.setLevel(file_level)
         file_format = logging.Formatter(
             "%(asctime)s [%(levelname)s] [%(filename)s:%(lineno)d] %(message)s",
@@ -0,0 +1,371 @@
+"""
+页面性能指标模块
+在页面导航后采集浏览器的性能数据，附加到 Allure 报告，并按页面汇总每次运行的指标，
+用于区分测试变慢是被测系统的原因还是框架的原因
+通用的多系统端到端测试框架
+
+采集内容：
+- Navigation Timing：首字节时间、DOMContentLoaded、load、文档传输大小
+- Resource Timing：资源数、传输大小、最慢的几个资源
+- Web Vitals：LCP、CLS（PerformanceObserver，buffered；Firefox/WebKit 不支持时为空）
+- CDP 性能指标（仅 Chromium）：JS 堆、DOM 节点数、布局次数、脚本/布局/任务耗时
+
+指标在导航完成（domcontentloaded）后立即采集，load 尚未触发时 load_ms 为空，
+LCP 为采集时刻的最大内容绘制。
+
+汇总：
+- 每个进程按页面名称记录数值指标的样本，会话结束时合并到统计文件中本次运行的记录
+  （并行执行时各 worker 写入同一运行记录），文件保留最近 PAGE_METRICS_HISTORY 次运行
+- summary() 计算本次运行每个页面每项指标的 p50/p90/max，trend() 给出某项指标在各次运行的 p50
+"""
+
+import json
+import math
+import threading
+import time
+from pathlib import Path
+
+import allure
+
+from config.settings import settings
+from utils.data_factory import data_factory
+from utils.json_store import update_json_file
+from utils.logger import logger
+
+# 在页面中执行的采集脚本，返回扁平的指标字典（浏览器不支持的指标为 null）
+METRICS_SCRIPT = """
+async () => {
+    const observe = (type) => new Promise((resolve) => {
+        const entries = [];
+        try {
+            const observer = new PerformanceObserver((list) => entries.push(...list.getEntries()));
+            observer.observe({ type, buffered: true });
+            // buffered 条目在下一个任务中回调，稍等后结束观察
+            setTimeout(() => { observer.disconnect(); resolve(entries); }, 50);
+        } catch (e) {
+            resolve(null);
+        }
+    });
+    const [paints, shifts] = await Promise.all([
+        observe('largest-contentful-paint'),
+        observe('layout-shift'),
+    ]);
+
+    const nav = performance.getEntriesByType('navigation')[0];
+    const resources = performance.getEntriesByType('resource');
+    const kb = (bytes) => Math.round(bytes / 102.4) / 10;
+    const ms = (value) => Math.round(value * 10) / 10;
+    return {
+        ttfb_ms: nav ? ms(nav.responseStart - nav.requestStart) : null,
+        dom_content_loaded_ms: nav ? ms(nav.domContentLoadedEventEnd) : null,
+        load_ms: nav && nav.loadEventEnd ? ms(nav.loadEventEnd) : null,
+        document_kb: nav ? kb(nav.transferSize) : null,
+        resource_count: resources.length,
+        resource_kb: kb(resources.reduce((sum, r) => sum + (r.transferSize || 0), 0)),
+        lcp_ms: paints && paints.length ? ms(paints[paints.length - 1].startTime) : null,
+        cls: shifts
+            ? Math.round(shifts.filter((s) => !s.hadRecentInput)
+                .reduce((sum, s) => sum + s.value, 0) * 1000) / 1000
+            : null,
+        slowest_resources: [...resources]
+            .sort((a, b) => b.duration - a.duration)
+            .slice(0, 5)
+            .map((r) => ({ name: r.name, type: r.initiatorType, duration_ms: ms(r.duration) })),
+    };
+}
+"""
+
+# CDP Performance.getMetrics 指标 -> (指标名称, 换算系数)
+CDP_METRICS = {
+    "JSHeapUsedSize": ("js_heap_mb", 1 / 1024 / 1024),
+    "Nodes": ("dom_nodes", 1),
+    "LayoutCount": ("layout_count", 1),
+    "ScriptDuration": ("script_ms", 1000),
+    "LayoutDuration": ("layout_ms", 1000),
+    "TaskDuration": ("task_ms", 1000),
+}
+
+
+def build_metrics(raw: dict, cdp_metrics: list[dict] | None = None) -> dict:
+    """
+    合并采集脚本和 CDP 的结果，去掉浏览器不支持的指标
+
+    Args:
+        raw: METRICS_SCRIPT 的返回值
+        cdp_metrics: CDP Performance.getMetrics 返回的 metrics 列表（非 Chromium 为 None）
+
+    Returns:
+        指标字典（数值指标 + slowest_resources）
+    """
+    metrics = {name: value for name, value in raw.items() if value is not None}
+    for item in cdp_metrics or []:
+        if item["name"] in CDP_METRICS:
+            name, scale = CDP_METRICS[item["name"]]
+            metrics[name] = round(item["value"] * scale, 1)
+    return metrics
+
+
+def _is_chromium(page) -> bool:
+    """判断页面是否运行在 Chromium 中（同步和异步页面均可）"""
+    browser = page.context.browser
+    return browser is not None and browser.browser_type.name == "chromium"
+
+
+def _percentile(values: list[float], pct: float) -> float:
+    """计算百分位数（最近秩法）"""
+    ordered = sorted(values)
+    return ordered[max(math.ceil(pct / 100 * len(ordered)), 1) - 1]
+
+
+class PageMetricsCollector:
+    """页面性能指标采集和汇总"""
+
+    def __init__(
+        self,
+        metrics_file: Path | None = None,
+        run_id: str | None = None,
+        history: int | None = None,
+    ):
+        """
+        初始化采集器
+
+        Args:
+            metrics_file: 统计文件路径
+            run_id: 运行 ID（同一次运行的所有 worker 相同），默认为 data_factory 的运行前缀
+            history: 统计文件保留的运行次数
+        """
+        self.metrics_file = metrics_file or settings.PAGE_METRICS_FILE
+        self.run_id = run_id or data_factory.run_prefix()
+        self.history = history or settings.PAGE_METRICS_HISTORY
+
+        # 本进程尚未保存的样本：页面名称 -> 指标名称 -> 样本
+        self._samples: dict[str, dict[str, list[float]]] = {}
+        self._lock = threading.Lock()
+
+    # ==================== 采集 ====================
+
+    def collect(self, page) -> dict | None:
+        """
+        采集同步页面当前文档的性能指标
+
+        Args:
+            page: Playwright 同步页面实例
+
+        Returns:
+            指标字典，采集失败时为 None
+        """
+        try:
+            raw = page.evaluate(METRICS_SCRIPT)
+            cdp_metrics = None
+            if _is_chromium(page):
+                cdp = page.context.new_cdp_session(page)
+                try:
+                    cdp.send("Performance.enable")
+                    cdp_metrics = cdp.send("Performance.getMetrics")["metrics"]
+                finally:
+                    cdp.detach()
+            return build_metrics(raw, cdp_metrics)
+        except Exception as e:
+            logger.debug(f"采集页面性能指标失败: {e}")
+            return None
+
+    async def collect_async(self, page) -> dict | None:
+        """
+        采集异步页面当前文档的性能指标
+
+        Args:
+            page: Playwright 异步页面实例
+
+        Returns:
+            指标字典，采集失败时为 None
+        """
+        try:
+            raw = await page.evaluate(METRICS_SCRIPT)
+            cdp_metrics = None
+            if _is_chromium(page):
+                cdp = await page.context.new_cdp_session(page)
+                try:
+                    await cdp.send("Performance.enable")
+                    cdp_metrics = (await cdp.send("Performance.getMetrics"))["metrics"]
+                finally:
+                    await cdp.detach()
+            return build_metrics(raw, cdp_metrics)
+        except Exception as e:
+            logger.debug(f"采集页面性能指标失败: {e}")
+            return None
+
+    def report(self, page_name: str, url: str, metrics: dict | None) -> None:
+        """
+        记录指标并附加到 Allure 报告
+
+        Args:
+            page_name: 页面名称
+            url: 导航的 URL
+            metrics: collect() 的返回值，为 None 时忽略
+        """
+        if metrics is None:
+            return
+        self.record(page_name, metrics)
+        allure.attach(
+            json.dumps({"url": url, **metrics}, ensure_ascii=False, indent=2),
+            name=f"页面性能: {page_name}",
+            attachment_type=allure.attachment_type.JSON,
+        )
+        logger.debug(
+            f"[{page_name}] 页面性能: TTFB {metrics.get('ttfb_ms')}ms, "
+            f"DCL {metrics.get('dom_content_loaded_ms')}ms, LCP {metrics.get('lcp_ms')}ms"
+        )
+
+    def record(self, page_name: str, metrics: dict) -> None:
+        """
+        记录一次导航的数值指标
+
+        Args:
+            page_name: 页面名称
+            metrics: 指标字典（非数值的项被忽略）
+        """
+        with self._lock:
+            page = self._samples.setdefault(page_name, {})
+            for name, value in metrics.items():
+                if isinstance(value, int | float) and not isinstance(value, bool):
+                    page.setdefault(name, []).append(value)
+
+    # ==================== 汇总 ====================
+
+    def _read_file(self) -> list[dict]:
+        """
+        读取统计文件
+
+        Returns:
+            运行记录列表（从旧到新），每条为 {"run_id", "started", "pages"}
+        """
+        if not self.metrics_file.exists():
+            return []
+        try:
+            with open(self.metrics_file, encoding="utf-8") as f:
+                data = json.load(f)
+            if not isinstance(data, list):
+                raise ValueError("顶层结构必须是数组")
+            return data
+        except (json.JSONDecodeError, OSError, ValueError) as e:
+            logger.warning(f"页面性能统计文件无效，已忽略: {self.metrics_file}, 错误: {e}")
+            return []
+
+    def save(self) -> None:
+        """
+        将本进程的样本合并到统计文件中本次运行的记录
+
+        在文件锁内合并（并行执行时其他 worker 可能同时保存同一运行记录），只追加本进程的样本。
+        """
+        with self._lock:
+            if not self._samples:
+                return
+
+            def merge(runs: list[dict]) -> list[dict]:
+                run = next((r for r in runs if r["run_id"] == self.run_id), None)
+                if run is None:
+                    run = {
+                        "run_id": self.run_id,
+                        "started": time.strftime("%Y-%m-%dT%H:%M:%S"),
+                        "pages": {},
+                    }
+                    runs.append(run)
+                for page_name, metrics in self._samples.items():
+                    target = run["pages"].setdefault(page_name, {})
+                    for name, values in metrics.items():
+                        target.setdefault(name, []).extend(values)
+                return runs[-self.history :]
+
+            if not update_json_file(self.metrics_file, self._read_file, merge):
+                return
+
+            logger.debug(f"页面性能统计已保存: {self.metrics_file}")
+            self._samples.clear()
+
+    def latest_run_id(self) -> str | None:
+        """
+        获取统计文件中最近一次运行的 ID
+
+        并行执行时主进程与 worker 的运行 ID 不同，主进程用它汇总 worker 写入的运行记录。
+
+        Returns:
+            运行 ID，文件中没有记录时为 None
+        """
+        with self._lock:
+            runs = self._read_file()
+        return runs[-1]["run_id"] if runs else None
+
+    def summary(self, run_id: str | None = None) -> dict[str, dict[str, dict]]:
+        """
+        汇总一次运行（含本进程未保存的样本）每个页面每项指标的分布
+
+        Args:
+            run_id: 运行 ID，默认为本次运行
+
+        Returns:
+            页面名称 -> 指标名称 -> {"count", "p50", "p90", "max"}
+        """
+        run_id = run_id or self.run_id
+        with self._lock:
+            run = next((r for r in self._read_file() if r["run_id"] == run_id), None)
+            pages = {
+                page_name: {name: list(values) for name, values in metrics.items()}
+                for page_name, metrics in (run["pages"] if run else {}).items()
+            }
+            if run_id == self.run_id:
+                for page_name, metrics in self._samples.items():
+                    for name, values in metrics.items():
+                        pages.setdefault(page_name, {}).setdefault(name, []).extend(values)
+
+        return {
+            page_name: {
+                name: {
+                    "count": len(values),
+                    "p50": _percentile(values, 50),
+                    "p90": _percentile(values, 90),
+                    "max": max(values),
+                }
+                for name, values in metrics.items()
+            }
+            for page_name, metrics in pages.items()
+        }
+
+    def trend(self, page_name: str, metric: str) -> list[tuple[str, float]]:
+        """
+        获取某个页面某项指标在各次运行中的中位数
+
+        Args:
+            page_name: 页面名称
+            metric: 指标名称，如 "lcp_ms"
+
+        Returns:
+            [(运行开始时间, p50), ...]，从旧到新，不含没有该指标的运行
+        """
+        return [
+            (run["started"], _percentile(values, 50))
+            for run in self._read_file()
+            if (values := run["pages"].get(page_name, {}).get(metric))
+        ]
+
+    def log_summary(
+        self, run_id: str | None = None, metrics: tuple[str, ...] = ("ttfb_ms", "lcp_ms", "cls")
+    ) -> None:
+        """
+        在日志中输出一次运行每个页面的主要指标
+
+        Args:
+            run_id: 运行 ID，默认为本次运行
+            metrics: 输出的指标
+        """
+        for page_name, page in sorted(self.summary(run_id).items()):
+            parts = [
+                f"{name} p50={page[name]['p50']} p90={page[name]['p90']}"
+                for name in metrics
+                if name in page
+            ]
+            if parts:
+                logger.info(f"[{page_name}] 页面性能: {', '.join(parts)}")
+
+
+# 创建全局实例
+page_metrics = PageMetricsCollector()
@@ -0,0 +1,298 @@
+"""
+页面复用池
+在同一个 worker 内复用页面实例，避免每个测试都创建/关闭页面的开销
+通用的多系统端到端测试框架
+
+复用前会对页面执行重置：
+- 清理本地存储并导航到 about:blank
+- 清除页面和上下文级别的路由处理器（BLOCK_RESOURCES 的拦截路由随后重新安装）
+- 移除通过 add_listener 注册的事件监听器（只使用 Playwright 公开的 remove_listener）
+- 泄漏检查：测试期间直接通过 page.on / page.once 注册且未移除的监听器会被带入下一个测试，
+  这样的页面（以及无法确认监听器状态的页面）不再复用
+- 恢复默认超时时间
+"""
+
+import contextlib
+import inspect
+from collections.abc import Callable, Mapping
+from weakref import WeakKeyDictionary
+
+from playwright.sync_api import Browser, BrowserContext, Page
+
+from config.settings import settings
+from utils.browser_context import close_context, install_resource_blocking, new_context
+from utils.logger import logger
+
+BLANK_URL = "about:blank"
+
+# 页面 -> 通过 add_listener 注册的 (事件名, 处理函数)，页面被回收后自动释放
+_tracked_listeners: WeakKeyDictionary = WeakKeyDictionary()
+
+# 页面 -> watch_listeners 之后注册且尚未移除的 (事件名, 处理函数, 实际注册的处理函数)
+_watched_listeners: WeakKeyDictionary = WeakKeyDictionary()
+
+
+def watch_listeners(page: Page) -> bool:
+    """
+    记录页面此后通过 page.on / page.once 注册的事件监听器，供 reset_page 做泄漏检查
+
+    包装页面实例的 on、once、remove_listener（仍调用 Playwright 的公开方法），
+    once 监听器触发后自动从记录中移除。在此之前注册的监听器视为页面的基线，不做检查。
+
+    Args:
+        page: 页面实例
+
+    Returns:
+        是否开始记录（页面不允许包装时返回 False，reset_page 将不复用该页面）
+    """
+    if page in _watched_listeners:
+        return True
+
+    on, once, remove_listener = page.on, page.once, page.remove_listener
+    records: list[tuple[str, Callable, Callable]] = []
+
+    def watched_on(event: str, handler: Callable) -> None:
+        on(event, handler)
+        records.append((event, handler, handler))
+
+    def watched_once(event: str, handler: Callable) -> None:
+        def fire(*args):
+            with contextlib.suppress(ValueError):
+                records.remove((event, handler, fire))
+            return handler(*args[: len(inspect.signature(handler).parameters)])
+
+        once(event, fire)
+        records.append((event, handler, fire))
+
+    def watched_remove_listener(event: str, handler: Callable) -> None:
+        for record in records:
+            if record[:2] == (event, handler):
+                records.remove(record)
+                remove_listener(event, record[2])
+                return
+        remove_listener(event, handler)
+
+    try:
+        page.on = watched_on
+        page.once = watched_once
+        page.remove_listener = watched_remove_listener
+    except AttributeError as e:
+        logger.debug(f"无法记录页面事件监听器: {e}")
+        return False
+    _watched_listeners[page] = records
+    return True
+
+
+def untracked_listeners(page: Page) -> list[tuple[str, Callable]] | None:
+    """
+    获取 watch_listeners 之后注册、未通过 add_listener 登记且尚未移除的监听器
+
+    Args:
+        page: 页面实例
+
+    Returns:
+        (事件名, 处理函数) 列表，页面未被记录时返回 None（无法确认）
+    """
+    records = _watched_listeners.get(page)
+    if records is None:
+        return None
+    tracked = _tracked_listeners.get(page, [])
+    return [(event, handler) for event, handler, _ in records if (event, handler) not in tracked]
+
+
+def add_listener(page: Page, event: str, handler: Callable) -> None:
+    """
+    注册页面事件监听器，并记录下来，页面被复用前由 reset_page 移除
+
+    页面对象和测试在可能被复用的页面上注册监听器时应使用此函数，
+    直接通过 page.on 注册的监听器不会被自动移除。
+
+    Args:
+        page: 页面实例（同步或异步页面）
+        event: 事件名，如 "load"
+        handler: 处理函数
+    """
+    page.on(event, handler)
+    _tracked_listeners.setdefault(page, []).append((event, handler))
+
+
+def remove_tracked_listeners(page: Page) -> int:
+    """
+    移除通过 add_listener 注册的事件监听器
+
+    Args:
+        page: 页面实例
+
+    Returns:
+        被移除的监听器数量
+    """
+    listeners = _tracked_listeners.pop(page, [])
+    for event, handler in listeners:
+        with contextlib.suppress(Exception):
+            page.remove_listener(event, handler)
+    return len(listeners)
+
+
+def reset_page(page: Page, clear_storage: bool = True) -> bool:
+    """
+    重置页面状态，使其可以被下一个测试复用
+
+    Args:
+        page: 页面实例
+        clear_storage: 是否清理 localStorage / sessionStorage
+
+    Returns:
+        重置后页面是否可以安全复用（页面需先通过 watch_listeners 记录监听器）
+    """
+    if page.is_closed():
+        return False
+
+    removed = remove_tracked_listeners(page)
+    if removed:
+        logger.debug(f"清理页面事件监听器: {removed} 个")
+
+    # 泄漏检查：未登记的监听器无法安全移除，带着它们复用会影响下一个测试
+    leaked = untracked_listeners(page)
+    if leaked is None:
+        logger.warning("无法确认页面事件监听器状态，将丢弃该页面")
+        return False
+    if leaked:
+        events = [event for event, _ in leaked]
+        logger.warning(f"测试遗留了未通过 add_listener 注册的页面事件监听器，将丢弃该页面: {events}")
+        return False
+
+    try:
+        if clear_storage and page.url.startswith(("http://", "https://")):
+            with contextlib.suppress(Exception):
+                page.evaluate("() => { localStorage.clear(); sessionStorage.clear(); }")
+        page.unroute_all(behavior="ignoreErrors")
+        page.goto(BLANK_URL)
+        page.set_default_timeout(settings.TIMEOUT)
+        page.set_default_navigation_timeout(settings.TIMEOUT)
+    except Exception as e:
+        logger.warning(f"页面重置失败，将丢弃该页面: {e}")
+        return False
+    return True
+
+
+class PagePool:
+    """
+    页面复用池
+
+    每个 worker 进程持有一个共享上下文和若干空闲页面。
+    测试结束后页面被重置并放回池中，下一个测试直接取用，无需重新创建。
+
+    使用示例:
+        ```python
+        pool = PagePool(browser)
+        page = pool.acquire()
+        ...
+        pool.release(page)
+        pool.close()
+        ```
+    """
+
+    def __init__(
+        self,
+        browser: Browser,
+        context_config: Mapping | None = None,
+        clear_cookies: bool = True,
+        max_idle: int = 1,
+    ):
+        """
+        初始化页面复用池
+
+        Args:
+            browser: 浏览器实例
+            context_config: 共享上下文的额外配置（如 storage_state），与 settings.context_config 合并
+            clear_cookies: 归还页面时是否清除上下文 Cookie（已认证的池应设为 False）
+            max_idle: 池中最多保留的空闲页面数
+        """
+        self.browser = browser
+        self.context_config = dict(context_config or {})
+        self.clear_cookies = clear_cookies
+        self.max_idle = max_idle
+
+        self._context: BrowserContext | None = None
+        self._idle: list[Page] = []
+
+        # 统计信息
+        self.created_count = 0
+        self.reused_count = 0
+        self.discarded_count = 0
+
+    @property
+    def context(self) -> BrowserContext:
+        """获取（必要时创建）共享的浏览器上下文"""
+        if self._context is None:
+            self._context = new_context(self.browser, **self.context_config)
+        return self._context
+
+    def acquire(self) -> Page:
+        """
+        获取一个可用页面，优先复用空闲页面
+
+        Returns:
+            页面实例
+        """
+        while self._idle:
+            page = self._idle.pop()
+            if not page.is_closed():
+                self.reused_count += 1
+                logger.debug(f"复用页面（累计复用 {self.reused_count} 次）")
+                return page
+
+        page = self.context.new_page()
+        page.set_default_timeout(settings.TIMEOUT)
+        watch_listeners(page)
+        self.created_count += 1
+        return page
+
+    def release(self, page: Page) -> None:
+        """
+        归还页面：重置后放回池中，重置失败则关闭
+
+        Args:
+            page: 页面实例
+        """
+        # 关闭测试过程中打开的其他页面（如弹窗）
+        for other in list(self.context.pages):
+            if other is not page and other not in self._idle:
+                with contextlib.suppress(Exception):
+                    other.close()
+
+        # 清除测试添加的上下文路由后重新安装资源拦截，否则后续测试不再拦截图片和媒体
+        with contextlib.suppress(Exception):
+            self.context.unroute_all(behavior="ignoreErrors")
+            install_resource_blocking(self.context)
+        if self.clear_cookies:
+            with contextlib.suppress(Exception):
+                self.context.clear_cookies()
+                self.context.clear_permissions()
+
+        # 已认证的池保留存储状态，避免丢失登录信息
+        reusable = reset_page(page, clear_storage=self.clear_cookies)
+        if reusable and len(self._idle) < self.max_idle:
+            self._idle.append(page)
+            return
+
+        self.discarded_count += 1
+        with contextlib.suppress(Exception):
+            page.close()
+
+    def close(self) -> None:
+        """关闭池中所有页面和共享上下文"""
+        for page in self._idle:
+            with contextlib.suppress(Exception):
+                page.close()
+        self._idle.clear()
+
+        if self._context is not None:
+            with contextlib.suppress(Exception):
+                close_context(self._context, "page_pool")
+            self._context = None
+
+        logger.debug(
+            f"页面复用池已关闭: 创建 {self.created_count} 个, "
+            f"复用 {self.reused_count} 次, 丢弃 {self.discarded_count} 个"
+        )
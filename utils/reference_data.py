@@ -0,0 +1,226 @@
+"""
+参考数据缓存
+缓存下拉框的可选项（国籍、国家、职位、雇佣状态等），每个会话只加载一次
+通用的多系统端到端测试框架
+
+原理：
+- 每个参考数据目录（catalog）首次使用时由调用方提供的加载函数获取（API 或一次 DOM 读取）
+- 加载结果按 BASE_URL 区分环境写入缓存文件，在有效期（TTL）内后续运行直接复用
+- 环境在每次读写时按当前的 settings.BASE_URL 确定，切换 BASE_URL 后不会读到其他系统的数据
+- 页面对象在操作 UI 之前即可校验测试数据中的选项是否存在，并解析为系统中的准确文本
+"""
+
+import json
+import threading
+import time
+from collections.abc import Awaitable, Callable
+from pathlib import Path
+
+from config.settings import settings
+from utils.json_store import update_json_file
+from utils.logger import logger
+
+
+class ReferenceDataCache:
+    """参考数据缓存"""
+
+    def __init__(
+        self,
+        cache_file: Path | None = None,
+        ttl_seconds: float | None = None,
+        environment: str | None = None,
+    ):
+        """
+        初始化参考数据缓存
+
+        Args:
+            cache_file: 缓存文件路径
+            ttl_seconds: 缓存有效期（秒）
+            environment: 固定的环境标识，用于区分不同系统的数据；
+                未指定时每次读写使用当前的 settings.BASE_URL
+        """
+        self.cache_file = cache_file or settings.REFERENCE_DATA_FILE
+        self.ttl_seconds = (
+            ttl_seconds if ttl_seconds is not None else settings.REFERENCE_DATA_TTL * 3600
+        )
+        self._environment = environment
+
+        # 环境 -> (目录名 -> 选项列表)
+        self._catalogs: dict[str, dict[str, list[str]]] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def environment(self) -> str:
+        """当前环境标识（未固定时为当前的 settings.BASE_URL）"""
+        return self._environment or settings.BASE_URL
+
+    def _read_file(self) -> dict[str, dict]:
+        """
+        读取缓存文件
+
+        Returns:
+            环境 -> (目录名 -> {"fetched_at": 时间戳, "values": 选项列表})
+        """
+        if not self.cache_file.exists():
+            return {}
+        try:
+            with open(self.cache_file, encoding="utf-8") as f:
+                data = json.load(f)
+            if not isinstance(data, dict):
+                raise ValueError("顶层结构必须是对象")
+            return data
+        except (json.JSONDecodeError, OSError, ValueError) as e:
+            logger.warning(f"参考数据缓存文件无效，已忽略: {self.cache_file}, 错误: {e}")
+            return {}
+
+    def _read_cached(self, environment: str, catalog: str) -> list[str] | None:
+        """
+        从缓存文件读取未过期的目录
+
+        Args:
+            environment: 环境标识
+            catalog: 目录名
+
+        Returns:
+            选项列表，不存在或已过期时返回 None
+        """
+        entry = self._read_file().get(environment, {}).get(catalog)
+        if not entry:
+            return None
+        if time.time() - entry.get("fetched_at", 0) > self.ttl_seconds:
+            logger.debug(f"参考数据已过期: {catalog}")
+            return None
+        return entry.get("values")
+
+    def _write_cached(self, environment: str, catalog: str, values: list[str]) -> None:
+        """
+        将目录写入缓存文件（与文件中其他环境、其他目录的数据合并）
+
+        Args:
+            environment: 环境标识
+            catalog: 目录名
+            values: 选项列表
+        """
+
+        def merge(merged: dict[str, dict]) -> dict[str, dict]:
+            merged.setdefault(environment, {})[catalog] = {
+                "fetched_at": time.time(),
+                "values": values,
+            }
+            return merged
+
+        # 并行 worker 可能同时写入不同的目录，在文件锁内读取、合并、写回
+        update_json_file(self.cache_file, self._read_file, merge, indent=2)
+
+    def get(self, catalog: str, loader: Callable[[], list[str] | None]) -> list[str]:
+        """
+        获取参考数据目录
+
+        依次使用：本会话已加载的数据 -> 缓存文件中未过期的数据 -> 调用加载函数。
+
+        Args:
+            catalog: 目录名，如 "nationalities"
+            loader: 加载函数，返回选项列表，无法加载时返回 None
+
+        Returns:
+            选项列表，无法加载时返回空列表
+        """
+        return self._get(self.environment, catalog, loader)
+
+    def _get(
+        self, environment: str, catalog: str, loader: Callable[[], list[str] | None]
+    ) -> list[str]:
+        """
+        获取指定环境的参考数据目录（get 和 get_async 的共同实现）
+
+        Args:
+            environment: 环境标识
+            catalog: 目录名
+            loader: 加载函数，返回选项列表，无法加载时返回 None
+
+        Returns:
+            选项列表，无法加载时返回空列表
+        """
+        with self._lock:
+            catalogs = self._catalogs.setdefault(environment, {})
+            if catalog in catalogs:
+                return catalogs[catalog]
+
+            values = self._read_cached(environment, catalog)
+            if values is None:
+                values = loader()
+                if values:
+                    logger.info(f"参考数据已加载: {catalog} ({len(values)} 项)")
+                    self._write_cached(environment, catalog, values)
+                else:
+                    logger.warning(f"参考数据加载失败: {catalog}")
+                    # 不缓存失败结果，下次使用时重试
+                    return []
+
+            catalogs[catalog] = values
+            return values
+
+    async def get_async(
+        self, catalog: str, loader: Callable[[], Awaitable[list[str] | None]]
+    ) -> list[str]:
+        """
+        获取参考数据目录（异步页面对象使用）
+
+        与 get 相同，加载函数为协程函数；加载期间不持有锁。
+
+        Args:
+            catalog: 目录名，如 "nationalities"
+            loader: 异步加载函数，返回选项列表，无法加载时返回 None
+
+        Returns:
+            选项列表，无法加载时返回空列表
+        """
+        environment = self.environment
+        with self._lock:
+            values = self._catalogs.get(environment, {}).get(catalog) or self._read_cached(
+                environment, catalog
+            )
+        if values is None:
+            values = await loader()
+        return self._get(environment, catalog, lambda: values)
+
+    def resolve(self, catalog: str, value: str, values: list[str]) -> str:
+        """
+        将测试数据中的选项解析为系统中的准确文本
+
+        依次尝试完全匹配、忽略大小写匹配、唯一的部分匹配。
+
+        Args:
+            catalog: 目录名（用于错误信息）
+            value: 测试数据中的选项
+            values: 目录中的全部选项
+
+        Returns:
+            系统中的选项文本
+
+        Raises:
+            ValueError: 选项不存在或部分匹配不唯一
+        """
+        if value in values:
+            return value
+
+        lowered = value.lower()
+        for candidate in values:
+            if candidate.lower() == lowered:
+                return candidate
+
+        partial = [candidate for candidate in values if lowered in candidate.lower()]
+        if len(partial) == 1:
+            return partial[0]
+        if partial:
+            raise ValueError(f"{catalog} 中的选项 '{value}' 匹配到多个: {partial}")
+        raise ValueError(f"{catalog} 中不存在选项: '{value}'")
+
+    def clear(self) -> None:
+        """清空本会话已加载的数据（缓存文件保留）"""
+        with self._lock:
+            self._catalogs.clear()
+
+
+# 创建全局实例
+reference_data = ReferenceDataCache()
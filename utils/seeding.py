@@ -0,0 +1,90 @@
+"""
+测试前置数据准备工具模块
+为需要现成数据的测试（如编辑员工）创建专用的测试员工，而不是修改系统中已有的数据
+通用的多系统端到端测试框架
+
+- API_SEEDING 启用时通过 OrangeHRM API 创建（一次请求，无需页面跳转）
+- 未启用或 API 不可用时通过 UI 创建
+创建的员工都会登记到 data_factory，在会话结束时统一清理。
+"""
+
+from playwright.sync_api import Page
+
+from config.settings import settings
+from pages.employee_form_page import EmployeeFormPage
+from pages.pim_page import PIMPage
+from utils.cleanup import EMPLOYEE_API_PATH
+from utils.data_factory import data_factory
+from utils.data_loader import TestDataLoader
+from utils.data_models import Employee
+from utils.logger import logger
+
+
+def _create_by_api(page: Page, employee: Employee) -> bool:
+    """
+    通过 API 创建员工
+
+    Args:
+        page: 已登录的页面（共享其 Cookie）
+        employee: 员工记录
+
+    Returns:
+        是否创建成功
+    """
+    try:
+        response = page.request.post(
+            f"{settings.BASE_URL}{EMPLOYEE_API_PATH}",
+            data={
+                "firstName": employee.first_name,
+                "middleName": employee.middle_name,
+                "lastName": employee.last_name,
+                "employeeId": employee.employee_id,
+                "empPicture": None,
+            },
+        )
+        if not response.ok:
+            logger.warning(f"通过 API 创建员工失败: HTTP {response.status}，改为通过 UI 创建")
+        return response.ok
+    except Exception as e:
+        logger.warning(f"员工 API 不可用: {e}，改为通过 UI 创建")
+        return False
+
+
+def _create_by_ui(page: Page, employee: Employee) -> None:
+    """
+    通过添加员工页面创建员工（create_new_employee 会自行登记）
+
+    Args:
+        page: 已登录的页面
+        employee: 员工记录
+    """
+    PIMPage(page).open().click_add_employee_tab()
+    EmployeeFormPage(page).create_new_employee(
+        employee.first_name,
+        employee.middle_name,
+        employee.last_name,
+        employee.employee_id,
+    )
+
+
+def seed_employee(page: Page, template: Employee | None = None) -> Employee:
+    """
+    创建一个测试员工
+
+    Args:
+        page: 已登录的页面
+        template: 员工模板，默认为测试数据中的 new_employee；名字和员工 ID 会被替换为唯一值
+
+    Returns:
+        创建的员工记录（包含员工 ID）
+    """
+    employee = data_factory.employee(template or TestDataLoader.get_employee("new_employee"))
+    full_name = f"{employee.first_name} {employee.last_name}"
+
+    if settings.API_SEEDING and _create_by_api(page, employee):
+        data_factory.register("employee", employee.employee_id, full_name)
+    else:
+        _create_by_ui(page, employee)
+
+    logger.info(f"已创建测试员工: {full_name} ({employee.employee_id})")
+    return employee
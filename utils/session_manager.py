@@ -12,7 +12,9 @@ from pathlib import Path
 from playwright.sync_api import Browser, BrowserContext, Page
 
 from config.settings import settings
+from utils.browser_context import close_context, new_context
 from utils.logger import logger
+from utils.page_pool import reset_page, watch_listeners
 
 
 def validate_session_file(session_file: Path, browser: Browser | None = None) -> bool:
@@ -51,9 +53,9 @@ def validate_session_file(session_file: Path, browser: Browser | None = None) ->
 
     # 通过实际请求验证 session 有效性
     try:
-        context_config = settings.get_context_config()
-        context_config["storage_state"] = str(session_file)
-        context = browser.new_context(**context_config)
+        context = browser.new_context(
+            **settings.context_config, storage_state=str(session_file)
+        )
         page = context.new_page()
 
         try:
@@ -207,16 +209,14 @@ class SessionManager:
 
         password = password or settings.ADMIN_PASSWORD
         session_file = self._get_session_file(username)
-        context_config = settings.get_context_config()
 
         # 尝试复用 Session
         if self.reuse_session and self._is_session_valid(session_file):
             logger.info(f"复用用户 [{username}] 的 Session")
-            context_config["storage_state"] = str(session_file)
-            context = self.browser.new_context(**context_config)
+            context = new_context(self.browser, storage_state=str(session_file))
         else:
             # 创建新上下文并登录
-            context = self.browser.new_context(**context_config)
+            context = new_context(self.browser)
             page = context.new_page()
 
             try:
@@ -255,6 +255,7 @@ class SessionManager:
         context = self.get_context_for_user(username, password)
         page = context.new_page()
         page.set_default_timeout(settings.TIMEOUT)
+        watch_listeners(page)
 
         self._pages[username] = page
         return page
@@ -298,6 +299,31 @@ class SessionManager:
         """
         return self.get_page_for_user(username, password)
 
+    def reset_user_page(self, username: str) -> Page | None:
+        """
+        重置指定用户的缓存页面，供下一个测试复用
+
+        清除路由处理器、恢复默认超时并导航到 about:blank，保留登录状态。
+        如果页面无法安全复用，则关闭该页面，下次获取时重新创建。
+
+        Args:
+            username: 用户名
+
+        Returns:
+            重置后的页面实例，如果页面已被丢弃则为 None
+        """
+        page = self._pages.get(username)
+        if page is None:
+            return None
+
+        if reset_page(page, clear_storage=False):
+            return page
+
+        with contextlib.suppress(Exception):
+            page.close()
+        del self._pages[username]
+        return None
+
     def close_user_session(self, username: str) -> None:
         """
         关闭指定用户的 Session
@@ -312,7 +338,7 @@ class SessionManager:
 
         if username in self._contexts:
             with contextlib.suppress(Exception):
-                self._contexts[username].close()
+                close_context(self._contexts[username], f"session_{username}")
             del self._contexts[username]
 
         logger.debug(f"已关闭用户 [{username}] 的 Session")